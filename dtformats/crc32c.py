@@ -0,0 +1,116 @@
+"""CRC-32C (Castagnoli) checksum functions, such as used by LevelDB.
+
+The checksum is calculated with the slicing-by-8 algorithm, which processes
+8 bytes of data per iteration using 8 lookup tables, instead of 1 byte per
+iteration using a single lookup table.
+"""
+
+import struct
+
+# Reversed representation of the CRC-32C polynomial: 0x1edc6f41.
+_POLYNOMIAL = 0x82F63B78
+
+# Delta used to mask checksums stored by LevelDB.
+_MASK_DELTA = 0xA282EAD8
+
+
+def _GetLookupTables():
+    """Determines the slicing-by-8 lookup tables.
+
+    Returns:
+      tuple[list[int], ...]: 8 lookup tables of 256 values each.
+    """
+    lookup_tables = [[0] * 256 for _ in range(8)]
+
+    for byte_value in range(256):
+        checksum = byte_value
+        for _ in range(8):
+            if checksum & 1:
+                checksum = (checksum >> 1) ^ _POLYNOMIAL
+            else:
+                checksum >>= 1
+
+        lookup_tables[0][byte_value] = checksum
+
+    for byte_value in range(256):
+        checksum = lookup_tables[0][byte_value]
+        for table_index in range(1, 8):
+            checksum = (checksum >> 8) ^ lookup_tables[0][checksum & 0xFF]
+            lookup_tables[table_index][byte_value] = checksum
+
+    return tuple(lookup_tables)
+
+
+_LOOKUP_TABLES = _GetLookupTables()
+
+
+def CalculateCRC32C(data, initial_value=0):
+    """Calculates a CRC-32C checksum.
+
+    Args:
+      data (bytes|bytearray|memoryview): data.
+      initial_value (Optional[int]): checksum of preceding data, to continue
+          the calculation from.
+
+    Returns:
+      int: CRC-32C checksum.
+    """
+    table0, table1, table2, table3, table4, table5, table6, table7 = _LOOKUP_TABLES
+
+    data_size = len(data)
+    aligned_data_size = data_size - (data_size % 8)
+
+    checksum = initial_value ^ 0xFFFFFFFF
+
+    # Unpacking the first 4 bytes as a 32-bit integer and the last 4 bytes as
+    # separate bytes is significantly faster than reading the bytes individually.
+    values = struct.iter_unpack("<IBBBB", memoryview(data)[:aligned_data_size])
+
+    for value_32bit, byte_value4, byte_value5, byte_value6, byte_value7 in values:
+        value_32bit ^= checksum
+        checksum = (
+            table7[value_32bit & 0xFF]
+            ^ table6[(value_32bit >> 8) & 0xFF]
+            ^ table5[(value_32bit >> 16) & 0xFF]
+            ^ table4[value_32bit >> 24]
+            ^ table3[byte_value4]
+            ^ table2[byte_value5]
+            ^ table1[byte_value6]
+            ^ table0[byte_value7]
+        )
+
+    for byte_value in data[aligned_data_size:]:
+        checksum = (checksum >> 8) ^ table0[(checksum ^ byte_value) & 0xFF]
+
+    return checksum ^ 0xFFFFFFFF
+
+
+def MaskCRC32C(checksum):
+    """Masks a CRC-32C checksum, such as stored by LevelDB.
+
+    Checksums are masked since calculating the checksum of data that contains
+    embedded checksums is problematic.
+
+    Args:
+      checksum (int): CRC-32C checksum.
+
+    Returns:
+      int: masked CRC-32C checksum.
+    """
+    checksum = ((checksum >> 15) | (checksum << 17)) & 0xFFFFFFFF
+
+    return (checksum + _MASK_DELTA) & 0xFFFFFFFF
+
+
+def UnmaskCRC32C(masked_checksum):
+    """Unmasks a masked CRC-32C checksum, such as stored by LevelDB.
+
+    Args:
+      masked_checksum (int): masked CRC-32C checksum.
+
+    Returns:
+      int: CRC-32C checksum.
+    """
+    checksum = (masked_checksum - _MASK_DELTA) & 0xFFFFFFFF
+
+    return ((checksum >> 17) | (checksum << 15)) & 0xFFFFFFFF
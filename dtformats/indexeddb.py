@@ -1,5 +1,6 @@
 """IndexedDB database files."""
 
+from dtformats import errors
 from dtformats import leveldb
 
 
@@ -7,30 +8,161 @@ class IndexedDBDatabaseEntry:
     """IndexedDB entry.
 
     Attributes:
-      key_segments (list[int|str]): key segments.
+      key (bytes): key, including the key prefix.
+      key_prefix (tuple[int, int, int]): database, object store and index
+          identifier of the key prefix.
       sequence_number (int): sequence number.
       value (bytes): value.
       value_type (int): value type.
     """
 
-    def __init__(self, key_segments, sequence_number, value_type, value):
+    def __init__(
+        self, key, key_prefix, key_prefix_size, sequence_number, value_type, value
+    ):
         """Initializes a IndexedDB table entry.
 
         Args:
-          key_segments (list[int|str]): key segments.
+          key (bytes): key, including the key prefix.
+          key_prefix (tuple[int, int, int]): database, object store and index
+              identifier of the key prefix.
+          key_prefix_size (int): size of the key prefix in the key.
           sequence_number (int): sequence number.
           value_type (int): value type.
           value (bytes): value.
         """
         super().__init__()
-        self.key_segments = key_segments
+        self._key_prefix_size = key_prefix_size
+        self._key_segments = None
+        self.key = key
+        self.key_prefix = key_prefix
         self.sequence_number = sequence_number
         self.value_type = value_type
         self.value = value
 
+    @property
+    def key_segments(self):
+        """list[str]: key segments formatted as strings."""
+        if self._key_segments is None:
+            key_data_offset = self._key_prefix_size
+
+            key_segments = [f"{value:d}" for value in self.key_prefix]
+
+            if self.key_prefix == (0, 0, 0) and key_data_offset < len(self.key):
+                metadata_type = self.key[key_data_offset]
+                key_data_offset += 1
+
+                key_segments.append(f"{metadata_type:d}")
+
+            # Represent the reamaining key as a string without leading b
+            if key_data_offset < len(self.key):
+                remaining_key = repr(self.key[key_data_offset:])[1:]
+                key_segments.append(remaining_key)
+
+            self._key_segments = key_segments
+
+        return self._key_segments
+
 
 class IndexedDBDatabaseTableFile(leveldb.LevelDBDatabaseTableFile):
-    """IndexedDB database sorted tables (.ldb) file."""
+    """IndexedDB database sorted tables (.ldb) file.
+
+    The keys in the table are ordered by the database, object store and index
+    identifier of their key prefix, hence the entries of an object store are
+    stored contiguously.
+
+    The remainder of the key, after the key prefix, is ordered by the decoded
+    value of the key, for example numbers are stored as little-endian doubles,
+    which differs from the bytewise order of the remainder. Searches within
+    the entries of a key prefix, such as Get, are therefore only valid for
+    keys of which the bytewise order matches that of the decoded value.
+    """
+
+    def _CreateKeyPrefix(
+        self, database_identifier, object_store_identifier, index_identifier
+    ):
+        """Creates a key prefix.
+
+        Args:
+          database_identifier (int): database identifier.
+          object_store_identifier (int): object store identifier.
+          index_identifier (int): index identifier.
+
+        Returns:
+          bytes: key prefix.
+        """
+        database_identifier_size = max((database_identifier.bit_length() + 7) // 8, 1)
+        object_store_identifier_size = max(
+            (object_store_identifier.bit_length() + 7) // 8, 1
+        )
+        index_identifier_size = max((index_identifier.bit_length() + 7) // 8, 1)
+
+        byte_value = (
+            ((database_identifier_size - 1) << 5)
+            | ((object_store_identifier_size - 1) << 2)
+            | (index_identifier_size - 1)
+        )
+        return b"".join(
+            [
+                bytes([byte_value]),
+                database_identifier.to_bytes(database_identifier_size, "little"),
+                object_store_identifier.to_bytes(
+                    object_store_identifier_size, "little"
+                ),
+                index_identifier.to_bytes(index_identifier_size, "little"),
+            ]
+        )
+
+    def _GetComparableKey(self, key):
+        """Retrieves a value of a key that is ordered as the keys in the table.
+
+        Note that only the key prefix is compared as in the table, the remainder
+        of the key is compared bytewise.
+
+        Args:
+          key (bytes): key, without the internal key suffix.
+
+        Returns:
+          tuple[tuple[int, int, int], bytes]: key prefix and remainder of the key.
+
+        Raises:
+          ParseError: if the key prefix cannot be read.
+        """
+        key_prefix, bytes_read = self._ReadKeyPrefix(key)
+
+        return key_prefix, key[bytes_read:]
+
+    def _ReadEntries(self, table_entries_iterator):
+        """Reads entries from table entries.
+
+        Args:
+          table_entries_iterator (iterator[LevelDBDatabaseTableEntry]): table
+              entries.
+
+        Yields:
+          IndexedDBDatabaseEntry: entry.
+
+        Raises:
+          ParseError: if the entries cannot be read.
+        """
+        key_prefix = None
+        key_prefix_data = None
+        key_prefix_size = 0
+
+        for table_entry in table_entries_iterator:
+            # Consecutive entries typically have the same key prefix, which then
+            # does not need to be read again.
+            if not key_prefix_data or not table_entry.key.startswith(key_prefix_data):
+                key_prefix, key_prefix_size = self._ReadKeyPrefix(table_entry.key)
+                key_prefix_data = table_entry.key[:key_prefix_size]
+
+            yield IndexedDBDatabaseEntry(
+                table_entry.key,
+                key_prefix,
+                key_prefix_size,
+                table_entry.sequence_number,
+                table_entry.value_type,
+                table_entry.value,
+            )
 
     def _ReadKeyPrefix(self, data):
         """Reads a key prefix.
@@ -40,66 +172,114 @@ class IndexedDBDatabaseTableFile(leveldb.LevelDBDatabaseTableFile):
 
         Returns:
           tuple[tuple[int, int, int], int]: key prefix and number of bytes read.
-        """
-        byte_value = data[0]
-        bytes_read = 1
 
-        database_identifier = 0
-        object_store_identifier = 0
-        index_identifier = 0
+        Raises:
+          ParseError: if the key prefix cannot be read.
+        """
+        if not data:
+            raise errors.ParseError("Missing key prefix.")
 
-        bit_shift = 0
-        for _ in range((byte_value >> 5) + 1):
-            database_identifier |= data[bytes_read] << bit_shift
-            bytes_read += 1
-            bit_shift += 8
+        byte_value = data[0]
 
-        bit_shift = 0
-        for _ in range(((byte_value & 0x1F) >> 2) + 1):
-            object_store_identifier |= data[bytes_read] << bit_shift
-            bytes_read += 1
-            bit_shift += 8
+        database_identifier_end_offset = (byte_value >> 5) + 2
+        object_store_identifier_end_offset = (
+            database_identifier_end_offset + ((byte_value >> 2) & 0x07) + 1
+        )
+        index_identifier_end_offset = (
+            object_store_identifier_end_offset + (byte_value & 0x03) + 1
+        )
 
-        bit_shift = 0
-        for _ in range((byte_value & 0x03) + 1):
-            index_identifier |= data[bytes_read] << bit_shift
-            bytes_read += 1
-            bit_shift += 8
+        if index_identifier_end_offset > len(data):
+            raise errors.ParseError("Key prefix exceeds key size.")
 
-        key_prefix = (database_identifier, object_store_identifier, index_identifier)
+        key_prefix = (
+            int.from_bytes(data[1:database_identifier_end_offset], "little"),
+            int.from_bytes(
+                data[database_identifier_end_offset:object_store_identifier_end_offset],
+                "little",
+            ),
+            int.from_bytes(
+                data[object_store_identifier_end_offset:index_identifier_end_offset],
+                "little",
+            ),
+        )
 
-        return key_prefix, bytes_read
+        return key_prefix, index_identifier_end_offset
 
-    def ReadEntries(self):
+    def ReadEntries(self, key_prefix=None):
         """Reads the table entries.
 
+        Args:
+          key_prefix (Optional[bytes]): prefix of the keys of the entries to read,
+              which starts with a complete key prefix, where None represents all
+              entries. Only the data blocks that can contain keys with the key
+              prefix are read.
+
         Yields:
           IndexedDBDatabaseEntry: entry.
 
         Raises:
           ParseError: if the entries cannot be read.
         """
-        table_entries_iterator = super().ReadTableEntries()
+        if not key_prefix:
+            yield from self._ReadEntries(super().ReadTableEntries())
+            return
 
-        for table_entry in table_entries_iterator:
-            key_prefix, bytes_read = self._ReadKeyPrefix(table_entry.key)
+        key_prefix_values, key_prefix_size = self._ReadKeyPrefix(key_prefix)
 
-            key_segments = [f"{value:d}" for value in key_prefix]
+        database_identifier, object_store_identifier, index_identifier = (
+            key_prefix_values
+        )
+        end_key = self._CreateKeyPrefix(
+            database_identifier, object_store_identifier, index_identifier + 1
+        )
 
-            if key_prefix == (0, 0, 0):
-                metadata_type = int(table_entry.key[bytes_read])
-                bytes_read += 1
+        # The remainder of the key is not ordered bytewise, hence only the key
+        # prefix is used to seek and the remainder of the prefix is matched
+        # against every entry of the key prefix.
+        table_entries_iterator = self.GetIterator(end_key=end_key)
+        table_entries_iterator.Seek(key_prefix[:key_prefix_size])
 
-                key_segments.append(f"{metadata_type:d}")
+        for entry in self._ReadEntries(table_entries_iterator):
+            if entry.key.startswith(key_prefix):
+                yield entry
 
-            # Represent the reamaining key as a string without leading b
-            if bytes_read < len(table_entry.key):
-                remaining_key = repr(table_entry.key[bytes_read:])[1:]
-                key_segments.append(remaining_key)
+    def ReadObjectStoreEntries(
+        self, database_identifier, object_store_identifier, index_identifier=None
+    ):
+        """Reads the table entries of an object store.
 
-            yield IndexedDBDatabaseEntry(
-                key_segments,
-                table_entry.sequence_number,
-                table_entry.value_type,
-                table_entry.value,
+        Only the data blocks that can contain entries of the object store are
+        read.
+
+        Args:
+          database_identifier (int): database identifier.
+          object_store_identifier (int): object store identifier.
+          index_identifier (Optional[int]): index identifier, such as 1 for
+              the object store data, where None represents all indexes.
+
+        Yields:
+          IndexedDBDatabaseEntry: entry.
+
+        Raises:
+          ParseError: if the entries cannot be read.
+        """
+        if index_identifier is None:
+            start_key = self._CreateKeyPrefix(
+                database_identifier, object_store_identifier, 0
+            )
+            end_key = self._CreateKeyPrefix(
+                database_identifier, object_store_identifier + 1, 0
             )
+        else:
+            start_key = self._CreateKeyPrefix(
+                database_identifier, object_store_identifier, index_identifier
+            )
+            end_key = self._CreateKeyPrefix(
+                database_identifier, object_store_identifier, index_identifier + 1
+            )
+
+        table_entries_iterator = self.GetIterator(end_key=end_key)
+        table_entries_iterator.Seek(start_key)
+
+        yield from self._ReadEntries(table_entries_iterator)
@@ -1,6 +1,12 @@
 """LevelDB database files."""
 
 import abc
+import bisect
+import collections
+import heapq
+import os
+
+from concurrent import futures
 
 import snappy
 import zstd
@@ -8,8 +14,30 @@ import zstd
 from dtfabric import errors as dtfabric_errors
 from dtfabric.runtime import data_maps as dtfabric_data_maps
 
+from dtformats import crc32c
 from dtformats import data_format
 from dtformats import errors
+from dtformats import file_system
+from dtformats import lru_cache
+from dtformats import varint
+
+
+def _GetTableBlockSize(table_block):
+    """Determines the size of a table block in the block cache.
+
+    Args:
+      table_block (LevelDBDatabaseTableBlock): table block.
+
+    Returns:
+      int: size of the (decompressed) block data.
+    """
+    return len(table_block.data)
+
+
+# Cache of decompressed table blocks that is shared by all table files, since
+# a LevelDB database typically consists of many table files. The blocks are
+# keyed by the identity of the table file and the offset of the block.
+BLOCK_CACHE = lru_cache.LRUCache(64 * 1024 * 1024, size_callback=_GetTableBlockSize)
 
 
 class LevelDBDatabaseBlockHandle:
@@ -32,6 +60,124 @@ class LevelDBDatabaseBlockHandle:
         self.size = size
 
 
+class LevelDBDatabaseChecksumStatistics:
+    """LevelDB database file checksum statistics.
+
+    For a write ahead log or descriptor file the checksums are stored per record
+    fragment, for a sorted tables file per block.
+
+    Attributes:
+      corrupted_offsets (list[int]): offsets of the corrupted blocks or record
+          fragments, relative to the start of the file.
+      number_of_corrupted (int): number of blocks or record fragments that are
+          corrupted.
+      number_of_skipped (int): number of blocks or record fragments of which
+          the checksum was not verified.
+      number_of_verified (int): number of blocks or record fragments of which
+          the checksum was verified and matched.
+    """
+
+    def __init__(self):
+        """Initializes LevelDB database file checksum statistics."""
+        super().__init__()
+        self.corrupted_offsets = []
+        self.number_of_corrupted = 0
+        self.number_of_skipped = 0
+        self.number_of_verified = 0
+
+
+class LevelDBDatabaseFilterBlock:
+    """LevelDB filter block.
+
+    Attributes:
+      data (bytes): filter block data.
+      filter_base_logarithm (int): base 2 logarithm of the size of the range of
+          data block offsets covered by a filter.
+      filter_offsets_offset (int): offset of the array of filter offsets
+          relative to the start of the filter block data.
+      number_of_filters (int): number of filters.
+    """
+
+    def __init__(
+        self, data, filter_base_logarithm, filter_offsets_offset, number_of_filters
+    ):
+        """Initializes a LevelDB filter block.
+
+        Args:
+          data (bytes): filter block data.
+          filter_base_logarithm (int): base 2 logarithm of the size of the range
+              of data block offsets covered by a filter.
+          filter_offsets_offset (int): offset of the array of filter offsets
+              relative to the start of the filter block data.
+          number_of_filters (int): number of filters.
+        """
+        super().__init__()
+        self.data = data
+        self.filter_base_logarithm = filter_base_logarithm
+        self.filter_offsets_offset = filter_offsets_offset
+        self.number_of_filters = number_of_filters
+
+
+class LevelDBDatabaseTableBlock:
+    """LevelDB table block.
+
+    Attributes:
+      data (bytes): (decompressed) block data.
+      entries_data_size (int): size of the entries data, which is the block data
+          without the restart values.
+      restart_values (list[int]): offsets of the restart points relative to the
+          start of the block data.
+    """
+
+    def __init__(self, data, entries_data_size, restart_values):
+        """Initializes a LevelDB table block.
+
+        Args:
+          data (bytes): (decompressed) block data.
+          entries_data_size (int): size of the entries data, which is the block
+              data without the restart values.
+          restart_values (list[int]): offsets of the restart points relative to
+              the start of the block data.
+        """
+        super().__init__()
+        self.data = data
+        self.entries_data_size = entries_data_size
+        self.restart_values = restart_values
+
+
+class LevelDBDatabaseTableDescriptor:
+    """LevelDB table descriptor.
+
+    Attributes:
+      file_number (int): number of the table file.
+      file_size (int): size of the table file.
+      largest_key (bytes): largest key in the table, without the internal key
+          suffix.
+      level (int): level of the table.
+      smallest_key (bytes): smallest key in the table, without the internal key
+          suffix.
+    """
+
+    def __init__(self, level, file_number, file_size, smallest_key, largest_key):
+        """Initializes a LevelDB table descriptor.
+
+        Args:
+          level (int): level of the table.
+          file_number (int): number of the table file.
+          file_size (int): size of the table file.
+          smallest_key (bytes): smallest key in the table, without the internal
+              key suffix.
+          largest_key (bytes): largest key in the table, without the internal key
+              suffix.
+        """
+        super().__init__()
+        self.file_number = file_number
+        self.file_size = file_size
+        self.largest_key = largest_key
+        self.level = level
+        self.smallest_key = smallest_key
+
+
 class LevelDBDatabaseTableEntry:
     """LevelDB table entry.
 
@@ -58,6 +204,34 @@ class LevelDBDatabaseTableEntry:
         self.value = value
 
 
+class LevelDBDatabaseVersionEdit:
+    """LevelDB version edit.
+
+    Attributes:
+      comparator_name (str): name of the comparator or None if not set.
+      deleted_tables (list[tuple[int, int]]): level and file number of
+          the deleted tables.
+      last_sequence_number (int): last sequence number or None if not set.
+      log_number (int): number of the log file or None if not set.
+      new_tables (list[LevelDBDatabaseTableDescriptor]): descriptors of the new
+          tables.
+      next_file_number (int): next file number or None if not set.
+      previous_log_number (int): number of the previous log file or None if
+          not set.
+    """
+
+    def __init__(self):
+        """Initializes a LevelDB version edit."""
+        super().__init__()
+        self.comparator_name = None
+        self.deleted_tables = []
+        self.last_sequence_number = None
+        self.log_number = None
+        self.new_tables = []
+        self.next_file_number = None
+        self.previous_log_number = None
+
+
 class LevelDBDatabaseFile(data_format.BinaryDataFile):
     """LevelDB file."""
 
@@ -76,33 +250,124 @@ class LevelDBDatabaseFile(data_format.BinaryDataFile):
 
     _VALUE_TYPES = {0: "kTypeDeletion", 1: "kTypeValue"}
 
-    def _ReadVariableSizeInteger(self, data):
+    CHECKSUM_POLICIES = frozenset(["skip", "verify", "verify-sampled"])
+
+    # Interval of the blocks of which the checksum is verified with the
+    # "verify-sampled" checksum policy.
+    _CHECKSUM_SAMPLE_INTERVAL = 16
+
+    def __init__(
+        self,
+        checksum_policy=None,
+        debug=False,
+        file_system_helper=None,
+        output_writer=None,
+    ):
+        """Initializes a LevelDB file.
+
+        Args:
+          checksum_policy (Optional[str]): checksum policy, where "verify"
+              verifies the checksum of every block, "verify-sampled" verifies
+              the checksum of 1 in every 16 blocks and "skip" does not verify
+              checksums. None represents "verify".
+          debug (Optional[bool]): True if debug information should be written.
+          file_system_helper (Optional[FileSystemHelper]): file system helper.
+          output_writer (Optional[OutputWriter]): output writer.
+
+        Raises:
+          ValueError: if the checksum policy is not supported.
+        """
+        checksum_policy = checksum_policy or "verify"
+        if checksum_policy not in self.CHECKSUM_POLICIES:
+            raise ValueError(f"Unsupported checksum policy: {checksum_policy!s}")
+
+        super().__init__(
+            debug=debug,
+            file_system_helper=file_system_helper,
+            output_writer=output_writer,
+        )
+        self._checksum_policy = checksum_policy
+
+        self.checksum_statistics = LevelDBDatabaseChecksumStatistics()
+
+    def _ReadVariableSizeInteger(self, data, data_offset=0):
         """Reads a variable size integer.
 
         Args:
           data (bytes): data.
+          data_offset (Optional[int]): offset of the integer relative to the start
+              of the data.
 
         Returns:
           tuple[int, int]: integer value and number of bytes read.
         """
-        data_size = len(data)
+        return varint.ReadBase128VariableSizeInteger(data, data_offset)
 
-        byte_value = data[0]
-        bytes_read = 1
-        bit_shift = 0
+    def _ShouldVerifyChecksum(self):
+        """Determines if the next checksum should be verified.
 
-        integer_value = int(byte_value) & 0x7F
+        Returns:
+          bool: True if the next checksum should be verified according to
+              the checksum policy.
+        """
+        if self._checksum_policy == "skip":
+            return False
+
+        if self._checksum_policy == "verify-sampled":
+            statistics = self.checksum_statistics
+            number_of_checksums = (
+                statistics.number_of_corrupted
+                + statistics.number_of_skipped
+                + statistics.number_of_verified
+            )
+            return number_of_checksums % self._CHECKSUM_SAMPLE_INTERVAL == 0
+
+        return True
 
-        while bytes_read < data_size and byte_value & 0x80:
-            byte_value = data[bytes_read]
-            bytes_read += 1
-            bit_shift += 7
+    def _UpdateChecksumStatisticsOfVerifiedData(self):
+        """Updates the checksum statistics for data verified previously.
 
-            integer_value |= (int(byte_value) & 0x7F) << bit_shift
+        This is used for data that is read from a cache, which only contains
+        data of which the checksum was verified when it was read from the file.
+        The data is counted as verified or skipped according to the checksum
+        policy as if it was read from the file.
+        """
+        if self._ShouldVerifyChecksum():
+            self.checksum_statistics.number_of_verified += 1
+        else:
+            self.checksum_statistics.number_of_skipped += 1
 
-            # TODO: check maximum size
+    def _VerifyChecksum(self, file_offset, data, masked_checksum):
+        """Verifies a masked CRC-32C checksum according to the checksum policy.
 
-        return integer_value, bytes_read
+        Args:
+          file_offset (int): offset of the block or record fragment relative to
+              the start of the file.
+          data (bytes|memoryview): data the checksum was calculated over.
+          masked_checksum (int): masked CRC-32C checksum stored in the file.
+
+        Returns:
+          bool: False if the checksum was verified and does not match, True
+              otherwise.
+        """
+        statistics = self.checksum_statistics
+
+        if not self._ShouldVerifyChecksum():
+            statistics.number_of_skipped += 1
+            return True
+
+        checksum = crc32c.MaskCRC32C(crc32c.CalculateCRC32C(data))
+
+        if self._debug:
+            self._DebugPrintValue("Calculated checksum", f"0x{checksum:08x}")
+
+        if checksum != masked_checksum:
+            statistics.corrupted_offsets.append(file_offset)
+            statistics.number_of_corrupted += 1
+            return False
+
+        statistics.number_of_verified += 1
+        return True
 
     @abc.abstractmethod
     def ReadFileObject(self, file_object):
@@ -116,6 +381,12 @@ class LevelDBDatabaseFile(data_format.BinaryDataFile):
 class LevelDBDatabaseLogFile(LevelDBDatabaseFile):
     """LevelDB write ahead log (.log) file."""
 
+    _BLOCK_SIZE = 32 * 1024
+
+    # The record fragment header consists of a 32-bit checksum, a 16-bit data
+    # size and an 8-bit record type.
+    _FRAGMENT_HEADER_SIZE = 7
+
     def _ReadBlock(self, file_object, file_offset):
         """Reads a block.
 
@@ -124,46 +395,124 @@ class LevelDBDatabaseLogFile(LevelDBDatabaseFile):
           file_offset (int): offset of the block relative to the start of the file.
 
         Returns:
-          tuple[leveldb_log_block, int]: block and number of bytes read.
+          bytes: block data.
 
         Raises:
           ParseError: if the block cannot be read.
         """
-        data_type_map = self._GetDataTypeMap("leveldb_log_block")
+        block_size = min(self._BLOCK_SIZE, self._file_size - file_offset)
 
-        block, bytes_read = self._ReadStructureFromFileObject(
-            file_object, file_offset, data_type_map, "block"
-        )
+        return self._ReadData(file_object, file_offset, block_size, "block")
+
+    def _ReadFragments(self, file_object):
+        """Reads the record fragments.
+
+        The file is read one 32 KiB block at a time and the fragment data is
+        not copied. Fragments that are corrupted are yielded without fragment data, where
+        a fragment that exceeds its block also ends the block.
+
+        Args:
+          file_object (file): file-like object.
+
+        Yields:
+          tuple[int, int, memoryview]: offset of the fragment relative to the start
+              of the file, record type and fragment data or None if the fragment
+              is corrupted.
+
+        Raises:
+          ParseError: if the fragments cannot be read.
+        """
+        self.checksum_statistics = LevelDBDatabaseChecksumStatistics()
 
         if self._debug:
+            data_type_map = self._GetDataTypeMap("leveldb_log_block")
             debug_info = self._DEBUG_INFORMATION.get("leveldb_log_block")
-            self._DebugPrintStructureObject(block, debug_info)
 
-        # TODO: calculate and validate checksum
+        block_offset = 0
+        while block_offset < self._file_size:
+            block_data = self._ReadBlock(file_object, block_offset)
+            block_size = len(block_data)
+
+            block_view = memoryview(block_data)
+
+            data_offset = 0
+            # A trailer smaller than the fragment header is padding.
+            while data_offset + self._FRAGMENT_HEADER_SIZE <= block_size:
+                fragment_offset = block_offset + data_offset
+
+                fragment_data_size = int.from_bytes(
+                    block_data[data_offset + 4 : data_offset + 6], "little"
+                )
+                record_type = block_data[data_offset + 6]
+
+                fragment_data_offset = data_offset + self._FRAGMENT_HEADER_SIZE
+                fragment_data_end_offset = fragment_data_offset + fragment_data_size
+
+                if fragment_data_end_offset > block_size:
+                    self.checksum_statistics.corrupted_offsets.append(fragment_offset)
+                    self.checksum_statistics.number_of_corrupted += 1
+
+                    yield fragment_offset, record_type, None
+                    break
+
+                if self._debug:
+                    log_block = self._ReadStructureFromByteStream(
+                        block_data[data_offset:fragment_data_end_offset],
+                        fragment_offset,
+                        data_type_map,
+                        "block",
+                    )
+                    self._DebugPrintStructureObject(log_block, debug_info)
+
+                # Zero type fragments are used for preallocated space, where
+                # the remainder of the block is unused.
+                if record_type == 0:
+                    break
+
+                # The checksum is calculated over the record type and fragment data.
+                masked_checksum = int.from_bytes(
+                    block_data[data_offset : data_offset + 4], "little"
+                )
+                if not self._VerifyChecksum(
+                    fragment_offset,
+                    block_view[data_offset + 6 : fragment_data_end_offset],
+                    masked_checksum,
+                ):
+                    yield fragment_offset, record_type, None
+
+                else:
+                    yield fragment_offset, record_type, block_view[
+                        fragment_data_offset:fragment_data_end_offset
+                    ]
+
+                data_offset = fragment_data_end_offset
 
-        return block, bytes_read
+            block_offset += block_size
 
     def _ReadRecord(self, file_offset, data, data_size):
         """Reads a record.
 
         Args:
           file_offset (int): offset of the record relative to the start of the file.
-          data (bytes): record data.
+          data (bytes|bytearray|memoryview): record data.
           data_size (int): record data size.
 
+        Yields:
+          LevelDBDatabaseTableEntry: entry of a value stored (put) or deleted by
+              the record.
+
         Raises:
           ParseError: if the record cannot be read.
         """
-        # pylint: disable=unused-variable
-
         if self._debug:
             value_string, _ = self._FormatIntegerAsDecimal(file_offset)
             self._DebugPrintValue("Offset", value_string)
 
-        value_header, data_offset = self._ReadRecordValueHeader(file_offset, data)
+        sequence_number, data_offset = self._ReadRecordValueHeader(file_offset, data)
 
+        # The values in a record have consecutive sequence numbers.
         while data_offset < data_size:
-            value_type = int(data[data_offset])
+            value_type = data[data_offset]
             data_offset += 1
 
             if self._debug:
@@ -176,46 +525,61 @@ class LevelDBDatabaseLogFile(LevelDBDatabaseFile):
             if value_type not in (0, 1):
                 raise errors.ParseError(f"Unsupported value type: {value_type:d}")
 
-            key, bytes_read = self._ReadRecordValueSlice(data[data_offset:], "Key")
+            key, bytes_read = self._ReadRecordValueSlice(data, data_offset, "Key")
             data_offset += bytes_read
 
+            value = b""
             if value_type == 1:
                 value, bytes_read = self._ReadRecordValueSlice(
-                    data[data_offset:], "Value"
+                    data, data_offset, "Value"
                 )
                 data_offset += bytes_read
 
+            yield LevelDBDatabaseTableEntry(key, sequence_number, value_type, value)
+
+            sequence_number += 1
+
     def _ReadRecordValueHeader(self, file_offset, data):
         """Reads a value header.
 
         Args:
           file_offset (int): offset of the record relative to the start of the file.
-          data (bytes): record data.
+          data (bytes|bytearray|memoryview): record data.
 
         Returns:
-          tuple[leveldb_log_value_header, int]: value header and number of bytes
+          tuple[int, int]: sequence number of the first value and number of bytes
               read.
 
         Raises:
           ParseError: if the value header cannot be read.
         """
-        data_type_map = self._GetDataTypeMap("leveldb_log_value_header")
-
-        value_header = self._ReadStructureFromByteStream(
-            data, file_offset, data_type_map, "Value header"
-        )
+        if len(data) < 12:
+            raise errors.ParseError(
+                f"Unable to read value header at offset: {file_offset:d} "
+                f"(0x{file_offset:08x}) with error: data too small."
+            )
 
         if self._debug:
+            data_type_map = self._GetDataTypeMap("leveldb_log_value_header")
+
+            value_header = self._ReadStructureFromByteStream(
+                bytes(data[:12]), file_offset, data_type_map, "Value header"
+            )
+
             debug_info = self._DEBUG_INFORMATION.get("leveldb_log_value_header")
             self._DebugPrintStructureObject(value_header, debug_info)
 
-        return value_header, 12
+        sequence_number = int.from_bytes(data[:8], "little")
 
-    def _ReadRecordValueSlice(self, data, description):
+        return sequence_number, 12
+
+    def _ReadRecordValueSlice(self, data, data_offset, description):
         """Reads a slice record value.
 
         Args:
-          data (bytes): value data.
+          data (bytes|bytearray|memoryview): record data.
+          data_offset (int): offset of the value relative to the start of the
+              record data.
           description (str): description of the value.
 
         Returns:
@@ -224,9 +588,17 @@ class LevelDBDatabaseLogFile(LevelDBDatabaseFile):
         Raises:
           ParseError: if the value cannot be read.
         """
-        data_size, bytes_read = self._ReadVariableSizeInteger(data)
+        data_size, bytes_read = self._ReadVariableSizeInteger(data, data_offset)
+
+        value_data_offset = data_offset + bytes_read
+        value_data_end_offset = value_data_offset + data_size
+        if value_data_end_offset > len(data):
+            raise errors.ParseError(
+                f"{description:s} size: {data_size:d} exceeds record data size."
+            )
 
-        value_data = data[bytes_read : bytes_read + data_size]
+        # The value is copied since the record data can be a reused buffer.
+        value_data = bytes(data[value_data_offset:value_data_end_offset])
 
         if self._debug:
             value_string, _ = self._FormatIntegerAsDecimal(data_size)
@@ -236,39 +608,99 @@ class LevelDBDatabaseLogFile(LevelDBDatabaseFile):
 
         return value_data, bytes_read + data_size
 
-    def ReadFileObject(self, file_object):
-        """Reads a LevelDB write ahead log file-like object.
+    def _ReadRecords(self, file_object):
+        """Reads the records.
+
+        Records that are stored in multiple fragments are reassembled in a buffer
+        that is reused for every record, hence the record data is only valid
+        until the next record is read. Records with corrupted fragments are
+        skipped.
 
         Args:
           file_object (file): file-like object.
 
+        Yields:
+          tuple[int, memoryview]: offset of the record relative to the start of
+              the file and record data.
+
         Raises:
-          ParseError: if the file cannot be read.
+          ParseError: if the records cannot be read.
         """
-        file_offset = 0
-        page_size = 32 * 1024
-        record_data = b""
-        record_offset = 0
+        record_data = bytearray()
+        record_offset = None
+        skip_fragments = False
+
+        for fragment_offset, record_type, fragment_data in self._ReadFragments(
+            file_object
+        ):
+            if fragment_data is None:
+                # The remaining fragments of a record with a corrupted fragment
+                # are skipped.
+                record_offset = None
+                skip_fragments = True
+
+            elif record_type == 1:
+                skip_fragments = False
+                yield fragment_offset, fragment_data
+
+            elif record_type == 2:
+                skip_fragments = False
+                record_data.clear()
+                record_data.extend(fragment_data)
+                record_offset = fragment_offset
+
+            elif record_type in (3, 4):
+                if record_offset is None:
+                    if skip_fragments:
+                        continue
+
+                    raise errors.ParseError(
+                        f"Missing first fragment of record at offset: "
+                        f"{fragment_offset:d} (0x{fragment_offset:08x})."
+                    )
+
+                record_data.extend(fragment_data)
+
+                if record_type == 4:
+                    with memoryview(record_data) as record_view:
+                        yield record_offset, record_view
+
+                    record_offset = None
+
+            else:
+                raise errors.ParseError(
+                    f"Unsupported record type: {record_type:d} at offset: "
+                    f"{fragment_offset:d} (0x{fragment_offset:08x})."
+                )
 
-        while file_offset < self._file_size:
-            log_block, bytes_read = self._ReadBlock(file_object, file_offset)
+    def ReadEntries(self):
+        """Reads the entries.
 
-            if log_block.record_type in (1, 2):
-                record_data = log_block.record_data
-                record_offset = file_offset
+        The log is read incrementally, hence logs of arbitrary size can be read
+        in constant memory.
 
-            elif log_block.record_type in (3, 4):
-                record_data = b"".join([record_data, log_block.record_data])
+        Yields:
+          LevelDBDatabaseTableEntry: entry of a value stored (put) or deleted,
+              in order of the log.
+
+        Raises:
+          ParseError: if the entries cannot be read.
+        """
+        for record_offset, record_data in self._ReadRecords(self._file_object):
+            yield from self._ReadRecord(record_offset, record_data, len(record_data))
 
-            if log_block.record_type in (1, 4):
-                self._ReadRecord(record_offset, record_data, len(record_data))
+    def ReadFileObject(self, file_object):
+        """Reads a LevelDB write ahead log file-like object.
 
-            file_offset += bytes_read
-            page_size -= bytes_read
+        Args:
+          file_object (file): file-like object.
 
-            if page_size <= 6:
-                file_offset += page_size
-                page_size = 32 * 1024
+        Raises:
+          ParseError: if the file cannot be read.
+        """
+        for record_offset, record_data in self._ReadRecords(file_object):
+            for _ in self._ReadRecord(record_offset, record_data, len(record_data)):
+                pass
 
 
 class LevelDBDatabaseDescriptorFile(LevelDBDatabaseLogFile):
@@ -293,19 +725,21 @@ class LevelDBDatabaseDescriptorFile(LevelDBDatabaseLogFile):
           data (bytes): record data.
           data_size (int): record data size.
 
+        Yields:
+          LevelDBDatabaseVersionEdit: version edit stored in the record.
+
         Raises:
           ParseError: if the record cannot be read.
         """
-        # pylint: disable=unused-variable
-
         if self._debug:
             value_string, _ = self._FormatIntegerAsDecimal(file_offset)
             self._DebugPrintValue("Offset", value_string)
 
         data_offset = 0
+        version_edit = LevelDBDatabaseVersionEdit()
 
         while data_offset < data_size:
-            value_tag, bytes_read = self._ReadVariableSizeInteger(data[data_offset:])
+            value_tag, bytes_read = self._ReadVariableSizeInteger(data, data_offset)
             data_offset += bytes_read
 
             if self._debug:
@@ -319,80 +753,97 @@ class LevelDBDatabaseDescriptorFile(LevelDBDatabaseLogFile):
                 raise errors.ParseError(f"Unsupported value tag: {value_tag:d}")
 
             if value_tag == 1:
-                comparator_name, bytes_read = self._ReadRecordValueString(
-                    data[data_offset:], "Name"
+                version_edit.comparator_name, bytes_read = self._ReadRecordValueString(
+                    data, data_offset, "Name"
                 )
 
             elif value_tag == 2:
-                log_number, bytes_read = self._ReadRecordValueInteger(
-                    data[data_offset:], "Log number"
+                version_edit.log_number, bytes_read = self._ReadRecordValueInteger(
+                    data, data_offset, "Log number"
                 )
 
             elif value_tag == 3:
-                next_file_number, bytes_read = self._ReadRecordValueInteger(
-                    data[data_offset:], "Next file number"
+                version_edit.next_file_number, bytes_read = (
+                    self._ReadRecordValueInteger(data, data_offset, "Next file number")
                 )
 
             elif value_tag == 4:
-                last_sequence_number, bytes_read = self._ReadRecordValueInteger(
-                    data[data_offset:], "Last sequence number"
+                version_edit.last_sequence_number, bytes_read = (
+                    self._ReadRecordValueInteger(
+                        data, data_offset, "Last sequence number"
+                    )
                 )
 
             elif value_tag == 5:
-                level, bytes_read = self._ReadRecordValueInteger(
-                    data[data_offset:], "Level"
-                )
+                _, bytes_read = self._ReadRecordValueInteger(data, data_offset, "Level")
                 data_offset += bytes_read
 
-                key, bytes_read = self._ReadRecordValueSlice(data[data_offset:], "Key")
+                _, bytes_read = self._ReadRecordValueSlice(data, data_offset, "Key")
 
             elif value_tag == 6:
                 level, bytes_read = self._ReadRecordValueInteger(
-                    data[data_offset:], "Level"
+                    data, data_offset, "Level"
                 )
                 data_offset += bytes_read
 
                 file_number, bytes_read = self._ReadRecordValueInteger(
-                    data[data_offset:], "File number"
+                    data, data_offset, "File number"
                 )
 
+                version_edit.deleted_tables.append((level, file_number))
+
             elif value_tag == 7:
                 level, bytes_read = self._ReadRecordValueInteger(
-                    data[data_offset:], "Level"
+                    data, data_offset, "Level"
                 )
                 data_offset += bytes_read
 
                 file_number, bytes_read = self._ReadRecordValueInteger(
-                    data[data_offset:], "File number"
+                    data, data_offset, "File number"
                 )
                 data_offset += bytes_read
 
                 file_size, bytes_read = self._ReadRecordValueInteger(
-                    data[data_offset:], "File size"
+                    data, data_offset, "File size"
                 )
                 data_offset += bytes_read
 
                 smallest_record_key, bytes_read = self._ReadRecordValueSlice(
-                    data[data_offset:], "Smallest record key"
+                    data, data_offset, "Smallest record key"
                 )
                 data_offset += bytes_read
 
                 largest_record_key, bytes_read = self._ReadRecordValueSlice(
-                    data[data_offset:], "Largest record key"
+                    data, data_offset, "Largest record key"
+                )
+
+                table_descriptor = LevelDBDatabaseTableDescriptor(
+                    level,
+                    file_number,
+                    file_size,
+                    smallest_record_key[:-8],
+                    largest_record_key[:-8],
                 )
+                version_edit.new_tables.append(table_descriptor)
 
             elif value_tag == 9:
-                previous_log_number, bytes_read = self._ReadRecordValueInteger(
-                    data[data_offset:], "Previous log number"
+                version_edit.previous_log_number, bytes_read = (
+                    self._ReadRecordValueInteger(
+                        data, data_offset, "Previous log number"
+                    )
                 )
 
             data_offset += bytes_read
 
-    def _ReadRecordValueInteger(self, data, description):
+        yield version_edit
+
+    def _ReadRecordValueInteger(self, data, data_offset, description):
         """Reads an integer record value.
 
         Args:
-          data (bytes): value data.
+          data (bytes): record data.
+          data_offset (int): offset of the value relative to the start of the
+              record data.
           description (str): description of the value.
 
         Returns:
@@ -401,7 +852,7 @@ class LevelDBDatabaseDescriptorFile(LevelDBDatabaseLogFile):
         Raises:
           ParseError: if the value cannot be read.
         """
-        integer_value, bytes_read = self._ReadVariableSizeInteger(data)
+        integer_value, bytes_read = self._ReadVariableSizeInteger(data, data_offset)
 
         if self._debug:
             value_string, _ = self._FormatIntegerAsDecimal(integer_value)
@@ -409,11 +860,13 @@ class LevelDBDatabaseDescriptorFile(LevelDBDatabaseLogFile):
 
         return integer_value, bytes_read
 
-    def _ReadRecordValueString(self, data, description):
+    def _ReadRecordValueString(self, data, data_offset, description):
         """Reads a string record value.
 
         Args:
-          data (bytes): value data.
+          data (bytes): record data.
+          data_offset (int): offset of the value relative to the start of the
+              record data.
           description (str): description of the value.
 
         Returns:
@@ -422,11 +875,12 @@ class LevelDBDatabaseDescriptorFile(LevelDBDatabaseLogFile):
         Raises:
           ParseError: if the value cannot be read.
         """
-        data_size, bytes_read = self._ReadVariableSizeInteger(data)
+        data_size, bytes_read = self._ReadVariableSizeInteger(data, data_offset)
 
-        string_data = data[bytes_read : bytes_read + data_size]
+        string_data_offset = data_offset + bytes_read
+        string_data = data[string_data_offset : string_data_offset + data_size]
 
-        string_value = string_data.decode("utf-8")
+        string_value = bytes(string_data).decode("utf-8")
 
         if self._debug:
             value_string, _ = self._FormatIntegerAsDecimal(data_size)
@@ -436,399 +890,1820 @@ class LevelDBDatabaseDescriptorFile(LevelDBDatabaseLogFile):
 
         return string_value, bytes_read + data_size
 
+    def ReadVersionEdits(self):
+        """Reads the version edits.
+
+        Yields:
+          LevelDBDatabaseVersionEdit: version edit, in order of the descriptor.
+
+        Raises:
+          ParseError: if the version edits cannot be read.
+        """
+        for record_offset, record_data in self._ReadRecords(self._file_object):
+            yield from self._ReadRecord(record_offset, record_data, len(record_data))
+
 
 class LevelDBDatabaseTableFile(LevelDBDatabaseFile):
     """LevelDB database sorted tables (.ldb) file."""
 
-    def __init__(self, debug=False, file_system_helper=None, output_writer=None):
+    _BLOOM_FILTER_NAME = b"filter.leveldb.BuiltinBloomFilter2"
+
+    def __init__(
+        self,
+        checksum_policy=None,
+        debug=False,
+        file_system_helper=None,
+        number_of_decompression_threads=None,
+        output_writer=None,
+    ):
         """Initializes a LevelDB file.
 
+        Blocks that are corrupted are read as empty blocks.
+
         Args:
+          checksum_policy (Optional[str]): checksum policy, where "verify"
+              verifies the checksum of every block, "verify-sampled" verifies
+              the checksum of 1 in every 16 blocks and "skip" does not verify
+              checksums. None represents "verify".
           debug (Optional[bool]): True if debug information should be written.
           file_system_helper (Optional[FileSystemHelper]): file system helper.
+          number_of_decompression_threads (Optional[int]): number of threads
+              used to decompress data blocks ahead of reading their entries,
+              where None or 1 represents decompressing the data blocks in
+              the calling thread.
           output_writer (Optional[OutputWriter]): output writer.
+
+        Raises:
+          ValueError: if the checksum policy is not supported.
         """
         super().__init__(
+            checksum_policy=checksum_policy,
             debug=debug,
             file_system_helper=file_system_helper,
             output_writer=output_writer,
         )
+        self._file_identity = None
+        self._filter_block = None
+        self._index_block = None
         self._index_block_offset = None
         self._index_block_size = None
+        self._number_of_decompression_threads = number_of_decompression_threads or 1
 
-    def _ReadBlock(self, file_object, file_offset, block_data_size, description):
-        """Reads a block.
+    def _CalculateBloomFilterHash(self, key):
+        """Calculates the hash of a key as used by the LevelDB bloom filter.
 
         Args:
-          file_object (file): file-like object.
-          file_offset (int): offset of the block relative to the start of the file.
-          block_data_size (int): size of the block data.
+          key (bytes): key, without the internal key suffix.
+
+        Returns:
+          int: 32-bit hash.
+        """
+        key_size = len(key)
+        hash_value = (0xBC9F1D34 ^ (key_size * 0xC6A4A793)) & 0xFFFFFFFF
+
+        key_offset = 0
+        while key_offset + 4 <= key_size:
+            hash_value += int.from_bytes(key[key_offset : key_offset + 4], "little")
+            hash_value = (hash_value * 0xC6A4A793) & 0xFFFFFFFF
+            hash_value ^= hash_value >> 16
+            key_offset += 4
+
+        remaining_size = key_size - key_offset
+        if remaining_size:
+            if remaining_size == 3:
+                hash_value += key[key_offset + 2] << 16
+            if remaining_size >= 2:
+                hash_value += key[key_offset + 1] << 8
+
+            hash_value += key[key_offset]
+            hash_value = (hash_value * 0xC6A4A793) & 0xFFFFFFFF
+            hash_value ^= hash_value >> 24
+
+        return hash_value
+
+    def _CreateTableBlock(self, table_data, description):
+        """Creates a table block.
+
+        Args:
+          table_data (bytes): uncompressed data of the table block.
           description (str): description of the table.
 
         Returns:
-          bytes: block data.
+          LevelDBDatabaseTableBlock: table block.
 
         Raises:
-          ParseError: if the block cannot be read.
+          ParseError: if the table block cannot be read.
         """
-        block_data = self._ReadData(
-            file_object, file_offset, block_data_size, "block data"
-        )
+        table_data_size = len(table_data)
 
         if self._debug:
-            self._DebugPrintData(f"{description:s} block data", block_data)
+            self._DebugPrintData(f"{description:s} table data", table_data)
 
-        data_type_map = self._GetDataTypeMap("leveldb_table_block_trailer")
-        file_offset += block_data_size
+        data_type_map = self._GetDataTypeMap("uint32le")
+        table_data_end_offset = table_data_size - 4
 
-        block_trailer, _ = self._ReadStructureFromFileObject(
-            file_object, file_offset, data_type_map, "block trailer"
+        number_of_restart_values = self._ReadStructureFromByteStream(
+            table_data[-4:],
+            table_data_end_offset,
+            data_type_map,
+            "number of restart values",
         )
 
         if self._debug:
-            debug_info = self._DEBUG_INFORMATION.get(
-                "leveldb_table_block_trailer", None
-            )
-            self._DebugPrintStructureObject(block_trailer, debug_info)
+            value_string, _ = self._FormatIntegerAsDecimal(number_of_restart_values)
+            self._DebugPrintValue("Number of restart values", value_string)
 
-        # TODO: calculate and validate checksum
+        data_type_map = self._GetDataTypeMap("array_of_uint32le")
+        table_data_end_offset -= 4 * number_of_restart_values
+
+        context = dtfabric_data_maps.DataTypeMapContext(
+            values={"number_of_elements": number_of_restart_values}
+        )
+
+        try:
+            restart_values = data_type_map.MapByteStream(
+                table_data[table_data_end_offset:], context=context
+            )
 
-        if block_trailer.compression_type not in (0, 1, 2):
+        except dtfabric_errors.MappingError as exception:
             raise errors.ParseError(
-                f"Unsupported compression type: {block_trailer.compression_type!s}"
+                (
+                    f"Unable to parse array of 32-bit restart values with error: "
+                    f"{exception!s}"
+                )
             )
 
-        if block_trailer.compression_type == 1:
-            block_data = snappy.decompress(block_data)
+        if self._debug:
+            value_string, _ = self._FormatArrayOfIntegersAsDecimals(restart_values)
+            self._DebugPrintValue("Restart values", value_string)
 
-        elif block_trailer.compression_type == 2:
-            block_data = zstd.decompress(block_data)
+        return LevelDBDatabaseTableBlock(
+            table_data, table_data_end_offset, restart_values
+        )
 
-        return block_data
+    def _DecodeTableBlock(self, compression_type, block_data, description):
+        """Decompresses block data and creates a table block.
 
-    def _ReadBlockHandle(self, data, description):
-        """Reads a  block handle.
+        This method is thread-safe, once the data type maps have been created.
 
         Args:
-          data (bytes): value data.
-          description (str): description of the block handle.
+          compression_type (int): compression type.
+          block_data (bytes): block data or None if the block is corrupted.
+          description (str): description of the table.
 
         Returns:
-          tuple[LevelDBDatabaseBlockHandle, int]: block handle and number of bytes
-              read.
+          LevelDBDatabaseTableBlock: table block, which is empty if the block is
+              corrupted.
 
         Raises:
-          ParseError: if the block handle cannot be read.
+          ParseError: if the table block cannot be read.
         """
-        block_offset, data_offset = self._ReadVariableSizeInteger(data)
-
-        block_size, bytes_read = self._ReadVariableSizeInteger(data[data_offset:])
-        data_offset += bytes_read
-
-        if self._debug:
-            value_string, _ = self._FormatIntegerAsHexadecimal8(block_offset)
-            self._DebugPrintValue(f"{description:s} block offset", value_string)
+        if block_data is None:
+            return LevelDBDatabaseTableBlock(b"", 0, [])
 
-            value_string, _ = self._FormatIntegerAsDecimal(block_size)
-            self._DebugPrintValue(f"{description:s} block size", value_string)
+        table_data = self._DecompressBlockData(compression_type, block_data)
 
-        block_handle = LevelDBDatabaseBlockHandle(block_offset, block_size)
-        return block_handle, data_offset
+        return self._CreateTableBlock(table_data, description)
 
-    def _ReadDataBlock(self, file_object, file_offset, block_data_size):
-        """Reads a data block.
+    def _DecompressBlockData(self, compression_type, block_data):
+        """Decompresses block data.
 
         Args:
-          file_object (file): file-like object.
-          file_offset (int): offset of the block containing the data relative to
-             the start of the file.
-          block_data_size (int): size of the block data.
-
-        Yields:
-          LevelDBDatabaseTableEntry: table entry.
+          compression_type (int): compression type.
+          block_data (bytes): block data.
 
-        Raises:
-          ParseError: if the index cannot be read.
+        Returns:
+          bytes: uncompressed block data.
         """
-        table_entries = list(
-            self._ReadTable(file_object, file_offset, block_data_size, "Data")
-        )
+        if compression_type == 1:
+            block_data = snappy.decompress(block_data)
 
-        yield from table_entries
+        elif compression_type == 2:
+            block_data = zstd.decompress(block_data)
 
-    def _ReadFileFooter(self, file_object):
-        """Reads the file footer.
+        return block_data
+
+    def _FilterMayContain(self, block_offset, key):
+        """Determines if the data block at an offset may contain a key.
 
         Args:
-          file_object (file): file-like object.
+          block_offset (int): offset of the data block relative to the start of
+              the file.
+          key (bytes): key, without the internal key suffix.
 
         Returns:
-          leveldb_table_footer: file footer.
-
-        Raises:
-          ParseError: if the file footer cannot be read.
+          bool: False if the filter of the data block does not contain the key,
+              True otherwise, including if there is no (supported) filter.
         """
-        data_type_map = self._GetDataTypeMap("leveldb_table_footer")
-        file_offset = self._file_size - 48
+        filter_block = self._filter_block
+        if not filter_block:
+            return True
 
-        file_footer, _ = self._ReadStructureFromFileObject(
-            file_object, file_offset, data_type_map, "file footer"
+        filter_index = block_offset >> filter_block.filter_base_logarithm
+        if filter_index >= filter_block.number_of_filters:
+            return True
+
+        offset = filter_block.filter_offsets_offset + (filter_index * 4)
+        filter_start_offset = int.from_bytes(
+            filter_block.data[offset : offset + 4], "little"
+        )
+        filter_end_offset = int.from_bytes(
+            filter_block.data[offset + 4 : offset + 8], "little"
         )
 
-        block_handle, data_offset = self._ReadBlockHandle(file_footer.data, "Metaindex")
+        if filter_start_offset == filter_end_offset:
+            # An empty filter does not contain any keys.
+            return False
 
-        file_footer.metaindex_block_offset = block_handle.offset
-        file_footer.metaindex_block_size = block_handle.size
+        if (
+            filter_start_offset > filter_end_offset
+            or filter_end_offset > filter_block.filter_offsets_offset
+        ):
+            # A corrupt filter is considered to contain all keys.
+            return True
 
-        block_handle, bytes_read = self._ReadBlockHandle(
-            file_footer.data[data_offset:], "Index"
-        )
-        data_offset += bytes_read
+        filter_size = filter_end_offset - filter_start_offset
+        if filter_size < 2:
+            return False
 
-        self._index_block_offset = block_handle.offset
-        self._index_block_size = block_handle.size
+        filter_data = filter_block.data
+        number_of_probes = filter_data[filter_end_offset - 1]
+        if number_of_probes > 30:
+            # Reserved for other bloom filter encodings.
+            return True
 
-        if self._debug:
-            file_footer.padding = file_footer.data[data_offset:]
+        number_of_bits = (filter_size - 1) * 8
 
-            debug_info = self._DEBUG_INFORMATION.get("leveldb_table_footer")
-            self._DebugPrintStructureObject(file_footer, debug_info)
+        hash_value = self._CalculateBloomFilterHash(key)
+        delta = ((hash_value >> 17) | (hash_value << 15)) & 0xFFFFFFFF
 
-        return file_footer
+        for _ in range(number_of_probes):
+            bit_index = hash_value % number_of_bits
+            byte_value = filter_data[filter_start_offset + (bit_index >> 3)]
+            if not byte_value & (1 << (bit_index & 0x07)):
+                return False
 
-    def _ReadIndexBlock(self, file_object, file_offset, block_data_size):
-        """Reads the index block.
+            hash_value = (hash_value + delta) & 0xFFFFFFFF
+
+        return True
+
+    def _GetComparableKey(self, key):
+        """Retrieves a value of a key that is ordered as the keys in the table.
+
+        The keys are ordered by the comparator used to write the table. For
+        the default (bytewise) comparator the key itself is ordered as the keys
+        in the table.
 
         Args:
-          file_object (file): file-like object.
-          file_offset (int): offset of the block containing the index block
-             relative to the start of the file.
-          block_data_size (int): size of the block data.
+          key (bytes): key, without the internal key suffix.
 
-        Yields:
-          LevelDBDatabaseTableEntry: table entry.
+        Returns:
+          object: comparable value of the key.
 
         Raises:
-          ParseError: if the index cannot be read.
+          ParseError: if the key cannot be read.
         """
-        index_table_entries = list(
-            self._ReadTable(file_object, file_offset, block_data_size, "Index")
-        )
+        return key
+
+    def _GetIndexBlock(self):
+        """Retrieves the index block.
 
-        for table_entry in index_table_entries:
-            block_handle, _ = self._ReadBlockHandle(table_entry.value, "Data")
+        The index block is read once and kept for the lifetime of the opened
+        file.
+
+        Returns:
+          LevelDBDatabaseTableBlock: index block.
 
-            yield from self._ReadDataBlock(
-                file_object, block_handle.offset, block_handle.size
+        Raises:
+          ParseError: if the index block cannot be read.
+        """
+        if not self._index_block:
+            self._index_block = self._ReadTableBlock(
+                self._file_object,
+                self._index_block_offset,
+                self._index_block_size,
+                "Index",
             )
 
-    def _ReadMetaindexBlock(self, file_object, file_footer):
-        """Reads a metaindex block.
+        return self._index_block
+
+    def _GetFileIdentity(self, file_object):
+        """Determines the identity of the file in the block cache.
+
+        For a file opened with the native file system helper the identity
+        consists of the device, inode, size and modification time of the file,
+        such that a file that was replaced is not identified as the original
+        file. For a file opened with another file system helper, such as
+        the dfVFS file system helper, the identity consists of the helper,
+        path and size of the file, since the same path can be used in another
+        file system, such as another storage media image or volume.
 
         Args:
           file_object (file): file-like object.
-          file_footer (leveldb_table_footer): file footer.
+
+        Returns:
+          tuple[object, ...]: identity of the file or None if the file cannot
+              be identified, such as when the file-like object was not opened
+              by path.
+        """
+        if not self._path:
+            return None
+
+        if isinstance(self._file_system_helper, file_system.NativeFileSystemHelper):
+            try:
+                stat_object = os.fstat(file_object.fileno())
+            except (AttributeError, OSError):
+                return None
+
+            return (
+                "native",
+                stat_object.st_dev,
+                stat_object.st_ino,
+                stat_object.st_size,
+                stat_object.st_mtime_ns,
+            )
+
+        # The file system helper is part of the identity since it determines
+        # the file system the path is relative to.
+        return (self._file_system_helper, self._path, self._file_size)
+
+    def _GetTableBlockCacheKey(self, file_offset):
+        """Retrieves the key of a table block in the block cache.
+
+        Args:
+          file_offset (int): offset of the block relative to the start of the file.
+
+        Returns:
+          tuple[tuple[object, ...], int]: key of the table block in the block
+              cache or None if the block cache is not used.
+        """
+        # The block cache is not used in debug mode so that the debug information
+        # of every block is printed.
+        if self._debug or not self._file_identity:
+            return None
+
+        return (self._file_identity, file_offset)
+
+    def _GetTableBlockRestartIndex(self, table_block, key):
+        """Determines the restart point of a table block to start a seek from.
+
+        Args:
+          table_block (LevelDBDatabaseTableBlock): table block.
+          key (bytes): key, without the internal key suffix.
+
+        Returns:
+          int: index of the last restart point with a key smaller than the key or
+              0 if there is no such restart point.
 
         Raises:
-          ParseError: if the metaindex block cannot be read.
+          ParseError: if the table block cannot be read.
         """
-        data = self._ReadData(
-            file_object,
-            file_footer.metaindex_block_offset,
-            file_footer.metaindex_block_size,
-            "metaindex block",
-        )
+        comparable_key = self._GetComparableKey(key)
+        restart_index = 0
 
-        if self._debug:
-            self._DebugPrintData("Metaindex block data", data)
+        first_restart_index = 0
+        last_restart_index = len(table_block.restart_values) - 1
 
-    def _ReadTable(self, file_object, file_offset, block_data_size, description):
-        """Reads a table.
+        while first_restart_index <= last_restart_index:
+            middle_restart_index = (first_restart_index + last_restart_index) // 2
+
+            restart_key = self._ReadTableBlockRestartKey(
+                table_block, middle_restart_index
+            )
+            if self._GetComparableKey(restart_key) < comparable_key:
+                restart_index = middle_restart_index
+                first_restart_index = middle_restart_index + 1
+            else:
+                last_restart_index = middle_restart_index - 1
+
+        return restart_index
+
+    def _ReadBlock(self, file_object, file_offset, block_data_size, description):
+        """Reads a block.
 
         Args:
           file_object (file): file-like object.
-          file_offset (int): offset of the block containing the tabel relative to
-             the start of the file.
+          file_offset (int): offset of the block relative to the start of the file.
           block_data_size (int): size of the block data.
           description (str): description of the table.
 
-        Yields:
-          LevelDBDatabaseTableEntry: table entry.
+        Returns:
+          bytes: block data or None if the block is corrupted.
 
         Raises:
-          ParseError: if the table cannot be read.
+          ParseError: if the block cannot be read.
         """
-        table_data = self._ReadBlock(
+        compression_type, block_data, _ = self._ReadBlockData(
             file_object, file_offset, block_data_size, description
         )
-        table_data_size = len(table_data)
+        if block_data is None:
+            return None
 
-        if self._debug:
-            self._DebugPrintData(f"{description:s} table data", table_data)
+        return self._DecompressBlockData(compression_type, block_data)
 
-        data_type_map = self._GetDataTypeMap("uint32le")
-        table_data_end_offset = table_data_size - 4
+    def _ReadBlockData(self, file_object, file_offset, block_data_size, description):
+        """Reads the data of a block without decompressing it.
 
-        number_of_restart_values = self._ReadStructureFromByteStream(
-            table_data[-4:],
-            table_data_end_offset,
-            data_type_map,
-            "number of restart values",
+        Args:
+          file_object (file): file-like object.
+          file_offset (int): offset of the block relative to the start of the file.
+          block_data_size (int): size of the block data.
+          description (str): description of the table.
+
+        Returns:
+          tuple[int, bytes, bool]: compression type, block data and True if
+              the checksum of the block was verified, where the block data is
+              None if the block is corrupted.
+
+        Raises:
+          ParseError: if the block data cannot be read.
+        """
+        # The block data and trailer are read at once.
+        data = self._ReadData(
+            file_object, file_offset, block_data_size + 5, "block data and trailer"
         )
+        block_data = data[:block_data_size]
 
         if self._debug:
-            value_string, _ = self._FormatIntegerAsDecimal(number_of_restart_values)
-            self._DebugPrintValue("Number of restart values", value_string)
+            self._DebugPrintData(f"{description:s} block data", block_data)
 
-        data_type_map = self._GetDataTypeMap("array_of_uint32le")
-        table_data_end_offset -= 4 * number_of_restart_values
+            data_type_map = self._GetDataTypeMap("leveldb_table_block_trailer")
 
-        context = dtfabric_data_maps.DataTypeMapContext(
-            values={"number_of_elements": number_of_restart_values}
-        )
+            block_trailer = self._ReadStructureFromByteStream(
+                data[block_data_size:],
+                file_offset + block_data_size,
+                data_type_map,
+                "block trailer",
+            )
 
-        try:
-            restart_values = data_type_map.MapByteStream(
-                table_data[table_data_end_offset:], context=context
+            debug_info = self._DEBUG_INFORMATION.get(
+                "leveldb_table_block_trailer", None
             )
+            self._DebugPrintStructureObject(block_trailer, debug_info)
 
-        except dtfabric_errors.MappingError as exception:
+        compression_type = data[block_data_size]
+
+        # The checksum is calculated over the block data and compression type.
+        checksum_verified = self._ShouldVerifyChecksum()
+
+        masked_checksum = int.from_bytes(data[block_data_size + 1 :], "little")
+        if not self._VerifyChecksum(
+            file_offset, memoryview(data)[: block_data_size + 1], masked_checksum
+        ):
+            return compression_type, None, False
+
+        if compression_type not in (0, 1, 2):
             raise errors.ParseError(
-                (
-                    f"Unable to parse array of 32-bit restart values with error: "
-                    f"{exception!s}"
-                )
+                f"Unsupported compression type: {compression_type:d}"
             )
 
-        if self._debug:
-            value_string, _ = self._FormatArrayOfIntegersAsDecimals(restart_values)
-            self._DebugPrintValue("Restart values", value_string)
+        return compression_type, block_data, checksum_verified
 
-        data_offset = 0
-        entry_index = 0
-        shared_key_data = b""
+    def _ReadBlockHandle(self, data, description, data_offset=0):
+        """Reads a block handle.
 
-        while data_offset < table_data_end_offset:
-            entry_offset = data_offset
+        Args:
+          data (bytes): value data.
+          description (str): description of the block handle.
+          data_offset (Optional[int]): offset of the block handle relative to
+              the start of the data.
 
-            if self._debug:
-                value_string, _ = self._FormatIntegerAsDecimal(entry_offset)
-                self._DebugPrintValue("Offset", value_string)
+        Returns:
+          tuple[LevelDBDatabaseBlockHandle, int]: block handle and number of bytes
+              read.
 
-            shared_key_data_size, bytes_read = self._ReadVariableSizeInteger(
-                table_data[data_offset:]
-            )
-            data_offset += bytes_read
+        Raises:
+          ParseError: if the block handle cannot be read.
+        """
+        integer_values, bytes_read = varint.ReadBase128VariableSizeIntegers(
+            data, data_offset, 2
+        )
+        block_offset, block_size = integer_values
 
-            non_shared_key_data_size, bytes_read = self._ReadVariableSizeInteger(
-                table_data[data_offset:]
-            )
-            data_offset += bytes_read
+        if self._debug:
+            value_string, _ = self._FormatIntegerAsHexadecimal8(block_offset)
+            self._DebugPrintValue(f"{description:s} block offset", value_string)
 
-            value_data_size, bytes_read = self._ReadVariableSizeInteger(
-                table_data[data_offset:]
-            )
-            data_offset += bytes_read
+            value_string, _ = self._FormatIntegerAsDecimal(block_size)
+            self._DebugPrintValue(f"{description:s} block size", value_string)
 
-            if self._debug:
-                value_string, _ = self._FormatIntegerAsDecimal(shared_key_data_size)
-                self._DebugPrintValue(
-                    f"Entry: {entry_index:d} shared key data size", value_string
-                )
+        block_handle = LevelDBDatabaseBlockHandle(block_offset, block_size)
+        return block_handle, bytes_read
 
-                value_string, _ = self._FormatIntegerAsDecimal(non_shared_key_data_size)
-                self._DebugPrintValue(
-                    f"Entry: {entry_index:d} non-shared key data size", value_string
-                )
+    def _ReadDataBlocks(self, file_object, block_handles):
+        """Reads data blocks.
 
-                value_string, _ = self._FormatIntegerAsDecimal(value_data_size)
-                self._DebugPrintValue(
-                    f"Entry: {entry_index:d} value data size", value_string
-                )
+        When multiple decompression threads are configured, the data blocks are
+        read and their checksums verified in the calling thread, after which
+        they are decompressed in a thread pool ahead of the data block being
+        returned. Data blocks are returned in the order of the block handles.
 
-            key_data_size = non_shared_key_data_size
+        Args:
+          file_object (file): file-like object.
+          block_handles (iterable[LevelDBDatabaseBlockHandle]): block handles of
+              the data blocks.
 
-            key_data_end_offset = data_offset + key_data_size
-            key_data = table_data[data_offset:key_data_end_offset]
+        Yields:
+          LevelDBDatabaseTableBlock: data block.
 
-            if self._debug:
-                self._DebugPrintData(f"Entry: {entry_index:d} key data", key_data)
+        Raises:
+          ParseError: if a data block cannot be read.
+        """
+        # Decompression is not done in parallel in debug mode to preserve
+        # the order of the debug output.
+        if self._debug or self._number_of_decompression_threads <= 1:
+            for block_handle in block_handles:
+                yield self._ReadTableBlock(
+                    file_object, block_handle.offset, block_handle.size, "Data"
+                )
 
-            if shared_key_data_size > 0:
-                key_data = b"".join([shared_key_data[:shared_key_data_size], key_data])
-                key_data_size += shared_key_data_size
+            return
 
-                if self._debug:
-                    self._DebugPrintData(f"Entry: {entry_index:d} key data", key_data)
+        # Make sure the data type maps are created before they are used by
+        # the decompression threads.
+        self._GetDataTypeMap("array_of_uint32le")
+        self._GetDataTypeMap("uint32le")
 
-            shared_key_data = key_data
+        maximum_number_of_pending_blocks = 2 * self._number_of_decompression_threads
 
-            if key_data_size < 8:
-                raise errors.ParseError(f"Unsupported key data size: {key_data_size:d}")
+        with futures.ThreadPoolExecutor(
+            max_workers=self._number_of_decompression_threads
+        ) as executor:
+            pending_blocks = collections.deque()
 
-            data_type_map = self._GetDataTypeMap("uint64le")
+            for block_handle in block_handles:
+                cache_key = self._GetTableBlockCacheKey(block_handle.offset)
 
-            internal_key_suffix = self._ReadStructureFromByteStream(
-                key_data[-8:],
-                key_data_end_offset - 8,
-                data_type_map,
-                "internal key suffix",
-            )
+                data_block = None
+                if cache_key:
+                    data_block = BLOCK_CACHE.Get(cache_key)
 
-            key_data = key_data[:-8]
-            value_type = internal_key_suffix & 0xFF
-            sequence_number = internal_key_suffix >> 8
+                if data_block:
+                    self._UpdateChecksumStatisticsOfVerifiedData()
 
-            if self._debug:
-                self._DebugPrintValue("Key", key_data)
+                    future = futures.Future()
+                    future.set_result(data_block)
 
-                value_type_string = self._VALUE_TYPES.get(value_type, "UNKNOWN")
-                value_string, _ = self._FormatIntegerAsDecimal(value_type)
-                self._DebugPrintValue(
-                    "Value type", f"{value_string:s} ({value_type_string:s})"
-                )
+                    # The data block does not need to be added to the cache.
+                    cache_key = None
 
-                value_string, _ = self._FormatIntegerAsDecimal(sequence_number)
-                self._DebugPrintValue("Sequence number", value_string)
+                else:
+                    compression_type, block_data, checksum_verified = (
+                        self._ReadBlockData(
+                            file_object, block_handle.offset, block_handle.size, "Data"
+                        )
+                    )
+                    # Only data blocks of which the checksum was verified are
+                    # cached, so that a cached data block is never corrupted.
+                    if not checksum_verified:
+                        cache_key = None
 
-            data_offset = key_data_end_offset
+                    future = executor.submit(
+                        self._DecodeTableBlock, compression_type, block_data, "Data"
+                    )
 
-            value_data_end_offset = data_offset + value_data_size
-            value_data = table_data[data_offset:value_data_end_offset]
+                pending_blocks.append((cache_key, future))
 
-            if self._debug:
-                self._DebugPrintData(f"Entry: {entry_index:d} value data", value_data)
+                if len(pending_blocks) >= maximum_number_of_pending_blocks:
+                    cache_key, future = pending_blocks.popleft()
+                    data_block = future.result()
 
-            data_offset = value_data_end_offset
+                    if cache_key:
+                        BLOCK_CACHE.Put(cache_key, data_block)
 
-            yield LevelDBDatabaseTableEntry(
-                key_data, sequence_number, value_type, value_data
-            )
+                    yield data_block
 
-            entry_index += 1
+            while pending_blocks:
+                cache_key, future = pending_blocks.popleft()
+                data_block = future.result()
 
-    def ReadFileObject(self, file_object):
-        """Reads a LevelDB database stored tables file-like object.
+                if cache_key:
+                    BLOCK_CACHE.Put(cache_key, data_block)
+
+                yield data_block
+
+    def _ReadFileFooter(self, file_object):
+        """Reads the file footer.
 
         Args:
           file_object (file): file-like object.
 
+        Returns:
+          leveldb_table_footer: file footer.
+
         Raises:
-          ParseError: if the file cannot be read.
+          ParseError: if the file footer cannot be read.
         """
-        file_footer = self._ReadFileFooter(file_object)
+        data_type_map = self._GetDataTypeMap("leveldb_table_footer")
+        file_offset = self._file_size - 48
 
-        self._ReadMetaindexBlock(file_object, file_footer)
+        file_footer, _ = self._ReadStructureFromFileObject(
+            file_object, file_offset, data_type_map, "file footer"
+        )
 
-    def ReadTableEntries(self):
-        """Reads the table entries.
+        block_handle, data_offset = self._ReadBlockHandle(file_footer.data, "Metaindex")
+
+        file_footer.metaindex_block_offset = block_handle.offset
+        file_footer.metaindex_block_size = block_handle.size
+
+        block_handle, bytes_read = self._ReadBlockHandle(
+            file_footer.data, "Index", data_offset=data_offset
+        )
+        data_offset += bytes_read
+
+        self._index_block_offset = block_handle.offset
+        self._index_block_size = block_handle.size
+
+        if self._debug:
+            file_footer.padding = file_footer.data[data_offset:]
+
+            debug_info = self._DEBUG_INFORMATION.get("leveldb_table_footer")
+            self._DebugPrintStructureObject(file_footer, debug_info)
+
+        return file_footer
+
+    def _ReadIndexBlock(self, file_object, file_offset, block_data_size):
+        """Reads the index block.
+
+        Args:
+          file_object (file): file-like object.
+          file_offset (int): offset of the block containing the index block
+             relative to the start of the file.
+          block_data_size (int): size of the block data.
 
         Yields:
           LevelDBDatabaseTableEntry: table entry.
 
         Raises:
-          ParseError: if the table entries cannot be read.
+          ParseError: if the index cannot be read.
         """
-        yield from self._ReadIndexBlock(
-            self._file_object, self._index_block_offset, self._index_block_size
+        index_block = self._ReadTableBlock(
+            file_object, file_offset, block_data_size, "Index"
         )
+
+        # Note that the index block data is read before the data blocks are read
+        # hence the index block entries can be read while reading the data blocks.
+        block_handles = (
+            self._ReadBlockHandle(table_entry.value, "Data")[0]
+            for table_entry in self._ReadTableBlockEntries(index_block)
+        )
+
+        for data_block in self._ReadDataBlocks(file_object, block_handles):
+            yield from self._ReadTableBlockEntries(data_block)
+
+    def _ReadMetaindexBlock(self, file_object, file_footer):
+        """Reads a metaindex block.
+
+        Args:
+          file_object (file): file-like object.
+          file_footer (leveldb_table_footer): file footer.
+
+        Raises:
+          ParseError: if the metaindex block cannot be read.
+        """
+        self._filter_block = None
+
+        metaindex_block = self._ReadTableBlock(
+            file_object,
+            file_footer.metaindex_block_offset,
+            file_footer.metaindex_block_size,
+            "Metaindex",
+        )
+
+        # Note that the keys of the metaindex block entries are names, without
+        # an internal key suffix.
+        block_data = metaindex_block.data
+        data_offset = 0
+        shared_key_data = b""
+
+        while data_offset < metaindex_block.entries_data_size:
+            integer_values, bytes_read = varint.ReadBase128VariableSizeIntegers(
+                block_data, data_offset, 3
+            )
+            shared_key_data_size, non_shared_key_data_size, value_data_size = (
+                integer_values
+            )
+            data_offset += bytes_read
+
+            key_data_end_offset = data_offset + non_shared_key_data_size
+            key_data = b"".join(
+                [
+                    shared_key_data[:shared_key_data_size],
+                    block_data[data_offset:key_data_end_offset],
+                ]
+            )
+            shared_key_data = key_data
+
+            if self._debug:
+                self._DebugPrintValue("Metaindex key", key_data)
+
+            block_handle, _ = self._ReadBlockHandle(
+                block_data, "Metaindex", data_offset=key_data_end_offset
+            )
+            data_offset = key_data_end_offset + value_data_size
+
+            if key_data == self._BLOOM_FILTER_NAME:
+                self._filter_block = self._ReadFilterBlock(file_object, block_handle)
+
+    def _ReadFilterBlock(self, file_object, block_handle):
+        """Reads a filter block.
+
+        Args:
+          file_object (file): file-like object.
+          block_handle (LevelDBDatabaseBlockHandle): block handle of the filter
+              block.
+
+        Returns:
+          LevelDBDatabaseFilterBlock: filter block or None if the filter block
+              is not supported.
+
+        Raises:
+          ParseError: if the filter block cannot be read.
+        """
+        block_data = self._ReadBlock(
+            file_object, block_handle.offset, block_handle.size, "Filter"
+        )
+        if block_data is None:
+            return None
+
+        block_data_size = len(block_data)
+
+        if block_data_size < 5:
+            return None
+
+        filter_base_logarithm = block_data[-1]
+        filter_offsets_offset = int.from_bytes(block_data[-5:-1], "little")
+
+        if filter_offsets_offset > block_data_size - 5:
+            return None
+
+        number_of_filters = (block_data_size - 5 - filter_offsets_offset) // 4
+
+        if self._debug:
+            value_string, _ = self._FormatIntegerAsDecimal(filter_base_logarithm)
+            self._DebugPrintValue("Filter base logarithm", value_string)
+
+            value_string, _ = self._FormatIntegerAsDecimal(number_of_filters)
+            self._DebugPrintValue("Number of filters", value_string)
+
+        return LevelDBDatabaseFilterBlock(
+            block_data, filter_base_logarithm, filter_offsets_offset, number_of_filters
+        )
+
+    def _ReadTableBlock(self, file_object, file_offset, block_data_size, description):
+        """Reads a table block.
+
+        Args:
+          file_object (file): file-like object.
+          file_offset (int): offset of the block containing the tabel relative to
+             the start of the file.
+          block_data_size (int): size of the block data.
+          description (str): description of the table.
+
+        Returns:
+          LevelDBDatabaseTableBlock: table block.
+
+        Raises:
+          ParseError: if the table block cannot be read.
+        """
+        cache_key = self._GetTableBlockCacheKey(file_offset)
+        if cache_key:
+            table_block = BLOCK_CACHE.Get(cache_key)
+            if table_block:
+                self._UpdateChecksumStatisticsOfVerifiedData()
+                return table_block
+
+        compression_type, block_data, checksum_verified = self._ReadBlockData(
+            file_object, file_offset, block_data_size, description
+        )
+        table_block = self._DecodeTableBlock(compression_type, block_data, description)
+
+        # Only table blocks of which the checksum was verified are cached, so
+        # that a cached table block is never corrupted.
+        if cache_key and checksum_verified:
+            BLOCK_CACHE.Put(cache_key, table_block)
+
+        return table_block
+
+    def _ReadTableBlockEntries(self, table_block, restart_index=0):
+        """Reads the entries of a table block.
+
+        Args:
+          table_block (LevelDBDatabaseTableBlock): table block.
+          restart_index (Optional[int]): index of the restart point to start
+              reading from.
+
+        Yields:
+          LevelDBDatabaseTableEntry: table entry.
+
+        Raises:
+          ParseError: if the table block entries cannot be read.
+        """
+        data_offset = 0
+        if restart_index > 0:
+            data_offset = table_block.restart_values[restart_index]
+
+        entry_index = 0
+        shared_key_data = b""
+
+        while data_offset < table_block.entries_data_size:
+            table_entry, shared_key_data, data_offset = self._ReadTableBlockEntry(
+                table_block.data, data_offset, shared_key_data, entry_index
+            )
+            yield table_entry
+
+            entry_index += 1
+
+    def _ReadTableBlockEntry(
+        self, table_data, data_offset, shared_key_data, entry_index
+    ):
+        """Reads a table block entry.
+
+        Args:
+          table_data (bytes): table block data.
+          data_offset (int): offset of the entry relative to the start of the table
+              block data.
+          shared_key_data (bytes): key data of the previous entry, including the
+              internal key suffix.
+          entry_index (int): index of the entry.
+
+        Returns:
+          tuple[LevelDBDatabaseTableEntry, bytes, int]: table entry, key data of
+              the entry including the internal key suffix and offset of the next
+              entry relative to the start of the table block data.
+
+        Raises:
+          ParseError: if the table block entry cannot be read.
+        """
+        entry_offset = data_offset
+
+        if self._debug:
+            value_string, _ = self._FormatIntegerAsDecimal(entry_offset)
+            self._DebugPrintValue("Offset", value_string)
+
+        integer_values, bytes_read = varint.ReadBase128VariableSizeIntegers(
+            table_data, data_offset, 3
+        )
+        shared_key_data_size, non_shared_key_data_size, value_data_size = integer_values
+        data_offset += bytes_read
+
+        if self._debug:
+            value_string, _ = self._FormatIntegerAsDecimal(shared_key_data_size)
+            self._DebugPrintValue(
+                f"Entry: {entry_index:d} shared key data size", value_string
+            )
+
+            value_string, _ = self._FormatIntegerAsDecimal(non_shared_key_data_size)
+            self._DebugPrintValue(
+                f"Entry: {entry_index:d} non-shared key data size", value_string
+            )
+
+            value_string, _ = self._FormatIntegerAsDecimal(value_data_size)
+            self._DebugPrintValue(
+                f"Entry: {entry_index:d} value data size", value_string
+            )
+
+        key_data_size = non_shared_key_data_size
+
+        key_data_end_offset = data_offset + key_data_size
+        key_data = table_data[data_offset:key_data_end_offset]
+
+        if self._debug:
+            self._DebugPrintData(f"Entry: {entry_index:d} key data", key_data)
+
+        if shared_key_data_size > 0:
+            key_data = b"".join([shared_key_data[:shared_key_data_size], key_data])
+            key_data_size += shared_key_data_size
+
+            if self._debug:
+                self._DebugPrintData(f"Entry: {entry_index:d} key data", key_data)
+
+        if key_data_size < 8:
+            raise errors.ParseError(f"Unsupported key data size: {key_data_size:d}")
+
+        data_type_map = self._GetDataTypeMap("uint64le")
+
+        internal_key_suffix = self._ReadStructureFromByteStream(
+            key_data[-8:],
+            key_data_end_offset - 8,
+            data_type_map,
+            "internal key suffix",
+        )
+
+        value_type = internal_key_suffix & 0xFF
+        sequence_number = internal_key_suffix >> 8
+
+        if self._debug:
+            self._DebugPrintValue("Key", key_data[:-8])
+
+            value_type_string = self._VALUE_TYPES.get(value_type, "UNKNOWN")
+            value_string, _ = self._FormatIntegerAsDecimal(value_type)
+            self._DebugPrintValue(
+                "Value type", f"{value_string:s} ({value_type_string:s})"
+            )
+
+            value_string, _ = self._FormatIntegerAsDecimal(sequence_number)
+            self._DebugPrintValue("Sequence number", value_string)
+
+        data_offset = key_data_end_offset
+
+        value_data_end_offset = data_offset + value_data_size
+        value_data = table_data[data_offset:value_data_end_offset]
+
+        if self._debug:
+            self._DebugPrintData(f"Entry: {entry_index:d} value data", value_data)
+
+        table_entry = LevelDBDatabaseTableEntry(
+            key_data[:-8], sequence_number, value_type, value_data
+        )
+        return table_entry, key_data, value_data_end_offset
+
+    def _ReadTableBlockRestartEntries(self, table_block, restart_index):
+        """Reads the entries of a table block between two restart points.
+
+        Args:
+          table_block (LevelDBDatabaseTableBlock): table block.
+          restart_index (int): index of the restart point to start reading from.
+
+        Returns:
+          list[LevelDBDatabaseTableEntry]: table entries up to the next restart
+              point or the end of the entries data.
+
+        Raises:
+          ParseError: if the table block entries cannot be read.
+        """
+        data_offset = 0
+        if table_block.restart_values:
+            data_offset = table_block.restart_values[restart_index]
+
+        data_end_offset = table_block.entries_data_size
+        if restart_index + 1 < len(table_block.restart_values):
+            data_end_offset = table_block.restart_values[restart_index + 1]
+
+        entry_index = 0
+        shared_key_data = b""
+        table_entries = []
+
+        while data_offset < data_end_offset:
+            table_entry, shared_key_data, data_offset = self._ReadTableBlockEntry(
+                table_block.data, data_offset, shared_key_data, entry_index
+            )
+            table_entries.append(table_entry)
+
+            entry_index += 1
+
+        return table_entries
+
+    def _ReadTableBlockRestartKey(self, table_block, restart_index):
+        """Reads the key of the entry at a restart point of a table block.
+
+        The entry at a restart point does not share key data with the previous
+        entry, hence its key can be read without reading preceding entries.
+
+        Args:
+          table_block (LevelDBDatabaseTableBlock): table block.
+          restart_index (int): index of the restart point.
+
+        Returns:
+          bytes: key, without the internal key suffix.
+
+        Raises:
+          ParseError: if the key cannot be read.
+        """
+        data_offset = table_block.restart_values[restart_index]
+
+        integer_values, bytes_read = varint.ReadBase128VariableSizeIntegers(
+            table_block.data, data_offset, 2
+        )
+        shared_key_data_size, non_shared_key_data_size = integer_values
+
+        if shared_key_data_size != 0 or non_shared_key_data_size < 8:
+            raise errors.ParseError(
+                f"Unsupported restart point: {restart_index:d} entry key data"
+            )
+
+        # The value data size is skipped.
+        _, value_bytes_read = self._ReadVariableSizeInteger(
+            table_block.data, data_offset + bytes_read
+        )
+        key_data_offset = data_offset + bytes_read + value_bytes_read
+
+        return table_block.data[
+            key_data_offset : key_data_offset + non_shared_key_data_size - 8
+        ]
+
+    def _SeekTableBlock(self, table_block, key):
+        """Seeks the first entry of a table block with a key equal to or greater
+        than the specified key.
+
+        The restart points are binary searched, after which only the entries
+        following the last restart point with a smaller key are read.
+
+        Args:
+          table_block (LevelDBDatabaseTableBlock): table block.
+          key (bytes): key, without the internal key suffix.
+
+        Returns:
+          LevelDBDatabaseTableEntry: table entry or None if the table block does
+              not contain an entry with a key equal to or greater than the key.
+
+        Raises:
+          ParseError: if the table block cannot be read.
+        """
+        comparable_key = self._GetComparableKey(key)
+        restart_index = self._GetTableBlockRestartIndex(table_block, key)
+
+        for table_entry in self._ReadTableBlockEntries(
+            table_block, restart_index=restart_index
+        ):
+            if self._GetComparableKey(table_entry.key) >= comparable_key:
+                return table_entry
+
+        return None
+
+    def Close(self):
+        """Closes a LevelDB database stored tables file.
+
+        Raises:
+          OSError: if the file is not opened.
+        """
+        super().Close()
+
+        self._file_identity = None
+        self._filter_block = None
+        self._index_block = None
+
+    def ReadFileObject(self, file_object):
+        """Reads a LevelDB database stored tables file-like object.
+
+        Args:
+          file_object (file): file-like object.
+
+        Raises:
+          ParseError: if the file cannot be read.
+        """
+        self.checksum_statistics = LevelDBDatabaseChecksumStatistics()
+
+        self._file_identity = self._GetFileIdentity(file_object)
+
+        file_footer = self._ReadFileFooter(file_object)
+
+        self._ReadMetaindexBlock(file_object, file_footer)
+
+    def Get(self, key):
+        """Retrieves the table entry of a specific key.
+
+        Only the index block and the data block that can contain the key are
+        read. If the table contains multiple entries of the key, the entry with
+        the highest sequence number is returned.
+
+        Args:
+          key (bytes): key, without the internal key suffix.
+
+        Returns:
+          LevelDBDatabaseTableEntry: table entry, which can be a deletion marker,
+              or None if the table does not contain the key.
+
+        Raises:
+          ParseError: if the table entry cannot be read.
+        """
+        index_block = self._GetIndexBlock()
+
+        # The key of an index entry is equal to or greater than the last key in
+        # the corresponding data block.
+        index_entry = self._SeekTableBlock(index_block, key)
+        if not index_entry:
+            return None
+
+        block_handle, _ = self._ReadBlockHandle(index_entry.value, "Data")
+
+        if not self._FilterMayContain(block_handle.offset, key):
+            return None
+
+        data_block = self._ReadTableBlock(
+            self._file_object, block_handle.offset, block_handle.size, "Data"
+        )
+
+        table_entry = self._SeekTableBlock(data_block, key)
+        if not table_entry or table_entry.key != key:
+            return None
+
+        return table_entry
+
+    def GetIterator(self, end_key=None):
+        """Retrieves an iterator over the table entries.
+
+        Args:
+          end_key (Optional[bytes]): key, without the internal key suffix, at
+              which the iterator stops, where the entries of the end key are not
+              included. None represents the end of the table.
+
+        Returns:
+          LevelDBDatabaseTableIterator: table iterator.
+        """
+        return LevelDBDatabaseTableIterator(self, end_key=end_key)
+
+    def MayContain(self, key):
+        """Determines if the table may contain a key.
+
+        Only the index block and the bloom filter are used, hence no data block
+        is read.
+
+        Args:
+          key (bytes): key, without the internal key suffix.
+
+        Returns:
+          bool: False if the table does not contain the key, True if the table
+              may contain the key.
+
+        Raises:
+          ParseError: if the index block cannot be read.
+        """
+        index_block = self._GetIndexBlock()
+
+        index_entry = self._SeekTableBlock(index_block, key)
+        if not index_entry:
+            return False
+
+        block_handle, _ = self._ReadBlockHandle(index_entry.value, "Data")
+
+        return self._FilterMayContain(block_handle.offset, key)
+
+    def ReadTableEntries(self):
+        """Reads the table entries.
+
+        Yields:
+          LevelDBDatabaseTableEntry: table entry.
+
+        Raises:
+          ParseError: if the table entries cannot be read.
+        """
+        yield from self._ReadIndexBlock(
+            self._file_object, self._index_block_offset, self._index_block_size
+        )
+
+
+class LevelDBDatabaseTableIterator:
+    """LevelDB database sorted tables (.ldb) file iterator.
+
+    The iterator is a cursor that is positioned between table entries. Data
+    blocks are only read when the iterator moves into them and only the entries
+    between the restart points around the position of the iterator are decoded.
+    """
+
+    # pylint: disable=protected-access
+
+    def __init__(self, table_file, end_key=None):
+        """Initializes a LevelDB database sorted tables (.ldb) file iterator.
+
+        The iterator is initially positioned before the first table entry.
+
+        Args:
+          table_file (LevelDBDatabaseTableFile): table file.
+          end_key (Optional[bytes]): key, without the internal key suffix, at
+              which the iterator stops, where the entries of the end key are not
+              included. None represents the end of the table.
+        """
+        super().__init__()
+        self._block_index = -1
+        self._comparable_end_key = None
+        self._entry_index = 0
+        self._index_entries = None
+        self._restart_index = 0
+        self._table_block = None
+        self._table_entries = []
+        self._table_file = table_file
+
+        if end_key is not None:
+            self._comparable_end_key = table_file._GetComparableKey(end_key)
+
+    def __iter__(self):
+        """Retrieves the iterator.
+
+        Returns:
+          LevelDBDatabaseTableIterator: table iterator.
+        """
+        return self
+
+    def __next__(self):
+        """Retrieves the next table entry.
+
+        Returns:
+          LevelDBDatabaseTableEntry: table entry.
+
+        Raises:
+          ParseError: if the table entry cannot be read.
+          StopIteration: if there are no more table entries.
+        """
+        table_entry = self.Next()
+        if table_entry is None:
+            raise StopIteration
+
+        return table_entry
+
+    def _GetIndexEntries(self):
+        """Retrieves the entries of the index block.
+
+        Returns:
+          list[LevelDBDatabaseTableEntry]: index block entries.
+
+        Raises:
+          ParseError: if the index block cannot be read.
+        """
+        if self._index_entries is None:
+            index_block = self._table_file._GetIndexBlock()
+            self._index_entries = list(
+                self._table_file._ReadTableBlockEntries(index_block)
+            )
+
+        return self._index_entries
+
+    def _ReadDataBlock(self, block_index):
+        """Reads a data block.
+
+        Args:
+          block_index (int): index of the data block in the index block.
+
+        Raises:
+          ParseError: if the data block cannot be read.
+        """
+        index_entry = self._GetIndexEntries()[block_index]
+
+        block_handle, _ = self._table_file._ReadBlockHandle(index_entry.value, "Data")
+
+        self._block_index = block_index
+        self._table_block = self._table_file._ReadTableBlock(
+            self._table_file._file_object,
+            block_handle.offset,
+            block_handle.size,
+            "Data",
+        )
+
+    def _ReadNextRestartEntries(self):
+        """Reads the entries following the current restart point.
+
+        Returns:
+          bool: True if entries were read or False if the end of the table was
+              reached.
+
+        Raises:
+          ParseError: if the entries cannot be read.
+        """
+        if self._table_block and self._restart_index + 1 < len(
+            self._table_block.restart_values
+        ):
+            self._restart_index += 1
+
+        elif self._block_index + 1 < len(self._GetIndexEntries()):
+            self._ReadDataBlock(self._block_index + 1)
+            self._restart_index = 0
+
+        else:
+            return False
+
+        self._table_entries = self._table_file._ReadTableBlockRestartEntries(
+            self._table_block, self._restart_index
+        )
+        self._entry_index = 0
+
+        return True
+
+    def _ReadPreviousRestartEntries(self):
+        """Reads the entries preceding the current restart point.
+
+        Returns:
+          bool: True if entries were read or False if the start of the table was
+              reached.
+
+        Raises:
+          ParseError: if the entries cannot be read.
+        """
+        if self._table_block and self._restart_index > 0:
+            self._restart_index -= 1
+
+        elif self._block_index > 0:
+            self._ReadDataBlock(self._block_index - 1)
+            self._restart_index = max(len(self._table_block.restart_values) - 1, 0)
+
+        else:
+            return False
+
+        self._table_entries = self._table_file._ReadTableBlockRestartEntries(
+            self._table_block, self._restart_index
+        )
+        self._entry_index = len(self._table_entries)
+
+        return True
+
+    def Next(self):
+        """Retrieves the table entry after the position of the iterator.
+
+        Returns:
+          LevelDBDatabaseTableEntry: table entry or None if there are no more
+              table entries before the end key.
+
+        Raises:
+          ParseError: if the table entry cannot be read.
+        """
+        while self._entry_index >= len(self._table_entries):
+            if not self._ReadNextRestartEntries():
+                return None
+
+        table_entry = self._table_entries[self._entry_index]
+        if (
+            self._comparable_end_key is not None
+            and self._table_file._GetComparableKey(table_entry.key)
+            >= self._comparable_end_key
+        ):
+            return None
+
+        self._entry_index += 1
+
+        return table_entry
+
+    def Prev(self):
+        """Retrieves the table entry before the position of the iterator.
+
+        Returns:
+          LevelDBDatabaseTableEntry: table entry or None if there are no more
+              preceding table entries.
+
+        Raises:
+          ParseError: if the table entry cannot be read.
+        """
+        while self._entry_index <= 0:
+            if not self._ReadPreviousRestartEntries():
+                return None
+
+        self._entry_index -= 1
+
+        return self._table_entries[self._entry_index]
+
+    def Seek(self, key):
+        """Positions the iterator before the first entry with a key equal to or
+        greater than the specified key.
+
+        Args:
+          key (bytes): key, without the internal key suffix.
+
+        Raises:
+          ParseError: if the table cannot be read.
+        """
+        get_comparable_key = self._table_file._GetComparableKey
+
+        comparable_key = get_comparable_key(key)
+        index_entries = self._GetIndexEntries()
+
+        # The key of an index entry is equal to or greater than the last key in
+        # the corresponding data block.
+        block_index = bisect.bisect_left(
+            index_entries,
+            comparable_key,
+            key=lambda index_entry: get_comparable_key(index_entry.key),
+        )
+        if block_index >= len(index_entries):
+            self._block_index = len(index_entries)
+            self._entry_index = 0
+            self._restart_index = 0
+            self._table_block = None
+            self._table_entries = []
+            return
+
+        self._ReadDataBlock(block_index)
+
+        self._restart_index = self._table_file._GetTableBlockRestartIndex(
+            self._table_block, key
+        )
+        self._table_entries = self._table_file._ReadTableBlockRestartEntries(
+            self._table_block, self._restart_index
+        )
+        self._entry_index = bisect.bisect_left(
+            self._table_entries,
+            comparable_key,
+            key=lambda table_entry: get_comparable_key(table_entry.key),
+        )
+
+
+class LevelDBDatabase:
+    """LevelDB database.
+
+    The database is a merged view of the tables that are live according to
+    the current descriptor (MANIFEST) file and the entries in the write ahead
+    log files that have not yet been stored in tables.
+
+    Only databases that use the default (bytewise) comparator are supported,
+    since the keys of the tables are merged and searched in bytewise order.
+
+    Attributes:
+      checksum_statistics (dict[str, LevelDBDatabaseChecksumStatistics]): checksum
+          statistics per name of the files that have been read.
+      comparator_name (str): name of the comparator according to the descriptor
+          file or None if not available.
+      last_sequence_number (int): last sequence number according to
+          the descriptor file or None if not available.
+    """
+
+    _BYTEWISE_COMPARATOR_NAME = "leveldb.BytewiseComparator"
+
+    def __init__(
+        self,
+        checksum_policy=None,
+        debug=False,
+        file_system_helper=None,
+        number_of_decompression_threads=None,
+        output_writer=None,
+    ):
+        """Initializes a LevelDB database.
+
+        Args:
+          checksum_policy (Optional[str]): checksum policy, where "verify"
+              verifies the checksum of every block, "verify-sampled" verifies
+              the checksum of 1 in every 16 blocks and "skip" does not verify
+              checksums. None represents "verify".
+          debug (Optional[bool]): True if debug information should be written.
+          file_system_helper (Optional[FileSystemHelper]): file system helper.
+          number_of_decompression_threads (Optional[int]): number of threads
+              used per table file to decompress data blocks ahead of reading
+              their entries, where None or 1 represents decompressing the data
+              blocks in the calling thread.
+          output_writer (Optional[OutputWriter]): output writer.
+
+        Raises:
+          ValueError: if the checksum policy is not supported.
+        """
+        if checksum_policy and (
+            checksum_policy not in LevelDBDatabaseFile.CHECKSUM_POLICIES
+        ):
+            raise ValueError(f"Unsupported checksum policy: {checksum_policy!s}")
+
+        if not file_system_helper:
+            file_system_helper = file_system.NativeFileSystemHelper()
+
+        super().__init__()
+        self._checksum_policy = checksum_policy
+        self._debug = debug
+        self._file_system_helper = file_system_helper
+        self._memory_table = {}
+        self._number_of_decompression_threads = number_of_decompression_threads
+        self._output_writer = output_writer
+        self._path_segments = None
+        self._table_descriptors = {}
+        self._table_files = {}
+
+        self.checksum_statistics = {}
+        self.comparator_name = None
+        self.last_sequence_number = None
+
+    def _GetTableFile(self, table_descriptor):
+        """Retrieves a table file.
+
+        Table files are opened on first use and kept open until the database is
+        closed.
+
+        Args:
+          table_descriptor (LevelDBDatabaseTableDescriptor): table descriptor.
+
+        Returns:
+          LevelDBDatabaseTableFile: table file.
+
+        Raises:
+          ParseError: if the table file cannot be opened.
+        """
+        table_file = self._table_files.get(table_descriptor.file_number, None)
+        if not table_file:
+            table_file_path = None
+            for extension in ("ldb", "sst"):
+                path = self._GetPath(
+                    f"{table_descriptor.file_number:06d}.{extension:s}"
+                )
+                if self._file_system_helper.CheckFileExistsByPath(path):
+                    table_file_path = path
+                    break
+
+            if not table_file_path:
+                raise errors.ParseError(
+                    f"Missing table file: {table_descriptor.file_number:06d}"
+                )
+
+            table_file = LevelDBDatabaseTableFile(
+                checksum_policy=self._checksum_policy,
+                debug=self._debug,
+                file_system_helper=self._file_system_helper,
+                number_of_decompression_threads=(self._number_of_decompression_threads),
+                output_writer=self._output_writer,
+            )
+            table_file.Open(table_file_path)
+
+            name = self._file_system_helper.SplitPath(table_file_path)[-1]
+            self.checksum_statistics[name] = table_file.checksum_statistics
+
+            self._table_files[table_descriptor.file_number] = table_file
+
+        return table_file
+
+    def _GetPath(self, name):
+        """Retrieves the path of a file in the database directory.
+
+        Args:
+          name (str): name of the file.
+
+        Returns:
+          str: path of the file.
+        """
+        return self._file_system_helper.JoinPath(self._path_segments + [name])
+
+    def _ReadDescriptorFile(self, name):
+        """Reads the tables that are live according to a descriptor file.
+
+        Args:
+          name (str): name of the descriptor (MANIFEST) file.
+
+        Returns:
+          tuple[int, int]: number of the log file and number of the previous log
+              file, where log files with a number smaller than the number of the
+              log file, other than the previous log file, are no longer in use.
+
+        Raises:
+          ParseError: if the descriptor file cannot be read or the comparator is
+              not supported.
+        """
+        descriptor_file = LevelDBDatabaseDescriptorFile(
+            checksum_policy=self._checksum_policy,
+            debug=self._debug,
+            file_system_helper=self._file_system_helper,
+            output_writer=self._output_writer,
+        )
+        descriptor_file.Open(self._GetPath(name))
+
+        log_number = 0
+        previous_log_number = 0
+        table_descriptors = {}
+
+        try:
+            for version_edit in descriptor_file.ReadVersionEdits():
+                if version_edit.comparator_name is not None:
+                    self.comparator_name = version_edit.comparator_name
+
+                if version_edit.last_sequence_number is not None:
+                    self.last_sequence_number = version_edit.last_sequence_number
+
+                if version_edit.log_number is not None:
+                    log_number = version_edit.log_number
+
+                if version_edit.previous_log_number is not None:
+                    previous_log_number = version_edit.previous_log_number
+
+                for level, file_number in version_edit.deleted_tables:
+                    table_descriptors.pop((level, file_number), None)
+
+                for table_descriptor in version_edit.new_tables:
+                    key = (table_descriptor.level, table_descriptor.file_number)
+                    table_descriptors[key] = table_descriptor
+
+        finally:
+            self.checksum_statistics[name] = descriptor_file.checksum_statistics
+
+            descriptor_file.Close()
+
+        if self.comparator_name not in (None, self._BYTEWISE_COMPARATOR_NAME):
+            raise errors.ParseError(f"Unsupported comparator: {self.comparator_name:s}")
+
+        self._table_descriptors = {}
+        for table_descriptor in table_descriptors.values():
+            self._table_descriptors.setdefault(table_descriptor.level, []).append(
+                table_descriptor
+            )
+
+        for level, level_table_descriptors in self._table_descriptors.items():
+            if level == 0:
+                # The tables in level 0 can overlap, where a table with a higher
+                # file number contains more recent entries.
+                level_table_descriptors.sort(
+                    key=lambda table_descriptor: table_descriptor.file_number,
+                    reverse=True,
+                )
+            else:
+                level_table_descriptors.sort(
+                    key=lambda table_descriptor: table_descriptor.smallest_key
+                )
+
+        return log_number, previous_log_number
+
+    def _ReadLogFiles(self, log_number, previous_log_number):
+        """Reads the entries of the log files that are in use into the memory table.
+
+        Args:
+          log_number (int): number of the log file, where log files with a number
+              smaller than the number of the log file are no longer in use.
+          previous_log_number (int): number of the previous log file.
+
+        Raises:
+          ParseError: if a log file cannot be read.
+        """
+        log_file_numbers = []
+
+        path = self._file_system_helper.JoinPath(self._path_segments)
+        for name in self._file_system_helper.ListDirectory(path):
+            file_number, _, extension = name.partition(".")
+            if extension != "log" or not file_number.isdigit():
+                continue
+
+            file_number = int(file_number, 10)
+            if file_number >= log_number or file_number == previous_log_number:
+                log_file_numbers.append(file_number)
+
+        self._memory_table = {}
+
+        for file_number in sorted(log_file_numbers):
+            name = f"{file_number:06d}.log"
+
+            log_file = LevelDBDatabaseLogFile(
+                checksum_policy=self._checksum_policy,
+                debug=self._debug,
+                file_system_helper=self._file_system_helper,
+                output_writer=self._output_writer,
+            )
+            log_file.Open(self._GetPath(name))
+
+            try:
+                for log_entry in log_file.ReadEntries():
+                    memory_table_entry = self._memory_table.get(log_entry.key, None)
+                    if (
+                        not memory_table_entry
+                        or log_entry.sequence_number
+                        > memory_table_entry.sequence_number
+                    ):
+                        self._memory_table[log_entry.key] = log_entry
+
+            finally:
+                self.checksum_statistics[name] = log_file.checksum_statistics
+
+                log_file.Close()
+
+    def _ReadTableEntries(self, table_descriptors):
+        """Reads the entries of tables that do not overlap.
+
+        Args:
+          table_descriptors (list[LevelDBDatabaseTableDescriptor]): descriptors of
+              the tables, sorted by key.
+
+        Yields:
+          LevelDBDatabaseTableEntry: table entry.
+
+        Raises:
+          ParseError: if a table cannot be read.
+        """
+        for table_descriptor in table_descriptors:
+            table_file = self._GetTableFile(table_descriptor)
+            yield from table_file.ReadTableEntries()
+
+    def Close(self):
+        """Closes the database.
+
+        Raises:
+          OSError: if the database is not opened.
+        """
+        if self._path_segments is None:
+            raise OSError("Database not opened")
+
+        for table_file in self._table_files.values():
+            table_file.Close()
+
+        self._memory_table = {}
+        self._path_segments = None
+        self._table_descriptors = {}
+        self._table_files = {}
+
+    def Get(self, key):
+        """Retrieves the entry of a specific key.
+
+        The memory table is searched first, followed by the tables in level order,
+        where only the tables with a key range that contains the key are searched.
+
+        Args:
+          key (bytes): key.
+
+        Returns:
+          LevelDBDatabaseTableEntry: most recent entry of the key or None if the
+              key is not stored or has been deleted.
+
+        Raises:
+          ParseError: if a table cannot be read.
+        """
+        table_entry = self._memory_table.get(key, None)
+
+        if not table_entry:
+            for level in sorted(self._table_descriptors.keys()):
+                table_descriptors = self._table_descriptors[level]
+
+                if level > 0:
+                    # The tables in level 1 and higher do not overlap.
+                    table_index = bisect.bisect_left(
+                        table_descriptors,
+                        key,
+                        key=lambda table_descriptor: table_descriptor.largest_key,
+                    )
+                    table_descriptors = table_descriptors[table_index : table_index + 1]
+
+                for table_descriptor in table_descriptors:
+                    if (
+                        key < table_descriptor.smallest_key
+                        or key > table_descriptor.largest_key
+                    ):
+                        continue
+
+                    table_file = self._GetTableFile(table_descriptor)
+                    table_entry = table_file.Get(key)
+                    if table_entry:
+                        break
+
+                if table_entry:
+                    break
+
+        if not table_entry or table_entry.value_type == 0:
+            return None
+
+        return table_entry
+
+    def Open(self, path):
+        """Opens a database.
+
+        Args:
+          path (str): path of the database directory.
+
+        Raises:
+          OSError: if the database is already opened.
+          ParseError: if the database cannot be read.
+        """
+        if self._path_segments is not None:
+            raise OSError("Database already opened")
+
+        self._path_segments = self._file_system_helper.SplitPath(path)
+
+        self.checksum_statistics = {}
+        self.comparator_name = None
+
+        try:
+            current_file_path = self._GetPath("CURRENT")
+            if not self._file_system_helper.CheckFileExistsByPath(current_file_path):
+                raise errors.ParseError(f"Missing file: {current_file_path:s}")
+
+            file_object = self._file_system_helper.OpenFileByPath(current_file_path)
+            try:
+                descriptor_file_name = file_object.read(4096)
+            finally:
+                file_object.close()
+
+            try:
+                descriptor_file_name = descriptor_file_name.decode("utf-8").strip()
+            except UnicodeDecodeError as exception:
+                raise errors.ParseError(
+                    f"Unable to read descriptor file name with error: {exception!s}"
+                )
+
+            log_number, previous_log_number = self._ReadDescriptorFile(
+                descriptor_file_name
+            )
+            self._ReadLogFiles(log_number, previous_log_number)
+
+        except (OSError, errors.ParseError):
+            self._path_segments = None
+            raise
+
+    def ReadEntries(self):
+        """Reads the entries.
+
+        The entries of the memory table and the tables are merged in key order,
+        where only the most recent entry of a key is retained and deleted keys
+        are skipped. The tables are read while merging, instead of being read
+        into memory.
+
+        Yields:
+          LevelDBDatabaseTableEntry: most recent entry of a key, in key order.
+
+        Raises:
+          ParseError: if the entries cannot be read.
+        """
+        entry_iterators = [
+            sorted(self._memory_table.values(), key=lambda entry: entry.key)
+        ]
+
+        for level, table_descriptors in self._table_descriptors.items():
+            if level == 0:
+                for table_descriptor in table_descriptors:
+                    table_file = self._GetTableFile(table_descriptor)
+                    entry_iterators.append(table_file.ReadTableEntries())
+            else:
+                entry_iterators.append(self._ReadTableEntries(table_descriptors))
+
+        last_key = None
+        for table_entry in heapq.merge(
+            *entry_iterators, key=lambda entry: (entry.key, -entry.sequence_number)
+        ):
+            if table_entry.key == last_key:
+                continue
+
+            last_key = table_entry.key
+
+            if table_entry.value_type != 0:
+                yield table_entry
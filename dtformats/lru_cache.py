@@ -0,0 +1,124 @@
+"""Least recently used (LRU) cache."""
+
+import collections
+import threading
+
+
+class LRUCache:
+    """Least recently used (LRU) cache with a maximum size.
+
+    The size of the cache is the sum of the sizes of the cached values, as
+    determined by the size callback, for example the number of bytes of
+    (decompressed) pages. The cache can be shared by multiple threads.
+
+    Attributes:
+      maximum_size (int): maximum size of the cache.
+      number_of_hits (int): number of lookups that returned a cached value.
+      number_of_misses (int): number of lookups that did not return a cached
+          value.
+    """
+
+    def __init__(self, maximum_size, size_callback=len):
+        """Initializes a least recently used (LRU) cache.
+
+        Args:
+          maximum_size (int): maximum size of the cache.
+          size_callback (Optional[function]): function to determine the size of
+              a value, where the default is the length of the value.
+        """
+        super().__init__()
+        self._lock = threading.Lock()
+        self._size = 0
+        self._size_callback = size_callback
+        self._values = collections.OrderedDict()
+
+        self.maximum_size = maximum_size
+        self.number_of_hits = 0
+        self.number_of_misses = 0
+
+    @property
+    def hit_rate(self):
+        """float: fraction of lookups that returned a cached value."""
+        number_of_lookups = self.number_of_hits + self.number_of_misses
+        if not number_of_lookups:
+            return 0.0
+
+        return float(self.number_of_hits) / number_of_lookups
+
+    @property
+    def number_of_values(self):
+        """int: number of cached values."""
+        return len(self._values)
+
+    @property
+    def size(self):
+        """int: size of the cached values."""
+        return self._size
+
+    def __contains__(self, key):
+        """Determines if a value is cached.
+
+        The lookup does not affect the recently used order or the statistics.
+
+        Args:
+          key (object): key of the value.
+
+        Returns:
+          bool: True if a value is cached for the key.
+        """
+        return key in self._values
+
+    def Clear(self):
+        """Removes all values from the cache."""
+        with self._lock:
+            self._values.clear()
+            self._size = 0
+
+    def Get(self, key, default=None):
+        """Retrieves a cached value and marks it as most recently used.
+
+        Args:
+          key (object): key of the value.
+          default (Optional[object]): value to return if no value is cached for
+              the key.
+
+        Returns:
+          object: cached value or the default if no value is cached for the key.
+        """
+        with self._lock:
+            lookup_value = self._values.get(key, None)
+            if lookup_value is None:
+                self.number_of_misses += 1
+                return default
+
+            self._values.move_to_end(key)
+            self.number_of_hits += 1
+
+        return lookup_value[0]
+
+    def Put(self, key, value):
+        """Caches a value as most recently used.
+
+        Least recently used values are removed until the cache fits within its
+        maximum size. A value larger than the maximum size is not cached.
+
+        Args:
+          key (object): key of the value.
+          value (object): value.
+        """
+        value_size = self._size_callback(value)
+
+        with self._lock:
+            lookup_value = self._values.pop(key, None)
+            if lookup_value is not None:
+                self._size -= lookup_value[1]
+
+            if value_size > self.maximum_size:
+                return
+
+            while self._values and self._size + value_size > self.maximum_size:
+                _, (_, evicted_value_size) = self._values.popitem(last=False)
+                self._size -= evicted_value_size
+
+            self._values[key] = (value, value_size)
+            self._size += value_size
@@ -1,6 +1,11 @@
 """Output writer."""
 
 import abc
+import os
+import sqlite3
+import sys
+
+from dfdatetime import posix_time as dfdatetime_posix_time
 
 
 class OutputWriter:
@@ -70,3 +75,726 @@ class StdoutWriter(OutputWriter):
         alignment, _ = divmod(len(description_no_tabs), 8)
         alignment_string = "\t" * (8 - alignment + 1)
         self.WriteText(f"{description:s}{alignment_string:s}: {value!s}\n")
+
+
+class LogEntryJSONWriter(OutputWriter):
+    """Apple Unified Logging log entry JSON output writer.
+
+    Log entries are written in the format of "log show --style json" or, if
+    JSON lines is enabled, as one compact JSON object per line. Output is
+    buffered and written to the file-like object in large batches.
+    """
+
+    _DEFAULT_MAXIMUM_BUFFER_SIZE = 1024 * 1024
+
+    # Event types of which the event message is stored after the machTimestamp.
+    _LATE_EVENT_MESSAGE_EVENT_TYPES = frozenset(
+        ["activityCreateEvent", "lossEvent", "signpostEvent", "userActionEvent"]
+    )
+
+    _NO_FORMAT_STRING_EVENT_TYPES = frozenset(
+        ["activityCreateEvent", "userActionEvent"]
+    )
+
+    _NO_SOURCE_EVENT_TYPES = frozenset(
+        ["activityCreateEvent", "lossEvent", "userActionEvent"]
+    )
+
+    _KEYS = (
+        "activityIdentifier",
+        "backtrace",
+        "bootUUID",
+        "category",
+        "creatorActivityID",
+        "eventMessage",
+        "eventType",
+        "formatString",
+        "lossCount",
+        "lossCountSaturated",
+        "lossEndMachContinuousTimestamp",
+        "lossEndTimestamp",
+        "lossStartMachContinuousTimestamp",
+        "lossStartTimestamp",
+        "machTimestamp",
+        "messageType",
+        "parentActivityIdentifier",
+        "processID",
+        "processImagePath",
+        "processImageUUID",
+        "senderImagePath",
+        "senderImageUUID",
+        "senderProgramCounter",
+        "signpostID",
+        "signpostName",
+        "signpostScope",
+        "signpostType",
+        "source",
+        "subsystem",
+        "threadID",
+        "timestamp",
+        "timezoneName",
+        "traceID",
+    )
+
+    _JSON_KEY_PREFIXES = {key: f'  "{key:s}" : ' for key in _KEYS}
+
+    _JSON_LINES_KEY_PREFIXES = {key: f'"{key:s}":' for key in _KEYS}
+
+    _PATH_TRANSLATION_TABLE = str.maketrans({'"': '\\"', "/": "\\/", "\\": "\\\\"})
+
+    _SENDER_IMAGE_PATH_TRANSLATION_TABLE = str.maketrans({'"': '\\"', "/": "\\/"})
+
+    _STRING_TRANSLATION_TABLE = str.maketrans(
+        {'"': '\\"', "/": "\\/", "\\": "\\\\", "\n": "\\n", "\t": "\\t"}
+    )
+
+    def __init__(
+        self,
+        activity_index=None,
+        file_object=None,
+        json_lines=False,
+        maximum_buffer_size=None,
+    ):
+        """Initializes a log entry JSON output writer.
+
+        Args:
+          activity_index (Optional[ActivityIndex]): activity index used to
+              determine the parent activity identifier of log entries, where None
+              represents that only the parent activity identifier stored in
+              a log entry is used.
+          file_object (Optional[file]): file-like object to write to, where None
+              represents stdout.
+          json_lines (Optional[bool]): True if the log entries should be written
+              as JSON lines.
+          maximum_buffer_size (Optional[int]): maximum number of characters to
+              buffer before writing to the file-like object.
+        """
+        super().__init__()
+        self._activity_index = activity_index
+        self._buffer = []
+        self._buffer_size = 0
+        self._file_object = file_object
+        self._json_lines = json_lines
+        self._maximum_buffer_size = (
+            maximum_buffer_size or self._DEFAULT_MAXIMUM_BUFFER_SIZE
+        )
+        self._number_of_log_entries = 0
+
+        if json_lines:
+            self._key_prefixes = self._JSON_LINES_KEY_PREFIXES
+            self._separator = ","
+        else:
+            self._key_prefixes = self._JSON_KEY_PREFIXES
+            self._separator = ",\n"
+
+    def _FlushBuffer(self):
+        """Writes the buffered output to the file-like object."""
+        if self._buffer:
+            file_object = self._file_object or sys.stdout
+            file_object.write("".join(self._buffer))
+
+            self._buffer = []
+            self._buffer_size = 0
+
+    def _FormatBacktrace(self, backtrace_frames):
+        """Formats a backtrace.
+
+        Args:
+          backtrace_frames (list[BacktraceFrame]): backtrace frames.
+
+        Returns:
+          str: JSON formatted backtrace.
+        """
+        frames = []
+        for backtrace_frame in backtrace_frames:
+            image_identifier = str(backtrace_frame.image_identifier).upper()
+
+            if self._json_lines:
+                frames.append(
+                    f'{{"imageOffset":{backtrace_frame.image_offset:d},'
+                    f'"imageUUID":"{image_identifier:s}"}}'
+                )
+            else:
+                frames.append(
+                    f"      {{\n"
+                    f'        "imageOffset" : {backtrace_frame.image_offset:d},\n'
+                    f'        "imageUUID" : "{image_identifier:s}"\n'
+                    f"      }}"
+                )
+
+        if self._json_lines:
+            frames_string = ",".join(frames)
+            return f'{{"frames":[{frames_string:s}]}}'
+
+        frames_string = ",\n".join(frames)
+        return f'{{\n    "frames" : [\n{frames_string:s}\n    ]\n  }}'
+
+    def _FormatLogEntry(self, log_entry):
+        """Formats a log entry.
+
+        Args:
+          log_entry (LogEntry): log entry.
+
+        Returns:
+          str: JSON formatted log entry.
+        """
+        activity_identifier = log_entry.activity_identifier or 0
+        category = log_entry.category or ""
+        date_time_string = self._FormatTimestamp(log_entry.timestamp)
+        event_type = log_entry.event_type or ""
+        process_identifier = log_entry.process_identifier or 0
+        sender_program_counter = log_entry.sender_program_counter or 0
+        sub_system = log_entry.sub_system or ""
+        thread_identifier = log_entry.thread_identifier or 0
+
+        boot_identifier = str(log_entry.boot_identifier).upper()
+
+        event_message = (log_entry.event_message or "").rstrip()
+        if len(event_message) >= 1085:
+            event_message = "".join([event_message[:1087], "<…>"])
+
+        event_message = event_message.translate(self._STRING_TRANSLATION_TABLE)
+
+        if event_type in self._NO_FORMAT_STRING_EVENT_TYPES:
+            format_string = ""
+        else:
+            format_string = (log_entry.format_string or "").translate(
+                self._STRING_TRANSLATION_TABLE
+            )
+
+        process_image_identifier = ""
+        if log_entry.process_image_identifier:
+            process_image_identifier = str(log_entry.process_image_identifier).upper()
+
+        process_image_path = (log_entry.process_image_path or "").translate(
+            self._PATH_TRANSLATION_TABLE
+        )
+
+        sender_image_identifier = ""
+        if log_entry.sender_image_identifier:
+            sender_image_identifier = str(log_entry.sender_image_identifier).upper()
+
+        sender_image_path = (log_entry.sender_image_path or "").translate(
+            self._SENDER_IMAGE_PATH_TRANSLATION_TABLE
+        )
+
+        if event_type == "timesyncEvent":
+            values = [
+                ("bootUUID", f'"{boot_identifier:s}"'),
+                ("category", f'"{category:s}"'),
+                ("processImageUUID", f'"{process_image_identifier:s}"'),
+                ("eventType", f'"{event_type:s}"'),
+                ("threadID", f"{thread_identifier:d}"),
+                ("timestamp", f'"{date_time_string:s}"'),
+                ("activityIdentifier", f"{activity_identifier:d}"),
+                ("senderProgramCounter", f"{sender_program_counter:d}"),
+                ("parentActivityIdentifier", "0"),
+                ("machTimestamp", f"{log_entry.mach_timestamp:d}"),
+                ("processID", f"{process_identifier:d}"),
+                ("subsystem", f'"{sub_system:s}"'),
+                ("timezoneName", '""'),
+                ("traceID", f"{log_entry.trace_identifier:d}"),
+                ("eventMessage", f'"{event_message:s}"'),
+                ("formatString", f'"{format_string:s}"'),
+                ("processImagePath", f'"{process_image_path:s}"'),
+                ("senderImageUUID", f'"{sender_image_identifier:s}"'),
+                ("senderImagePath", f'"{sender_image_path:s}"'),
+            ]
+            return self._FormatValues(values)
+
+        creator_activity_identifier = log_entry.creator_activity_identifier
+        has_late_event_message = event_type in self._LATE_EVENT_MESSAGE_EVENT_TYPES
+        has_loss = log_entry.loss_count is not None
+        has_signpost = log_entry.signpost_identifier is not None
+
+        values = [("traceID", f"{log_entry.trace_identifier:d}")]
+
+        if not has_late_event_message:
+            values.append(("eventMessage", f'"{event_message:s}"'))
+
+        values.append(("eventType", f'"{event_type:s}"'))
+
+        if has_loss:
+            # TODO: improve support for lossCountSaturated
+            values.extend(
+                [
+                    ("lossCount", f"{log_entry.loss_count:d}"),
+                    ("lossCountSaturated", "true"),
+                ]
+            )
+
+        if has_signpost:
+            signpost_scope = log_entry.signpost_scope or ""
+
+            values.extend(
+                [
+                    ("signpostID", f"{log_entry.signpost_identifier:d}"),
+                    ("signpostScope", f'"{signpost_scope:s}"'),
+                ]
+            )
+
+        if event_type not in self._NO_SOURCE_EVENT_TYPES:
+            # TODO: implement source support.
+            values.append(("source", "null"))
+
+        values.append(("formatString", f'"{format_string:s}"'))
+
+        if has_loss:
+            values.append(
+                (
+                    "lossEndMachContinuousTimestamp",
+                    f"{log_entry.loss_end_mach_timestamp:d}",
+                )
+            )
+
+        values.extend(
+            [
+                ("activityIdentifier", f"{activity_identifier:d}"),
+                ("subsystem", f'"{sub_system:s}"'),
+                ("category", f'"{category:s}"'),
+                ("threadID", f"{thread_identifier:d}"),
+                ("senderImageUUID", f'"{sender_image_identifier:s}"'),
+            ]
+        )
+
+        if has_signpost:
+            signpost_type = log_entry.signpost_type or ""
+
+            values.append(("signpostType", f'"{signpost_type:s}"'))
+
+        if log_entry.backtrace_frames:
+            values.append(
+                ("backtrace", self._FormatBacktrace(log_entry.backtrace_frames))
+            )
+
+        values.extend(
+            [
+                ("bootUUID", f'"{boot_identifier:s}"'),
+                ("processImagePath", f'"{process_image_path:s}"'),
+                ("timestamp", f'"{date_time_string:s}"'),
+                ("senderImagePath", f'"{sender_image_path:s}"'),
+            ]
+        )
+
+        if creator_activity_identifier is not None:
+            if self._activity_index:
+                self._activity_index.AddLogEntry(log_entry)
+
+            values.append(("creatorActivityID", f"{creator_activity_identifier:d}"))
+
+        elif has_loss:
+            start_time_string = self._FormatTimestamp(log_entry.loss_start_timestamp)
+            end_time_string = self._FormatTimestamp(log_entry.loss_end_timestamp)
+
+            values.extend(
+                [
+                    (
+                        "lossStartMachContinuousTimestamp",
+                        f"{log_entry.loss_start_mach_timestamp:d}",
+                    ),
+                    ("lossEndTimestamp", f'"{end_time_string:s}"'),
+                    ("lossStartTimestamp", f'"{start_time_string:s}"'),
+                ]
+            )
+
+        elif has_signpost:
+            signpost_name = log_entry.signpost_name or ""
+
+            values.append(("signpostName", f'"{signpost_name:s}"'))
+
+        values.append(("machTimestamp", f"{log_entry.mach_timestamp:d}"))
+
+        if has_late_event_message:
+            values.append(("eventMessage", f'"{event_message:s}"'))
+        else:
+            message_type = log_entry.message_type or ""
+
+            values.append(("messageType", f'"{message_type:s}"'))
+
+        if log_entry.parent_activity_identifier:
+            parent_activity_identifier = log_entry.parent_activity_identifier
+        elif self._activity_index:
+            parent_activity_identifier = (
+                self._activity_index.GetParentActivityIdentifier(activity_identifier)
+                or 0
+            )
+        else:
+            parent_activity_identifier = 0
+
+        if parent_activity_identifier == creator_activity_identifier:
+            parent_activity_identifier = 0
+
+        values.extend(
+            [
+                ("processImageUUID", f'"{process_image_identifier:s}"'),
+                ("processID", f"{process_identifier:d}"),
+                ("senderProgramCounter", f"{sender_program_counter:d}"),
+                ("parentActivityIdentifier", f"{parent_activity_identifier:d}"),
+                ("timezoneName", '""'),
+            ]
+        )
+
+        return self._FormatValues(values)
+
+    def _FormatTimestamp(self, timestamp):
+        """Formats a timestamp.
+
+        Args:
+          timestamp (int): number of nanoseconds since January 1, 1970
+              00:00:00.000000000.
+
+        Returns:
+          str: date and time string.
+        """
+        if timestamp is None:
+            return "YYYY-MM-DD hh:ss:mm.######+####"
+
+        date_time = dfdatetime_posix_time.PosixTimeInNanoseconds(timestamp=timestamp)
+        iso8601_string = date_time.CopyToDateTimeStringISO8601()
+        return "".join(
+            [
+                iso8601_string[:10],
+                " ",
+                iso8601_string[11:26],
+                iso8601_string[29:32],
+                iso8601_string[33:35],
+            ]
+        )
+
+    def _FormatValues(self, values):
+        """Formats JSON values.
+
+        Args:
+          values (list[tuple[str, str]]): key and JSON formatted value pairs.
+
+        Returns:
+          str: JSON formatted values.
+        """
+        key_prefixes = self._key_prefixes
+        return self._separator.join(
+            [f"{key_prefixes[key]:s}{value:s}" for key, value in values]
+        )
+
+    def Close(self):
+        """Closes the output writer object."""
+        if not self._json_lines:
+            self.WriteText("}]")
+
+        self._FlushBuffer()
+
+    def Open(self):
+        """Opens the output writer object."""
+        self._number_of_log_entries = 0
+
+        if not self._json_lines:
+            self.WriteText("[{\n")
+
+    def WriteLogEntry(self, log_entry):
+        """Writes a log entry.
+
+        Args:
+          log_entry (LogEntry): log entry.
+        """
+        text = self._FormatLogEntry(log_entry)
+
+        if self._json_lines:
+            self.WriteText(f"{{{text:s}}}\n")
+        elif self._number_of_log_entries > 0:
+            self.WriteText(f"}},{{\n{text:s}\n")
+        else:
+            self.WriteText(f"{text:s}\n")
+
+        self._number_of_log_entries += 1
+
+    def WriteText(self, text):
+        """Writes text to the output.
+
+        Args:
+          text (str): text to write.
+        """
+        self._buffer.append(text)
+        self._buffer_size += len(text)
+
+        if self._buffer_size >= self._maximum_buffer_size:
+            self._FlushBuffer()
+
+    def WriteValue(self, description, value):
+        """Writes a value.
+
+        Args:
+          description (str): description.
+          value (object): value.
+        """
+        description_no_tabs = description.replace("\t", " " * 8)
+        alignment, _ = divmod(len(description_no_tabs), 8)
+        alignment_string = "\t" * (8 - alignment + 1)
+        self.WriteText(f"{description:s}{alignment_string:s}: {value!s}\n")
+
+
+class LogEntrySQLiteWriter:
+    """Apple Unified Logging log entry SQLite database writer.
+
+    Log entries are inserted in batches inside large transactions. Frequently
+    repeated strings, such as sub systems, categories, format strings and image
+    paths, are stored once in separate tables and referenced by identifier.
+    The indexes on timestamp, process identifier and sub system are created
+    after the log entries have been inserted.
+
+    Note that SQLite only supports signed 64-bit integers, hence 64-bit values
+    such as the trace identifier are stored as two's complement.
+    """
+
+    _DEFAULT_BATCH_SIZE = 10000
+
+    _DEFAULT_TRANSACTION_SIZE = 1000000
+
+    _INDEXES = {
+        "log_entries_process_identifier": "process_identifier",
+        "log_entries_sub_system_identifier": "sub_system_identifier",
+        "log_entries_timestamp": "timestamp",
+    }
+
+    _LOG_ENTRIES_COLUMNS = (
+        ("identifier", "INTEGER PRIMARY KEY"),
+        ("timestamp", "INTEGER"),
+        ("mach_timestamp", "INTEGER"),
+        ("boot_identifier", "TEXT"),
+        ("event_type", "TEXT"),
+        ("message_type", "TEXT"),
+        ("process_identifier", "INTEGER"),
+        ("thread_identifier", "INTEGER"),
+        ("activity_identifier", "INTEGER"),
+        ("creator_activity_identifier", "INTEGER"),
+        ("parent_activity_identifier", "INTEGER"),
+        ("trace_identifier", "INTEGER"),
+        ("ttl", "INTEGER"),
+        ("sub_system_identifier", "INTEGER"),
+        ("category_identifier", "INTEGER"),
+        ("format_string_identifier", "INTEGER"),
+        ("event_message", "TEXT"),
+        ("process_image_identifier", "TEXT"),
+        ("process_image_path_identifier", "INTEGER"),
+        ("sender_image_identifier", "TEXT"),
+        ("sender_image_path_identifier", "INTEGER"),
+        ("sender_program_counter", "INTEGER"),
+        ("signpost_identifier", "INTEGER"),
+        ("signpost_name", "TEXT"),
+        ("signpost_scope", "TEXT"),
+        ("signpost_type", "TEXT"),
+        ("loss_count", "INTEGER"),
+        ("loss_start_timestamp", "INTEGER"),
+        ("loss_end_timestamp", "INTEGER"),
+    )
+
+    _STRING_TABLE_NAMES = ("categories", "format_strings", "image_paths", "sub_systems")
+
+    def __init__(self, batch_size=None, transaction_size=None):
+        """Initializes a log entry SQLite database writer.
+
+        Args:
+          batch_size (Optional[int]): number of log entries to insert per batch.
+          transaction_size (Optional[int]): number of log entries to insert per
+              transaction.
+        """
+        super().__init__()
+        self._batch_size = batch_size or self._DEFAULT_BATCH_SIZE
+        self._connection = None
+        self._log_entry_rows = []
+        self._number_of_log_entries_in_transaction = 0
+        self._string_identifiers = {}
+        self._string_rows = {}
+        self._transaction_size = transaction_size or self._DEFAULT_TRANSACTION_SIZE
+
+        column_names = ", ".join([name for name, _ in self._LOG_ENTRIES_COLUMNS[1:]])
+        placeholders = ", ".join(["?"] * (len(self._LOG_ENTRIES_COLUMNS) - 1))
+        self._insert_log_entry_query = (
+            f"INSERT INTO log_entries ({column_names:s}) VALUES ({placeholders:s})"
+        )
+
+    def _FlushLogEntries(self):
+        """Inserts the batched log entries and referenced strings."""
+        for table_name, string_rows in self._string_rows.items():
+            if string_rows:
+                self._connection.executemany(
+                    f"INSERT INTO {table_name:s} (identifier, value) VALUES (?, ?)",
+                    string_rows,
+                )
+                self._string_rows[table_name] = []
+
+        if self._log_entry_rows:
+            self._connection.executemany(
+                self._insert_log_entry_query, self._log_entry_rows
+            )
+            self._number_of_log_entries_in_transaction += len(self._log_entry_rows)
+            self._log_entry_rows = []
+
+        if self._number_of_log_entries_in_transaction >= self._transaction_size:
+            self._connection.commit()
+            self._number_of_log_entries_in_transaction = 0
+
+    def _GetSignedInteger64(self, integer):
+        """Retrieves a 64-bit integer as two's complement signed integer.
+
+        Args:
+          integer (int): unsigned 64-bit integer or None.
+
+        Returns:
+          int: signed 64-bit integer or None if not set.
+        """
+        if integer is None or integer < 0x8000000000000000:
+            return integer
+
+        return integer - 0x10000000000000000
+
+    def _GetStringIdentifier(self, table_name, string):
+        """Retrieves the identifier of an interned string.
+
+        Args:
+          table_name (str): name of the string table.
+          string (str): string or None.
+
+        Returns:
+          int: identifier of the string in the string table or None if the string
+              is not set.
+        """
+        if string is None:
+            return None
+
+        string_identifiers = self._string_identifiers[table_name]
+        identifier = string_identifiers.get(string, None)
+        if identifier is None:
+            identifier = len(string_identifiers) + 1
+            string_identifiers[string] = identifier
+            self._string_rows[table_name].append((identifier, string))
+
+        return identifier
+
+    def Close(self):
+        """Closes the SQLite database.
+
+        Raises:
+          OSError: if the database is not opened.
+        """
+        if not self._connection:
+            raise OSError("Database not opened")
+
+        self._FlushLogEntries()
+        self._connection.commit()
+
+        for index_name, column_name in self._INDEXES.items():
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {index_name:s} ON log_entries "
+                f"({column_name:s})"
+            )
+
+        self._connection.commit()
+        self._connection.close()
+        self._connection = None
+
+    def Open(self, path):
+        """Opens the SQLite database.
+
+        If the database already exists, log entries are appended.
+
+        Args:
+          path (str): path of the SQLite database.
+
+        Raises:
+          OSError: if the database is already opened.
+        """
+        if self._connection:
+            raise OSError("Database already opened")
+
+        database_exists = os.path.exists(path)
+
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode = MEMORY")
+        self._connection.execute("PRAGMA synchronous = OFF")
+
+        self._log_entry_rows = []
+        self._number_of_log_entries_in_transaction = 0
+
+        for table_name in self._STRING_TABLE_NAMES:
+            self._string_identifiers[table_name] = {}
+            self._string_rows[table_name] = []
+
+        if not database_exists:
+            for table_name in self._STRING_TABLE_NAMES:
+                self._connection.execute(
+                    f"CREATE TABLE {table_name:s} (identifier INTEGER PRIMARY KEY, "
+                    f"value TEXT)"
+                )
+
+            column_definitions = ", ".join(
+                [
+                    f"{name:s} {column_type:s}"
+                    for name, column_type in self._LOG_ENTRIES_COLUMNS
+                ]
+            )
+            self._connection.execute(
+                f"CREATE TABLE log_entries ({column_definitions:s})"
+            )
+
+        else:
+            for table_name in self._STRING_TABLE_NAMES:
+                string_identifiers = self._string_identifiers[table_name]
+                for identifier, string in self._connection.execute(
+                    f"SELECT identifier, value FROM {table_name:s}"
+                ):
+                    string_identifiers[string] = identifier
+
+        self._connection.commit()
+
+    def WriteLogEntry(self, log_entry):
+        """Writes a log entry.
+
+        Args:
+          log_entry (LogEntry): log entry.
+        """
+        process_image_identifier = None
+        if log_entry.process_image_identifier:
+            process_image_identifier = str(log_entry.process_image_identifier).upper()
+
+        sender_image_identifier = None
+        if log_entry.sender_image_identifier:
+            sender_image_identifier = str(log_entry.sender_image_identifier).upper()
+
+        boot_identifier = None
+        if log_entry.boot_identifier:
+            boot_identifier = str(log_entry.boot_identifier).upper()
+
+        self._log_entry_rows.append(
+            (
+                log_entry.timestamp,
+                log_entry.mach_timestamp,
+                boot_identifier,
+                log_entry.event_type,
+                log_entry.message_type,
+                log_entry.process_identifier,
+                log_entry.thread_identifier,
+                self._GetSignedInteger64(log_entry.activity_identifier),
+                self._GetSignedInteger64(log_entry.creator_activity_identifier),
+                self._GetSignedInteger64(log_entry.parent_activity_identifier),
+                self._GetSignedInteger64(log_entry.trace_identifier),
+                log_entry.ttl,
+                self._GetStringIdentifier("sub_systems", log_entry.sub_system),
+                self._GetStringIdentifier("categories", log_entry.category),
+                self._GetStringIdentifier("format_strings", log_entry.format_string),
+                log_entry.event_message,
+                process_image_identifier,
+                self._GetStringIdentifier("image_paths", log_entry.process_image_path),
+                sender_image_identifier,
+                self._GetStringIdentifier("image_paths", log_entry.sender_image_path),
+                self._GetSignedInteger64(log_entry.sender_program_counter),
+                self._GetSignedInteger64(log_entry.signpost_identifier),
+                log_entry.signpost_name,
+                log_entry.signpost_scope,
+                log_entry.signpost_type,
+                log_entry.loss_count,
+                log_entry.loss_start_timestamp,
+                log_entry.loss_end_timestamp,
+            )
+        )
+
+        if len(self._log_entry_rows) >= self._batch_size:
+            self._FlushLogEntries()
@@ -1,8 +1,15 @@
 """Apple Spotlight store database files."""
 
+import array
+import collections
+import hashlib
 import os
+import sqlite3
+import sys
 import zlib
 
+from concurrent import futures
+
 import lz4.block
 
 from dfdatetime import cocoa_time as dfdatetime_cocoa_time
@@ -12,6 +19,8 @@ from dtfabric.runtime import data_maps as dtfabric_data_maps
 
 from dtformats import data_format
 from dtformats import errors
+from dtformats import lru_cache
+from dtformats import varint
 
 
 class SpotlightStoreIndexValue:
@@ -127,8 +136,15 @@ class SpotlightStoreRecordHeader:
 class SpotlightStreamsMapDataFile(data_format.BinaryDataFile):
     """Apple Spotlight database streams map data file (dbStr-#.map.data).
 
+    The stream values are not copied into separate objects, instead the data
+    is stored in a single buffer and the stream values are referenced by their
+    offsets in the buffer.
+
     Attributes:
-      stream_values (list[bytes]): stream values.
+      data (bytes): data of the stream values.
+      offsets (array.array): offsets of the stream values relative to the start
+          of the data, where the end offset of stream value N is stored at
+          index N + 1.
     """
 
     # Using a class constant significantly speeds up the time required to load
@@ -142,7 +158,7 @@ class SpotlightStreamsMapDataFile(data_format.BinaryDataFile):
     def __init__(
         self,
         data_size,
-        ranges,
+        offsets,
         debug=False,
         file_system_helper=None,
         output_writer=None,
@@ -151,8 +167,8 @@ class SpotlightStreamsMapDataFile(data_format.BinaryDataFile):
 
         Args:
           data_size (int): data size.
-          ranges (list[tuple[int, int]]): offset and size pairs of the stream value
-              data ranges.
+          offsets (array.array): offsets of the stream values, where the end offset
+              of stream value N is stored at index N + 1.
           debug (Optional[bool]): True if debug information should be written.
           file_system_helper (Optional[FileSystemHelper]): file system helper.
           output_writer (Optional[OutputWriter]): output writer.
@@ -163,42 +179,43 @@ class SpotlightStreamsMapDataFile(data_format.BinaryDataFile):
             output_writer=output_writer,
         )
         self._data_size = data_size
-        self._ranges = ranges
-        self.stream_values = []
+        self.data = b""
+        self.offsets = offsets
+
+    @property
+    def number_of_stream_values(self):
+        """int: number of stream values."""
+        return max(len(self.offsets) - 1, 0)
 
-    def _ReadVariableSizeInteger(self, data):
+    def _ReadVariableSizeInteger(self, data, data_offset=0):
         """Reads a variable size integer.
 
         Args:
           data (bytes): data.
+          data_offset (Optional[int]): offset of the integer relative to the start
+              of the data.
 
         Returns:
           tuple[int, int]: integer value and number of bytes read.
         """
-        byte_value = data[0]
-        bytes_read = 1
+        return varint.ReadSpotlightVariableSizeInteger(data, data_offset)
 
-        number_of_additional_bytes = 0
-        for bitmask in (0x80, 0xC0, 0xE0, 0xF0, 0xF8, 0xFC, 0xFE, 0xFF):
-            if byte_value & bitmask != bitmask:
-                break
-            number_of_additional_bytes += 1
-
-        if number_of_additional_bytes > 4:
-            byte_value = 0
-        elif number_of_additional_bytes > 0:
-            byte_value &= bitmask ^ 0xFF
+    def GetStreamValue(self, index):
+        """Retrieves a stream value.
 
-        integer_value = int(byte_value)
-        while number_of_additional_bytes > 0:
-            integer_value <<= 8
+        Args:
+          index (int): index of the stream value.
 
-            integer_value += int(data[bytes_read])
-            bytes_read += 1
+        Returns:
+          memoryview: stream value data, without copying the data.
 
-            number_of_additional_bytes -= 1
+        Raises:
+          IndexError: if the index is out of bounds.
+        """
+        if index < 0 or index >= self.number_of_stream_values:
+            raise IndexError(f"Stream value index: {index:d} out of bounds")
 
-        return integer_value, bytes_read
+        return memoryview(self.data)[self.offsets[index] : self.offsets[index + 1]]
 
     def ReadFileObject(self, file_object):
         """Reads a database streams map data file-like object.
@@ -209,24 +226,19 @@ class SpotlightStreamsMapDataFile(data_format.BinaryDataFile):
         Raises:
           ParseError: if the file cannot be read.
         """
-        data = file_object.read(self._data_size)
+        self.data = file_object.read(self._data_size)
 
-        for index, value_range in enumerate(self._ranges):
-            value_offset, value_size = value_range
-
-            stream_value = data[value_offset : value_offset + value_size]
+        if self._debug:
+            for index in range(self.number_of_stream_values):
+                value_offset = self.offsets[index]
+                value_end_offset = self.offsets[index + 1]
+                value_size = value_end_offset - value_offset
 
-            if self._debug:
                 message = (
                     f"Stream value: {index:d} at offset: 0x{value_offset:08x} of "
                     f"size: {value_size:d}"
                 )
-                self._DebugPrintData(
-                    message,
-                    stream_value,
-                )
-
-            self.stream_values.append(stream_value)
+                self._DebugPrintData(message, self.data[value_offset:value_end_offset])
 
         if self._debug and self._data_size < self._file_size:
             trailing_data = file_object.read(self._file_size - self._data_size)
@@ -303,8 +315,9 @@ class SpotlightStreamsMapOffsetsFile(data_format.BinaryDataFile):
     """Apple Spotlight database streams map offsets file (dbStr-#.map.offsets).
 
     Attributes:
-      ranges (list[tuple[int, int]]): offset and size pairs of the stream value
-          data ranges.
+      offsets (array.array): offsets of the stream values relative to the start
+          of the data, where the end offset of stream value N is stored at
+          index N + 1.
     """
 
     # Using a class constant significantly speeds up the time required to load
@@ -339,7 +352,7 @@ class SpotlightStreamsMapOffsetsFile(data_format.BinaryDataFile):
         )
         self._data_size = data_size
         self._number_of_entries = number_of_entries
-        self.ranges = []
+        self.offsets = array.array("I")
 
     def ReadFileObject(self, file_object):
         """Reads a database streams map offsets file-like object.
@@ -353,50 +366,34 @@ class SpotlightStreamsMapOffsetsFile(data_format.BinaryDataFile):
         data_size = self._number_of_entries * 4
         data = file_object.read(data_size)
 
-        data_type_map = self._GetDataTypeMap("array_of_uint32le")
-
-        context = dtfabric_data_maps.DataTypeMapContext(
-            values={"number_of_elements": self._number_of_entries}
-        )
-        try:
-            offsets_array = data_type_map.MapByteStream(data, context=context)
-
-        except dtfabric_errors.MappingError as exception:
+        if len(data) != data_size:
             raise errors.ParseError(
-                f"Unable to parse array of 32-bit offsets with error: {exception!s}"
+                f"Unable to parse array of 32-bit offsets with error: data size: "
+                f"{len(data):d} does not match expected size: {data_size:d}"
             )
 
-        index = 0
-        last_offset = 0
-
-        for index, offset in enumerate(offsets_array):
-            if index == 0:
-                last_offset = offsets_array[0]
-                continue
-
-            range_size = offset - last_offset
-
-            if self._debug:
-                self._DebugPrintValue(
-                    f"Range: {index:d}",
-                    (f"0x{last_offset:08x} - 0x{offset:08x} ({range_size:d})"),
-                )
+        # The offsets are decoded in a single pass instead of per value.
+        self.offsets = array.array("I")
+        self.offsets.frombytes(data)
 
-            self.ranges.append((last_offset, range_size))
+        if sys.byteorder == "big":
+            self.offsets.byteswap()
 
-            last_offset = offset
+        # The end offset of the last stream value is the data size.
+        if self.offsets and self.offsets[-1]:
+            self.offsets.append(self._data_size)
 
-        if last_offset:
-            range_size = self._data_size - last_offset
+        if self._debug:
+            for index in range(1, len(self.offsets)):
+                last_offset = self.offsets[index - 1]
+                offset = self.offsets[index]
+                range_size = offset - last_offset
 
-            if self._debug:
                 self._DebugPrintValue(
                     f"Range: {index:d}",
-                    (f"0x{last_offset:08x} - 0x{self._data_size:08x} ({range_size:d})"),
+                    (f"0x{last_offset:08x} - 0x{offset:08x} ({range_size:d})"),
                 )
 
-            self.ranges.append((last_offset, range_size))
-
         if self._debug:
             self._DebugPrintText("\n")
 
@@ -417,12 +414,36 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
         custom_format_callbacks={"signature": "_FormatStreamAsString"},
     )
 
-    def __init__(self, debug=False, file_system_helper=None, output_writer=None):
+    # Sizes of the values of metadata attribute value types that are stored
+    # without a data size.
+    _FIXED_SIZE_VALUE_TYPE_SIZES = {0x08: 1, 0x09: 4, 0x0A: 8, 0x0C: 8}
+
+    # Maximum size of the uncompressed record pages cache, in bytes.
+    _MAXIMUM_RECORD_PAGES_CACHE_SIZE = 64 * 1024 * 1024
+
+    # Size of the chunks in which the map is read to determine the identity.
+    _IDENTITY_READ_SIZE = 1024 * 1024
+
+    def __init__(
+        self,
+        debug=False,
+        file_system_helper=None,
+        maximum_record_pages_cache_size=None,
+        number_of_decompression_threads=None,
+        output_writer=None,
+    ):
         """Initializes a store database file.
 
         Args:
           debug (Optional[bool]): True if debug information should be written.
           file_system_helper (Optional[FileSystemHelper]): file system helper.
+          maximum_record_pages_cache_size (Optional[int]): maximum size of
+              the uncompressed record pages cache, in bytes, where None represents
+              the default size.
+          number_of_decompression_threads (Optional[int]): number of threads
+              used to decompress record pages ahead of reading them, where None
+              or 1 represents decompressing the record pages in the calling
+              thread.
           output_writer (Optional[OutputWriter]): output writer.
         """
         super().__init__(
@@ -430,13 +451,22 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
             file_system_helper=file_system_helper,
             output_writer=output_writer,
         )
+        self._identity = None
         self._map_values = []
+        self._number_of_decompression_threads = number_of_decompression_threads or 1
         self._metadata_lists = {}
         self._metadata_localized_strings = {}
         self._metadata_types = {}
         self._metadata_values = {}
         self._record_descriptors = {}
-        self._record_pages_cache = {}
+        self._record_pages_cache = lru_cache.LRUCache(
+            maximum_record_pages_cache_size or self._MAXIMUM_RECORD_PAGES_CACHE_SIZE
+        )
+
+    @property
+    def identity(self):
+        """str: size and hash of the file header and map or None if not read."""
+        return self._identity
 
     @property
     def number_of_metadata_items(self):
@@ -676,12 +706,125 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
 
         return b"".join(uncompressed_blocks)
 
-    def _GetMetadataItemByIdentifier(self, file_object, identifier):
+    def _DecompressRecordPageData(self, page_header, page_data, file_offset):
+        """Decompresses record page data.
+
+        Args:
+          page_header (spotlight_store_db_property_page_header): page header.
+          page_data (bytes): page data.
+          file_offset (int): offset of the page data relative to the start of
+              the file.
+
+        Returns:
+          bytes: uncompressed page data.
+
+        Raises:
+          ParseError: if the page data cannot be decompressed.
+        """
+        if page_header.uncompressed_page_size > 0:
+            compressed_page_data = page_data
+
+            if page_header.property_table_type & 0x00001000 and compressed_page_data[
+                0:4
+            ] in (b"bv41", b"bv4-"):
+                page_data = self._DecompressLZ4PageData(
+                    compressed_page_data, file_offset
+                )
+
+            elif compressed_page_data[0] == 0x78:
+                page_data = zlib.decompress(compressed_page_data)
+
+            # TODO: add support for other compression types.
+            else:
+                if self._debug:
+                    self._DebugPrintData("Data", page_data)
+
+                raise errors.ParseError("Unsupported compression type")
+
+        return page_data
+
+    def _GetIdentity(self, file_object, file_header):
+        """Determines the identity of the database.
+
+        The file header and map change when the database is modified, hence
+        their hash, together with the file size, is used to identify
+        the database.
+
+        Args:
+          file_object (file): file-like object.
+          file_header (spotlight_store_db_file_header): file header.
+
+        Returns:
+          str: size and hash of the file header and map.
+
+        Raises:
+          ParseError: if the file header or map cannot be read.
+        """
+        data_type_map = self._GetDataTypeMap("spotlight_store_db_file_header")
+        file_header_size = data_type_map.GetSizeHint()
+
+        file_header_data = self._ReadData(
+            file_object, 0, file_header_size, "file header"
+        )
+        identity_hash = hashlib.sha256(file_header_data)
+
+        file_offset = file_header.map_offset
+        map_end_offset = file_header.map_offset + file_header.map_size
+        while file_offset < map_end_offset:
+            read_size = min(self._IDENTITY_READ_SIZE, map_end_offset - file_offset)
+            map_data = self._ReadData(file_object, file_offset, read_size, "map")
+            identity_hash.update(map_data)
+            file_offset += read_size
+
+        return f"{self._file_size:d}:{identity_hash.hexdigest():s}"
+
+    def _GetMetadataAttributeValueSize(self, metadata_type, data, data_offset):
+        """Determines the size of a metadata attribute value without decoding it.
+
+        Args:
+          metadata_type (spotlight_store_db_property_value11): metadata type
+              property value.
+          data (bytes): data.
+          data_offset (int): offset of the value relative to the start of the data.
+
+        Returns:
+          int: size of the metadata attribute value.
+        """
+        value_type = getattr(metadata_type, "value_type", None)
+        if value_type is None:
+            return 0
+
+        if getattr(metadata_type, "key_name", None) == "kMDStoreAccumulatedSizes":
+            return len(data) - data_offset
+
+        property_type = getattr(metadata_type, "property_type", None) or 0
+
+        if value_type in (0x00, 0x02, 0x06, 0x0F) or (
+            value_type == 0x07 and property_type & 0x02 == 0x00
+        ):
+            _, value_size = self._ReadVariableSizeInteger(data, data_offset)
+            return value_size
+
+        if value_type in (0x08, 0x09, 0x0A, 0x0C) and property_type & 0x02 == 0x00:
+            return self._FIXED_SIZE_VALUE_TYPE_SIZES[value_type]
+
+        if value_type in (0x07, 0x08, 0x09, 0x0A, 0x0B, 0x0C, 0x0E):
+            data_size, value_size = self._ReadVariableSizeInteger(data, data_offset)
+            return value_size + data_size
+
+        return 0
+
+    def _GetMetadataItemByIdentifier(
+        self, file_object, identifier, metadata_type_indexes=None
+    ):
         """Retrieves a specific metadata item.
 
         Args:
           file_object (file): file-like object.
           identifier (int): file (system) entry identifier of the metadata item.
+          metadata_type_indexes (Optional[set[int]]): indexes of the metadata
+              types of the attributes to read, where None represents all
+              attributes.
 
         Returns:
           SpotlightStoreMetadataItem: metadata item matching the identifier or None
@@ -699,15 +842,33 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
             )
             self._DebugPrintText("\n")
 
-        page_data = self._record_pages_cache.get(record_descriptor.page_offset, None)
+        page_data = self._record_pages_cache.Get(record_descriptor.page_offset)
         if not page_data:
             _, page_data = self._ReadRecordPage(
                 file_object, record_descriptor.page_offset
             )
-            # TODO: remove page from cache if full.
-            self._record_pages_cache[record_descriptor.page_offset] = page_data
+            self._record_pages_cache.Put(record_descriptor.page_offset, page_data)
+
+        return self._ReadRecord(
+            page_data,
+            record_descriptor.page_value_offset,
+            metadata_type_indexes=metadata_type_indexes,
+        )
+
+    def _GetMetadataTypeIndexes(self, attribute_names):
+        """Retrieves the indexes of the metadata types of specific attributes.
+
+        Args:
+          attribute_names (set[str]): names of the metadata attributes.
 
-        return self._ReadRecord(page_data, record_descriptor.page_value_offset)
+        Returns:
+          set[int]: indexes of the metadata types.
+        """
+        return {
+            metadata_type_index
+            for metadata_type_index, metadata_type in self._metadata_types.items()
+            if getattr(metadata_type, "key_name", None) in attribute_names
+        }
 
     def _ReadFileHeader(self, file_object):
         """Reads the file header.
@@ -773,7 +934,7 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
             page_value_size = 4
 
             index_size, bytes_read = self._ReadVariableSizeInteger(
-                page_data[page_data_offset + page_value_size :]
+                page_data, page_data_offset + page_value_size
             )
             _, padding_size = divmod(index_size, 4)
 
@@ -846,26 +1007,30 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
         Raises:
           ParseError: if the index streams map cannot be read.
         """
-        stream_values = self._ReadStreamsMap(streams_map_number)
+        data, offsets = self._ReadStreamsMap(streams_map_number)
+        data_view = memoryview(data)
+
+        for index in range(len(offsets) - 1):
+            value_offset = offsets[index]
+            value_end_offset = offsets[index + 1]
 
-        index_values_data_type_map = self._GetDataTypeMap(
-            "spotlight_store_db_index_values"
-        )
-        for index, stream_value in enumerate(stream_values):
             if self._debug:
-                self._DebugPrintData(f"Stream value: {index:d} data", stream_value)
+                self._DebugPrintData(
+                    f"Stream value: {index:d} data",
+                    data[value_offset:value_end_offset],
+                )
 
             if index == 0:
                 continue
 
-            unknown1, data_offset = self._ReadVariableSizeInteger(stream_value)
+            unknown1, data_offset = self._ReadVariableSizeInteger(data, value_offset)
 
             if self._debug:
                 self._DebugPrintDecimalValue("Unknown1", unknown1)
 
-            index_size, bytes_read = self._ReadVariableSizeInteger(
-                stream_value[data_offset:]
-            )
+            data_offset += value_offset
+
+            index_size, bytes_read = self._ReadVariableSizeInteger(data, data_offset)
 
             data_offset += bytes_read
 
@@ -873,19 +1038,24 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
 
             index_size -= padding_size
 
-            context = dtfabric_data_maps.DataTypeMapContext(
-                values={"index_size": index_size}
-            )
-            try:
-                index_values = index_values_data_type_map.MapByteStream(
-                    stream_value[data_offset + padding_size :], context=context
-                )
-            except dtfabric_errors.MappingError as exception:
+            index_values_offset = data_offset + padding_size
+            index_values_end_offset = index_values_offset + index_size
+            if index_values_end_offset > value_end_offset:
                 raise errors.ParseError(
                     f"Unable to map stream value: {index:d} data with error: "
-                    f"{exception!s}"
+                    f"index size: {index_size:d} exceeds stream value data"
                 )
 
+            # The 32-bit index values are decoded in a single pass instead of
+            # per value.
+            index_values = array.array("I")
+            index_values.frombytes(
+                data_view[index_values_offset:index_values_end_offset]
+            )
+
+            if sys.byteorder == "big":
+                index_values.byteswap()
+
             values_list = []
             for metadata_value_index in index_values:
                 metadata_value = self._metadata_values.get(metadata_value_index)
@@ -895,9 +1065,7 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
             if self._debug:
                 self._DebugPrintDecimalValue("Table index", index)
                 self._DebugPrintDecimalValue("Index size", index_size)
-                self._DebugPrintData(
-                    "Padding", stream_value[data_offset : data_offset + padding_size]
-                )
+                self._DebugPrintData("Padding", data[data_offset:index_values_offset])
                 value_string, _ = self._FormatArrayOfIntegersAsDecimals(index_values)
                 self._DebugPrintValue("Index values", value_string)
                 self._DebugPrintText("\n")
@@ -996,13 +1164,14 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
 
             file_offset += map_value_size
 
-    def _ReadMetadataAttribute(self, metadata_type, data):
+    def _ReadMetadataAttribute(self, metadata_type, data, data_offset):
         """Reads a metadata attribute.
 
         Args:
           metadata_type (spotlight_store_db_property_value11): metadata type
               property value.
           data (bytes): data.
+          data_offset (int): offset of the value relative to the start of the data.
 
         Returns:
           tuple[SpotlightStoreMetadataAttribute, int]: metadata attribute and
@@ -1025,46 +1194,47 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
             self._DebugPrintValue("Value type", value_string)
 
         if key_name == "kMDStoreAccumulatedSizes":
-            bytes_read = len(data)
-            value = data
+            bytes_read = len(data) - data_offset
+            value = data[data_offset:]
 
         elif value_type in (0x00, 0x02, 0x06):
-            value, bytes_read = self._ReadVariableSizeInteger(data)
+            value, bytes_read = self._ReadVariableSizeInteger(data, data_offset)
 
         elif value_type == 0x07:
             value, bytes_read = self._ReadMetadataAttributeVariableSizeIntegerValue(
-                property_type, data
+                property_type, data, data_offset
             )
         elif value_type == 0x08:
             value, bytes_read = self._ReadMetadataAttributeByteValue(
-                property_type, data
+                property_type, data, data_offset
             )
         elif value_type == 0x09:
             value, bytes_read = self._ReadMetadataAttributeFloat32Value(
-                property_type, data
+                property_type, data, data_offset
             )
         elif value_type in (0x0A, 0x0C):
             value, bytes_read = self._ReadMetadataAttributeFloat64Value(
-                property_type, data
+                property_type, data, data_offset
             )
         elif value_type == 0x0B:
             value, bytes_read = self._ReadMetadataAttributeStringValue(
-                property_type, data
+                property_type, data, data_offset
             )
         elif value_type == 0x0E:
-            data_size, bytes_read = self._ReadVariableSizeInteger(data)
+            data_size, bytes_read = self._ReadVariableSizeInteger(data, data_offset)
 
             if self._debug:
                 self._DebugPrintDecimalValue("Data size", data_size)
 
-            value = data[bytes_read : bytes_read + data_size]
+            value_data_offset = data_offset + bytes_read
+            value = data[value_data_offset : value_data_offset + data_size]
             bytes_read += data_size
 
             # TODO: decode binary data e.g. UUID
 
         elif value_type == 0x0F:
             value, bytes_read = self._ReadMetadataAttributeReferenceValue(
-                property_type, data
+                property_type, data, data_offset
             )
         else:
             # TODO: value type 0x01, 0x03, 0x04, 0x05, 0x0d
@@ -1081,12 +1251,13 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
 
         return metadata_attribute, bytes_read
 
-    def _ReadMetadataAttributeByteValue(self, property_type, data):
+    def _ReadMetadataAttributeByteValue(self, property_type, data, data_offset):
         """Reads a metadata attribute byte value.
 
         Args:
           property_type (int): metadata attribute property type.
           data (bytes): data.
+          data_offset (int): offset of the value relative to the start of the data.
 
         Returns:
           tuple[object, int]: value and number of bytes read.
@@ -1095,7 +1266,7 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
           ParseError: if the metadata attribute byte value cannot be read.
         """
         if property_type & 0x02:
-            data_size, bytes_read = self._ReadVariableSizeInteger(data)
+            data_size, bytes_read = self._ReadVariableSizeInteger(data, data_offset)
         else:
             data_size, bytes_read = 1, 0
 
@@ -1104,12 +1275,15 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
 
         data_type_map = self._GetDataTypeMap("array_of_byte")
 
+        value_data_offset = data_offset + bytes_read
+
         context = dtfabric_data_maps.DataTypeMapContext(
             values={"elements_data_size": data_size}
         )
         try:
             array_of_values = data_type_map.MapByteStream(
-                data[bytes_read : bytes_read + data_size], context=context
+                data[value_data_offset : value_data_offset + data_size],
+                context=context,
             )
         except dtfabric_errors.MappingError as exception:
             raise errors.ParseError(
@@ -1125,12 +1299,13 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
 
         return value, bytes_read
 
-    def _ReadMetadataAttributeFloat32Value(self, property_type, data):
+    def _ReadMetadataAttributeFloat32Value(self, property_type, data, data_offset):
         """Reads a metadata attribute 32-bit floating-point value.
 
         Args:
           property_type (int): metadata attribute property type.
           data (bytes): data.
+          data_offset (int): offset of the value relative to the start of the data.
 
         Returns:
           tuple[object, int]: value and number of bytes read.
@@ -1142,19 +1317,22 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
         if property_type & 0x02 == 0x00:
             data_size, bytes_read = 4, 0
         else:
-            data_size, bytes_read = self._ReadVariableSizeInteger(data)
+            data_size, bytes_read = self._ReadVariableSizeInteger(data, data_offset)
 
         if self._debug and bytes_read != 0:
             self._DebugPrintDecimalValue("Data size", data_size)
 
         data_type_map = self._GetDataTypeMap("array_of_float32")
 
+        value_data_offset = data_offset + bytes_read
+
         context = dtfabric_data_maps.DataTypeMapContext(
             values={"elements_data_size": data_size}
         )
         try:
             array_of_values = data_type_map.MapByteStream(
-                data[bytes_read : bytes_read + data_size], context=context
+                data[value_data_offset : value_data_offset + data_size],
+                context=context,
             )
         except dtfabric_errors.MappingError as exception:
             raise errors.ParseError(
@@ -1171,12 +1349,13 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
 
         return value, bytes_read
 
-    def _ReadMetadataAttributeFloat64Value(self, property_type, data):
+    def _ReadMetadataAttributeFloat64Value(self, property_type, data, data_offset):
         """Reads a metadata attribute 64-bit floating-point value.
 
         Args:
           property_type (int): metadata attribute property type.
           data (bytes): data.
+          data_offset (int): offset of the value relative to the start of the data.
 
         Returns:
           tuple[object, int]: value and number of bytes read.
@@ -1188,19 +1367,22 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
         if property_type & 0x02 == 0x00:
             data_size, bytes_read = 8, 0
         else:
-            data_size, bytes_read = self._ReadVariableSizeInteger(data)
+            data_size, bytes_read = self._ReadVariableSizeInteger(data, data_offset)
 
         if self._debug and bytes_read != 0:
             self._DebugPrintDecimalValue("Data size", data_size)
 
         data_type_map = self._GetDataTypeMap("array_of_float64")
 
+        value_data_offset = data_offset + bytes_read
+
         context = dtfabric_data_maps.DataTypeMapContext(
             values={"elements_data_size": data_size}
         )
         try:
             array_of_values = data_type_map.MapByteStream(
-                data[bytes_read : bytes_read + data_size], context=context
+                data[value_data_offset : value_data_offset + data_size],
+                context=context,
             )
         except dtfabric_errors.MappingError as exception:
             raise errors.ParseError(
@@ -1277,12 +1459,13 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
             page_data_offset += context.byte_size
             page_value_index += 1
 
-    def _ReadMetadataAttributeReferenceValue(self, property_type, data):
+    def _ReadMetadataAttributeReferenceValue(self, property_type, data, data_offset):
         """Reads a metadata attribute reference value.
 
         Args:
           property_type (int): metadata attribute property type.
           data (bytes): data.
+          data_offset (int): offset of the value relative to the start of the data.
 
         Returns:
           tuple[object, int]: value and number of bytes read.
@@ -1290,7 +1473,7 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
         Raises:
           ParseError: if the metadata attribute reference value cannot be read.
         """
-        table_index, bytes_read = self._ReadVariableSizeInteger(data)
+        table_index, bytes_read = self._ReadVariableSizeInteger(data, data_offset)
 
         if property_type & 0x03 == 0x03:
             if self._debug:
@@ -1336,7 +1519,7 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
         Raises:
           ParseError: if the metadata attribute streams map cannot be read.
         """
-        stream_values = self._ReadStreamsMap(streams_map_number)
+        data, offsets = self._ReadStreamsMap(streams_map_number)
 
         data_type_map = None
         debug_info = None
@@ -1357,25 +1540,37 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
                     "spotlight_metadata_attribute_value", None
                 )
 
-        for index, stream_value in enumerate(stream_values):
+        for index in range(len(offsets) - 1):
+            value_offset = offsets[index]
+            value_end_offset = offsets[index + 1]
+
             if self._debug:
-                self._DebugPrintData(f"Stream value: {index:d} data", stream_value)
+                self._DebugPrintData(
+                    f"Stream value: {index:d} data",
+                    data[value_offset:value_end_offset],
+                )
 
             if index == 0:
                 continue
 
-            data_size, data_offset = self._ReadVariableSizeInteger(stream_value)
+            data_size, data_offset = self._ReadVariableSizeInteger(data, value_offset)
 
             if self._debug:
                 self._DebugPrintDecimalValue("Data size", data_size)
 
-            if data_offset + data_size != len(stream_value):
+            data_offset += value_offset
+
+            if data_offset + data_size != value_end_offset:
                 # Stream values where the data size does not match appear to contain
                 # remnant data.
                 continue
 
             try:
-                property_value = data_type_map.MapByteStream(stream_value[data_offset:])
+                # Note that dtFabric does not support mapping strings from
+                # a memoryview, hence only the structure data is copied.
+                property_value = data_type_map.MapByteStream(
+                    data[data_offset:value_end_offset]
+                )
             except dtfabric_errors.MappingError as exception:
                 raise errors.ParseError(
                     f"Unable to map stream value: {index:d} data with error: "
@@ -1389,12 +1584,13 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
 
             property_table[index] = property_value
 
-    def _ReadMetadataAttributeStringValue(self, property_type, data):
+    def _ReadMetadataAttributeStringValue(self, property_type, data, data_offset):
         """Reads a metadata attribute string value.
 
         Args:
           property_type (int): metadata attribute property type.
           data (bytes): data.
+          data_offset (int): offset of the value relative to the start of the data.
 
         Returns:
           tuple[object, int]: value and number of bytes read.
@@ -1402,11 +1598,15 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
         Raises:
           ParseError: if the metadata attribute string value cannot be read.
         """
-        data_size, bytes_read = self._ReadVariableSizeInteger(data)
+        data_size, bytes_read = self._ReadVariableSizeInteger(data, data_offset)
+
+        value_data_offset = data_offset + bytes_read
 
         if self._debug:
             self._DebugPrintDecimalValue("Data size", data_size)
-            self._DebugPrintData("Data", data[bytes_read : bytes_read + data_size])
+            self._DebugPrintData(
+                "Data", data[value_data_offset : value_data_offset + data_size]
+            )
 
         data_type_map = self._GetDataTypeMap("array_of_cstring")
 
@@ -1415,7 +1615,8 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
         )
         try:
             array_of_values = data_type_map.MapByteStream(
-                data[bytes_read : bytes_read + data_size], context=context
+                data[value_data_offset : value_data_offset + data_size],
+                context=context,
             )
         except dtfabric_errors.MappingError as exception:
             raise errors.ParseError(
@@ -1435,31 +1636,35 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
 
         return value, bytes_read
 
-    def _ReadMetadataAttributeVariableSizeIntegerValue(self, property_type, data):
+    def _ReadMetadataAttributeVariableSizeIntegerValue(
+        self, property_type, data, data_offset
+    ):
         """Reads a metadata attribute variable size integer value.
 
         Args:
           property_type (int): metadata attribute property type.
           data (bytes): data.
+          data_offset (int): offset of the value relative to the start of the data.
 
         Returns:
           tuple[object, int]: value and number of bytes read.
         """
         if property_type & 0x02 == 0x00:
-            return self._ReadVariableSizeInteger(data)
+            return self._ReadVariableSizeInteger(data, data_offset)
 
-        data_size, bytes_read = self._ReadVariableSizeInteger(data)
+        data_size, bytes_read = self._ReadVariableSizeInteger(data, data_offset)
         if self._debug:
             self._DebugPrintDecimalValue("Data size", data_size)
 
         array_of_values = []
 
-        data_offset = 0
-        while data_offset < data_size:
+        value_data_offset = data_offset
+        value_data_end_offset = data_offset + data_size
+        while value_data_offset < value_data_end_offset:
             integer_value, integer_value_size = self._ReadVariableSizeInteger(
-                data[data_offset:data_size]
+                data, value_data_offset
             )
-            data_offset += integer_value_size
+            value_data_offset += integer_value_size
 
             array_of_values.append(integer_value)
 
@@ -1579,13 +1784,16 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
             )
             file_offset = next_block_number * 0x1000
 
-    def _ReadRecord(self, page_data, page_value_offset):
+    def _ReadRecord(self, page_data, page_value_offset, metadata_type_indexes=None):
         """Reads a record.
 
         Args:
           page_data (bytes): page data.
           page_value_offset (int): offset of the page value relative to the start
               of the page data.
+          metadata_type_indexes (Optional[set[int]]): indexes of the metadata
+              types of the attributes to read, where None represents all
+              attributes. The values of other attributes are skipped.
 
         Returns:
           SpotlightStoreMetadataItem: metadata item.
@@ -1598,10 +1806,7 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
             self._DebugPrintValue("Record data offset", value_string)
 
         page_data_offset = page_value_offset - 20
-        record_header, bytes_read = self._ReadRecordHeader(
-            page_data[page_data_offset:], page_data_offset
-        )
-        page_data_offset += bytes_read
+        record_header, bytes_read = self._ReadRecordHeader(page_data, page_data_offset)
         record_data_offset = bytes_read
 
         metadata_item = SpotlightStoreMetadataItem()
@@ -1613,19 +1818,23 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
         metadata_attribute_index = 0
         metadata_type_index = 0
 
-        record_data_end_offset = page_data_offset + record_header.data_size
+        # The record data is copied once, after which the metadata attributes
+        # are read by offset.
+        record_data_end_offset = (
+            page_data_offset + record_data_offset + record_header.data_size
+        )
+        record_data = page_data[page_data_offset:record_data_end_offset]
 
         while record_data_offset < record_header.data_size:
             relative_metadata_type_index, bytes_read = self._ReadVariableSizeInteger(
-                page_data[page_data_offset:record_data_end_offset]
+                record_data, record_data_offset
             )
             if self._debug:
                 self._DebugPrintData(
                     "Relative metadata attribute type index data",
-                    page_data[page_data_offset : page_data_offset + bytes_read],
+                    record_data[record_data_offset : record_data_offset + bytes_read],
                 )
 
-            page_data_offset += bytes_read
             record_data_offset += bytes_read
 
             metadata_type_index += relative_metadata_type_index
@@ -1643,11 +1852,21 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
                 self._DebugPrintDecimalValue(description, metadata_type_index)
 
             metadata_type = self._metadata_types.get(metadata_type_index)
+
+            if (
+                metadata_type_indexes is not None
+                and metadata_type_index not in metadata_type_indexes
+            ):
+                record_data_offset += self._GetMetadataAttributeValueSize(
+                    metadata_type, record_data, record_data_offset
+                )
+                metadata_attribute_index += 1
+                continue
+
             metadata_attribute, bytes_read = self._ReadMetadataAttribute(
-                metadata_type, page_data[page_data_offset:record_data_end_offset]
+                metadata_type, record_data, record_data_offset
             )
 
-            page_data_offset += bytes_read
             record_data_offset += bytes_read
 
             metadata_item.attributes[metadata_attribute.key] = metadata_attribute
@@ -1655,13 +1874,13 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
 
         return metadata_item
 
-    def _ReadRecordHeader(self, data, page_data_offset):
+    def _ReadRecordHeader(self, page_data, page_data_offset):
         """Reads a record header.
 
         Args:
-          data (bytes): data.
-          page_data_offset (int): offset of the page value relative to the start
-              of the page data.
+          page_data (bytes): page data.
+          page_data_offset (int): offset of the record relative to the start of
+              the page data.
 
         Returns:
           tuple[SpotlightStoreRecordHeader, int]: record header and number of bytes
@@ -1675,26 +1894,28 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
         context = dtfabric_data_maps.DataTypeMapContext()
 
         try:
-            record = data_type_map.MapByteStream(data, context=context)
+            record = data_type_map.MapByteStream(
+                page_data[page_data_offset : page_data_offset + 4], context=context
+            )
         except dtfabric_errors.MappingError as exception:
             raise errors.ParseError(
                 f"Unable to map record at offset: 0x{page_data_offset:08x} with "
                 f"error: {exception!s}"
             )
 
-        data_offset = context.byte_size
+        data_offset = page_data_offset + context.byte_size
 
-        identifier, bytes_read = self._ReadVariableSizeInteger(data[data_offset:])
+        identifier, bytes_read = self._ReadVariableSizeInteger(page_data, data_offset)
 
         data_offset += bytes_read
 
-        flags = data[data_offset]
+        flags = page_data[data_offset]
 
         data_offset += 1
 
         value_names = ["item_identifier", "parent_identifier", "last_update_time"]
         values, bytes_read = self._ReadVariableSizeIntegers(
-            data[data_offset:], value_names
+            page_data, value_names, data_offset=data_offset
         )
         data_offset += bytes_read
 
@@ -1709,7 +1930,7 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
         record_header.parent_identifier = values.get("parent_identifier")
         record_header.last_update_time = values.get("last_update_time")
 
-        return record_header, data_offset
+        return record_header, data_offset - page_data_offset
 
     def _ReadRecordPage(self, file_object, file_offset):
         """Reads a record page.
@@ -1722,6 +1943,29 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
           tuple[spotlight_store_db_property_page_header, bytes]: page header and
               page data.
 
+        Raises:
+          ParseError: if the property page cannot be read.
+        """
+        page_header, page_data, page_data_offset = self._ReadRecordPageData(
+            file_object, file_offset
+        )
+        page_data = self._DecompressRecordPageData(
+            page_header, page_data, page_data_offset
+        )
+        return page_header, page_data
+
+    def _ReadRecordPageData(self, file_object, file_offset):
+        """Reads the data of a record page without decompressing it.
+
+        Args:
+          file_object (file): file-like object.
+          file_offset (int): file offset.
+
+        Returns:
+          tuple[spotlight_store_db_property_page_header, bytes, int]: page header,
+              page data and offset of the page data relative to the start of
+              the file.
+
         Raises:
           ParseError: if the property page cannot be read.
         """
@@ -1740,29 +1984,7 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
 
         page_data = file_object.read(page_header.page_size - bytes_read)
 
-        file_offset += bytes_read
-
-        if page_header.uncompressed_page_size > 0:
-            compressed_page_data = page_data
-
-            if page_header.property_table_type & 0x00001000 and compressed_page_data[
-                0:4
-            ] in (b"bv41", b"bv4-"):
-                page_data = self._DecompressLZ4PageData(
-                    compressed_page_data, file_offset
-                )
-
-            elif compressed_page_data[0] == 0x78:
-                page_data = zlib.decompress(compressed_page_data)
-
-            # TODO: add support for other compression types.
-            else:
-                if self._debug:
-                    self._DebugPrintData("Data", page_data)
-
-                raise errors.ParseError("Unsupported compression type")
-
-        return page_header, page_data
+        return page_header, page_data, file_offset + bytes_read
 
     def _ReadRecordPageValues(self, page_data, page_offset):
         """Reads the record page values.
@@ -1784,9 +2006,7 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
                 )
                 self._DebugPrintValue("Record data offset", value_string)
 
-            record_header, _ = self._ReadRecordHeader(
-                page_data[page_data_offset:], page_data_offset
-            )
+            record_header, _ = self._ReadRecordHeader(page_data, page_data_offset)
 
             if self._debug:
                 record_data = page_data[
@@ -1833,6 +2053,106 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
 
             page_data_offset += 4 + record_header.data_size
 
+    def _ReadRecordPages(self, file_object, file_offsets):
+        """Reads record pages.
+
+        When multiple decompression threads are configured, the data of the
+        record pages is read in the calling thread and decompressed in a thread
+        pool ahead of the record page being returned. Record pages are returned
+        in the order of the file offsets.
+
+        Args:
+          file_object (file): file-like object.
+          file_offsets (list[int]): file offsets of the record pages.
+
+        Yields:
+          tuple[int, spotlight_store_db_property_page_header, bytes]: file offset,
+              page header and uncompressed page data.
+
+        Raises:
+          ParseError: if a record page cannot be read.
+        """
+        # Decompression is not done in parallel in debug mode to preserve
+        # the order of the debug output.
+        if self._debug or self._number_of_decompression_threads <= 1:
+            for file_offset in file_offsets:
+                page_header, page_data = self._ReadRecordPage(file_object, file_offset)
+                yield file_offset, page_header, page_data
+
+            return
+
+        # Make sure the data type map is created before it is used by
+        # the decompression threads.
+        self._GetDataTypeMap("spotlight_store_db_lz4_block_header")
+
+        maximum_number_of_pending_pages = 2 * self._number_of_decompression_threads
+
+        with futures.ThreadPoolExecutor(
+            max_workers=self._number_of_decompression_threads
+        ) as executor:
+            pending_pages = collections.deque()
+
+            for file_offset in file_offsets:
+                page_header, page_data, page_data_offset = self._ReadRecordPageData(
+                    file_object, file_offset
+                )
+                future = executor.submit(
+                    self._DecompressRecordPageData,
+                    page_header,
+                    page_data,
+                    page_data_offset,
+                )
+                pending_pages.append((file_offset, page_header, future))
+
+                if len(pending_pages) >= maximum_number_of_pending_pages:
+                    file_offset, page_header, future = pending_pages.popleft()
+                    yield file_offset, page_header, future.result()
+
+            while pending_pages:
+                file_offset, page_header, future = pending_pages.popleft()
+                yield file_offset, page_header, future.result()
+
+    def _ReadRecords(self, page_data, page_offset, metadata_type_indexes=None):
+        """Reads the records of a record page.
+
+        Records that are superseded by a record with the same identifier in
+        another page or at another offset are ignored.
+
+        Args:
+          page_data (bytes): page data.
+          page_offset (int): file offset of the page.
+          metadata_type_indexes (Optional[set[int]]): indexes of the metadata
+              types of the attributes to read, where None represents all
+              attributes.
+
+        Yields:
+          SpotlightStoreMetadataItem: metadata item.
+
+        Raises:
+          ParseError: if a record cannot be read.
+        """
+        page_data_offset = 0
+        page_data_size = len(page_data)
+
+        while page_data_offset < page_data_size:
+            record_header, _ = self._ReadRecordHeader(page_data, page_data_offset)
+
+            page_value_offset = page_data_offset + 20
+
+            record_descriptor = self._record_descriptors.get(record_header.identifier)
+            if (
+                record_descriptor
+                and record_descriptor.page_offset == page_offset
+                and record_descriptor.page_value_offset == page_value_offset
+            ):
+                yield self._ReadRecord(
+                    page_data,
+                    page_value_offset,
+                    metadata_type_indexes=metadata_type_indexes,
+                )
+
+            page_data_offset += 4 + record_header.data_size
+
     def _ReadStreamsMap(self, streams_map_number):
         """Reads a streams map.
 
@@ -1840,7 +2160,9 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
           streams_map_number (int): number of the streams map.
 
         Returns:
-          list[bytes]: stream values.
+          tuple[bytes, array.array]: data of the stream values and offsets of
+              the stream values relative to the start of the data, where the end
+              offset of stream value N is stored at index N + 1.
 
         Raises:
           ParseError: if the streams map cannot be read.
@@ -1872,7 +2194,7 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
         )
         streams_map_offsets.Open(offsets_file_path)
 
-        ranges = streams_map_offsets.ranges
+        offsets = streams_map_offsets.offsets
 
         streams_map_offsets.Close()
 
@@ -1881,85 +2203,148 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
         data_file_path = self._file_system_helper.JoinPath(path_segments)
 
         streams_map_data = SpotlightStreamsMapDataFile(
-            data_size, ranges, file_system_helper=self._file_system_helper
+            data_size, offsets, file_system_helper=self._file_system_helper
         )
         streams_map_data.Open(data_file_path)
 
-        stream_values = streams_map_data.stream_values
+        data = streams_map_data.data
 
         streams_map_data.Close()
 
-        return stream_values
+        return data, offsets
 
-    def _ReadVariableSizeInteger(self, data):
+    def _ReadVariableSizeInteger(self, data, data_offset=0):
         """Reads a variable size integer.
 
         Args:
           data (bytes): data.
+          data_offset (Optional[int]): offset of the integer relative to the start
+              of the data.
 
         Returns:
           tuple[int, int]: integer value and number of bytes read.
         """
-        byte_value = data[0]
-        bytes_read = 1
-
-        number_of_additional_bytes = 0
-        for bitmask in (0x80, 0xC0, 0xE0, 0xF0, 0xF8, 0xFC, 0xFE, 0xFF):
-            if byte_value & bitmask != bitmask:
-                break
-            number_of_additional_bytes += 1
-
-        if number_of_additional_bytes > 4:
-            byte_value = 0
-        elif number_of_additional_bytes > 0:
-            byte_value &= bitmask ^ 0xFF
-
-        integer_value = int(byte_value)
-        while number_of_additional_bytes > 0:
-            integer_value <<= 8
+        return varint.ReadSpotlightVariableSizeInteger(data, data_offset)
 
-            integer_value += int(data[bytes_read])
-            bytes_read += 1
-
-            number_of_additional_bytes -= 1
-
-        return integer_value, bytes_read
-
-    def _ReadVariableSizeIntegers(self, data, names):
+    def _ReadVariableSizeIntegers(self, data, names, data_offset=0):
         """Reads variable size integers.
 
         Args:
           data (bytes): data.
           names (list[str]): names to identify the integer values.
+          data_offset (Optional[int]): offset of the first integer relative to
+              the start of the data.
 
         Returns:
           tuple[dict[str, int], int]: integer values per name and number of bytes
               read.
         """
-        values = {}
+        integer_values, bytes_read = varint.ReadSpotlightVariableSizeIntegers(
+            data, data_offset, len(names)
+        )
+        return dict(zip(names, integer_values)), bytes_read
 
-        data_offset = 0
-        for name in names:
-            integer_value, bytes_read = self._ReadVariableSizeInteger(
-                data[data_offset:]
-            )
-            data_offset += bytes_read
+    def Close(self):
+        """Closes a store database file.
 
-            values[name] = integer_value
+        Raises:
+          OSError: if the file is not opened.
+        """
+        super().Close()
 
-        return values, data_offset
+        self._identity = None
+        self._record_pages_cache.Clear()
 
-    def GetMetadataItemByIdentifier(self, identifier):
+    def GetMetadataItemByIdentifier(self, identifier, attribute_names=None):
         """Retrieves a specific metadata item.
 
         Args:
           identifier (int): file (system) entry identifier of the metadata item.
+          attribute_names (Optional[set[str]]): names of the metadata attributes
+              to read, where None represents all attributes.
 
         Returns:
           SpotlightStoreMetadataItem: metadata item matching the identifier or None
               if no such item.
         """
-        return self._GetMetadataItemByIdentifier(self._file_object, identifier)
+        metadata_type_indexes = None
+        if attribute_names is not None:
+            metadata_type_indexes = self._GetMetadataTypeIndexes(attribute_names)
+
+        return self._GetMetadataItemByIdentifier(
+            self._file_object, identifier, metadata_type_indexes=metadata_type_indexes
+        )
+
+    def GetMetadataItemsByIdentifiers(self, identifiers, attribute_names=None):
+        """Retrieves specific metadata items.
+
+        The metadata items are read in the order of their location in the file,
+        to reduce the number of record pages that need to be read, instead of
+        the order of the identifiers.
+
+        Args:
+          identifiers (list[int]): file (system) entry identifiers of the metadata
+              items.
+          attribute_names (Optional[set[str]]): names of the metadata attributes
+              to read, where None represents all attributes.
+
+        Yields:
+          SpotlightStoreMetadataItem: metadata item matching one of
+              the identifiers.
+        """
+        metadata_type_indexes = None
+        if attribute_names is not None:
+            metadata_type_indexes = self._GetMetadataTypeIndexes(attribute_names)
+
+        record_descriptors = []
+        for identifier in set(identifiers):
+            record_descriptor = self._record_descriptors.get(identifier, None)
+            if record_descriptor:
+                record_descriptors.append(record_descriptor)
+
+        record_descriptors.sort(
+            key=lambda record_descriptor: (
+                record_descriptor.page_offset,
+                record_descriptor.page_value_offset,
+            )
+        )
+        for record_descriptor in record_descriptors:
+            yield self._GetMetadataItemByIdentifier(
+                self._file_object,
+                record_descriptor.identifier,
+                metadata_type_indexes=metadata_type_indexes,
+            )
+
+    def IterateMetadataItems(self, attribute_names=None):
+        """Iterates over the metadata items.
+
+        The metadata items are read in the order of the record pages in the file,
+        where every record page is read and decompressed once, without being
+        stored in the record pages cache.
+
+        Args:
+          attribute_names (Optional[set[str]]): names of the metadata attributes
+              to read, where None represents all attributes.
+
+        Yields:
+          SpotlightStoreMetadataItem: metadata item.
+
+        Raises:
+          ParseError: if a record page cannot be read.
+        """
+        metadata_type_indexes = None
+        if attribute_names is not None:
+            metadata_type_indexes = self._GetMetadataTypeIndexes(attribute_names)
+
+        file_offsets = [
+            map_value.block_number * 0x1000 for map_value in self._map_values
+        ]
+        for file_offset, _, page_data in self._ReadRecordPages(
+            self._file_object, file_offsets
+        ):
+            yield from self._ReadRecords(
+                page_data, file_offset, metadata_type_indexes=metadata_type_indexes
+            )
 
     def ReadFileObject(self, file_object):
         """Reads an Apple Spotlight database file-like object.
@@ -1972,6 +2357,8 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
         """
         file_header = self._ReadFileHeader(file_object)
 
+        self._identity = self._GetIdentity(file_object, file_header)
+
         self._ReadMapPages(file_object, file_header.map_offset, file_header.map_size)
 
         if not file_header.metadata_types_block_number:
@@ -2017,13 +2404,14 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
                 self._metadata_localized_strings,
             )
 
-        for map_value in self._map_values:
-            file_offset = map_value.block_number * 0x1000
-            _, page_data = self._ReadRecordPage(file_object, file_offset)
-
-            # TODO: remove page from cache if full.
-            self._record_pages_cache[file_offset] = page_data
-
+        # The record pages are only read to build the record descriptors, pages
+        # are cached on demand when metadata items are retrieved.
+        file_offsets = [
+            map_value.block_number * 0x1000 for map_value in self._map_values
+        ]
+        for file_offset, _, page_data in self._ReadRecordPages(
+            file_object, file_offsets
+        ):
             self._ReadRecordPageValues(page_data, file_offset)
 
         if self._debug:
@@ -2033,3 +2421,329 @@ class SpotlightStoreDatabaseFile(data_format.BinaryDataFile):
                 )
             # TODO: do something with metadata_item or remove.
             _ = metadata_item
+
+
+class SpotlightStoreDatabaseIndex:
+    """Secondary index over metadata attribute values of an Apple Spotlight store.
+
+    The index is stored in a SQLite database and contains the name, parent
+    identifier, content type and dates of the metadata items. Queries return
+    the matching metadata items read from the store database.
+    """
+
+    _CONTENT_TYPE_ATTRIBUTE_NAME = "kMDItemContentType"
+
+    _DATE_ATTRIBUTE_NAMES = (
+        "_kMDItemContentChangeDate",
+        "_kMDItemCreationDate",
+        "kMDItemContentCreationDate",
+        "kMDItemContentModificationDate",
+        "kMDItemDateAdded",
+        "kMDItemLastUsedDate",
+    )
+
+    _FORMAT_VERSION = 1
+
+    _NAME_ATTRIBUTE_NAME = "_kMDItemFileName"
+
+    _BATCH_SIZE = 10000
+
+    def __init__(self, store_database):
+        """Initializes a secondary index.
+
+        Args:
+          store_database (SpotlightStoreDatabaseFile): store database file.
+        """
+        super().__init__()
+        self._connection = None
+        self._store_database = store_database
+
+    def _BuildIndex(self, connection):
+        """Builds the index from the metadata items in the store database.
+
+        Args:
+          connection (sqlite3.Connection): connection to the index file.
+
+        Raises:
+          ParseError: if the metadata items cannot be read.
+          sqlite3.Error: if the index cannot be written.
+        """
+        connection.execute("PRAGMA journal_mode=MEMORY")
+        connection.execute("PRAGMA synchronous=OFF")
+
+        connection.execute("CREATE TABLE metadata (key TEXT, value TEXT)")
+        connection.execute(
+            "CREATE TABLE metadata_items (identifier INTEGER PRIMARY KEY, "
+            "parent_identifier INTEGER, name TEXT, content_type TEXT)"
+        )
+        connection.execute(
+            "CREATE TABLE dates (identifier INTEGER, attribute_name TEXT, "
+            "timestamp REAL)"
+        )
+        connection.executemany(
+            "INSERT INTO metadata (key, value) VALUES (?, ?)",
+            [
+                ("format_version", f"{self._FORMAT_VERSION:d}"),
+                ("store_identity", self._store_database.identity or ""),
+            ],
+        )
+
+        attribute_names = set(self._DATE_ATTRIBUTE_NAMES)
+        attribute_names.add(self._CONTENT_TYPE_ATTRIBUTE_NAME)
+        attribute_names.add(self._NAME_ATTRIBUTE_NAME)
+
+        date_rows = []
+        metadata_item_rows = []
+
+        for metadata_item in self._store_database.IterateMetadataItems(
+            attribute_names=attribute_names
+        ):
+            identifier = self._GetIdentifier(metadata_item.identifier)
+            attributes = metadata_item.attributes
+
+            metadata_item_rows.append(
+                (
+                    identifier,
+                    self._GetIdentifier(metadata_item.parent_identifier),
+                    self._GetStringValue(attributes.get(self._NAME_ATTRIBUTE_NAME)),
+                    self._GetStringValue(
+                        attributes.get(self._CONTENT_TYPE_ATTRIBUTE_NAME)
+                    ),
+                )
+            )
+
+            for attribute_name in self._DATE_ATTRIBUTE_NAMES:
+                timestamp = self._GetDateValue(attributes.get(attribute_name))
+                if timestamp is not None:
+                    date_rows.append((identifier, attribute_name, timestamp))
+
+            if len(metadata_item_rows) >= self._BATCH_SIZE:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO metadata_items VALUES (?, ?, ?, ?)",
+                    metadata_item_rows,
+                )
+                metadata_item_rows = []
+
+            if len(date_rows) >= self._BATCH_SIZE:
+                connection.executemany("INSERT INTO dates VALUES (?, ?, ?)", date_rows)
+                date_rows = []
+
+        if metadata_item_rows:
+            connection.executemany(
+                "INSERT OR REPLACE INTO metadata_items VALUES (?, ?, ?, ?)",
+                metadata_item_rows,
+            )
+
+        if date_rows:
+            connection.executemany("INSERT INTO dates VALUES (?, ?, ?)", date_rows)
+
+        # The indexes are created after the values have been inserted, which
+        # is significantly faster than maintaining them during the inserts.
+        connection.execute("CREATE INDEX metadata_items_name ON metadata_items (name)")
+        connection.execute(
+            "CREATE INDEX metadata_items_parent_identifier ON "
+            "metadata_items (parent_identifier)"
+        )
+        connection.execute(
+            "CREATE INDEX dates_attribute_name_timestamp ON "
+            "dates (attribute_name, timestamp)"
+        )
+        connection.commit()
+
+    def _GetDateValue(self, metadata_attribute):
+        """Retrieves a date value of a metadata attribute.
+
+        Args:
+          metadata_attribute (SpotlightStoreMetadataAttribute): metadata attribute.
+
+        Returns:
+          float: date and time value, as a Cocoa timestamp, or None if not
+              available.
+        """
+        value = getattr(metadata_attribute, "value", None)
+        if isinstance(value, (list, tuple)):
+            value = value[0] if value else None
+
+        if not isinstance(value, (float, int)):
+            return None
+
+        return float(value)
+
+    def _GetIdentifier(self, identifier):
+        """Retrieves an identifier as two's complement signed 64-bit integer.
+
+        Args:
+          identifier (int): unsigned 64-bit identifier.
+
+        Returns:
+          int: signed 64-bit identifier.
+        """
+        if identifier < 0x8000000000000000:
+            return identifier
+
+        return identifier - 0x10000000000000000
+
+    def _GetMetadataItems(self, query, parameters):
+        """Retrieves the metadata items that match an index query.
+
+        Args:
+          query (str): SQL query that returns identifiers.
+          parameters (tuple[object, ...]): parameters of the query.
+
+        Yields:
+          SpotlightStoreMetadataItem: metadata item.
+        """
+        cursor = self._connection.execute(query, parameters)
+        identifiers = [identifier & 0xFFFFFFFFFFFFFFFF for (identifier,) in cursor]
+
+        yield from self._store_database.GetMetadataItemsByIdentifiers(identifiers)
+
+    def _GetStringValue(self, metadata_attribute):
+        """Retrieves a string value of a metadata attribute.
+
+        Args:
+          metadata_attribute (SpotlightStoreMetadataAttribute): metadata attribute.
+
+        Returns:
+          str: string value or None if not available.
+        """
+        value = getattr(metadata_attribute, "value", None)
+        if isinstance(value, (list, tuple)):
+            value = value[0] if value else None
+
+        if not isinstance(value, str):
+            return None
+
+        return value
+
+    def Build(self, path):
+        """Builds the index from the metadata items in the store database.
+
+        Args:
+          path (str): path of the index file.
+
+        Raises:
+          OSError: if the index file already exists or the index is already
+              opened.
+        """
+        if self._connection:
+            raise OSError("Index already opened")
+
+        if os.path.exists(path):
+            raise OSError(f"Index file: {path:s} already exists")
+
+        connection = sqlite3.connect(path)
+
+        index_built = False
+        try:
+            self._BuildIndex(connection)
+            index_built = True
+
+        finally:
+            if not index_built:
+                # Remove the partially built index file so that the index can be
+                # built again.
+                connection.close()
+                os.remove(path)
+
+        self._connection = connection
+
+    def Close(self):
+        """Closes the index.
+
+        Raises:
+          OSError: if the index is not opened.
+        """
+        if not self._connection:
+            raise OSError("Index not opened")
+
+        self._connection.close()
+        self._connection = None
+
+    def GetChildMetadataItems(self, parent_identifier):
+        """Retrieves the metadata items of a specific parent.
+
+        Args:
+          parent_identifier (int): file (system) entry identifier of the parent.
+
+        Yields:
+          SpotlightStoreMetadataItem: metadata item.
+        """
+        yield from self._GetMetadataItems(
+            "SELECT identifier FROM metadata_items WHERE parent_identifier = ?",
+            (self._GetIdentifier(parent_identifier),),
+        )
+
+    def GetMetadataItemsByDateRange(self, attribute_name, start_time, end_time):
+        """Retrieves the metadata items with a date in a specific range.
+
+        Args:
+          attribute_name (str): name of the date metadata attribute, such as
+              "_kMDItemContentChangeDate".
+          start_time (float): start of the range, as a Cocoa timestamp, which
+              is included in the range.
+          end_time (float): end of the range, as a Cocoa timestamp, which is
+              not included in the range.
+
+        Yields:
+          SpotlightStoreMetadataItem: metadata item.
+        """
+        yield from self._GetMetadataItems(
+            "SELECT identifier FROM dates WHERE attribute_name = ? AND "
+            "timestamp >= ? AND timestamp < ?",
+            (attribute_name, start_time, end_time),
+        )
+
+    def GetMetadataItemsByNamePrefix(self, name_prefix):
+        """Retrieves the metadata items with a name that starts with a prefix.
+
+        The comparison is case-sensitive.
+
+        Args:
+          name_prefix (str): prefix of the name.
+
+        Yields:
+          SpotlightStoreMetadataItem: metadata item.
+        """
+        # A range instead of LIKE is used so that the name index can be used.
+        yield from self._GetMetadataItems(
+            "SELECT identifier FROM metadata_items WHERE name >= ? AND name < ?",
+            (name_prefix, "".join([name_prefix, "\U0010ffff"])),
+        )
+
+    def Open(self, path):
+        """Opens a previously built index.
+
+        Args:
+          path (str): path of the index file.
+
+        Raises:
+          OSError: if the index file does not exist, is not supported, was not
+              built from the store database or the index is already opened.
+        """
+        if self._connection:
+            raise OSError("Index already opened")
+
+        if not os.path.exists(path):
+            raise OSError(f"No such index file: {path:s}")
+
+        connection = sqlite3.connect(path)
+
+        try:
+            cursor = connection.execute("SELECT key, value FROM metadata")
+            metadata = dict(cursor.fetchall())
+        except sqlite3.DatabaseError as exception:
+            connection.close()
+            raise OSError(f"Unsupported index file: {path:s} with error: {exception!s}")
+
+        if metadata.get("format_version", None) != f"{self._FORMAT_VERSION:d}":
+            connection.close()
+            raise OSError(f"Unsupported index file: {path:s} format version")
+
+        if metadata.get("store_identity", None) != (
+            self._store_database.identity or ""
+        ):
+            connection.close()
+            raise OSError(f"Index file: {path:s} was not built from the store database")
+
+        self._connection = connection
@@ -1,7 +1,9 @@
 """Apple Unified Logging and Activity Tracing files."""
 
 import abc
+import array
 import base64
+import bisect
 import collections
 import os
 import re
@@ -213,6 +215,327 @@ class LogEntry:
         return self.timestamp < other.timestamp
 
 
+class TraceV3FileCheckpoint:
+    """Tracev3 file checkpoint.
+
+    A checkpoint contains the state needed to resume reading log entries from
+    a tracev3 file that has grown since it was last read, such as
+    logdata.LiveData.tracev3.
+
+    Attributes:
+      boot_identifier (str): boot identifier of the tracev3 file, contains
+          an UUID.
+      catalog_offset (int): offset of the chunk header of the most recent
+          catalog relative to the start of the file.
+      file_offset (int): offset of the chunk header of the next chunk to read
+          relative to the start of the file.
+      unreferenced_oversize_chunks (list[tuple[int, int, int]]): offset of
+          the chunk header of the chunk set relative to the start of the file,
+          proc_id and data reference of the Oversize chunks that have not yet
+          been referenced by a firehose tracepoint.
+    """
+
+    def __init__(self):
+        """Initializes a tracev3 file checkpoint."""
+        super().__init__()
+        self.boot_identifier = None
+        self.catalog_offset = None
+        self.file_offset = None
+        self.unreferenced_oversize_chunks = []
+
+    def CopyFromDict(self, checkpoint_values):
+        """Copies the checkpoint from a dictionary.
+
+        Args:
+          checkpoint_values (dict[str, object]): checkpoint values.
+        """
+        self.boot_identifier = checkpoint_values.get("boot_identifier", None)
+        self.catalog_offset = checkpoint_values.get("catalog_offset", None)
+        self.file_offset = checkpoint_values.get("file_offset", None)
+        self.unreferenced_oversize_chunks = [
+            tuple(values)
+            for values in checkpoint_values.get("unreferenced_oversize_chunks", None)
+            or []
+        ]
+
+    def CopyToDict(self):
+        """Copies the checkpoint to a dictionary.
+
+        Returns:
+          dict[str, object]: checkpoint values.
+        """
+        return {
+            "boot_identifier": self.boot_identifier,
+            "catalog_offset": self.catalog_offset,
+            "file_offset": self.file_offset,
+            "unreferenced_oversize_chunks": [
+                list(values) for values in self.unreferenced_oversize_chunks
+            ],
+        }
+
+
+class ActivityIndexGeneration:
+    """Activity index generation.
+
+    A generation contains the activity relationships and log entry references
+    that were added to the activity index, stored as integer arrays sorted by
+    activity identifier.
+
+    Attributes:
+      activity_identifiers (array.array): activity identifiers, sorted.
+      child_activity_identifiers (array.array): activity identifiers, sorted by
+          their parent activity identifier.
+      child_parent_activity_identifiers (array.array): parent activity
+          identifiers, sorted.
+      entry_activity_identifiers (array.array): activity identifiers of log
+          entries, sorted.
+      entry_identifiers (array.array): log entry identifiers, in order of
+          entry_activity_identifiers.
+      parent_activity_identifiers (array.array): parent activity identifiers,
+          in order of activity_identifiers.
+    """
+
+    def __init__(self):
+        """Initializes an activity index generation."""
+        super().__init__()
+        self.activity_identifiers = array.array("Q")
+        self.child_activity_identifiers = array.array("Q")
+        self.child_parent_activity_identifiers = array.array("Q")
+        self.entry_activity_identifiers = array.array("Q")
+        self.entry_identifiers = array.array("Q")
+        self.parent_activity_identifiers = array.array("Q")
+
+
+class ActivityIndex:
+    """Activity index.
+
+    The activity index tracks the creator (parent) relationships of activities
+    and the log entries per activity across multiple tracev3 files, such as all
+    files in a logarchive.
+
+    Relationships and log entry references are added to the current generation,
+    which is converted into sorted integer arrays once it contains the maximum
+    number of values. When the maximum number of generations is exceeded the
+    oldest generation is evicted, which bounds the memory used by the index.
+    """
+
+    def __init__(self, maximum_generation_size=65536, maximum_number_of_generations=16):
+        """Initializes an activity index.
+
+        Args:
+          maximum_generation_size (Optional[int]): maximum number of activity
+              relationships and log entry references per generation.
+          maximum_number_of_generations (Optional[int]): maximum number of
+              generations, including the current generation.
+        """
+        super().__init__()
+        self._child_activity_identifiers_per_parent = collections.defaultdict(list)
+        self._current_generation_size = 0
+        self._entry_identifiers_per_activity_identifier = collections.defaultdict(list)
+        self._generations = collections.deque()
+        self._maximum_generation_size = maximum_generation_size
+        self._maximum_number_of_generations = maximum_number_of_generations
+        self._parent_per_activity_identifier = {}
+
+    @property
+    def number_of_generations(self):
+        """int: number of generations, including the current generation."""
+        return len(self._generations) + 1
+
+    def _AddToCurrentGeneration(self):
+        """Accounts for a value added to the current generation."""
+        self._current_generation_size += 1
+        if self._current_generation_size >= self._maximum_generation_size:
+            self._SealCurrentGeneration()
+
+    def _GetChildActivityIdentifiers(self, activity_identifier):
+        """Retrieves the child activity identifiers.
+
+        Args:
+          activity_identifier (int): activity identifier.
+
+        Returns:
+          list[int]: child activity identifiers.
+        """
+        child_activity_identifiers = list(
+            self._child_activity_identifiers_per_parent.get(activity_identifier, [])
+        )
+        for generation in self._generations:
+            parent_activity_identifiers = generation.child_parent_activity_identifiers
+            index = bisect.bisect_left(parent_activity_identifiers, activity_identifier)
+            end_index = bisect.bisect_right(
+                parent_activity_identifiers, activity_identifier, lo=index
+            )
+            child_activity_identifiers.extend(
+                generation.child_activity_identifiers[index:end_index]
+            )
+
+        return child_activity_identifiers
+
+    def _SealCurrentGeneration(self):
+        """Converts the current generation into sorted integer arrays."""
+        generation = ActivityIndexGeneration()
+
+        for activity_identifier, parent_activity_identifier in sorted(
+            self._parent_per_activity_identifier.items()
+        ):
+            generation.activity_identifiers.append(activity_identifier)
+            generation.parent_activity_identifiers.append(parent_activity_identifier)
+
+        for parent_activity_identifier, child_activity_identifiers in sorted(
+            self._child_activity_identifiers_per_parent.items()
+        ):
+            generation.child_activity_identifiers.extend(child_activity_identifiers)
+            generation.child_parent_activity_identifiers.extend(
+                [parent_activity_identifier] * len(child_activity_identifiers)
+            )
+
+        for activity_identifier, entry_identifiers in sorted(
+            self._entry_identifiers_per_activity_identifier.items()
+        ):
+            generation.entry_activity_identifiers.extend(
+                [activity_identifier] * len(entry_identifiers)
+            )
+            generation.entry_identifiers.extend(entry_identifiers)
+
+        # Newer generations are stored first so that they take precedence.
+        self._generations.appendleft(generation)
+        while len(self._generations) >= self._maximum_number_of_generations:
+            self._generations.pop()
+
+        self._child_activity_identifiers_per_parent = collections.defaultdict(list)
+        self._current_generation_size = 0
+        self._entry_identifiers_per_activity_identifier = collections.defaultdict(list)
+        self._parent_per_activity_identifier = {}
+
+    def AddActivity(self, activity_identifier, parent_activity_identifier):
+        """Adds an activity relationship.
+
+        Args:
+          activity_identifier (int): activity identifier.
+          parent_activity_identifier (int): parent (creator) activity identifier.
+        """
+        self._parent_per_activity_identifier[activity_identifier] = (
+            parent_activity_identifier
+        )
+        self._child_activity_identifiers_per_parent[parent_activity_identifier].append(
+            activity_identifier
+        )
+        self._AddToCurrentGeneration()
+
+    def AddLogEntry(self, log_entry, entry_identifier=None):
+        """Adds a log entry.
+
+        Args:
+          log_entry (LogEntry): log entry.
+          entry_identifier (Optional[int]): identifier of the log entry, such as
+              its sequence number, which is returned by GetEntryIdentifiers.
+              If None the log entry is only used to track activity
+              relationships.
+        """
+        activity_identifier = log_entry.activity_identifier or 0
+
+        if log_entry.creator_activity_identifier is not None:
+            self.AddActivity(
+                activity_identifier,
+                log_entry.creator_activity_identifier
+                & TraceV3File.ACTIVITY_IDENTIFIER_BITMASK,
+            )
+
+        if entry_identifier is not None and activity_identifier:
+            self._entry_identifiers_per_activity_identifier[activity_identifier].append(
+                entry_identifier
+            )
+            self._AddToCurrentGeneration()
+
+    def GetDescendantActivityIdentifiers(self, activity_identifier):
+        """Retrieves the activity identifier and those of its descendants.
+
+        Args:
+          activity_identifier (int): activity identifier.
+
+        Returns:
+          set[int]: activity identifier and the activity identifiers of its
+              descendants.
+        """
+        activity_identifiers = set([activity_identifier])
+
+        activity_identifiers_to_resolve = [activity_identifier]
+        while activity_identifiers_to_resolve:
+            parent_activity_identifier = activity_identifiers_to_resolve.pop()
+            for child_activity_identifier in self._GetChildActivityIdentifiers(
+                parent_activity_identifier
+            ):
+                if child_activity_identifier not in activity_identifiers:
+                    activity_identifiers.add(child_activity_identifier)
+                    activity_identifiers_to_resolve.append(child_activity_identifier)
+
+        return activity_identifiers
+
+    def GetEntryIdentifiers(self, activity_identifier, include_descendants=True):
+        """Retrieves the identifiers of the log entries of an activity.
+
+        Args:
+          activity_identifier (int): activity identifier.
+          include_descendants (Optional[bool]): True if the log entries of
+              descendant activities should be included.
+
+        Returns:
+          list[int]: sorted log entry identifiers.
+        """
+        if include_descendants:
+            activity_identifiers = self.GetDescendantActivityIdentifiers(
+                activity_identifier
+            )
+        else:
+            activity_identifiers = [activity_identifier]
+
+        entry_identifiers = []
+        for lookup_activity_identifier in activity_identifiers:
+            entry_identifiers.extend(
+                self._entry_identifiers_per_activity_identifier.get(
+                    lookup_activity_identifier, []
+                )
+            )
+            for generation in self._generations:
+                entry_activity_identifiers = generation.entry_activity_identifiers
+                index = bisect.bisect_left(
+                    entry_activity_identifiers, lookup_activity_identifier
+                )
+                end_index = bisect.bisect_right(
+                    entry_activity_identifiers, lookup_activity_identifier, lo=index
+                )
+                entry_identifiers.extend(generation.entry_identifiers[index:end_index])
+
+        return sorted(entry_identifiers)
+
+    def GetParentActivityIdentifier(self, activity_identifier):
+        """Retrieves the parent activity identifier.
+
+        Args:
+          activity_identifier (int): activity identifier.
+
+        Returns:
+          int: parent (creator) activity identifier or None if not available.
+        """
+        parent_activity_identifier = self._parent_per_activity_identifier.get(
+            activity_identifier, None
+        )
+        if parent_activity_identifier is not None:
+            return parent_activity_identifier
+
+        for generation in self._generations:
+            activity_identifiers = generation.activity_identifiers
+            index = bisect.bisect_left(activity_identifiers, activity_identifier)
+            if (
+                index < len(activity_identifiers)
+                and activity_identifiers[index] == activity_identifier
+            ):
+                return generation.parent_activity_identifiers[index]
+
+        return None
+
+
 class FormatStringOperator:
     """Format string operator.
 
@@ -2634,11 +2957,18 @@ class TraceV3File(data_format.BinaryDataFile):
         self._timesync_path = None
         self._timesync_sync_records = []
         self._timesync_timebase = 1.0
+        self._unreferenced_oversize_chunks = {}
         self._uuidtext_path = None
 
     def _BuildCatalogProcessInformationEntries(self, catalog):
         """Builds the catalog process information lookup table.
 
+        The lookup table is keyed by the proc_id, which consists of the upper
+        and lower proc_id values as: (upper << 32) | lower. Per process
+        information entry the sub system strings are resolved once and
+        the ranges of the load addresses of the images are sorted, so that they
+        can be looked up efficiently per firehose tracepoint.
+
         Args:
           catalog (tracev3_catalog): catalog.
 
@@ -2675,17 +3005,76 @@ class TraceV3File(data_format.BinaryDataFile):
 
                 self._DebugPrintText("\n")
 
+            process_information_entry.sub_system_strings = {}
+            for sub_system_entry in process_information_entry.sub_system_entries:
+                category = self._catalog_strings_map.get(
+                    sub_system_entry.category_offset, None
+                )
+                sub_system = self._catalog_strings_map.get(
+                    sub_system_entry.sub_system_offset, None
+                )
+                process_information_entry.sub_system_strings[
+                    sub_system_entry.identifier
+                ] = (category, sub_system)
+
+            self._BuildLoadAddressRanges(catalog, process_information_entry)
+
             proc_id = (
-                f"{process_information_entry.proc_id_upper:d}@"
-                f"{process_information_entry.proc_id_lower:d}"
-            )
+                process_information_entry.proc_id_upper << 32
+            ) | process_information_entry.proc_id_lower
             if proc_id in self._catalog_process_information_entries:
-                raise errors.ParseError(f"proc_id: {proc_id:s} already set")
+                raise errors.ParseError(
+                    f"proc_id: {process_information_entry.proc_id_upper:d}@"
+                    f"{process_information_entry.proc_id_lower:d} already set"
+                )
 
             self._catalog_process_information_entries[proc_id] = (
                 process_information_entry
             )
 
+    def _BuildLoadAddressRanges(self, catalog, process_information_entry):
+        """Builds the sorted load address ranges of a process information entry.
+
+        The ranges are stored in the process information entry as
+        "load_address_ranges", a list of tuples of the start and end load address
+        and the image identifier, sorted by start load address, and
+        "load_address_range_starts" and "load_address_range_maximum_ends" which
+        contain the start load address and the largest end load address up to and
+        including the range, used for binary search.
+
+        Args:
+          catalog (tracev3_catalog): catalog.
+          process_information_entry (tracev3_catalog_process_information_entry):
+              process information entry.
+        """
+        load_address_ranges = []
+        for uuid_entry in process_information_entry.uuid_entries:
+            start_load_address = (
+                uuid_entry.load_address_upper << 32
+            ) | uuid_entry.load_address_lower
+            end_load_address = start_load_address + uuid_entry.size
+            image_identifier = catalog.uuids[uuid_entry.uuid_index]
+
+            load_address_ranges.append(
+                (start_load_address, end_load_address, image_identifier)
+            )
+
+        load_address_ranges.sort(key=lambda load_address_range: load_address_range[0])
+
+        maximum_end_load_address = 0
+        maximum_end_load_addresses = []
+        for _, end_load_address, _ in load_address_ranges:
+            maximum_end_load_address = max(maximum_end_load_address, end_load_address)
+            maximum_end_load_addresses.append(maximum_end_load_address)
+
+        process_information_entry.load_address_ranges = load_address_ranges
+        process_information_entry.load_address_range_maximum_ends = (
+            maximum_end_load_addresses
+        )
+        process_information_entry.load_address_range_starts = [
+            start_load_address for start_load_address, _, _ in load_address_ranges
+        ]
+
     def _CalculateFormatStringReference(self, tracepoint_data_object, string_reference):
         """Calculates the format string reference.
 
@@ -3069,12 +3458,12 @@ class TraceV3File(data_format.BinaryDataFile):
         """Retrieves the data items and values data.
 
         Args:
-          proc_id (str): firehose tracepoint proc_id value.
+          proc_id (int): firehose tracepoint proc_id value.
           tracepoint_data_object (object): firehose tracepoint data object.
           values_data (bytes): (public) values data.
           private_data (bytes): private data.
-          oversize_chunks (dict[str, oversize_chunk]): Oversize chunks per data
-              reference.
+          oversize_chunks (dict[tuple[int, int], oversize_chunk]): Oversize chunks
+              per proc_id and data reference.
 
         Returns:
           tuple[list[tracev3_data_item], bytes, bytes]: data items and values
@@ -3085,9 +3474,10 @@ class TraceV3File(data_format.BinaryDataFile):
             data_items = getattr(tracepoint_data_object, "data_items", None)
             return data_items, values_data, private_data
 
-        lookup_key = f"{proc_id:s}:{data_reference:04x}"
+        lookup_key = (proc_id, data_reference)
         oversize_chunk = oversize_chunks.get(lookup_key)
         if oversize_chunk:
+            self._unreferenced_oversize_chunks.pop(lookup_key, None)
             return (
                 oversize_chunk.data_items,
                 oversize_chunk.values_data,
@@ -3163,27 +3553,32 @@ class TraceV3File(data_format.BinaryDataFile):
 
         if strings_file_type == 0x0008:
             load_address_upper = tracepoint_data_object.load_address_upper or 0
-            load_address_lower = tracepoint_data_object.load_address_lower
+            load_address = (
+                load_address_upper << 32
+            ) | tracepoint_data_object.load_address_lower
 
-            for uuid_entry in process_information_entry.uuid_entries:
-                if (
-                    load_address_upper != uuid_entry.load_address_upper
-                    or load_address_lower < uuid_entry.load_address_lower
-                ):
-                    continue
-
-                if load_address_lower <= (
-                    uuid_entry.load_address_lower + uuid_entry.size
+            load_address_ranges = getattr(
+                process_information_entry, "load_address_ranges", None
+            )
+            if load_address_ranges:
+                maximum_end_load_addresses = (
+                    process_information_entry.load_address_range_maximum_ends
+                )
+                range_index = bisect.bisect_right(
+                    process_information_entry.load_address_range_starts, load_address
+                )
+                while (
+                    range_index > 0
+                    and maximum_end_load_addresses[range_index - 1] >= load_address
                 ):
-                    if self._catalog:
-                        strings_file_identifier = self._catalog.uuids[
-                            uuid_entry.uuid_index
-                        ]
-
-                    image_text_offset = uuid_entry.load_address_lower | (
-                        uuid_entry.load_address_upper << 32
+                    range_index -= 1
+                    start_load_address, end_load_address, image_identifier = (
+                        load_address_ranges[range_index]
                     )
-                    break
+                    if load_address <= end_load_address:
+                        strings_file_identifier = image_identifier
+                        image_text_offset = start_load_address
+                        break
 
             if not strings_file_identifier:
                 # ~~> no uuid found for absolute pc
@@ -3313,16 +3708,14 @@ class TraceV3File(data_format.BinaryDataFile):
         category = None
         sub_system = None
 
-        # TODO: build a look up table of entries per identifier.
         if process_information_entry and sub_system_identifier is not None:
-            for sub_system_entry in process_information_entry.sub_system_entries:
-                if sub_system_entry.identifier == sub_system_identifier:
-                    category = self._catalog_strings_map.get(
-                        sub_system_entry.category_offset, None
-                    )
-                    sub_system = self._catalog_strings_map.get(
-                        sub_system_entry.sub_system_offset, None
-                    )
+            sub_system_strings = getattr(
+                process_information_entry, "sub_system_strings", None
+            )
+            if sub_system_strings:
+                category, sub_system = sub_system_strings.get(
+                    sub_system_identifier, (None, None)
+                )
 
         if self._debug and sub_system_identifier is not None:
             self._DebugPrintDecimalValue("Sub system identifier", sub_system_identifier)
@@ -3622,8 +4015,8 @@ class TraceV3File(data_format.BinaryDataFile):
           file_offset (int): offset of the chunk set data relative to the start
               of the file.
           chunk_header (tracev3_chunk_header): the chunk header of the chunk set.
-          oversize_chunks (dict[str, oversize_chunk]): Oversize chunks per data
-              reference.
+          oversize_chunks (dict[tuple[int, int], oversize_chunk]): Oversize chunks
+              per proc_id and data reference.
 
         Yields:
           LogEntry: a log entry.
@@ -3631,42 +4024,14 @@ class TraceV3File(data_format.BinaryDataFile):
         Raises:
           ParseError: if the chunk header cannot be read.
         """
-        chunk_data = file_object.read(chunk_header.chunk_data_size)
-
-        data_type_map = self._GetDataTypeMap("tracev3_lz4_block_header")
-
-        lz4_block_header, _ = self._ReadStructureFromFileObject(
-            file_object, file_offset, data_type_map, "LZ4 block header"
+        uncompressed_data = self._ReadChunkSetData(
+            file_object, file_offset, chunk_header
         )
-        if self._debug:
-            debug_info = self._DEBUG_INFORMATION.get("tracev3_lz4_block_header")
-            self._DebugPrintStructureObject(lz4_block_header, debug_info)
-
-        # TODO: add support for multi block compressed data.
-        if lz4_block_header.signature == b"bv41":
-            end_of_data_offset = 12 + lz4_block_header.compressed_data_size
-            uncompressed_data = lz4.block.decompress(
-                chunk_data[12:end_of_data_offset],
-                uncompressed_size=lz4_block_header.uncompressed_data_size,
-            )
-
-        elif lz4_block_header.signature == b"bv4-":
-            end_of_data_offset = 8 + lz4_block_header.uncompressed_data_size
-            uncompressed_data = chunk_data[8:end_of_data_offset]
-
-        else:
-            raise errors.ParseError("Unsupported start of LZ4 block marker")
-
-        end_of_lz4_block_marker = chunk_data[
-            end_of_data_offset : end_of_data_offset + 4
-        ]
-        if end_of_lz4_block_marker != b"bv4$":
-            raise errors.ParseError("Unsupported end of LZ4 block marker")
 
         data_type_map = self._GetDataTypeMap("tracev3_chunk_header")
 
         data_offset = 0
-        while data_offset < lz4_block_header.uncompressed_data_size:
+        while data_offset < len(uncompressed_data):
             if self._debug:
                 self._DebugPrintText(f"Chunk: {self._chunk_index:d}\n")
                 self._chunk_index += 1
@@ -3705,13 +4070,16 @@ class TraceV3File(data_format.BinaryDataFile):
                     chunkset_chunk_header.chunk_data_size,
                     data_offset,
                 )
-                lookup_key = (
-                    f"{oversize_chunk.proc_id_upper:d}@"
-                    f"{oversize_chunk.proc_id_lower:d}:"
-                    f"{oversize_chunk.data_reference:04x}"
-                )
+                proc_id = (
+                    oversize_chunk.proc_id_upper << 32
+                ) | oversize_chunk.proc_id_lower
+                lookup_key = (proc_id, oversize_chunk.data_reference)
                 oversize_chunks[lookup_key] = oversize_chunk
 
+                # Track the chunk set that contains the Oversize chunk until it is
+                # referenced, so that it can be restored from a checkpoint.
+                self._unreferenced_oversize_chunks[lookup_key] = file_offset - 16
+
             elif chunkset_chunk_header.chunk_tag == self._CHUNK_TAG_STATEDUMP:
                 yield from self._ReadStateDumpChunkData(
                     chunkset_chunk_data,
@@ -3735,6 +4103,115 @@ class TraceV3File(data_format.BinaryDataFile):
 
             data_offset += alignment
 
+    def _ReadChunkSetData(self, file_object, file_offset, chunk_header):
+        """Reads and decompresses the data of a chunk set.
+
+        Args:
+          file_object (file): file-like object.
+          file_offset (int): offset of the chunk set data relative to the start
+              of the file.
+          chunk_header (tracev3_chunk_header): the chunk header of the chunk set.
+
+        Returns:
+          bytes: uncompressed chunk set data.
+
+        Raises:
+          ParseError: if the chunk set data cannot be read.
+        """
+        chunk_data = self._ReadData(
+            file_object, file_offset, chunk_header.chunk_data_size, "chunk set"
+        )
+
+        data_type_map = self._GetDataTypeMap("tracev3_lz4_block_header")
+
+        lz4_block_header = self._ReadStructureFromByteStream(
+            chunk_data, file_offset, data_type_map, "LZ4 block header"
+        )
+        if self._debug:
+            debug_info = self._DEBUG_INFORMATION.get("tracev3_lz4_block_header")
+            self._DebugPrintStructureObject(lz4_block_header, debug_info)
+
+        # TODO: add support for multi block compressed data.
+        if lz4_block_header.signature == b"bv41":
+            end_of_data_offset = 12 + lz4_block_header.compressed_data_size
+            uncompressed_data = lz4.block.decompress(
+                chunk_data[12:end_of_data_offset],
+                uncompressed_size=lz4_block_header.uncompressed_data_size,
+            )
+
+        elif lz4_block_header.signature == b"bv4-":
+            end_of_data_offset = 8 + lz4_block_header.uncompressed_data_size
+            uncompressed_data = chunk_data[8:end_of_data_offset]
+
+        else:
+            raise errors.ParseError("Unsupported start of LZ4 block marker")
+
+        end_of_lz4_block_marker = chunk_data[
+            end_of_data_offset : end_of_data_offset + 4
+        ]
+        if end_of_lz4_block_marker != b"bv4$":
+            raise errors.ParseError("Unsupported end of LZ4 block marker")
+
+        return uncompressed_data
+
+    def _ReadChunkSetOversizeChunks(
+        self, file_object, file_offset, chunk_header, oversize_chunks
+    ):
+        """Reads the Oversize chunks of a chunk set.
+
+        Other chunks in the chunk set are skipped, which is used to restore
+        the Oversize chunks referenced by firehose chunks in subsequent chunk
+        sets when resuming from a checkpoint.
+
+        Args:
+          file_object (file): file-like object.
+          file_offset (int): offset of the chunk set data relative to the start
+              of the file.
+          chunk_header (tracev3_chunk_header): the chunk header of the chunk set.
+          oversize_chunks (dict[tuple[int, int], oversize_chunk]): Oversize chunks
+              per proc_id and data reference.
+
+        Raises:
+          ParseError: if the chunk set cannot be read.
+        """
+        uncompressed_data = self._ReadChunkSetData(
+            file_object, file_offset, chunk_header
+        )
+
+        data_type_map = self._GetDataTypeMap("tracev3_chunk_header")
+
+        data_offset = 0
+        while data_offset < len(uncompressed_data):
+            chunkset_chunk_header = self._ReadStructureFromByteStream(
+                uncompressed_data[data_offset:],
+                data_offset,
+                data_type_map,
+                "chunk header",
+            )
+            data_offset += 16
+
+            data_end_offset = data_offset + chunkset_chunk_header.chunk_data_size
+
+            if chunkset_chunk_header.chunk_tag == self._CHUNK_TAG_OVERSIZE:
+                oversize_chunk = self._ReadOversizeChunkData(
+                    uncompressed_data[data_offset:data_end_offset],
+                    chunkset_chunk_header.chunk_data_size,
+                    data_offset,
+                )
+                proc_id = (
+                    oversize_chunk.proc_id_upper << 32
+                ) | oversize_chunk.proc_id_lower
+                lookup_key = (proc_id, oversize_chunk.data_reference)
+                oversize_chunks[lookup_key] = oversize_chunk
+
+            data_offset = data_end_offset
+
+            _, alignment = divmod(data_offset, 8)
+            if alignment > 0:
+                alignment = 8 - alignment
+
+            data_offset += alignment
+
     def _ReadBacktraceData(self, flags, backtrace_data, data_offset):
         """Reads firehose tracepoint backtrace data.
 
@@ -3905,8 +4382,8 @@ class TraceV3File(data_format.BinaryDataFile):
           chunk_data_size (int): size of the firehose chunk data.
           data_offset (int): offset of the firehose chunk relative to the start
               of the chunk set.
-          oversize_chunks (dict[str, oversize_chunk]): Oversize chunks per data
-              reference.
+          oversize_chunks (dict[tuple[int, int], oversize_chunk]): Oversize chunks
+              per proc_id and data reference.
 
         Yields:
           LogEntry: a log entry.
@@ -3926,9 +4403,7 @@ class TraceV3File(data_format.BinaryDataFile):
                 firehose_header.base_continuous_time, description="Base continuous time"
             )
 
-        proc_id = (
-            f"{firehose_header.proc_id_upper:d}@" f"{firehose_header.proc_id_lower:d}"
-        )
+        proc_id = (firehose_header.proc_id_upper << 32) | firehose_header.proc_id_lower
         if not self._catalog:
             process_information_entry = None
         else:
@@ -3937,8 +4412,9 @@ class TraceV3File(data_format.BinaryDataFile):
             )
             if not process_information_entry:
                 raise errors.ParseError(
-                    f"Unable to retrieve process information entry: {proc_id:s} from "
-                    f"catalog"
+                    f"Unable to retrieve process information entry: "
+                    f"{firehose_header.proc_id_upper:d}@"
+                    f"{firehose_header.proc_id_lower:d} from catalog"
                 )
 
         chunk_data_offset = 32
@@ -4716,16 +5192,17 @@ class TraceV3File(data_format.BinaryDataFile):
             )
 
         proc_id = (
-            f"{simpledump_chunk.proc_id_upper:d}@" f"{simpledump_chunk.proc_id_lower:d}"
-        )
+            simpledump_chunk.proc_id_upper << 32
+        ) | simpledump_chunk.proc_id_lower
         process_information_entry = self._catalog_process_information_entries.get(
             proc_id
         )
         if not process_information_entry:
             self._RaiseParserWarning(
                 (
-                    f"Unable to retrieve process information entry: {proc_id:s} from "
-                    f"catalog"
+                    f"Unable to retrieve process information entry: "
+                    f"{simpledump_chunk.proc_id_upper:d}@"
+                    f"{simpledump_chunk.proc_id_lower:d} from catalog"
                 )
             )
 
@@ -4792,16 +5269,15 @@ class TraceV3File(data_format.BinaryDataFile):
                 "Trailing StateDump chunk data", chunk_data[context.byte_size :]
             )
 
-        proc_id = (
-            f"{statedump_chunk.proc_id_upper:d}@" f"{statedump_chunk.proc_id_lower:d}"
-        )
+        proc_id = (statedump_chunk.proc_id_upper << 32) | statedump_chunk.proc_id_lower
         process_information_entry = self._catalog_process_information_entries.get(
             proc_id
         )
         if not process_information_entry:
             self._RaiseParserWarning(
-                f"Unable to retrieve process information entry: {proc_id:s} from "
-                f"catalog"
+                f"Unable to retrieve process information entry: "
+                f"{statedump_chunk.proc_id_upper:d}@"
+                f"{statedump_chunk.proc_id_lower:d} from catalog"
             )
 
         event_message = ""
@@ -5010,15 +5486,124 @@ class TraceV3File(data_format.BinaryDataFile):
                 description="Continuous sub chunk time",
             )
 
-    def ReadLogEntries(self):
+    def _ReadCheckpoint(self, checkpoint, oversize_chunks):
+        """Restores the read state from a checkpoint.
+
+        Args:
+          checkpoint (TraceV3FileCheckpoint): checkpoint.
+          oversize_chunks (dict[tuple[int, int], oversize_chunk]): Oversize chunks
+              per proc_id and data reference.
+
+        Raises:
+          ParseError: if the checkpoint does not correspond with the file or
+              the state cannot be restored.
+        """
+        boot_identifier_string = str(self._boot_identifier).upper()
+        if checkpoint.boot_identifier != boot_identifier_string:
+            raise errors.ParseError(
+                f"Checkpoint boot identifier: {checkpoint.boot_identifier!s} does "
+                f"not match file boot identifier: {boot_identifier_string:s}"
+            )
+
+        # Note that the file offset is 8-byte aligned and can exceed the file size
+        # when the last chunk in the file is not padded.
+        if checkpoint.file_offset >= self._file_size + 8:
+            raise errors.ParseError(
+                f"Checkpoint file offset: {checkpoint.file_offset:d} exceeds file "
+                f"size: {self._file_size:d}"
+            )
+
+        if checkpoint.catalog_offset is not None:
+            chunk_header = self._ReadChunkHeader(
+                self._file_object, checkpoint.catalog_offset
+            )
+            if chunk_header.chunk_tag != self._CHUNK_TAG_CATALOG:
+                raise errors.ParseError(
+                    f"Unsupported catalog chunk tag: "
+                    f"0x{chunk_header.chunk_tag:04x}."
+                )
+
+            self._catalog = self._ReadCatalog(
+                self._file_object,
+                checkpoint.catalog_offset + 16,
+                chunk_header.chunk_data_size,
+            )
+            self._BuildCatalogProcessInformationEntries(self._catalog)
+
+        lookup_keys_per_chunk_set_offset = {}
+        for (
+            chunk_set_offset,
+            proc_id,
+            data_reference,
+        ) in checkpoint.unreferenced_oversize_chunks:
+            lookup_keys = lookup_keys_per_chunk_set_offset.setdefault(
+                chunk_set_offset, []
+            )
+            lookup_keys.append((proc_id, data_reference))
+
+        for chunk_set_offset, lookup_keys in sorted(
+            lookup_keys_per_chunk_set_offset.items()
+        ):
+            chunk_header = self._ReadChunkHeader(self._file_object, chunk_set_offset)
+            if chunk_header.chunk_tag != self._CHUNK_TAG_CHUNK_SET:
+                raise errors.ParseError(
+                    f"Unsupported chunk set chunk tag: "
+                    f"0x{chunk_header.chunk_tag:04x}."
+                )
+
+            chunk_set_oversize_chunks = {}
+            self._ReadChunkSetOversizeChunks(
+                self._file_object,
+                chunk_set_offset + 16,
+                chunk_header,
+                chunk_set_oversize_chunks,
+            )
+
+            for lookup_key in lookup_keys:
+                oversize_chunk = chunk_set_oversize_chunks.get(lookup_key, None)
+                if not oversize_chunk:
+                    proc_id, data_reference = lookup_key
+                    raise errors.ParseError(
+                        f"Missing Oversize chunk with proc_id: {proc_id:d} and data "
+                        f"reference: {data_reference:d} in chunk set at offset: "
+                        f"{chunk_set_offset:d}"
+                    )
+
+                oversize_chunks[lookup_key] = oversize_chunk
+                self._unreferenced_oversize_chunks[lookup_key] = chunk_set_offset
+
+    def ReadLogEntries(self, checkpoint=None):
         """Reads log traces.
 
+        If a checkpoint is provided, reading resumes from the position stored
+        in the checkpoint, and the checkpoint is updated after every chunk that
+        was read completely. Chunks that were not yet completely written, such
+        as at the end of a logdata.LiveData.tracev3 file, are left for a next
+        read. Log entries of a chunk set that was only partially consumed will
+        be read again when resuming.
+
+        Args:
+          checkpoint (Optional[TraceV3FileCheckpoint]): checkpoint, where reading
+              starts at the beginning of the file if the file offset of
+              the checkpoint is not set.
+
         Yields:
           LogEntry: a log entry.
 
         Raises:
           ParseError: if the file cannot be read.
         """
+        oversize_chunks = {}
+        self._unreferenced_oversize_chunks = {}
+
+        if checkpoint and checkpoint.file_offset is not None:
+            self._ReadCheckpoint(checkpoint, oversize_chunks)
+
+            yield from self._ReadLogEntriesFromChunks(
+                checkpoint.file_offset, oversize_chunks, checkpoint=checkpoint
+            )
+            return
+
         if self._timesync_boot_record:
             boot_identifier_string = str(self._boot_identifier).upper()
 
@@ -5056,26 +5641,73 @@ class TraceV3File(data_format.BinaryDataFile):
 
         file_offset = self._file_object.tell()
 
-        oversize_chunks = {}
+        if checkpoint:
+            checkpoint.boot_identifier = str(self._boot_identifier).upper()
+            checkpoint.catalog_offset = None
+            checkpoint.file_offset = file_offset
+            checkpoint.unreferenced_oversize_chunks = []
+
+        yield from self._ReadLogEntriesFromChunks(
+            file_offset, oversize_chunks, checkpoint=checkpoint
+        )
+
+    def _ReadLogEntriesFromChunks(self, file_offset, oversize_chunks, checkpoint=None):
+        """Reads log traces from the catalog and chunk set chunks.
+
+        Args:
+          file_offset (int): offset of the first chunk header relative to the start
+              of the file.
+          oversize_chunks (dict[tuple[int, int], oversize_chunk]): Oversize chunks
+              per proc_id and data reference.
+          checkpoint (Optional[TraceV3FileCheckpoint]): checkpoint to update after
+              every chunk that was read completely.
+
+        Yields:
+          LogEntry: a log entry.
 
+        Raises:
+          ParseError: if the file cannot be read.
+        """
         while file_offset < self._file_size:
+            if checkpoint and file_offset + 16 > self._file_size:
+                break
+
             if self._debug:
                 self._DebugPrintText(f"Chunk: {self._chunk_index:d}\n")
                 self._chunk_index += 1
 
+            chunk_offset = file_offset
+
             chunk_header = self._ReadChunkHeader(self._file_object, file_offset)
             file_offset += 16
 
+            if checkpoint and (
+                file_offset + chunk_header.chunk_data_size > self._file_size
+            ):
+                break
+
             if chunk_header.chunk_tag == self._CHUNK_TAG_CATALOG:
                 self._catalog = self._ReadCatalog(
                     self._file_object, file_offset, chunk_header.chunk_data_size
                 )
                 self._BuildCatalogProcessInformationEntries(self._catalog)
 
+                if checkpoint:
+                    checkpoint.catalog_offset = chunk_offset
+
             elif chunk_header.chunk_tag == self._CHUNK_TAG_CHUNK_SET:
                 yield from self._ReadChunkSet(
                     self._file_object, file_offset, chunk_header, oversize_chunks
                 )
+
+                if checkpoint:
+                    checkpoint.unreferenced_oversize_chunks = sorted(
+                        (chunk_set_offset, proc_id, data_reference)
+                        for (proc_id, data_reference), chunk_set_offset in (
+                            self._unreferenced_oversize_chunks.items()
+                        )
+                    )
+
             else:
                 raise errors.ParseError(
                     f"Unsupported chunk tag: 0x{chunk_header.chunk_tag:04x}."
@@ -5089,6 +5721,9 @@ class TraceV3File(data_format.BinaryDataFile):
 
             file_offset += alignment
 
+            if checkpoint:
+                checkpoint.file_offset = file_offset
+
 
 class UUIDTextFile(data_format.BinaryDataFile):
     """Apple Unified Logging and Activity Tracing (uuidtext) file."""
@@ -0,0 +1,171 @@
+"""Variable size integer (varint) decoding functions.
+
+The functions read the integers at an offset in the data instead of from
+the start of the data, so that the data does not need to be sliced (copied)
+per integer. The data can be a bytes, bytearray or memoryview object.
+"""
+
+
+def _GetSpotlightFirstByteValues():
+    """Determines the values of the first byte of Spotlight variable size integers.
+
+    Returns:
+      list[tuple[int, int]]: number of additional bytes and the integer value
+          stored in the first byte, per first byte value.
+    """
+    first_byte_values = []
+    for byte_value in range(256):
+        number_of_additional_bytes = 0
+        for bitmask in (0x80, 0xC0, 0xE0, 0xF0, 0xF8, 0xFC, 0xFE, 0xFF):
+            if byte_value & bitmask != bitmask:
+                break
+            number_of_additional_bytes += 1
+
+        if number_of_additional_bytes > 4:
+            byte_value = 0
+        elif number_of_additional_bytes > 0:
+            byte_value &= bitmask ^ 0xFF
+
+        first_byte_values.append((number_of_additional_bytes, byte_value))
+
+    return first_byte_values
+
+
+_SPOTLIGHT_FIRST_BYTE_VALUES = _GetSpotlightFirstByteValues()
+
+
+def ReadBase128VariableSizeInteger(data, data_offset=0):
+    """Reads a base-128 (LEB128) variable size integer, such as used by LevelDB.
+
+    Args:
+      data (bytes|bytearray|memoryview): data.
+      data_offset (Optional[int]): offset of the integer relative to the start
+          of the data.
+
+    Returns:
+      tuple[int, int]: integer value and number of bytes read.
+    """
+    data_size = len(data)
+
+    byte_value = data[data_offset]
+    bytes_read = 1
+    bit_shift = 0
+
+    integer_value = byte_value & 0x7F
+
+    while byte_value & 0x80 and data_offset + bytes_read < data_size:
+        byte_value = data[data_offset + bytes_read]
+        bytes_read += 1
+        bit_shift += 7
+
+        integer_value |= (byte_value & 0x7F) << bit_shift
+
+    return integer_value, bytes_read
+
+
+def ReadBase128VariableSizeIntegers(data, data_offset, number_of_values):
+    """Reads consecutive base-128 (LEB128) variable size integers.
+
+    Args:
+      data (bytes|bytearray|memoryview): data.
+      data_offset (int): offset of the first integer relative to the start of
+          the data.
+      number_of_values (int): number of integers to read.
+
+    Returns:
+      tuple[list[int], int]: integer values and number of bytes read.
+    """
+    data_size = len(data)
+    integer_values = []
+
+    value_offset = data_offset
+    for _ in range(number_of_values):
+        byte_value = data[value_offset]
+        value_offset += 1
+        bit_shift = 0
+
+        integer_value = byte_value & 0x7F
+
+        while byte_value & 0x80 and value_offset < data_size:
+            byte_value = data[value_offset]
+            value_offset += 1
+            bit_shift += 7
+
+            integer_value |= (byte_value & 0x7F) << bit_shift
+
+        integer_values.append(integer_value)
+
+    return integer_values, value_offset - data_offset
+
+
+def ReadSpotlightVariableSizeInteger(data, data_offset=0):
+    """Reads a Spotlight variable size integer.
+
+    The number of leading bits set in the first byte indicates the number of
+    additional big-endian bytes of the integer.
+
+    Args:
+      data (bytes|bytearray|memoryview): data.
+      data_offset (Optional[int]): offset of the integer relative to the start
+          of the data.
+
+    Returns:
+      tuple[int, int]: integer value and number of bytes read.
+
+    Raises:
+      ValueError: if the data is too small to contain the integer.
+    """
+    number_of_additional_bytes, integer_value = _SPOTLIGHT_FIRST_BYTE_VALUES[
+        data[data_offset]
+    ]
+    if not number_of_additional_bytes:
+        return integer_value, 1
+
+    data_offset += 1
+    data_end_offset = data_offset + number_of_additional_bytes
+    if data_end_offset > len(data):
+        raise ValueError("Data too small to contain variable size integer.")
+
+    integer_value <<= 8 * number_of_additional_bytes
+    integer_value |= int.from_bytes(data[data_offset:data_end_offset], "big")
+
+    return integer_value, number_of_additional_bytes + 1
+
+
+def ReadSpotlightVariableSizeIntegers(data, data_offset, number_of_values):
+    """Reads consecutive Spotlight variable size integers.
+
+    Args:
+      data (bytes|bytearray|memoryview): data.
+      data_offset (int): offset of the first integer relative to the start of
+          the data.
+      number_of_values (int): number of integers to read.
+
+    Returns:
+      tuple[list[int], int]: integer values and number of bytes read.
+
+    Raises:
+      ValueError: if the data is too small to contain the integers.
+    """
+    data_size = len(data)
+    integer_values = []
+
+    value_offset = data_offset
+    for _ in range(number_of_values):
+        number_of_additional_bytes, integer_value = _SPOTLIGHT_FIRST_BYTE_VALUES[
+            data[value_offset]
+        ]
+        value_offset += 1
+
+        if number_of_additional_bytes:
+            value_end_offset = value_offset + number_of_additional_bytes
+            if value_end_offset > data_size:
+                raise ValueError("Data too small to contain variable size integer.")
+
+            integer_value <<= 8 * number_of_additional_bytes
+            integer_value |= int.from_bytes(data[value_offset:value_end_offset], "big")
+            value_offset = value_end_offset
+
+        integer_values.append(integer_value)
+
+    return integer_values, value_offset - data_offset
@@ -1,5 +1,6 @@
 """WMI Common Information Model (CIM) repository files."""
 
+import bisect
 import glob
 import hashlib
 import logging
@@ -11,6 +12,20 @@ from dtfabric.runtime import data_maps as dtfabric_data_maps
 from dtformats import data_format
 from dtformats import errors
 from dtformats import file_system
+from dtformats import lru_cache
+
+
+def _GetPageCacheSize(page):  # pylint: disable=unused-argument
+    """Determines the size of a page in a page cache.
+
+    Args:
+      page (IndexBinaryTreePage|ObjectsDataPage): page.
+
+    Returns:
+      int: size of the page, where every page counts as 1 so that the maximum
+          size of a page cache is expressed in number of pages.
+    """
+    return 1
 
 
 class ClassDefinitionProperty:
@@ -208,17 +223,22 @@ class ObjectsDataPage:
           page_offset (int): offset of the page relative to the start of the file.
         """
         super().__init__()
-        self._object_descriptors = []
+        self._object_descriptors = {}
 
         self.page_offset = page_offset
 
     def AppendObjectDescriptor(self, object_descriptor):
         """Appends an object descriptor.
 
+        If the page contains multiple object descriptors with the same record
+        identifier the first one is used.
+
         Args:
           object_descriptor (cim_object_descriptor): object descriptor.
         """
-        self._object_descriptors.append(object_descriptor)
+        self._object_descriptors.setdefault(
+            object_descriptor.identifier, object_descriptor
+        )
 
     def GetObjectDescriptor(self, record_identifier, data_size):
         """Retrieves a specific object descriptor.
@@ -230,12 +250,7 @@ class ObjectsDataPage:
         Returns:
           cim_object_descriptor: an object descriptor or None.
         """
-        object_descriptor_match = None
-        for object_descriptor in self._object_descriptors:
-            if object_descriptor.identifier == record_identifier:
-                object_descriptor_match = object_descriptor
-                break
-
+        object_descriptor_match = self._object_descriptors.get(record_identifier, None)
         if not object_descriptor_match:
             logging.warning("Object record data not found.")
             return None
@@ -299,7 +314,12 @@ class PropertyValueDataMap:
 
 
 class IndexBinaryTreeFile(data_format.BinaryDataFile):
-    """Index binary-tree (Index.btr) file."""
+    """Index binary-tree (Index.btr) file.
+
+    Attributes:
+      page_cache (LRUCache): cache of the most recently used pages, keyed by
+          (physical) page number.
+    """
 
     # Using a class constant significantly speeds up the time required to load
     # the dtFabric and dtFormats definition files.
@@ -322,6 +342,8 @@ class IndexBinaryTreeFile(data_format.BinaryDataFile):
 
     _KEY_SEGMENT_SEPARATOR = "\\"
 
+    _MAXIMUM_NUMBER_OF_CACHED_PAGES = 1024
+
     def __init__(self, debug=False, output_writer=None):
         """Initializes an index binary-tree file.
 
@@ -332,6 +354,10 @@ class IndexBinaryTreeFile(data_format.BinaryDataFile):
         super().__init__(debug=debug, output_writer=output_writer)
         self._unavailable_page_numbers = set([0, 0xFFFFFFFF])
 
+        self.page_cache = lru_cache.LRUCache(
+            self._MAXIMUM_NUMBER_OF_CACHED_PAGES, size_callback=_GetPageCacheSize
+        )
+
     def _DebugPrintPageBody(self, page_body):
         """Prints page body debug information.
 
@@ -616,8 +642,27 @@ class IndexBinaryTreeFile(data_format.BinaryDataFile):
         if file_offset >= self._file_size:
             return None
 
-        # TODO: cache pages.
-        return self._ReadPage(self._file_object, file_offset)
+        # Pages are not cached in debug mode so that the debug information is
+        # printed every time a page is read.
+        if self._debug:
+            return self._ReadPage(self._file_object, file_offset)
+
+        index_binary_tree_page = self.page_cache.Get(page_number)
+        if not index_binary_tree_page:
+            index_binary_tree_page = self._ReadPage(self._file_object, file_offset)
+            self.page_cache.Put(page_number, index_binary_tree_page)
+
+        return index_binary_tree_page
+
+    def Close(self):
+        """Closes an index binary-tree file.
+
+        Raises:
+          OSError: if the file is not opened.
+        """
+        super().Close()
+
+        self.page_cache.Clear()
 
     def ReadFileObject(self, file_object):
         """Reads an index binary-tree file-like object.
@@ -901,7 +946,12 @@ class MappingFile(data_format.BinaryDataFile):
 
 
 class ObjectsDataFile(data_format.BinaryDataFile):
-    """An objects data (Objects.data) file."""
+    """An objects data (Objects.data) file.
+
+    Attributes:
+      page_cache (LRUCache): cache of the most recently used pages, keyed by
+          (physical) page number and if the page is a data page.
+    """
 
     # Using a class constant significantly speeds up the time required to load
     # the dtFabric and dtFormats definition files.
@@ -914,8 +964,23 @@ class ObjectsDataFile(data_format.BinaryDataFile):
 
     _EMPTY_OBJECT_DESCRIPTOR = b"\x00" * 16
 
+    _MAXIMUM_NUMBER_OF_CACHED_PAGES = 1024
+
     _PAGE_SIZE = 8192
 
+    def __init__(self, debug=False, output_writer=None):
+        """Initializes an objects data file.
+
+        Args:
+          debug (Optional[bool]): True if debug information should be written.
+          output_writer (Optional[OutputWriter]): output writer.
+        """
+        super().__init__(debug=debug, output_writer=output_writer)
+
+        self.page_cache = lru_cache.LRUCache(
+            self._MAXIMUM_NUMBER_OF_CACHED_PAGES, size_callback=_GetPageCacheSize
+        )
+
     def _ReadObjectDescriptor(self, file_object):
         """Reads an object descriptor.
 
@@ -1022,7 +1087,31 @@ class ObjectsDataFile(data_format.BinaryDataFile):
         if file_offset >= self._file_size:
             return None
 
-        return self._ReadPage(self._file_object, file_offset, is_data_page)
+        # Pages are not cached in debug mode so that the debug information is
+        # printed every time a page is read.
+        if self._debug:
+            return self._ReadPage(self._file_object, file_offset, is_data_page)
+
+        # The same page is read as a page with object descriptors and as a data
+        # page without them, hence both are part of the key.
+        cache_key = (page_number, is_data_page)
+
+        objects_page = self.page_cache.Get(cache_key)
+        if not objects_page:
+            objects_page = self._ReadPage(self._file_object, file_offset, is_data_page)
+            self.page_cache.Put(cache_key, objects_page)
+
+        return objects_page
+
+    def Close(self):
+        """Closes an objects data file.
+
+        Raises:
+          OSError: if the file is not opened.
+        """
+        super().Close()
+
+        self.page_cache.Clear()
 
     def ReadFileObject(self, file_object):
         """Reads an objects data file-like object.
@@ -3492,7 +3581,7 @@ class CIMRepository(data_format.BinaryDataFormat):
         # Unsure how reliable this method is since multiple index[1-3].map files
         # can have the same sequence number but contain different mappings.
         for mapping_file_number in range(1, 4):
-            filename_as_glob, _ = self._FormatFilenameAsGlob(
+            filename_as_glob = self._FormatFilenameAsGlob(
                 f"mapping{mapping_file_number:d}.map"
             )
             path_with_glob = self._file_system_helper.JoinPath([path, filename_as_glob])
@@ -3530,39 +3619,82 @@ class CIMRepository(data_format.BinaryDataFormat):
 
         return active_mapping_file
 
-    def _GetClassDefinitionByName(self, class_name):
+    def _GetClassDefinitionByName(self, class_name, namespace_hash=None):
         """Retrieves a class definition by name.
 
         Args:
           class_name (str): name of the class definition.
+          namespace_hash (Optional[str]): hash of the namespace in which the class
+              definition is looked up first.
 
         Returns:
           ClassDefinition: class definitions or None.
         """
         class_name_hash = self._GetHashFromString(class_name)
-        return self._GetClassDefinitionByHash(class_name_hash)
+        return self._GetClassDefinitionByHash(
+            class_name_hash, namespace_hash=namespace_hash
+        )
 
-    def _GetClassDefinitionByHash(self, class_name_hash):
+    def _GetClassDefinitionByHash(self, class_name_hash, namespace_hash=None):
         """Retrieves a class definition by hash of the name.
 
+        The same class can be defined in multiple namespaces, hence the class
+        definition is looked up in the namespace of the instance that is being
+        read first. If the class is not defined in that namespace, or no
+        namespace is specified, the class definition of the first namespace,
+        in order of namespace hash, that defines the class is used.
+
         Args:
           class_name_hash (str): hash of the class name.
+          namespace_hash (Optional[str]): hash of the namespace in which the class
+              definition is looked up first.
 
         Returns:
           ClassDefinition: class definitions or None.
         """
-        # TODO: change to resolve on demand and cache the resulting class
-        # definition.
-        class_definition = self._class_definitions_by_hash.get(
-            class_name_hash.lower(), None
-        )
+        if namespace_hash:
+            namespace_hash = namespace_hash.lower()
+
+        lookup_key = (namespace_hash, class_name_hash.lower())
+
+        # Note that None is cached for class definitions that are not found
+        # so that these are only looked up once.
+        if lookup_key in self._class_definitions_by_hash:
+            return self._class_definitions_by_hash[lookup_key]
+
+        class_definition = None
+        if namespace_hash:
+            for _, object_record in self._ReadClassDefinitionObjectRecords(
+                class_name_hash=class_name_hash, namespace_hashes=[namespace_hash]
+            ):
+                class_definition = self._ReadClassDefinitionFromObjectRecord(
+                    object_record
+                )
+                break
+
+        if not class_definition:
+            for _, object_record in self._ReadClassDefinitionObjectRecords(
+                class_name_hash=class_name_hash
+            ):
+                class_definition = self._ReadClassDefinitionFromObjectRecord(
+                    object_record
+                )
+                break
+
+        if self._debug and class_definition:
+            class_definition.DebugPrint()
+
+        self._class_definitions_by_hash[lookup_key] = class_definition
+
         return class_definition
 
-    def _GetClassValueMapByHash(self, class_name_hash):
+    def _GetClassValueMapByHash(self, class_name_hash, namespace_hash=None):
         """Retrieves a class value map by hash of the name.
 
         Args:
           class_name_hash (str): hash of the class name.
+          namespace_hash (Optional[str]): hash of the namespace in which the class
+              definitions are looked up first.
 
         Returns:
           ClassValueMap: class value map or None.
@@ -3570,11 +3702,16 @@ class CIMRepository(data_format.BinaryDataFormat):
         Raises:
           RuntimeError: if a class definition cannot be found.
         """
-        lookup_key = class_name_hash.lower()
+        if namespace_hash:
+            namespace_hash = namespace_hash.lower()
+
+        lookup_key = (namespace_hash, class_name_hash.lower())
 
         class_value_data_map = self._class_value_data_map_by_hash.get(lookup_key, None)
         if not class_value_data_map:
-            class_definition = self._GetClassDefinitionByHash(class_name_hash)
+            class_definition = self._GetClassDefinitionByHash(
+                class_name_hash, namespace_hash=namespace_hash
+            )
             if not class_definition:
                 raise RuntimeError(
                     (
@@ -3586,7 +3723,7 @@ class CIMRepository(data_format.BinaryDataFormat):
             class_definitions = [class_definition]
             while class_definition.super_class_name:
                 class_definition = self._GetClassDefinitionByName(
-                    class_definition.super_class_name
+                    class_definition.super_class_name, namespace_hash=namespace_hash
                 )
                 if not class_definition:
                     raise RuntimeError(
@@ -3702,20 +3839,168 @@ class CIMRepository(data_format.BinaryDataFormat):
 
         return self._index_root_page
 
-    def _GetKeysFromIndexPage(self, index_page):
-        """Retrieves the keys from an index page.
+    def _GetInstanceKeys(self, namespace_hash, class_name_hash=None):
+        """Retrieves the index keys of instances in a namespace.
+
+        Instances are stored in the index both with an instance ("I") key under
+        a "KI_<class name hash>" key segment and an instance location ("IL")
+        key under a "CI_<class name hash>" key segment.
+
+        Args:
+          namespace_hash (str): hash of the namespace name.
+          class_name_hash (Optional[str]): hash of the class name of the
+              instances, where None represents all classes.
+
+        Yields:
+          str: a CIM key.
+        """
+        namespace_key_segment = f"NS_{namespace_hash.upper():s}"
+
+        for class_key_segment_type, instance_key_segment_type in (
+            ("CI", "IL"),
+            ("KI", "I"),
+        ):
+            if not class_name_hash:
+                key_prefix = self._KEY_SEGMENT_SEPARATOR.join(
+                    ["", namespace_key_segment, f"{class_key_segment_type:s}_"]
+                )
+            else:
+                key_prefix = self._KEY_SEGMENT_SEPARATOR.join(
+                    [
+                        "",
+                        namespace_key_segment,
+                        f"{class_key_segment_type:s}_{class_name_hash.upper():s}",
+                        f"{instance_key_segment_type:s}_",
+                    ]
+                )
+
+            yield from self._GetKeysByPrefix(key_prefix)
+
+    def _GetKeyPrefixEndKey(self, key_prefix):
+        """Determines the smallest key that is greater than all keys with a prefix.
+
+        Args:
+          key_prefix (str): key prefix.
+
+        Returns:
+          str: end key.
+        """
+        return "".join([key_prefix[:-1], chr(ord(key_prefix[-1]) + 1)])
+
+    def _GetKeysByPrefix(self, key_prefix):
+        """Retrieves the keys with a specific prefix from the index.
+
+        Args:
+          key_prefix (str): key prefix, such as "\\NS_<hash>\\CD_".
+
+        Yields:
+          str: a CIM key.
+        """
+        index_page = self._GetIndexRootPage()
+        end_key = self._GetKeyPrefixEndKey(key_prefix)
+
+        yield from self._GetKeysFromIndexPage(
+            index_page, start_key=key_prefix, end_key=end_key
+        )
+
+    def _GetKeysFromIndexPage(self, index_page, start_key=None, end_key=None):
+        """Retrieves the keys from an index page and its sub pages.
+
+        The keys of an index page are sorted and the sub page before a key
+        contains the keys that are smaller than that key, hence only the sub
+        pages that can contain keys in the range are read. If the number of sub
+        pages of an index page does not match its number of keys, such as in
+        a damaged repository, all its sub pages are read and the keys are not
+        necessarily returned in sorted order.
+
+        Args:
+          index_page (IndexBinaryTreePage): index page.
+          start_key (Optional[str]): first key of the range, where None
+              represents the first key in the index.
+          end_key (Optional[str]): key that is greater than the last key of the
+              range, where None represents the end of the index.
 
         Yields:
           str: a CIM key.
         """
         if index_page:
-            yield from index_page.keys
+            keys = index_page.keys
+
+            first_key_index = 0
+            if start_key:
+                first_key_index = bisect.bisect_left(keys, start_key)
 
-            for mapped_page_number in index_page.sub_pages:
-                sub_index_page = self._GetIndexPageByMappedPageNumber(
-                    mapped_page_number
+            last_key_index = len(keys)
+            if end_key:
+                last_key_index = bisect.bisect_left(keys, end_key)
+
+            if not index_page.sub_pages:
+                yield from keys[first_key_index:last_key_index]
+
+            elif len(index_page.sub_pages) != len(keys) + 1:
+                logging.warning(
+                    f"Unsupported number of index binary-tree sub pages: "
+                    f"{len(index_page.sub_pages):d}."
                 )
-                yield from self._GetKeysFromIndexPage(sub_index_page)
+
+                for key in keys:
+                    if (not start_key or key >= start_key) and (
+                        not end_key or key < end_key
+                    ):
+                        yield key
+
+                for mapped_page_number in index_page.sub_pages:
+                    sub_index_page = self._GetIndexPageByMappedPageNumber(
+                        mapped_page_number
+                    )
+                    yield from self._GetKeysFromIndexPage(
+                        sub_index_page, start_key=start_key, end_key=end_key
+                    )
+
+            else:
+                for key_index in range(first_key_index, last_key_index + 1):
+                    mapped_page_number = index_page.sub_pages[key_index]
+                    sub_index_page = self._GetIndexPageByMappedPageNumber(
+                        mapped_page_number
+                    )
+                    yield from self._GetKeysFromIndexPage(
+                        sub_index_page, start_key=start_key, end_key=end_key
+                    )
+
+                    if key_index < last_key_index:
+                        yield keys[key_index]
+
+    def _GetNamespaceHashes(self):
+        """Retrieves the hashes of the namespaces in the index.
+
+        Every namespace is looked up with a single search of the index, instead
+        of reading all the keys of the namespace.
+
+        Yields:
+          str: hash of a namespace name.
+        """
+        index_page = self._GetIndexRootPage()
+
+        start_key = "\\NS_"
+        end_key = self._GetKeyPrefixEndKey(start_key)
+
+        while True:
+            keys_iterator = self._GetKeysFromIndexPage(
+                index_page, start_key=start_key, end_key=end_key
+            )
+            key = next(keys_iterator, None)
+            if not key:
+                break
+
+            key_segments = key.split(self._KEY_SEGMENT_SEPARATOR)
+
+            namespace_hash = key_segments[1][3:]
+            yield namespace_hash.lower()
+
+            # Continue with the first key after the keys of the namespace.
+            start_key = self._GetKeyPrefixEndKey(
+                "".join(["\\NS_", namespace_hash, self._KEY_SEGMENT_SEPARATOR])
+            )
 
     def _GetObjectsPageByMappedPageNumber(self, mapped_page_number, is_data_page):
         """Retrieves a specific objects page by mapped page number.
@@ -3851,7 +4136,7 @@ class CIMRepository(data_format.BinaryDataFormat):
         Returns:
           IndexBinaryTreeFile: index binary tree file or None if not available.
         """
-        filename_as_glob, _ = self._FormatFilenameAsGlob("index.btr")
+        filename_as_glob = self._FormatFilenameAsGlob("index.btr")
         index_binary_tree_file_glob = self._file_system_helper.JoinPath(
             [path, filename_as_glob]
         )
@@ -3880,7 +4165,7 @@ class CIMRepository(data_format.BinaryDataFormat):
         Returns:
           MappingFile: mapping file or None if not available.
         """
-        filename_as_glob, _ = self._FormatFilenameAsGlob(filename)
+        filename_as_glob = self._FormatFilenameAsGlob(filename)
         mapping_file_glob = self._file_system_helper.JoinPath([path, filename_as_glob])
 
         mapping_file_path = glob.glob(mapping_file_glob)
@@ -3904,7 +4189,7 @@ class CIMRepository(data_format.BinaryDataFormat):
         Returns:
           file: file-like object or None if not available.
         """
-        filename_as_glob, _ = self._FormatFilenameAsGlob("mapping.ver")
+        filename_as_glob = self._FormatFilenameAsGlob("mapping.ver")
         mapping_version_file_glob = self._file_system_helper.JoinPath(
             [path, filename_as_glob]
         )
@@ -3925,7 +4210,7 @@ class CIMRepository(data_format.BinaryDataFormat):
         Returns:
           ObjectsDataFile: objects data file or None if not available.
         """
-        filename_as_glob, _ = self._FormatFilenameAsGlob("objects.data")
+        filename_as_glob = self._FormatFilenameAsGlob("objects.data")
         objects_data_file_glob = self._file_system_helper.JoinPath(
             [path, filename_as_glob]
         )
@@ -3953,7 +4238,7 @@ class CIMRepository(data_format.BinaryDataFormat):
         Returns:
           RepositoryFile: repository file or None if not available.
         """
-        filename_as_glob, _ = self._FormatFilenameAsGlob("cim.rep")
+        filename_as_glob = self._FormatFilenameAsGlob("cim.rep")
         repository_file_glob = self._file_system_helper.JoinPath(
             [path, filename_as_glob]
         )
@@ -3971,54 +4256,84 @@ class CIMRepository(data_format.BinaryDataFormat):
 
         return repository_file
 
-    def _ReadClassDefinitionObjectRecords(self):
+    def _ReadClassDefinitionFromObjectRecord(self, object_record):
+        """Reads a class definition from an object record.
+
+        Args:
+          object_record (ObjectRecord): object record.
+
+        Returns:
+          ClassDefinition: class definition.
+
+        Raises:
+          ParseError: if the class definition cannot be read.
+        """
+        class_definition_reference = ClassDefinitionReference(
+            debug=self._debug, output_writer=self._output_writer
+        )
+        class_definition_reference.ReadObjectRecord(object_record.data)
+
+        class_definition = ClassDefinition(
+            debug=self._debug, output_writer=self._output_writer
+        )
+        class_definition.ReadClassDefinitionBlock(
+            class_definition_reference.data,
+            record_data_offset=class_definition_reference.offset,
+        )
+        return class_definition
+
+    def _ReadClassDefinitionObjectRecords(
+        self, class_name_hash=None, namespace_hashes=None
+    ):
         """Reads class definition object records.
 
+        Args:
+          class_name_hash (Optional[str]): hash of the class name of the class
+              definitions to read, where None represents all class definitions.
+          namespace_hashes (Optional[list[str]]): hashes of the namespaces of
+              the class definitions to read, where None represents all
+              namespaces.
+
         Yields:
           tuple[str, ObjectRecord]: name hash and class definition object record.
         """
-        index_page = self._GetIndexRootPage()
-        for key in self._GetKeysFromIndexPage(index_page):
-            key_segments = key.split(self._KEY_SEGMENT_SEPARATOR)
-
-            data_type, name_hash, mapped_page_number, record_identifier, data_size = (
-                self._GetObjectRecordValuesFromKey(key_segments[-1])
-            )
-            if data_type != "CD":
-                continue
-
-            object_record = self._GetObjectRecord(
-                data_type, mapped_page_number, record_identifier, data_size
+        key_segment_prefix = "CD_"
+        if class_name_hash:
+            key_segment_prefix = "".join(
+                [key_segment_prefix, class_name_hash.upper(), self._KEY_VALUE_SEPARATOR]
             )
-            yield name_hash, object_record
 
-    def _ReadClassDefinitionsFromObjectRecords(self):
-        """Reads the class definitions from object records."""
-        for name_hash, object_record in self._ReadClassDefinitionObjectRecords():
-            class_definition_reference = ClassDefinitionReference(
-                debug=self._debug, output_writer=self._output_writer
-            )
-            class_definition_reference.ReadObjectRecord(object_record.data)
+        if namespace_hashes is None:
+            namespace_hashes = self._GetNamespaceHashes()
 
-            class_definition = ClassDefinition(
-                debug=self._debug, output_writer=self._output_writer
-            )
-            class_definition.ReadClassDefinitionBlock(
-                class_definition_reference.data,
-                record_data_offset=class_definition_reference.offset,
+        for namespace_hash in namespace_hashes:
+            key_prefix = self._KEY_SEGMENT_SEPARATOR.join(
+                ["", f"NS_{namespace_hash.upper():s}", key_segment_prefix]
             )
-            self._class_definitions_by_hash[name_hash] = class_definition
+            for key in self._GetKeysByPrefix(key_prefix):
+                key_segments = key.split(self._KEY_SEGMENT_SEPARATOR)
+
+                (
+                    data_type,
+                    name_hash,
+                    mapped_page_number,
+                    record_identifier,
+                    data_size,
+                ) = self._GetObjectRecordValuesFromKey(key_segments[-1])
+                if data_type != "CD":
+                    continue
 
-        if self._debug:
-            self._DebugPrintText("Class definitions:\n")
-            for class_definition in self._class_definitions_by_hash.values():
-                class_definition.DebugPrint()
+                object_record = self._GetObjectRecord(
+                    data_type, mapped_page_number, record_identifier, data_size
+                )
+                yield name_hash, object_record
 
-    def _ReadInstance(self, instance_reference):
+    def _ReadInstance(self, instance_reference, namespace_hash=None):
         """Reads an instance.
 
         Args:
           instance_reference (InstanceReference): instance reference.
+          namespace_hash (Optional[str]): hash of the namespace of the instance.
 
         Returns:
           Instance: instance.
@@ -4027,7 +4342,9 @@ class CIMRepository(data_format.BinaryDataFormat):
         if not class_name_hash:
             class_name_hash = self._GetHashFromString(instance_reference.class_name)
 
-        class_value_data_map = self._GetClassValueMapByHash(class_name_hash)
+        class_value_data_map = self._GetClassValueMapByHash(
+            class_name_hash, namespace_hash=namespace_hash
+        )
 
         instance = Instance(debug=self._debug, output_writer=self._output_writer)
 
@@ -4048,11 +4365,12 @@ class CIMRepository(data_format.BinaryDataFormat):
         return instance
 
     # TODO: remove after refactor
-    def _ReadInstanceFromObjectRecord(self, object_record):
+    def _ReadInstanceFromObjectRecord(self, object_record, namespace_hash=None):
         """Reads an instance.
 
         Args:
           object_record (ObjectRecord): object record.
+          namespace_hash (Optional[str]): hash of the namespace of the instance.
 
         Returns:
           Instance: instance or None.
@@ -4065,7 +4383,7 @@ class CIMRepository(data_format.BinaryDataFormat):
         instance = Instance(debug=self._debug, output_writer=self._output_writer)
 
         class_value_data_map = self._GetClassValueMapByHash(
-            instance_reference.class_name_hash
+            instance_reference.class_name_hash, namespace_hash=namespace_hash
         )
         instance.ReadInstanceBlockData(
             class_value_data_map,
@@ -4083,26 +4401,44 @@ class CIMRepository(data_format.BinaryDataFormat):
 
         return instance
 
-    def _ReadInstanceObjectRecords(self):
+    def _ReadInstanceObjectRecords(self, class_name_hashes=None, namespace_hashes=None):
         """Reads instance object records.
 
+        Only the object records of the instances that match the class name and
+        namespace hashes are read.
+
+        Args:
+          class_name_hashes (Optional[list[str]]): hashes of the class names of
+              the instances to read, where None represents all classes.
+          namespace_hashes (Optional[list[str]]): hashes of the namespaces of
+              the instances to read, where None represents all namespaces.
+
         Yields:
-          tuple[str, ObjectRecord]: name hash and instance object record.
+          tuple[str, ObjectRecord]: namespace hash and instance object record.
         """
-        index_page = self._GetIndexRootPage()
-        for key in self._GetKeysFromIndexPage(index_page):
-            key_segments = key.split(self._KEY_SEGMENT_SEPARATOR)
+        if class_name_hashes is None:
+            class_name_hashes = [None]
 
-            data_type, name_hash, mapped_page_number, record_identifier, data_size = (
-                self._GetObjectRecordValuesFromKey(key_segments[-1])
-            )
-            if data_type not in ("I", "IL"):
-                continue
+        if namespace_hashes is None:
+            namespace_hashes = self._GetNamespaceHashes()
 
-            object_record = self._GetObjectRecord(
-                data_type, mapped_page_number, record_identifier, data_size
-            )
-            yield name_hash, object_record
+        for namespace_hash in namespace_hashes:
+            for class_name_hash in class_name_hashes:
+                for key in self._GetInstanceKeys(
+                    namespace_hash, class_name_hash=class_name_hash
+                ):
+                    key_segments = key.split(self._KEY_SEGMENT_SEPARATOR)
+
+                    data_type, _, mapped_page_number, record_identifier, data_size = (
+                        self._GetObjectRecordValuesFromKey(key_segments[-1])
+                    )
+                    if data_type not in ("I", "IL"):
+                        continue
+
+                    object_record = self._GetObjectRecord(
+                        data_type, mapped_page_number, record_identifier, data_size
+                    )
+                    yield namespace_hash, object_record
 
     def _ReadNamespacesFromObjectRecords(self):
         """Reads namespaces from object records."""
@@ -4112,41 +4448,36 @@ class CIMRepository(data_format.BinaryDataFormat):
         instances_per_namespace = {}
         parent_namespaces = set()
 
-        index_page = self._GetIndexRootPage()
-        for key in self._GetKeysFromIndexPage(index_page):
-            key_segments = key.split(self._KEY_SEGMENT_SEPARATOR)
-
-            key_segment = key_segments[1]
-            if not key_segment.startswith("NS_"):
-                continue
-
-            namespace_hash = key_segment[3:].lower()
+        for namespace_hash in self._GetNamespaceHashes():
             parent_namespaces.add(namespace_hash)
 
-            _, _, key_segment = key_segments[2].partition("_")
-            if key_segment.lower() != class_name_hash:
-                continue
+            for key in self._GetInstanceKeys(
+                namespace_hash, class_name_hash=class_name_hash
+            ):
+                key_segments = key.split(self._KEY_SEGMENT_SEPARATOR)
 
-            data_type, _, mapped_page_number, record_identifier, data_size = (
-                self._GetObjectRecordValuesFromKey(key_segments[-1])
-            )
-            if data_type not in ("I", "IL"):
-                continue
+                data_type, _, mapped_page_number, record_identifier, data_size = (
+                    self._GetObjectRecordValuesFromKey(key_segments[-1])
+                )
+                if data_type not in ("I", "IL"):
+                    continue
 
-            if (mapped_page_number, record_identifier) in object_record_values:
-                continue
+                if (mapped_page_number, record_identifier) in object_record_values:
+                    continue
 
-            object_record = self._GetObjectRecord(
-                data_type, mapped_page_number, record_identifier, data_size
-            )
-            object_record_values.add((mapped_page_number, record_identifier))
+                object_record = self._GetObjectRecord(
+                    data_type, mapped_page_number, record_identifier, data_size
+                )
+                object_record_values.add((mapped_page_number, record_identifier))
 
-            instance = self._ReadInstanceFromObjectRecord(object_record)
+                instance = self._ReadInstanceFromObjectRecord(
+                    object_record, namespace_hash=namespace_hash
+                )
 
-            if namespace_hash not in instances_per_namespace:
-                instances_per_namespace[namespace_hash] = []
+                if namespace_hash not in instances_per_namespace:
+                    instances_per_namespace[namespace_hash] = []
 
-            instances_per_namespace[namespace_hash].append(instance)
+                instances_per_namespace[namespace_hash].append(instance)
 
         namespaces_by_hash = {}
         for namespace in self._COMMON_NAMESPACES:
@@ -4196,17 +4527,61 @@ class CIMRepository(data_format.BinaryDataFormat):
             self._index_binary_tree_file.Close()
             self._index_binary_tree_file = None
 
-    def GetInstances(self):
+    def GetInstances(self, class_names=None, namespaces=None):
         """Retrieves instances.
 
+        Args:
+          class_names (Optional[list[str]]): names of the classes of the
+              instances to retrieve, such as "__EventFilter", where None
+              represents all classes.
+          namespaces (Optional[list[str]]): names of the namespaces of the
+              instances to retrieve, such as "ROOT\\subscription", where None
+              represents all namespaces.
+
         Yields:
           Instance: an instance.
+
+        Raises:
+          ValueError: if namespaces are specified for a CIM repository file
+              (CIM.REP).
         """
         if self._repository_file:
-            yield from self._repository_file.ReadInstances()
+            if namespaces is not None:
+                raise ValueError(
+                    "Unsupported namespaces for CIM repository file (CIM.REP)."
+                )
+
+            # The instances in a CIM repository file (CIM.REP) can only be
+            # filtered after they have been read.
+            lookup_class_names = None
+            if class_names is not None:
+                lookup_class_names = set(
+                    class_name.lower() for class_name in class_names
+                )
+
+            for instance in self._repository_file.ReadInstances():
+                if (
+                    lookup_class_names is None
+                    or (instance.class_name or "").lower() in lookup_class_names
+                ):
+                    yield instance
 
         else:
-            for _, object_record in self._ReadInstanceObjectRecords():
+            class_name_hashes = None
+            if class_names is not None:
+                class_name_hashes = [
+                    self._GetHashFromString(class_name) for class_name in class_names
+                ]
+
+            namespace_hashes = None
+            if namespaces is not None:
+                namespace_hashes = [
+                    self._GetHashFromString(namespace) for namespace in namespaces
+                ]
+
+            for namespace_hash, object_record in self._ReadInstanceObjectRecords(
+                class_name_hashes=class_name_hashes, namespace_hashes=namespace_hashes
+            ):
                 instance_reference = InstanceReference(
                     self.format_version,
                     debug=self._debug,
@@ -4214,7 +4589,9 @@ class CIMRepository(data_format.BinaryDataFormat):
                 )
                 instance_reference.ReadObjectRecord(object_record.data)
 
-                yield self._ReadInstance(instance_reference)
+                yield self._ReadInstance(
+                    instance_reference, namespace_hash=namespace_hash
+                )
 
     def GetNamespaces(self):
         """Retrieves namespaces.
@@ -4260,6 +4637,22 @@ class CIMRepository(data_format.BinaryDataFormat):
             data_type, mapped_page_number, record_identifier, data_size
         )
 
+    def GetPageCaches(self):
+        """Retrieves the page caches.
+
+        Returns:
+          dict[str, LRUCache]: page caches per name of the file, such as
+              "Index.btr", of the files that are opened.
+        """
+        page_caches = {}
+        if self._index_binary_tree_file:
+            page_caches["Index.btr"] = self._index_binary_tree_file.page_cache
+
+        if self._objects_data_file:
+            page_caches["Objects.data"] = self._objects_data_file.page_cache
+
+        return page_caches
+
     def Open(self, path):
         """Opens the CIM repository.
 
@@ -4321,5 +4714,3 @@ class CIMRepository(data_format.BinaryDataFormat):
             objects_mapping_file.Close()
 
             self._objects_data_file = self._OpenObjectsDataFile(path)
-
-            self._ReadClassDefinitionsFromObjectRecords()
@@ -26,6 +26,16 @@ def Main():
         description=("Extracts information from LevelDB database files.")
     )
 
+    argument_parser.add_argument(
+        "--checksum_policy",
+        "--checksum-policy",
+        dest="checksum_policy",
+        choices=sorted(leveldb.LevelDBDatabaseFile.CHECKSUM_POLICIES),
+        action="store",
+        default="verify",
+        help="policy for verifying the checksums of blocks.",
+    )
+
     argument_parser.add_argument(
         "-d",
         "--debug",
@@ -93,17 +103,23 @@ def Main():
 
     if file_signature == b"\x57\xfb\x80\x8b\x24\x75\x47\xdb":
         leveldb_file = leveldb.LevelDBDatabaseTableFile(
-            debug=options.debug, output_writer=output_writer
+            checksum_policy=options.checksum_policy,
+            debug=options.debug,
+            output_writer=output_writer,
         )
 
     elif path_segments[-1].startswith("MANIFEST"):
         leveldb_file = leveldb.LevelDBDatabaseDescriptorFile(
-            debug=options.debug, output_writer=output_writer
+            checksum_policy=options.checksum_policy,
+            debug=options.debug,
+            output_writer=output_writer,
         )
 
     else:
         leveldb_file = leveldb.LevelDBDatabaseLogFile(
-            debug=options.debug, output_writer=output_writer
+            checksum_policy=options.checksum_policy,
+            debug=options.debug,
+            output_writer=output_writer,
         )
 
     leveldb_file.Open(options.source)
@@ -132,6 +148,18 @@ def Main():
 
     print("")
 
+    checksum_statistics = leveldb_file.checksum_statistics
+
+    print("Checksums:")
+    print(f"  verified\t: {checksum_statistics.number_of_verified:d}")
+    print(f"  skipped\t: {checksum_statistics.number_of_skipped:d}")
+    print(f"  corrupted\t: {checksum_statistics.number_of_corrupted:d}")
+
+    for file_offset in checksum_statistics.corrupted_offsets:
+        print(f"  corrupted at offset: {file_offset:d} (0x{file_offset:08x})")
+
+    print("")
+
     leveldb_file.Close()
 
     output_writer.Close()
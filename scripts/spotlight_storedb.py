@@ -159,6 +159,39 @@ class TableView:
         output_writer.WriteText("\n")
 
 
+def WriteMetadataItem(output_writer, metadata_item):
+    """Writes a metadata item to the output.
+
+    Args:
+      output_writer (OutputWriter): output writer.
+      metadata_item (SpotlightStoreMetadataItem): metadata item.
+    """
+    table_view = TableView()
+
+    # TODO: add option to print all names
+    # names = metadata_item.attributes.keys()
+    names = ATTRIBUTE_NAMES
+
+    for name in names:
+        lookup_name = LOOKUP_ATTRIBUTE_NAMES.get(name, name)
+        metadata_attribute = metadata_item.attributes.get(lookup_name)
+        if not metadata_attribute:
+            value_string = "(null)"
+
+        elif metadata_attribute.value_type == 0x0B:
+            value_string = f'"{metadata_attribute.value:s}"'
+
+        elif metadata_attribute.value_type == 0x0C:
+            value_string = GetDateTimeString(metadata_attribute.value)
+
+        else:
+            value_string = f"{metadata_attribute.value!s}"
+
+        table_view.AddRow([name, f"= {value_string:s}"])
+
+    table_view.Write(output_writer)
+
+
 def Main():
     """The main program function.
 
@@ -169,6 +202,15 @@ def Main():
         description=("Extracts information from Apple Spotlight store database files.")
     )
 
+    argument_parser.add_argument(
+        "-a",
+        "--all",
+        dest="all",
+        action="store_true",
+        default=False,
+        help="show all metadata items, in the order they are stored.",
+    )
+
     argument_parser.add_argument(
         "-d",
         "--debug",
@@ -255,14 +297,14 @@ def Main():
         )
         streams_map_offsets.Open(path)
 
-        ranges = streams_map_offsets.ranges
+        offsets = streams_map_offsets.offsets
 
         streams_map_offsets.Close()
 
         path = "".join([options.source[:-6], "data"])
         streams_map_data = spotlight_storedb.SpotlightStreamsMapDataFile(
             data_size,
-            ranges,
+            offsets,
             debug=options.debug,
             file_system_helper=file_system_helper,
             output_writer=output_writer,
@@ -281,11 +323,27 @@ def Main():
         )
         spotlight_store_database.Open(options.source)
 
-        if options.item is None:
+        attribute_names = {
+            LOOKUP_ATTRIBUTE_NAMES.get(name, name) for name in ATTRIBUTE_NAMES
+        }
+
+        if options.all:
+            for metadata_item in spotlight_store_database.IterateMetadataItems(
+                attribute_names=attribute_names
+            ):
+                output_writer.WriteText(
+                    f"Metadata item: {metadata_item.identifier:d}\n"
+                )
+                WriteMetadataItem(output_writer, metadata_item)
+                output_writer.WriteText("\n")
+
+        elif options.item is None:
             properties_plist = ""
             metadata_version = ""
 
-            metadata_item = spotlight_store_database.GetMetadataItemByIdentifier(1)
+            metadata_item = spotlight_store_database.GetMetadataItemByIdentifier(
+                1, attribute_names={"kMDStoreProperties", "_kStoreMetadataVersion"}
+            )
             if metadata_item:
                 metadata_attribute = metadata_item.attributes.get(
                     "kMDStoreProperties", None
@@ -319,35 +377,12 @@ def Main():
 
         else:
             metadata_item = spotlight_store_database.GetMetadataItemByIdentifier(
-                options.item
+                options.item, attribute_names=attribute_names
             )
             if not metadata_item:
                 output_writer.WriteText(f"No such metadata item: {options.item:d}\n")
             else:
-                table_view = TableView()
-
-                # TODO: add option to print all names
-                # names = metadata_item.attributes.keys()
-                names = ATTRIBUTE_NAMES
-
-                for name in names:
-                    lookup_name = LOOKUP_ATTRIBUTE_NAMES.get(name, name)
-                    metadata_attribute = metadata_item.attributes.get(lookup_name)
-                    if not metadata_attribute:
-                        value_string = "(null)"
-
-                    elif metadata_attribute.value_type == 0x0B:
-                        value_string = f'"{metadata_attribute.value:s}"'
-
-                    elif metadata_attribute.value_type == 0x0C:
-                        value_string = GetDateTimeString(metadata_attribute.value)
-
-                    else:
-                        value_string = f"{metadata_attribute.value!s}"
-
-                    table_view.AddRow([name, f"= {value_string:s}"])
-
-            table_view.Write(output_writer)
+                WriteMetadataItem(output_writer, metadata_item)
 
         spotlight_store_database.Close()
 
@@ -3,8 +3,9 @@
 
 import argparse
 import heapq
+import json
 import logging
-import re
+import os
 import sys
 
 from dfdatetime import posix_time as dfdatetime_posix_time
@@ -97,6 +98,18 @@ def Main():
             "files."
         )
     )
+    argument_parser.add_argument(
+        "--checkpoint",
+        dest="checkpoint",
+        action="store",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help=(
+            "path of a checkpoint file, to only read log entries of a tracev3 "
+            "file that were added since the checkpoint was last written."
+        ),
+    )
     argument_parser.add_argument(
         "-d",
         "--debug",
@@ -110,10 +123,22 @@ def Main():
         dest="format",
         action="store",
         type=str,
-        choices=["json", "text"],
+        choices=["json", "jsonl", "sqlite", "text"],
         default="text",
         metavar="FORMAT",
-        help="output format.",
+        help=(
+            "output format, where sqlite requires the path of the database to be "
+            "specified with --output."
+        ),
+    )
+    argument_parser.add_argument(
+        "--output",
+        dest="output",
+        action="store",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="path of the output file.",
     )
     if dfvfs_helpers:
         dfvfs_helpers.AddDFVFSCLIArguments(argument_parser)
@@ -147,6 +172,13 @@ def Main():
 
         file_system_helper = file_system.NativeFileSystemHelper()
 
+    if options.format == "sqlite" and not options.output:
+        print("Output file missing.")
+        print("")
+        argument_parser.print_help()
+        print("")
+        return False
+
     output_writer = output_writers.StdoutWriter()
 
     try:
@@ -237,279 +269,58 @@ def Main():
             _ = record
 
     else:
+        checkpoint = None
+        if options.checkpoint:
+            checkpoint = unified_logging.TraceV3FileCheckpoint()
+            if os.path.exists(options.checkpoint):
+                with open(options.checkpoint, "r", encoding="utf-8") as file_object:
+                    checkpoint.CopyFromDict(json.load(file_object))
+
         log_entries_heap = LogEntriesHeap()
-        for log_entry in unified_logging_file.ReadLogEntries():
-            log_entries_heap.PushLogEntry(log_entry)
 
-        escape_regex = re.compile(r'([\\/"])', re.MULTILINE)
+        if options.format == "sqlite":
+            # The log entries are stored unsorted since the database has
+            # a timestamp index.
+            sqlite_writer = output_writers.LogEntrySQLiteWriter()
+            sqlite_writer.Open(options.output)
+
+            for log_entry in unified_logging_file.ReadLogEntries(checkpoint=checkpoint):
+                sqlite_writer.WriteLogEntry(log_entry)
+
+            sqlite_writer.Close()
 
-        if options.format == "json":
-            print("[{")
         else:
+            for log_entry in unified_logging_file.ReadLogEntries(checkpoint=checkpoint):
+                log_entries_heap.PushLogEntry(log_entry)
+
+        if checkpoint:
+            with open(options.checkpoint, "w", encoding="utf-8") as file_object:
+                json.dump(checkpoint.CopyToDict(), file_object)
+
+        if options.format in ("json", "jsonl"):
+            json_writer = output_writers.LogEntryJSONWriter(
+                activity_index=unified_logging.ActivityIndex(),
+                json_lines=options.format == "jsonl",
+            )
+            json_writer.Open()
+
+            for log_entry in log_entries_heap.PopLogEntries():
+                json_writer.WriteLogEntry(log_entry)
+
+            json_writer.Close()
+
+        elif options.format == "text":
             print(
                 "Timestamp                       Thread     Type        "
                 "Activity             PID    TTL"
             )
 
-        parent_per_activity_identifier = {}
-        for index, log_entry in enumerate(log_entries_heap.PopLogEntries()):
-            if options.format == "json" and index > 0:
-                print("},{")
-
-            activity_identifier = log_entry.activity_identifier or 0
-            date_time_string = GetDateTimeString(log_entry.timestamp)
-            process_identifier = log_entry.process_identifier or 0
-            sender_program_counter = log_entry.sender_program_counter or 0
-            thread_identifier = log_entry.thread_identifier or 0
-
-            if options.format == "json":
-                boot_identifier = str(log_entry.boot_identifier).upper()
-                category = log_entry.category or ""
-                event_type = log_entry.event_type or ""
-                sub_system = log_entry.sub_system or ""
-
-                event_message = log_entry.event_message or ""
-                event_message = event_message.rstrip()
-                if len(event_message) >= 1085:
-                    event_message = "".join([event_message[:1087], "<…>"])
-
-                event_message = escape_regex.sub(r"\\\1", event_message)
-                event_message = event_message.replace("\n", "\\n")
-                event_message = event_message.replace("\t", "\\t")
-
-                creator_activity_identifier = log_entry.creator_activity_identifier
-
-                if event_type in ("activityCreateEvent", "userActionEvent"):
-                    # The format string for an activityCreateEvent or an userActionEvent
-                    # is empty.
-                    format_string = ""
-                else:
-                    format_string = log_entry.format_string or ""
-                    format_string = escape_regex.sub(r"\\\1", format_string)
-                    format_string = format_string.replace("\n", "\\n")
-                    format_string = format_string.replace("\t", "\\t")
-
-                process_image_identifier = ""
-                if log_entry.process_image_identifier:
-                    process_image_identifier = str(
-                        log_entry.process_image_identifier
-                    ).upper()
-
-                process_image_path = log_entry.process_image_path or ""
-                process_image_path = escape_regex.sub(r"\\\1", process_image_path)
-
-                sender_image_identifier = ""
-                if log_entry.sender_image_identifier:
-                    sender_image_identifier = str(
-                        log_entry.sender_image_identifier
-                    ).upper()
-
-                sender_image_path = log_entry.sender_image_path or ""
-                sender_image_path = sender_image_path.replace('"', '\\"')
-                sender_image_path = sender_image_path.replace("/", "\\/")
-
-                if event_type == "timesyncEvent":
-                    lines = [
-                        f'  "bootUUID" : "{boot_identifier:s}",',
-                        f'  "category" : "{category:s}",',
-                        f'  "processImageUUID" : "{process_image_identifier:s}",',
-                        f'  "eventType" : "{event_type:s}",',
-                        f'  "threadID" : {thread_identifier:d},',
-                        f'  "timestamp" : "{date_time_string:s}",',
-                        f'  "activityIdentifier" : {activity_identifier:d},',
-                        f'  "senderProgramCounter" : {sender_program_counter:d},',
-                        '  "parentActivityIdentifier" : 0,',
-                        f'  "machTimestamp" : {log_entry.mach_timestamp:d},',
-                        f'  "processID" : {process_identifier:d},',
-                        f'  "subsystem" : "{sub_system:s}",',
-                        '  "timezoneName" : "",',
-                        f'  "traceID" : {log_entry.trace_identifier:d},',
-                        f'  "eventMessage" : "{event_message:s}",',
-                        f'  "formatString" : "{format_string:s}",',
-                        f'  "processImagePath" : "{process_image_path:s}",',
-                        f'  "senderImageUUID" : "{sender_image_identifier:s}",',
-                        f'  "senderImagePath" : "{sender_image_path:s}"',
-                    ]
-
-                else:
-                    lines = [f'  "traceID" : {log_entry.trace_identifier:d},']
-
-                    if event_type not in (
-                        "activityCreateEvent",
-                        "lossEvent",
-                        "signpostEvent",
-                        "userActionEvent",
-                    ):
-                        lines.append(f'  "eventMessage" : "{event_message:s}",')
-
-                    lines.append(f'  "eventType" : "{event_type:s}",')
-
-                    if log_entry.loss_count is not None:
-                        # TODO: improve support for lossCountSaturated
-                        lines.extend(
-                            [
-                                f'  "lossCount" : {log_entry.loss_count:d},',
-                                '  "lossCountSaturated" : true,',
-                            ]
-                        )
-
-                    if log_entry.signpost_identifier is not None:
-                        signpost_scope = log_entry.signpost_scope or ""
-
-                        lines.extend(
-                            [
-                                f'  "signpostID" : {log_entry.signpost_identifier:d},',
-                                f'  "signpostScope" : "{signpost_scope:s}",',
-                            ]
-                        )
-
-                    if event_type not in (
-                        "activityCreateEvent",
-                        "lossEvent",
-                        "userActionEvent",
-                    ):
-                        # TODO: implement source support.
-                        lines.append('  "source" : null,')
-
-                    lines.append(f'  "formatString" : "{format_string:s}",')
-
-                    if log_entry.loss_count is not None:
-                        lines.append(
-                            (
-                                f'  "lossEndMachContinuousTimestamp" : '
-                                f"{log_entry.loss_end_mach_timestamp:d},"
-                            )
-                        )
-
-                    lines.extend(
-                        [
-                            f'  "activityIdentifier" : {activity_identifier:d},',
-                            f'  "subsystem" : "{sub_system:s}",',
-                            f'  "category" : "{category:s}",',
-                            f'  "threadID" : {thread_identifier:d},',
-                            f'  "senderImageUUID" : "{sender_image_identifier:s}",',
-                        ]
-                    )
+            for log_entry in log_entries_heap.PopLogEntries():
+                activity_identifier = log_entry.activity_identifier or 0
+                date_time_string = GetDateTimeString(log_entry.timestamp)
+                process_identifier = log_entry.process_identifier or 0
+                thread_identifier = log_entry.thread_identifier or 0
 
-                    if log_entry.signpost_identifier is not None:
-                        signpost_type = log_entry.signpost_type or ""
-
-                        lines.append(f'  "signpostType" : "{signpost_type:s}",')
-
-                    if log_entry.backtrace_frames:
-                        lines.extend(
-                            ['  "backtrace" : {', '    "frames" : [', "      {"]
-                        )
-                        for index, backtrace_frame in enumerate(
-                            log_entry.backtrace_frames
-                        ):
-                            if index > 0:
-                                lines.extend(["      },", "      {"])
-
-                            image_identifier = str(
-                                backtrace_frame.image_identifier
-                            ).upper()
-
-                            lines.extend(
-                                [
-                                    (
-                                        f'        "imageOffset" : '
-                                        f"{backtrace_frame.image_offset:d},"
-                                    ),
-                                    f'        "imageUUID" : "{image_identifier:s}"',
-                                ]
-                            )
-
-                        lines.extend(["      }", "    ]", "  },"])
-
-                    lines.extend(
-                        [
-                            f'  "bootUUID" : "{boot_identifier:s}",',
-                            f'  "processImagePath" : "{process_image_path:s}",',
-                            f'  "timestamp" : "{date_time_string:s}",',
-                            f'  "senderImagePath" : "{sender_image_path:s}",',
-                        ]
-                    )
-                    if creator_activity_identifier is not None:
-                        parent_per_activity_identifier[activity_identifier] = (
-                            creator_activity_identifier
-                            & unified_logging_file.ACTIVITY_IDENTIFIER_BITMASK
-                        )
-                        lines.append(
-                            f'  "creatorActivityID" : {creator_activity_identifier:d},'
-                        )
-
-                    elif log_entry.loss_count is not None:
-                        start_time_string = GetDateTimeString(
-                            log_entry.loss_start_timestamp
-                        )
-                        end_time_string = GetDateTimeString(
-                            log_entry.loss_end_timestamp
-                        )
-                        lines.extend(
-                            [
-                                (
-                                    f'  "lossStartMachContinuousTimestamp" : '
-                                    f"{log_entry.loss_start_mach_timestamp:d},"
-                                ),
-                                f'  "lossEndTimestamp" : "{end_time_string:s}",',
-                                f'  "lossStartTimestamp" : "{start_time_string:s}",',
-                            ]
-                        )
-
-                    elif log_entry.signpost_identifier is not None:
-                        signpost_name = log_entry.signpost_name or ""
-
-                        lines.append(f'  "signpostName" : "{signpost_name:s}",')
-
-                    lines.append(f'  "machTimestamp" : {log_entry.mach_timestamp:d},')
-
-                    if event_type in (
-                        "activityCreateEvent",
-                        "lossEvent",
-                        "signpostEvent",
-                        "userActionEvent",
-                    ):
-                        lines.append(f'  "eventMessage" : "{event_message:s}",')
-                    else:
-                        message_type = log_entry.message_type or ""
-
-                        lines.append(f'  "messageType" : "{message_type:s}",')
-
-                    if log_entry.parent_activity_identifier:
-                        parent_activity_identifier = (
-                            log_entry.parent_activity_identifier
-                        )
-                    else:
-                        parent_activity_identifier = (
-                            parent_per_activity_identifier.get(
-                                activity_identifier, None
-                            )
-                            or 0
-                        )
-
-                    if parent_activity_identifier == creator_activity_identifier:
-                        parent_activity_identifier = 0
-
-                    lines.extend(
-                        [
-                            (
-                                f'  "processImageUUID" : '
-                                f'"{process_image_identifier:s}",'
-                            ),
-                            f'  "processID" : {process_identifier:d},',
-                            f'  "senderProgramCounter" : {sender_program_counter:d},',
-                            (
-                                f'  "parentActivityIdentifier" : '
-                                f"{parent_activity_identifier:d},"
-                            ),
-                            '  "timezoneName" : ""',
-                        ]
-                    )
-
-                print("\n".join(lines))
-
-            else:
                 event_message_parts = []
 
                 if log_entry.process_image_path:
@@ -536,9 +347,6 @@ def Main():
                     f"{process_identifier:<6d}\t{ttl:<4d}\t{event_message:s}"
                 )
 
-        if options.format == "json":
-            print("}]", end="")
-
     unified_logging_file.Close()
 
     output_writer.Close()
@@ -84,6 +84,19 @@ def Main():
         )
     )
 
+    argument_parser.add_argument(
+        "--class_name",
+        "--class-name",
+        dest="class_names",
+        action="append",
+        default=None,
+        metavar="NAME",
+        help=(
+            "name of the class of the instances to output, can be specified "
+            "multiple times."
+        ),
+    )
+
     argument_parser.add_argument(
         "-d",
         "--debug",
@@ -93,6 +106,18 @@ def Main():
         help="enable debug output.",
     )
 
+    argument_parser.add_argument(
+        "--namespace",
+        dest="namespaces",
+        action="append",
+        default=None,
+        metavar="NAMESPACE",
+        help=(
+            "name of the namespace of the instances to output, such as "
+            "ROOT\\subscription, can be specified multiple times."
+        ),
+    )
+
     # TODO: make this more descriptive.
     argument_parser.add_argument(
         "--output_mode",
@@ -103,6 +128,14 @@ def Main():
         help="output mode.",
     )
 
+    argument_parser.add_argument(
+        "--statistics",
+        dest="statistics",
+        action="store_true",
+        default=False,
+        help="print page cache statistics.",
+    )
+
     argument_parser.add_argument(
         "source",
         nargs="?",
@@ -150,8 +183,20 @@ def Main():
             print(key_path)
 
     elif options.output_mode == "instances":
-        for instance in cim_repository.GetInstances():
-            PrintInstance(instance)
+        try:
+            for instance in cim_repository.GetInstances(
+                class_names=options.class_names, namespaces=options.namespaces
+            ):
+                PrintInstance(instance)
+
+        except ValueError as exception:
+            print(f"Unable to output instances with error: {exception!s}")
+            print("")
+
+            cim_repository.Close()
+            output_writer.Close()
+
+            return False
 
     elif options.output_mode == "namespaces":
         for instance in sorted(
@@ -173,6 +218,17 @@ def Main():
                         )
                         registration.ReadObjectRecord(object_record.data)
 
+    if options.statistics:
+        print("Page caches:")
+        for name, page_cache in sorted(cim_repository.GetPageCaches().items()):
+            print(
+                f"  {name:s}\thit rate: {page_cache.hit_rate:.2f}\thits: "
+                f"{page_cache.number_of_hits:d}\tmisses: "
+                f"{page_cache.number_of_misses:d}"
+            )
+
+        print("")
+
     cim_repository.Close()
 
     output_writer.Close()
@@ -0,0 +1,55 @@
+"""Tests for the CRC-32C (Castagnoli) checksum functions."""
+
+import unittest
+
+from dtformats import crc32c
+
+from tests import test_lib
+
+
+class CRC32CTest(test_lib.BaseTestCase):
+    """CRC-32C (Castagnoli) checksum functions tests."""
+
+    def testCalculateCRC32C(self):
+        """Tests the CalculateCRC32C function."""
+        checksum = crc32c.CalculateCRC32C(b"")
+        self.assertEqual(checksum, 0x00000000)
+
+        checksum = crc32c.CalculateCRC32C(b"123456789")
+        self.assertEqual(checksum, 0xE3069283)
+
+        checksum = crc32c.CalculateCRC32C(b"\x00" * 32)
+        self.assertEqual(checksum, 0x8A9136AA)
+
+        checksum = crc32c.CalculateCRC32C(b"\xff" * 32)
+        self.assertEqual(checksum, 0x62A8AB43)
+
+        checksum = crc32c.CalculateCRC32C(bytes(range(32)))
+        self.assertEqual(checksum, 0x46DD794E)
+
+        checksum = crc32c.CalculateCRC32C(memoryview(bytes(range(31, -1, -1))))
+        self.assertEqual(checksum, 0x113FDB5C)
+
+        checksum = crc32c.CalculateCRC32C(b"hello ")
+        checksum = crc32c.CalculateCRC32C(bytearray(b"world"), initial_value=checksum)
+        self.assertEqual(checksum, crc32c.CalculateCRC32C(b"hello world"))
+
+    def testMaskCRC32C(self):
+        """Tests the MaskCRC32C and UnmaskCRC32C functions."""
+        checksum = crc32c.CalculateCRC32C(b"foo")
+
+        masked_checksum = crc32c.MaskCRC32C(checksum)
+        self.assertNotEqual(masked_checksum, checksum)
+        self.assertNotEqual(crc32c.MaskCRC32C(masked_checksum), checksum)
+
+        self.assertEqual(crc32c.UnmaskCRC32C(masked_checksum), checksum)
+        self.assertEqual(
+            crc32c.UnmaskCRC32C(
+                crc32c.UnmaskCRC32C(crc32c.MaskCRC32C(masked_checksum))
+            ),
+            checksum,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
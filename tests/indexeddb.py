@@ -0,0 +1,236 @@
+"""Tests for IndexedDB database files."""
+
+import os
+import struct
+import tempfile
+import unittest
+
+from dtformats import errors
+from dtformats import indexeddb
+
+from tests import leveldb as leveldb_test
+
+
+class IndexedDBDatabaseEntryTest(leveldb_test.LevelDBTestCase):
+    """IndexedDB entry tests."""
+
+    def testKeySegments(self):
+        """Tests the key_segments property."""
+        entry = indexeddb.IndexedDBDatabaseEntry(
+            b"\x00\x01\x02\x01\x03key", (1, 2, 1), 4, 5, 1, b"value"
+        )
+        self.assertEqual(entry.key_segments, ["1", "2", "1", "'\\x03key'"])
+
+        entry = indexeddb.IndexedDBDatabaseEntry(
+            b"\x00\x00\x00\x00\x32", (0, 0, 0), 4, 5, 1, b"value"
+        )
+        self.assertEqual(entry.key_segments, ["0", "0", "0", "50"])
+
+
+class IndexedDBDatabaseTableFileTest(leveldb_test.LevelDBTestCase):
+    """IndexedDB database sorted tables (.ldb) file tests."""
+
+    # pylint: disable=protected-access
+
+    def _CreateIndexedDBTableFile(self, path):
+        """Creates an IndexedDB table file for testing.
+
+        Args:
+          path (str): path of the table file.
+
+        Returns:
+          list[tuple[int, int, int]]: key prefixes of the entries, in order of
+              the table.
+        """
+        test_file = indexeddb.IndexedDBDatabaseTableFile()
+
+        # The key prefixes are in order of the IndexedDB comparator, which for
+        # object store 511 and 512 differs from the bytewise order.
+        key_prefixes = [
+            (0, 0, 0),
+            (1, 1, 1),
+            (1, 2, 1),
+            (1, 2, 1),
+            (1, 2, 2),
+            (1, 2, 30),
+            (1, 3, 1),
+            (1, 511, 1),
+            (1, 511, 30),
+            (1, 512, 1),
+            (1, 512, 2),
+            (2, 1, 1),
+        ]
+
+        entries = []
+        for entry_index, key_prefix in enumerate(key_prefixes):
+            key = b"".join(
+                [test_file._CreateKeyPrefix(*key_prefix), bytes([entry_index])]
+            )
+            entries.append((key, entry_index, 1, b"value"))
+
+        self._CreateTableFile(path, entries, entries_per_block=2)
+
+        return key_prefixes
+
+    def testCreateKeyPrefix(self):
+        """Tests the _CreateKeyPrefix function."""
+        test_file = indexeddb.IndexedDBDatabaseTableFile()
+
+        key_prefix = test_file._CreateKeyPrefix(1, 2, 3)
+        self.assertEqual(key_prefix, b"\x00\x01\x02\x03")
+
+        key_prefix = test_file._CreateKeyPrefix(257, 2, 3)
+        self.assertEqual(key_prefix, b"\x20\x01\x01\x02\x03")
+
+        key_prefix = test_file._CreateKeyPrefix(0, 0, 0)
+        self.assertEqual(key_prefix, b"\x00\x00\x00\x00")
+
+    def testGetComparableKey(self):
+        """Tests the _GetComparableKey function."""
+        test_file = indexeddb.IndexedDBDatabaseTableFile()
+
+        comparable_key = test_file._GetComparableKey(b"\x04\x01\xff\x01\x01key")
+        self.assertEqual(comparable_key, ((1, 511, 1), b"key"))
+
+        self.assertLess(
+            test_file._GetComparableKey(b"\x04\x01\xff\x01\x01"),
+            test_file._GetComparableKey(b"\x04\x01\x00\x02\x01"),
+        )
+
+    def testReadKeyPrefix(self):
+        """Tests the _ReadKeyPrefix function."""
+        test_file = indexeddb.IndexedDBDatabaseTableFile()
+
+        key_prefix, bytes_read = test_file._ReadKeyPrefix(b"\x00\x01\x02\x03")
+        self.assertEqual(key_prefix, (1, 2, 3))
+        self.assertEqual(bytes_read, 4)
+
+        key_prefix, bytes_read = test_file._ReadKeyPrefix(b"\x20\x01\x01\x02\x03\xff")
+        self.assertEqual(key_prefix, (257, 2, 3))
+        self.assertEqual(bytes_read, 5)
+
+        with self.assertRaises(errors.ParseError):
+            test_file._ReadKeyPrefix(b"\x20\x01\x01\x02")
+
+        with self.assertRaises(errors.ParseError):
+            test_file._ReadKeyPrefix(b"")
+
+    def testReadEntries(self):
+        """Tests the ReadEntries function."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            test_file_path = os.path.join(temporary_directory, "000001.ldb")
+            key_prefixes = self._CreateIndexedDBTableFile(test_file_path)
+
+            test_file = indexeddb.IndexedDBDatabaseTableFile()
+            test_file.Open(test_file_path)
+
+            try:
+                entries = list(test_file.ReadEntries())
+                self.assertEqual([entry.key_prefix for entry in entries], key_prefixes)
+                self.assertEqual(entries[2].key_segments, ["1", "2", "1", "'\\x02'"])
+
+                key_prefix = test_file._CreateKeyPrefix(1, 2, 1)
+                sequence_numbers = [
+                    entry.sequence_number
+                    for entry in test_file.ReadEntries(key_prefix=key_prefix)
+                ]
+                self.assertEqual(sequence_numbers, [2, 3])
+
+                sequence_numbers = [
+                    entry.sequence_number
+                    for entry in test_file.ReadEntries(key_prefix=key_prefix + b"\x03")
+                ]
+                self.assertEqual(sequence_numbers, [3])
+
+            finally:
+                test_file.Close()
+
+    def testReadEntriesWithNumberKeys(self):
+        """Tests the ReadEntries function with keys that contain numbers."""
+        test_file = indexeddb.IndexedDBDatabaseTableFile()
+
+        key_prefix = test_file._CreateKeyPrefix(1, 2, 1)
+
+        # Numbers are stored as a type (0x03) followed by a little-endian double,
+        # where the keys are ordered by value and not bytewise.
+        entries = []
+        for entry_index, number in enumerate([0.5, 1.0, 2.0, 3.0]):
+            key = b"".join([key_prefix, b"\x03", struct.pack("<d", number)])
+            entries.append((key, entry_index, 1, b"value"))
+
+        entries.append((test_file._CreateKeyPrefix(1, 2, 2), 4, 1, b"value"))
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            test_file_path = os.path.join(temporary_directory, "000001.ldb")
+            self._CreateTableFile(test_file_path, entries, entries_per_block=1)
+
+            test_file.Open(test_file_path)
+
+            try:
+                sequence_numbers = [
+                    entry.sequence_number
+                    for entry in test_file.ReadEntries(key_prefix=key_prefix)
+                ]
+                self.assertEqual(sequence_numbers, [0, 1, 2, 3])
+
+                for entry_index, number in enumerate([0.5, 1.0, 2.0, 3.0]):
+                    number_key_prefix = b"".join(
+                        [key_prefix, b"\x03", struct.pack("<d", number)]
+                    )
+                    sequence_numbers = [
+                        entry.sequence_number
+                        for entry in test_file.ReadEntries(key_prefix=number_key_prefix)
+                    ]
+                    self.assertEqual(sequence_numbers, [entry_index])
+
+            finally:
+                test_file.Close()
+
+    def testReadObjectStoreEntries(self):
+        """Tests the ReadObjectStoreEntries function."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            test_file_path = os.path.join(temporary_directory, "000001.ldb")
+            self._CreateIndexedDBTableFile(test_file_path)
+
+            test_file = indexeddb.IndexedDBDatabaseTableFile()
+            test_file.Open(test_file_path)
+
+            try:
+                key_prefixes = [
+                    entry.key_prefix for entry in test_file.ReadObjectStoreEntries(1, 2)
+                ]
+                self.assertEqual(
+                    key_prefixes, [(1, 2, 1), (1, 2, 1), (1, 2, 2), (1, 2, 30)]
+                )
+
+                key_prefixes = [
+                    entry.key_prefix
+                    for entry in test_file.ReadObjectStoreEntries(
+                        1, 2, index_identifier=1
+                    )
+                ]
+                self.assertEqual(key_prefixes, [(1, 2, 1), (1, 2, 1)])
+
+                key_prefixes = [
+                    entry.key_prefix
+                    for entry in test_file.ReadObjectStoreEntries(1, 511)
+                ]
+                self.assertEqual(key_prefixes, [(1, 511, 1), (1, 511, 30)])
+
+                key_prefixes = [
+                    entry.key_prefix
+                    for entry in test_file.ReadObjectStoreEntries(1, 512)
+                ]
+                self.assertEqual(key_prefixes, [(1, 512, 1), (1, 512, 2)])
+
+                key_prefixes = [
+                    entry.key_prefix for entry in test_file.ReadObjectStoreEntries(3, 1)
+                ]
+                self.assertEqual(key_prefixes, [])
+
+            finally:
+                test_file.Close()
+
+
+if __name__ == "__main__":
+    unittest.main()
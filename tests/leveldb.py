@@ -1,12 +1,439 @@
 """Tests for LevelDB database files."""
 
+import os
+import tempfile
 import unittest
 
+import snappy
+
+from dtformats import crc32c
+from dtformats import errors
+from dtformats import file_system
 from dtformats import leveldb
 
 from tests import test_lib
 
 
+class TestFileSystemHelper(file_system.FileSystemHelper):
+    """File system helper for testing, other than the native one."""
+
+    def GetFileSizeByPath(self, path):
+        """Retrieves the size of a specific file.
+
+        Args:
+          path (str): path of the file.
+
+        Returns:
+          int: size of the file in bytes.
+        """
+        return os.stat(path).st_size
+
+    def OpenFileByPath(self, path):
+        """Opens a specific file.
+
+        Args:
+          path (str): path of the file.
+
+        Returns:
+          file: file-like object of the file.
+        """
+        return open(path, "rb")  # pylint: disable=consider-using-with
+
+
+class LevelDBTestCase(test_lib.BaseTestCase):
+    """Shared functionality for LevelDB database file tests."""
+
+    def _CreateBlock(self, entries, restart_interval=4):
+        """Creates an uncompressed table block for testing.
+
+        Args:
+          entries (list[tuple[bytes, bytes]]): internal key and value pairs.
+          restart_interval (Optional[int]): number of entries between restart
+              points.
+
+        Returns:
+          bytes: block data.
+        """
+        block_data = []
+        data_offset = 0
+        restart_values = []
+        shared_key_data = b""
+
+        for entry_index, (key_data, value_data) in enumerate(entries):
+            shared_key_data_size = 0
+            if entry_index % restart_interval == 0:
+                restart_values.append(data_offset)
+            else:
+                shared_key_data_size = len(
+                    os.path.commonprefix([key_data, shared_key_data])
+                )
+
+            entry_data = b"".join(
+                [
+                    self._CreateVariableSizeInteger(shared_key_data_size),
+                    self._CreateVariableSizeInteger(
+                        len(key_data) - shared_key_data_size
+                    ),
+                    self._CreateVariableSizeInteger(len(value_data)),
+                    key_data[shared_key_data_size:],
+                    value_data,
+                ]
+            )
+            block_data.append(entry_data)
+            data_offset += len(entry_data)
+            shared_key_data = key_data
+
+        for restart_value in restart_values:
+            block_data.append(restart_value.to_bytes(4, "little"))
+
+        block_data.append(len(restart_values).to_bytes(4, "little"))
+
+        return b"".join(block_data)
+
+    def _CreateBlockTrailer(self, block_data, compression_type=0):
+        """Creates a table block trailer for testing.
+
+        Args:
+          block_data (bytes): block data.
+          compression_type (Optional[int]): compression type of the block data.
+
+        Returns:
+          bytes: block trailer data.
+        """
+        compression_type_data = compression_type.to_bytes(1, "little")
+
+        checksum = crc32c.CalculateCRC32C(block_data + compression_type_data)
+
+        return compression_type_data + crc32c.MaskCRC32C(checksum).to_bytes(4, "little")
+
+    def _CreateBloomFilter(self, keys, bits_per_key=10):
+        """Creates a bloom filter for testing.
+
+        Args:
+          keys (list[bytes]): keys, without the internal key suffix.
+          bits_per_key (Optional[int]): number of bits per key.
+
+        Returns:
+          bytes: bloom filter data.
+        """
+        if not keys:
+            return b""
+
+        test_file = leveldb.LevelDBDatabaseTableFile()
+
+        number_of_bits = max(len(keys) * bits_per_key, 64)
+        number_of_bytes = (number_of_bits + 7) // 8
+        number_of_bits = number_of_bytes * 8
+
+        number_of_probes = min(max(int(bits_per_key * 0.69), 1), 30)
+
+        filter_data = bytearray(number_of_bytes)
+        for key in keys:
+            hash_value = test_file._CalculateBloomFilterHash(key)
+            delta = ((hash_value >> 17) | (hash_value << 15)) & 0xFFFFFFFF
+
+            for _ in range(number_of_probes):
+                bit_index = hash_value % number_of_bits
+                filter_data[bit_index >> 3] |= 1 << (bit_index & 0x07)
+                hash_value = (hash_value + delta) & 0xFFFFFFFF
+
+        filter_data.append(number_of_probes)
+
+        return bytes(filter_data)
+
+    def _CreateDescriptorFile(self, path, version_edits):
+        """Creates a descriptor (MANIFEST) file for testing.
+
+        Args:
+          path (str): path of the descriptor file.
+          version_edits (list[dict[str, object]]): version edits, where a new table
+              is defined as a tuple of level, file number, file size, smallest key
+              and largest key.
+        """
+        records = []
+        for version_edit in version_edits:
+            record_data = []
+
+            comparator_name = version_edit.get("comparator_name", None)
+            if comparator_name is not None:
+                comparator_name = comparator_name.encode("utf-8")
+                record_data.extend(
+                    [
+                        self._CreateVariableSizeInteger(1),
+                        self._CreateVariableSizeInteger(len(comparator_name)),
+                        comparator_name,
+                    ]
+                )
+
+            log_number = version_edit.get("log_number", None)
+            if log_number is not None:
+                record_data.extend(
+                    [
+                        self._CreateVariableSizeInteger(2),
+                        self._CreateVariableSizeInteger(log_number),
+                    ]
+                )
+
+            last_sequence_number = version_edit.get("last_sequence_number", None)
+            if last_sequence_number is not None:
+                record_data.extend(
+                    [
+                        self._CreateVariableSizeInteger(4),
+                        self._CreateVariableSizeInteger(last_sequence_number),
+                    ]
+                )
+
+            for level, file_number in version_edit.get("deleted_tables", []):
+                record_data.extend(
+                    [
+                        self._CreateVariableSizeInteger(6),
+                        self._CreateVariableSizeInteger(level),
+                        self._CreateVariableSizeInteger(file_number),
+                    ]
+                )
+
+            for new_table in version_edit.get("new_tables", []):
+                level, file_number, file_size, smallest_key, largest_key = new_table
+
+                smallest_key += b"\x01\x00\x00\x00\x00\x00\x00\x00"
+                largest_key += b"\x01\x00\x00\x00\x00\x00\x00\x00"
+
+                record_data.extend(
+                    [
+                        self._CreateVariableSizeInteger(7),
+                        self._CreateVariableSizeInteger(level),
+                        self._CreateVariableSizeInteger(file_number),
+                        self._CreateVariableSizeInteger(file_size),
+                        self._CreateVariableSizeInteger(len(smallest_key)),
+                        smallest_key,
+                        self._CreateVariableSizeInteger(len(largest_key)),
+                        largest_key,
+                    ]
+                )
+
+            records.append(b"".join(record_data))
+
+        self._CreateLogFile(path, records)
+
+    def _CreateLogFile(self, path, records):
+        """Creates a write ahead log file for testing.
+
+        Args:
+          path (str): path of the log file.
+          records (list[bytes]): record data, where records that do not fit in
+              the remainder of a 32 KiB block are stored in multiple fragments.
+        """
+        file_data = []
+        block_remainder = 32 * 1024
+
+        for record_data in records:
+            data_offset = 0
+            while data_offset == 0 or data_offset < len(record_data):
+                if block_remainder < 7:
+                    file_data.append(b"\x00" * block_remainder)
+                    block_remainder = 32 * 1024
+
+                fragment_data = record_data[
+                    data_offset : data_offset + block_remainder - 7
+                ]
+                is_first = data_offset == 0
+                data_offset += len(fragment_data)
+                is_last = data_offset >= len(record_data)
+
+                if is_first and is_last:
+                    record_type = 1
+                elif is_first:
+                    record_type = 2
+                elif is_last:
+                    record_type = 4
+                else:
+                    record_type = 3
+
+                checksum = crc32c.CalculateCRC32C(
+                    record_type.to_bytes(1, "little") + fragment_data
+                )
+                file_data.extend(
+                    [
+                        crc32c.MaskCRC32C(checksum).to_bytes(4, "little"),
+                        len(fragment_data).to_bytes(2, "little"),
+                        record_type.to_bytes(1, "little"),
+                        fragment_data,
+                    ]
+                )
+                block_remainder -= 7 + len(fragment_data)
+
+                if not record_data:
+                    break
+
+        with open(path, "wb") as file_object:
+            file_object.write(b"".join(file_data))
+
+    def _CreateTableFile(
+        self,
+        path,
+        entries,
+        bloom_filter=False,
+        compression_type=0,
+        entries_per_block=8,
+    ):
+        """Creates a table file for testing.
+
+        Args:
+          path (str): path of the table file.
+          entries (list[tuple[bytes, int, int, bytes]]): key, sequence number,
+              value type and value of the entries, sorted by key.
+          bloom_filter (Optional[bool]): True if a bloom filter block should be
+              created.
+          compression_type (Optional[int]): compression type of the data blocks,
+              where 0 represents uncompressed and 1 Snappy compressed.
+          entries_per_block (Optional[int]): number of entries per data block.
+        """
+        file_data = []
+        file_offset = 0
+        filters = []
+        filter_keys = []
+        index_entries = []
+
+        for entry_index in range(0, len(entries), entries_per_block):
+            block_entries = []
+            for key, sequence_number, value_type, value in entries[
+                entry_index : entry_index + entries_per_block
+            ]:
+                internal_key_suffix = (sequence_number << 8) | value_type
+                block_entries.append(
+                    (key + internal_key_suffix.to_bytes(8, "little"), value)
+                )
+
+            block_data = self._CreateBlock(block_entries)
+            if compression_type == 1:
+                block_data = snappy.compress(block_data)
+
+            block_handle = b"".join(
+                [
+                    self._CreateVariableSizeInteger(file_offset),
+                    self._CreateVariableSizeInteger(len(block_data)),
+                ]
+            )
+            index_entries.append((block_entries[-1][0], block_handle))
+
+            # A filter covers the data blocks of a 128 byte range of offsets.
+            while (file_offset >> 7) > len(filters):
+                filters.append(self._CreateBloomFilter(filter_keys))
+                filter_keys = []
+
+            filter_keys.extend(
+                [
+                    key
+                    for key, _, _, _ in entries[
+                        entry_index : entry_index + entries_per_block
+                    ]
+                ]
+            )
+
+            file_data.extend(
+                [block_data, self._CreateBlockTrailer(block_data, compression_type)]
+            )
+            file_offset += len(block_data) + 5
+
+        metaindex_entries = []
+        if bloom_filter:
+            if filter_keys:
+                filters.append(self._CreateBloomFilter(filter_keys))
+
+            filter_offsets = []
+            filter_offset = 0
+            for filter_data in filters:
+                filter_offsets.append(filter_offset.to_bytes(4, "little"))
+                filter_offset += len(filter_data)
+
+            block_data = b"".join(
+                filters
+                + filter_offsets
+                + [filter_offset.to_bytes(4, "little"), b"\x07"]
+            )
+            block_handle = b"".join(
+                [
+                    self._CreateVariableSizeInteger(file_offset),
+                    self._CreateVariableSizeInteger(len(block_data)),
+                ]
+            )
+            metaindex_entries.append(
+                (b"filter.leveldb.BuiltinBloomFilter2", block_handle)
+            )
+
+            file_data.extend([block_data, self._CreateBlockTrailer(block_data)])
+            file_offset += len(block_data) + 5
+
+        block_handles = []
+        for block_data in (
+            self._CreateBlock(metaindex_entries),
+            self._CreateBlock(index_entries, 1),
+        ):
+            block_handles.append(self._CreateVariableSizeInteger(file_offset))
+            block_handles.append(self._CreateVariableSizeInteger(len(block_data)))
+
+            file_data.extend([block_data, self._CreateBlockTrailer(block_data)])
+            file_offset += len(block_data) + 5
+
+        footer_data = b"".join(block_handles)
+        file_data.extend(
+            [
+                footer_data,
+                b"\x00" * (40 - len(footer_data)),
+                b"\x57\xfb\x80\x8b\x24\x75\x47\xdb",
+            ]
+        )
+
+        with open(path, "wb") as file_object:
+            file_object.write(b"".join(file_data))
+
+    def _CreateVariableSizeInteger(self, integer_value):
+        """Creates a variable size integer for testing.
+
+        Args:
+          integer_value (int): integer value.
+
+        Returns:
+          bytes: variable size integer data.
+        """
+        data = bytearray()
+        while integer_value >= 0x80:
+            data.append((integer_value & 0x7F) | 0x80)
+            integer_value >>= 7
+
+        data.append(integer_value)
+
+        return bytes(data)
+
+    def _CreateWriteBatch(self, sequence_number, operations):
+        """Creates a write batch log record for testing.
+
+        Args:
+          sequence_number (int): sequence number of the first operation.
+          operations (list[tuple[bytes, bytes]]): key and value of the operations,
+              where a value of None represents a deletion.
+
+        Returns:
+          bytes: record data.
+        """
+        record_data = [
+            sequence_number.to_bytes(8, "little"),
+            len(operations).to_bytes(4, "little"),
+        ]
+        for key, value in operations:
+            record_data.extend(
+                [
+                    b"\x00" if value is None else b"\x01",
+                    self._CreateVariableSizeInteger(len(key)),
+                    key,
+                ]
+            )
+            if value is not None:
+                record_data.extend([self._CreateVariableSizeInteger(len(value)), value])
+
+        return b"".join(record_data)
+
+
 class LevelDBDatabaseFileTest(test_lib.BaseTestCase):
     """LevelDB database file tests."""
 
@@ -25,8 +452,783 @@ class LevelDBDatabaseFileTest(test_lib.BaseTestCase):
         self.assertEqual(bytes_read, 2)
 
 
-# TODO: add tests for LevelDBDatabaseLogFile
-# TODO: add tests for LevelDBDatabaseTableFile
+class LevelDBDatabaseLogFileTest(LevelDBTestCase):
+    """LevelDB write ahead log (.log) file tests."""
+
+    def testReadEntries(self):
+        """Tests the ReadEntries function."""
+        records = [
+            self._CreateWriteBatch(10, [(b"key1", b"value1"), (b"key2", b"value2")]),
+            self._CreateWriteBatch(12, [(b"key1", None)]),
+        ]
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            test_file_path = os.path.join(temporary_directory, "000003.log")
+            self._CreateLogFile(test_file_path, records)
+
+            test_file = leveldb.LevelDBDatabaseLogFile()
+            test_file.Open(test_file_path)
+
+            try:
+                log_entries = [
+                    (
+                        log_entry.key,
+                        log_entry.sequence_number,
+                        log_entry.value_type,
+                        log_entry.value,
+                    )
+                    for log_entry in test_file.ReadEntries()
+                ]
+            finally:
+                test_file.Close()
+
+        self.assertEqual(
+            log_entries,
+            [
+                (b"key1", 10, 1, b"value1"),
+                (b"key2", 11, 1, b"value2"),
+                (b"key1", 12, 0, b""),
+            ],
+        )
+
+    def testReadEntriesWithFragments(self):
+        """Tests the ReadEntries function with records stored in fragments."""
+        value = bytes(range(256)) * 300
+
+        records = [
+            self._CreateWriteBatch(1, [(b"key1", b"value1")]),
+            self._CreateWriteBatch(2, [(b"key2", value), (b"key3", value)]),
+            self._CreateWriteBatch(4, [(b"key4", b"value4")]),
+        ]
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            test_file_path = os.path.join(temporary_directory, "000003.log")
+            self._CreateLogFile(test_file_path, records)
+
+            test_file = leveldb.LevelDBDatabaseLogFile()
+            test_file.Open(test_file_path)
+
+            try:
+                record_types = [
+                    record_type
+                    for _, record_type, _ in test_file._ReadFragments(
+                        test_file._file_object
+                    )
+                ]
+
+                log_entries = [
+                    (log_entry.key, log_entry.sequence_number, log_entry.value)
+                    for log_entry in test_file.ReadEntries()
+                ]
+            finally:
+                test_file.Close()
+
+        self.assertEqual(record_types, [1, 2, 3, 3, 3, 4, 1])
+
+        self.assertEqual(
+            log_entries,
+            [
+                (b"key1", 1, b"value1"),
+                (b"key2", 2, value),
+                (b"key3", 3, value),
+                (b"key4", 4, b"value4"),
+            ],
+        )
+
+    def testReadEntriesWithCorruptedFragment(self):
+        """Tests the ReadEntries function with a corrupted record fragment."""
+        value = bytes(range(256)) * 300
+
+        records = [
+            self._CreateWriteBatch(1, [(b"key1", b"value1")]),
+            self._CreateWriteBatch(2, [(b"key2", value), (b"key3", value)]),
+            self._CreateWriteBatch(4, [(b"key4", b"value4")]),
+        ]
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            test_file_path = os.path.join(temporary_directory, "000003.log")
+            self._CreateLogFile(test_file_path, records)
+
+            # Corrupt the data of the first middle fragment in the second block.
+            with open(test_file_path, "r+b") as file_object:
+                file_object.seek(32768 + 100)
+                byte_value = file_object.read(1)[0]
+
+                file_object.seek(32768 + 100)
+                file_object.write(bytes([byte_value ^ 0xFF]))
+
+            test_file = leveldb.LevelDBDatabaseLogFile()
+            test_file.Open(test_file_path)
+
+            try:
+                keys = [log_entry.key for log_entry in test_file.ReadEntries()]
+                checksum_statistics = test_file.checksum_statistics
+            finally:
+                test_file.Close()
+
+            self.assertEqual(keys, [b"key1", b"key4"])
+
+            self.assertEqual(checksum_statistics.corrupted_offsets, [32768])
+            self.assertEqual(checksum_statistics.number_of_corrupted, 1)
+            self.assertEqual(checksum_statistics.number_of_skipped, 0)
+            self.assertEqual(checksum_statistics.number_of_verified, 6)
+
+            test_file = leveldb.LevelDBDatabaseLogFile(checksum_policy="skip")
+            test_file.Open(test_file_path)
+
+            try:
+                keys = [log_entry.key for log_entry in test_file.ReadEntries()]
+                checksum_statistics = test_file.checksum_statistics
+            finally:
+                test_file.Close()
+
+            self.assertEqual(keys, [b"key1", b"key2", b"key3", b"key4"])
+
+            self.assertEqual(checksum_statistics.number_of_corrupted, 0)
+            self.assertEqual(checksum_statistics.number_of_skipped, 7)
+            self.assertEqual(checksum_statistics.number_of_verified, 0)
+
+            test_file = leveldb.LevelDBDatabaseLogFile(checksum_policy="verify-sampled")
+            test_file.Open(test_file_path)
+
+            try:
+                keys = [log_entry.key for log_entry in test_file.ReadEntries()]
+                checksum_statistics = test_file.checksum_statistics
+            finally:
+                test_file.Close()
+
+            self.assertEqual(keys, [b"key1", b"key2", b"key3", b"key4"])
+
+            self.assertEqual(checksum_statistics.number_of_corrupted, 0)
+            self.assertEqual(checksum_statistics.number_of_skipped, 6)
+            self.assertEqual(checksum_statistics.number_of_verified, 1)
+
+        with self.assertRaises(ValueError):
+            leveldb.LevelDBDatabaseLogFile(checksum_policy="bogus")
+
+
+class LevelDBDatabaseDescriptorFileTest(LevelDBTestCase):
+    """LevelDB descriptor file tests."""
+
+    def testReadVersionEdits(self):
+        """Tests the ReadVersionEdits function."""
+        version_edits = [
+            {"log_number": 3, "new_tables": [(1, 5, 1024, b"key1", b"key9")]},
+            {"deleted_tables": [(1, 5)], "last_sequence_number": 20},
+        ]
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            test_file_path = os.path.join(temporary_directory, "MANIFEST-000002")
+            self._CreateDescriptorFile(test_file_path, version_edits)
+
+            test_file = leveldb.LevelDBDatabaseDescriptorFile()
+            test_file.Open(test_file_path)
+
+            try:
+                version_edits = list(test_file.ReadVersionEdits())
+            finally:
+                test_file.Close()
+
+        self.assertEqual(len(version_edits), 2)
+
+        self.assertEqual(version_edits[0].log_number, 3)
+        self.assertIsNone(version_edits[0].last_sequence_number)
+        self.assertEqual(len(version_edits[0].new_tables), 1)
+
+        table_descriptor = version_edits[0].new_tables[0]
+        self.assertEqual(table_descriptor.level, 1)
+        self.assertEqual(table_descriptor.file_number, 5)
+        self.assertEqual(table_descriptor.file_size, 1024)
+        self.assertEqual(table_descriptor.smallest_key, b"key1")
+        self.assertEqual(table_descriptor.largest_key, b"key9")
+
+        self.assertEqual(version_edits[1].deleted_tables, [(1, 5)])
+        self.assertEqual(version_edits[1].last_sequence_number, 20)
+
+
+class LevelDBDatabaseTableFileTest(LevelDBTestCase):
+    """LevelDB database sorted tables (.ldb) file tests."""
+
+    # pylint: disable=protected-access
+
+    def testBlockCache(self):
+        """Tests the shared block cache."""
+        entries = [
+            (f"key{key_index:04d}".encode("ascii"), key_index, 1, b"value")
+            for key_index in range(20)
+        ]
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            test_file_path = os.path.join(temporary_directory, "000001.ldb")
+            self._CreateTableFile(test_file_path, entries)
+
+            leveldb.BLOCK_CACHE.Clear()
+
+            test_file = leveldb.LevelDBDatabaseTableFile()
+            test_file.Open(test_file_path)
+
+            try:
+                number_of_hits = leveldb.BLOCK_CACHE.number_of_hits
+                test_file.Get(b"key0010")
+                self.assertEqual(leveldb.BLOCK_CACHE.number_of_hits, number_of_hits)
+
+                test_file.Get(b"key0011")
+                self.assertEqual(leveldb.BLOCK_CACHE.number_of_hits, number_of_hits + 1)
+            finally:
+                test_file.Close()
+
+            # Another instance of the same table file shares the cached blocks.
+            test_file = leveldb.LevelDBDatabaseTableFile()
+            test_file.Open(test_file_path)
+
+            try:
+                number_of_hits = leveldb.BLOCK_CACHE.number_of_hits
+                keys = [table_entry.key for table_entry in test_file.ReadTableEntries()]
+                self.assertEqual(len(keys), 20)
+                self.assertEqual(leveldb.BLOCK_CACHE.number_of_hits, number_of_hits + 2)
+            finally:
+                test_file.Close()
+
+            leveldb.BLOCK_CACHE.Clear()
+
+    def testBlockCacheWithReplacedFile(self):
+        """Tests the shared block cache with a table file that was replaced."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            test_file_path = os.path.join(temporary_directory, "000001.ldb")
+            self._CreateTableFile(test_file_path, [(b"key0001", 1, 1, b"value")])
+
+            test_file = leveldb.LevelDBDatabaseTableFile()
+            test_file.Open(test_file_path)
+
+            try:
+                table_entry = test_file.Get(b"key0001")
+                self.assertEqual(table_entry.value, b"value")
+            finally:
+                test_file.Close()
+
+            # Replace the table file by a table file of the same size.
+            replacement_file_path = os.path.join(temporary_directory, "000002.ldb")
+            self._CreateTableFile(replacement_file_path, [(b"key0001", 1, 1, b"VALUE")])
+            os.replace(replacement_file_path, test_file_path)
+
+            test_file = leveldb.LevelDBDatabaseTableFile()
+            test_file.Open(test_file_path)
+
+            try:
+                table_entry = test_file.Get(b"key0001")
+                self.assertEqual(table_entry.value, b"VALUE")
+            finally:
+                test_file.Close()
+
+            leveldb.BLOCK_CACHE.Clear()
+
+    def testCalculateBloomFilterHash(self):
+        """Tests the _CalculateBloomFilterHash function."""
+        test_file = leveldb.LevelDBDatabaseTableFile()
+
+        hash_value = test_file._CalculateBloomFilterHash(b"")
+        self.assertEqual(hash_value, 0xBC9F1D34)
+
+        hash_value = test_file._CalculateBloomFilterHash(b"\x62")
+        self.assertEqual(hash_value, 0xEF1345C4)
+
+        hash_value = test_file._CalculateBloomFilterHash(b"\xc3\x97")
+        self.assertEqual(hash_value, 0x5B663814)
+
+        hash_value = test_file._CalculateBloomFilterHash(b"\xe2\x99\xa5")
+        self.assertEqual(hash_value, 0x323C078F)
+
+        hash_value = test_file._CalculateBloomFilterHash(b"\xe1\x80\xb9\x32")
+        self.assertEqual(hash_value, 0xED21633A)
+
+    def testChecksumVerification(self):
+        """Tests the checksum verification of blocks."""
+        entries = [
+            (f"key{key_index:04d}".encode("ascii"), key_index, 1, b"value")
+            for key_index in range(20)
+        ]
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            test_file_path = os.path.join(temporary_directory, "000001.ldb")
+            self._CreateTableFile(test_file_path, entries)
+
+            # Corrupt the second data block, which contains key0008 - key0015.
+            with open(test_file_path, "r+b") as file_object:
+                file_data = file_object.read()
+
+                data_offset = file_data.index(b"key0008")
+                file_object.seek(data_offset)
+                file_object.write(b"key000X")
+
+            leveldb.BLOCK_CACHE.Clear()
+
+            test_file = leveldb.LevelDBDatabaseTableFile()
+            test_file.Open(test_file_path)
+
+            try:
+                keys = [table_entry.key for table_entry in test_file.ReadTableEntries()]
+                checksum_statistics = test_file.checksum_statistics
+            finally:
+                test_file.Close()
+
+            leveldb.BLOCK_CACHE.Clear()
+
+            expected_keys = [key for key, _, _, _ in entries]
+            self.assertEqual(keys, expected_keys[:8] + expected_keys[16:])
+
+            self.assertEqual(len(checksum_statistics.corrupted_offsets), 1)
+            self.assertEqual(checksum_statistics.number_of_corrupted, 1)
+            self.assertEqual(checksum_statistics.number_of_skipped, 0)
+            self.assertEqual(checksum_statistics.number_of_verified, 4)
+
+            test_file = leveldb.LevelDBDatabaseTableFile(checksum_policy="skip")
+            test_file.Open(test_file_path)
+
+            try:
+                keys = [table_entry.key for table_entry in test_file.ReadTableEntries()]
+                checksum_statistics = test_file.checksum_statistics
+            finally:
+                test_file.Close()
+
+            leveldb.BLOCK_CACHE.Clear()
+
+            self.assertEqual(len(keys), 20)
+            self.assertEqual(keys[8], b"key000X")
+
+            self.assertEqual(checksum_statistics.number_of_corrupted, 0)
+            self.assertEqual(checksum_statistics.number_of_skipped, 5)
+            self.assertEqual(checksum_statistics.number_of_verified, 0)
+
+    def testChecksumVerificationWithBlockCache(self):
+        """Tests the checksum verification of blocks read from the block cache."""
+        entries = [
+            (f"key{key_index:04d}".encode("ascii"), key_index, 1, b"value")
+            for key_index in range(20)
+        ]
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            test_file_path = os.path.join(temporary_directory, "000001.ldb")
+            self._CreateTableFile(test_file_path, entries)
+
+            # Corrupt the second data block, which contains key0008 - key0015.
+            with open(test_file_path, "r+b") as file_object:
+                file_data = file_object.read()
+
+                data_offset = file_data.index(b"key0008")
+                file_object.seek(data_offset)
+                file_object.write(b"key000X")
+
+            leveldb.BLOCK_CACHE.Clear()
+
+            expected_keys = [key for key, _, _, _ in entries]
+            expected_keys = expected_keys[:8] + expected_keys[16:]
+
+            # The block cache is not cleared between the readers, hence blocks
+            # read by one reader can be returned from the cache to the next.
+            test_readers = [
+                ("skip", None, 20, (0, 5, 0)),
+                ("verify", None, 12, (1, 0, 4)),
+                ("verify", None, 12, (1, 0, 4)),
+                ("verify", 2, 12, (1, 0, 4)),
+                ("skip", None, 20, (0, 5, 0)),
+            ]
+            for (
+                checksum_policy,
+                number_of_decompression_threads,
+                expected_number_of_keys,
+                expected_statistics,
+            ) in test_readers:
+                test_file = leveldb.LevelDBDatabaseTableFile(
+                    checksum_policy=checksum_policy,
+                    number_of_decompression_threads=number_of_decompression_threads,
+                )
+                test_file.Open(test_file_path)
+
+                try:
+                    keys = [
+                        table_entry.key for table_entry in test_file.ReadTableEntries()
+                    ]
+                    checksum_statistics = test_file.checksum_statistics
+                finally:
+                    test_file.Close()
+
+                self.assertEqual(len(keys), expected_number_of_keys)
+                if checksum_policy == "verify":
+                    self.assertEqual(keys, expected_keys)
+                    self.assertEqual(len(checksum_statistics.corrupted_offsets), 1)
+
+                statistics = (
+                    checksum_statistics.number_of_corrupted,
+                    checksum_statistics.number_of_skipped,
+                    checksum_statistics.number_of_verified,
+                )
+                self.assertEqual(statistics, expected_statistics)
+
+            leveldb.BLOCK_CACHE.Clear()
+
+    def testGetFileIdentity(self):
+        """Tests the _GetFileIdentity function."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            test_file_path = os.path.join(temporary_directory, "000001.ldb")
+            self._CreateTableFile(test_file_path, [(b"key0001", 1, 1, b"value")])
+
+            file_identities = []
+            for file_system_helper in (
+                file_system.NativeFileSystemHelper(),
+                TestFileSystemHelper(),
+                TestFileSystemHelper(),
+            ):
+                test_file = leveldb.LevelDBDatabaseTableFile(
+                    file_system_helper=file_system_helper
+                )
+                test_file.Open(test_file_path)
+
+                try:
+                    file_identities.append(test_file._file_identity)
+                finally:
+                    test_file.Close()
+
+            self.assertEqual(file_identities[0][0], "native")
+
+            # The same path opened with different file system helpers, such
+            # as for different storage media images, has a different identity.
+            self.assertEqual(len(set(file_identities)), 3)
+
+    def testGet(self):
+        """Tests the Get function."""
+        entries = []
+        for key_index in range(0, 200, 2):
+            key = f"key{key_index:04d}".encode("ascii")
+            entries.append(
+                (key, key_index + 1000, 1, f"new{key_index:d}".encode("ascii"))
+            )
+            entries.append((key, key_index, 1, f"old{key_index:d}".encode("ascii")))
+
+        entries.append((b"key9999", 5000, 0, b""))
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            test_file_path = os.path.join(temporary_directory, "000001.ldb")
+            self._CreateTableFile(test_file_path, entries)
+
+            test_file = leveldb.LevelDBDatabaseTableFile()
+            test_file.Open(test_file_path)
+
+            try:
+                table_entry = test_file.Get(b"key0000")
+                self.assertIsNotNone(table_entry)
+                self.assertEqual(table_entry.sequence_number, 1000)
+                self.assertEqual(table_entry.value, b"new0")
+
+                table_entry = test_file.Get(b"key0124")
+                self.assertIsNotNone(table_entry)
+                self.assertEqual(table_entry.value, b"new124")
+
+                table_entry = test_file.Get(b"key0198")
+                self.assertIsNotNone(table_entry)
+                self.assertEqual(table_entry.value, b"new198")
+
+                table_entry = test_file.Get(b"key9999")
+                self.assertIsNotNone(table_entry)
+                self.assertEqual(table_entry.value_type, 0)
+
+                self.assertIsNone(test_file.Get(b"a"))
+                self.assertIsNone(test_file.Get(b"key0001"))
+                self.assertIsNone(test_file.Get(b"zzz"))
+
+            finally:
+                test_file.Close()
+
+    def testGetIterator(self):
+        """Tests the GetIterator function."""
+        entries = [
+            (f"key{key_index:04d}".encode("ascii"), key_index, 1, b"value")
+            for key_index in range(0, 100, 2)
+        ]
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            test_file_path = os.path.join(temporary_directory, "000001.ldb")
+            self._CreateTableFile(test_file_path, entries)
+
+            test_file = leveldb.LevelDBDatabaseTableFile()
+            test_file.Open(test_file_path)
+
+            try:
+                table_iterator = test_file.GetIterator()
+                self.assertIsNone(table_iterator.Prev())
+
+                keys = [table_entry.key for table_entry in table_iterator]
+                self.assertEqual(keys, [key for key, _, _, _ in entries])
+
+                table_entry = table_iterator.Prev()
+                self.assertEqual(table_entry.key, b"key0098")
+
+                table_iterator.Seek(b"key0031")
+                table_entry = table_iterator.Next()
+                self.assertEqual(table_entry.key, b"key0032")
+
+                table_entry = table_iterator.Prev()
+                self.assertEqual(table_entry.key, b"key0032")
+
+                # Move backwards over a restart point and a data block boundary.
+                keys = [table_iterator.Prev().key for _ in range(6)]
+                self.assertEqual(
+                    keys,
+                    [
+                        b"key0030",
+                        b"key0028",
+                        b"key0026",
+                        b"key0024",
+                        b"key0022",
+                        b"key0020",
+                    ],
+                )
+
+                table_iterator.Seek(b"zzz")
+                self.assertIsNone(table_iterator.Next())
+
+                table_entry = table_iterator.Prev()
+                self.assertEqual(table_entry.key, b"key0098")
+
+                table_iterator = test_file.GetIterator(end_key=b"key0040")
+                table_iterator.Seek(b"key0030")
+
+                keys = [table_entry.key for table_entry in table_iterator]
+                self.assertEqual(
+                    keys, [b"key0030", b"key0032", b"key0034", b"key0036", b"key0038"]
+                )
+
+            finally:
+                test_file.Close()
+
+    def testMayContain(self):
+        """Tests the MayContain function."""
+        entries = [
+            (f"key{key_index:04d}".encode("ascii"), key_index, 1, b"value")
+            for key_index in range(0, 200, 2)
+        ]
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            test_file_path = os.path.join(temporary_directory, "000001.ldb")
+            self._CreateTableFile(test_file_path, entries, bloom_filter=True)
+
+            test_file = leveldb.LevelDBDatabaseTableFile()
+            test_file.Open(test_file_path)
+
+            try:
+                self.assertIsNotNone(test_file._filter_block)
+
+                for key, _, _, _ in entries:
+                    self.assertTrue(test_file.MayContain(key))
+                    self.assertIsNotNone(test_file.Get(key))
+
+                number_of_rejected_keys = 0
+                for key_index in range(1, 200, 2):
+                    key = f"key{key_index:04d}".encode("ascii")
+                    if not test_file.MayContain(key):
+                        number_of_rejected_keys += 1
+
+                    self.assertIsNone(test_file.Get(key))
+
+                # With 10 bits per key less than 1% of the keys are expected to be
+                # false positives.
+                self.assertGreater(number_of_rejected_keys, 90)
+
+                self.assertFalse(test_file.MayContain(b"zzz"))
+
+            finally:
+                test_file.Close()
+
+    def testReadTableEntries(self):
+        """Tests the ReadTableEntries function."""
+        entries = [
+            (f"key{key_index:04d}".encode("ascii"), key_index, 1, b"value")
+            for key_index in range(20)
+        ]
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            test_file_path = os.path.join(temporary_directory, "000001.ldb")
+            self._CreateTableFile(test_file_path, entries)
+
+            test_file = leveldb.LevelDBDatabaseTableFile()
+            test_file.Open(test_file_path)
+
+            try:
+                keys = [table_entry.key for table_entry in test_file.ReadTableEntries()]
+            finally:
+                test_file.Close()
+
+        self.assertEqual(keys, [key for key, _, _, _ in entries])
+
+    def testReadTableEntriesWithDecompressionThreads(self):
+        """Tests the ReadTableEntries function with decompression threads."""
+        entries = [
+            (f"key{key_index:04d}".encode("ascii"), key_index, 1, b"value" * key_index)
+            for key_index in range(100)
+        ]
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            test_file_path = os.path.join(temporary_directory, "000001.ldb")
+            self._CreateTableFile(test_file_path, entries, compression_type=1)
+
+            leveldb.BLOCK_CACHE.Clear()
+
+            test_file = leveldb.LevelDBDatabaseTableFile(
+                number_of_decompression_threads=4
+            )
+            test_file.Open(test_file_path)
+
+            try:
+                # Read the entries of one data block so that it is cached.
+                table_entry = test_file.Get(b"key0042")
+                self.assertEqual(table_entry.value, b"value" * 42)
+
+                table_entries = [
+                    (table_entry.key, table_entry.value)
+                    for table_entry in test_file.ReadTableEntries()
+                ]
+            finally:
+                test_file.Close()
+
+            leveldb.BLOCK_CACHE.Clear()
+
+        self.assertEqual(table_entries, [(key, value) for key, _, _, value in entries])
+
+
+class LevelDBDatabaseTest(LevelDBTestCase):
+    """LevelDB database tests."""
+
+    def _CreateDatabase(self, path, comparator_name="leveldb.BytewiseComparator"):
+        """Creates a database for testing.
+
+        The database consists of:
+        * a level 1 table with key0000 - key0049, where key0025 is deleted;
+        * a level 0 table with newer values of key0000 - key0019;
+        * a log with a newer value of key0001 and a deletion of key0002;
+        * an obsolete level 1 table and log with values that are not live.
+
+        Args:
+          path (str): path of the database directory.
+          comparator_name (Optional[str]): name of the comparator.
+        """
+        entries = []
+        for key_index in range(50):
+            key = f"key{key_index:04d}".encode("ascii")
+            value_type = 0 if key_index == 25 else 1
+            entries.append((key, key_index + 1, value_type, b"level1"))
+
+        self._CreateTableFile(os.path.join(path, "000005.ldb"), entries)
+
+        entries = [
+            (f"key{key_index:04d}".encode("ascii"), key_index + 100, 1, b"level0")
+            for key_index in range(20)
+        ]
+        self._CreateTableFile(
+            os.path.join(path, "000007.ldb"), entries, bloom_filter=True
+        )
+
+        entries = [(b"key0003", 1, 1, b"obsolete")]
+        self._CreateTableFile(os.path.join(path, "000004.ldb"), entries)
+
+        records = [self._CreateWriteBatch(1, [(b"key0004", b"obsolete")])]
+        self._CreateLogFile(os.path.join(path, "000003.log"), records)
+
+        records = [
+            self._CreateWriteBatch(200, [(b"key0001", b"log"), (b"key0002", None)])
+        ]
+        self._CreateLogFile(os.path.join(path, "000008.log"), records)
+
+        version_edits = [
+            {
+                "comparator_name": comparator_name,
+                "log_number": 3,
+                "new_tables": [(1, 4, 0, b"key0003", b"key0003")],
+            },
+            {
+                "deleted_tables": [(1, 4)],
+                "log_number": 8,
+                "last_sequence_number": 199,
+                "new_tables": [
+                    (1, 5, 0, b"key0000", b"key0049"),
+                    (0, 7, 0, b"key0000", b"key0019"),
+                ],
+            },
+        ]
+        self._CreateDescriptorFile(os.path.join(path, "MANIFEST-000006"), version_edits)
+
+        with open(os.path.join(path, "CURRENT"), "wb") as file_object:
+            file_object.write(b"MANIFEST-000006\n")
+
+    def testGet(self):
+        """Tests the Get function."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            self._CreateDatabase(temporary_directory)
+
+            test_database = leveldb.LevelDBDatabase()
+            test_database.Open(temporary_directory)
+
+            try:
+                self.assertEqual(
+                    test_database.comparator_name, "leveldb.BytewiseComparator"
+                )
+                self.assertEqual(test_database.last_sequence_number, 199)
+
+                self.assertEqual(
+                    sorted(test_database.checksum_statistics.keys()),
+                    ["000008.log", "MANIFEST-000006"],
+                )
+                checksum_statistics = test_database.checksum_statistics["000008.log"]
+                self.assertEqual(checksum_statistics.number_of_corrupted, 0)
+                self.assertEqual(checksum_statistics.number_of_verified, 1)
+
+                self.assertEqual(test_database.Get(b"key0000").value, b"level0")
+                self.assertEqual(test_database.Get(b"key0001").value, b"log")
+                self.assertIsNone(test_database.Get(b"key0002"))
+                self.assertEqual(test_database.Get(b"key0003").value, b"level0")
+                self.assertEqual(test_database.Get(b"key0010").value, b"level0")
+                self.assertIsNone(test_database.Get(b"key0025"))
+                self.assertEqual(test_database.Get(b"key0030").value, b"level1")
+                self.assertIsNone(test_database.Get(b"key0100"))
+
+            finally:
+                test_database.Close()
+
+    def testOpenWithUnsupportedComparator(self):
+        """Tests the Open function with an unsupported comparator."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            self._CreateDatabase(temporary_directory, comparator_name="idb_cmp1")
+
+            test_database = leveldb.LevelDBDatabase()
+
+            with self.assertRaises(errors.ParseError):
+                test_database.Open(temporary_directory)
+
+            with self.assertRaises(OSError):
+                test_database.Close()
+
+    def testReadEntries(self):
+        """Tests the ReadEntries function."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            self._CreateDatabase(temporary_directory)
+
+            test_database = leveldb.LevelDBDatabase()
+            test_database.Open(temporary_directory)
+
+            try:
+                entries = [
+                    (table_entry.key, table_entry.value)
+                    for table_entry in test_database.ReadEntries()
+                ]
+            finally:
+                test_database.Close()
+
+        expected_entries = [(b"key0000", b"level0"), (b"key0001", b"log")]
+        for key_index in range(3, 50):
+            if key_index != 25:
+                key = f"key{key_index:04d}".encode("ascii")
+                value = b"level0" if key_index < 20 else b"level1"
+                expected_entries.append((key, value))
+
+        self.assertEqual(entries, expected_entries)
 
 
 if __name__ == "__main__":
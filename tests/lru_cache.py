@@ -0,0 +1,65 @@
+"""Tests for the least recently used (LRU) cache."""
+
+import unittest
+
+from dtformats import lru_cache
+
+from tests import test_lib
+
+
+class LRUCacheTest(test_lib.BaseTestCase):
+    """Least recently used (LRU) cache tests."""
+
+    def testGet(self):
+        """Tests the Get function."""
+        test_cache = lru_cache.LRUCache(16)
+        test_cache.Put(1, b"\x01\x02\x03\x04")
+
+        value = test_cache.Get(1)
+        self.assertEqual(value, b"\x01\x02\x03\x04")
+
+        value = test_cache.Get(2)
+        self.assertIsNone(value)
+
+        value = test_cache.Get(2, default=b"")
+        self.assertEqual(value, b"")
+
+        self.assertEqual(test_cache.number_of_hits, 1)
+        self.assertEqual(test_cache.number_of_misses, 2)
+        self.assertAlmostEqual(test_cache.hit_rate, 1.0 / 3.0)
+
+    def testPut(self):
+        """Tests the Put function."""
+        test_cache = lru_cache.LRUCache(16)
+
+        test_cache.Put(1, b"A" * 8)
+        test_cache.Put(2, b"B" * 8)
+        self.assertEqual(test_cache.number_of_values, 2)
+        self.assertEqual(test_cache.size, 16)
+
+        # Mark 1 as most recently used so 2 is evicted.
+        test_cache.Get(1)
+        test_cache.Put(3, b"C" * 4)
+        self.assertEqual(test_cache.number_of_values, 2)
+        self.assertEqual(test_cache.size, 12)
+        self.assertIn(1, test_cache)
+        self.assertNotIn(2, test_cache)
+        self.assertIn(3, test_cache)
+
+        # Replace a cached value.
+        test_cache.Put(3, b"C" * 8)
+        self.assertEqual(test_cache.number_of_values, 2)
+        self.assertEqual(test_cache.size, 16)
+
+        # A value larger than the maximum size is not cached.
+        test_cache.Put(4, b"D" * 32)
+        self.assertNotIn(4, test_cache)
+        self.assertEqual(test_cache.size, 16)
+
+        test_cache.Clear()
+        self.assertEqual(test_cache.number_of_values, 0)
+        self.assertEqual(test_cache.size, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
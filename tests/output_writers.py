@@ -1,8 +1,15 @@
 """Tests for output writers."""
 
+import io
+import json
+import os
+import sqlite3
+import tempfile
 import unittest
+import uuid
 
 from dtformats import output_writers
+from dtformats import unified_logging
 
 from tests import test_lib
 
@@ -29,5 +36,245 @@ class StdoutWriterTest(test_lib.BaseTestCase):
         test_writer.WriteText("")
 
 
+class LogEntryJSONWriterTest(test_lib.BaseTestCase):
+    """Apple Unified Logging log entry JSON output writer tests."""
+
+    # pylint: disable=protected-access
+
+    def _CreateTestLogEntry(self):
+        """Creates a log entry for testing.
+
+        Returns:
+          LogEntry: log entry.
+        """
+        backtrace_frame = unified_logging.BacktraceFrame()
+        backtrace_frame.image_identifier = uuid.UUID(
+            "10167444-3a9a-33fc-af11-d0adebbf5b95"
+        )
+        backtrace_frame.image_offset = 17654
+
+        log_entry = unified_logging.LogEntry()
+        log_entry.activity_identifier = 0
+        log_entry.backtrace_frames = [backtrace_frame]
+        log_entry.boot_identifier = uuid.UUID("e955fe07-ab9d-48ec-a851-97ac5c611182")
+        log_entry.category = "builtin"
+        log_entry.event_message = 'Path: "/tmp"\tand\n'
+        log_entry.event_type = "logEvent"
+        log_entry.format_string = "Path: %s"
+        log_entry.mach_timestamp = 435663966275
+        log_entry.message_type = "Error"
+        log_entry.process_identifier = 14225
+        log_entry.sender_image_identifier = backtrace_frame.image_identifier
+        log_entry.sender_image_path = "/usr/lib/libtest.dylib"
+        log_entry.sender_program_counter = 17654
+        log_entry.sub_system = "com.apple.AssetCache"
+        log_entry.thread_identifier = 28030
+        log_entry.timestamp = 1548580688663966000
+        log_entry.trace_identifier = 15101861027778564
+        return log_entry
+
+    def testFormatTimestamp(self):
+        """Tests the _FormatTimestamp function."""
+        test_writer = output_writers.LogEntryJSONWriter()
+
+        date_time_string = test_writer._FormatTimestamp(1548580688663966000)
+        self.assertEqual(date_time_string, "2019-01-27 09:18:08.663966+0000")
+
+        date_time_string = test_writer._FormatTimestamp(None)
+        self.assertEqual(date_time_string, "YYYY-MM-DD hh:ss:mm.######+####")
+
+    def testWriteLogEntry(self):
+        """Tests the WriteLogEntry function."""
+        file_object = io.StringIO()
+        test_writer = output_writers.LogEntryJSONWriter(file_object=file_object)
+
+        log_entry = self._CreateTestLogEntry()
+
+        test_writer.Open()
+        test_writer.WriteLogEntry(log_entry)
+        test_writer.WriteLogEntry(log_entry)
+        test_writer.Close()
+
+        expected_log_entry_output = "\n".join(
+            [
+                '  "traceID" : 15101861027778564,',
+                '  "eventMessage" : "Path: \\"\\/tmp\\"\\tand",',
+                '  "eventType" : "logEvent",',
+                '  "source" : null,',
+                '  "formatString" : "Path: %s",',
+                '  "activityIdentifier" : 0,',
+                '  "subsystem" : "com.apple.AssetCache",',
+                '  "category" : "builtin",',
+                '  "threadID" : 28030,',
+                '  "senderImageUUID" : "10167444-3A9A-33FC-AF11-D0ADEBBF5B95",',
+                '  "backtrace" : {',
+                '    "frames" : [',
+                "      {",
+                '        "imageOffset" : 17654,',
+                '        "imageUUID" : "10167444-3A9A-33FC-AF11-D0ADEBBF5B95"',
+                "      }",
+                "    ]",
+                "  },",
+                '  "bootUUID" : "E955FE07-AB9D-48EC-A851-97AC5C611182",',
+                '  "processImagePath" : "",',
+                '  "timestamp" : "2019-01-27 09:18:08.663966+0000",',
+                '  "senderImagePath" : "\\/usr\\/lib\\/libtest.dylib",',
+                '  "machTimestamp" : 435663966275,',
+                '  "messageType" : "Error",',
+                '  "processImageUUID" : "",',
+                '  "processID" : 14225,',
+                '  "senderProgramCounter" : 17654,',
+                '  "parentActivityIdentifier" : 0,',
+                '  "timezoneName" : ""',
+                "",
+            ]
+        )
+        expected_output = "".join(
+            [
+                "[{\n",
+                expected_log_entry_output,
+                "},{\n",
+                expected_log_entry_output,
+                "}]",
+            ]
+        )
+        self.assertEqual(file_object.getvalue(), expected_output)
+
+        json_values = json.loads(expected_output)
+        self.assertEqual(len(json_values), 2)
+
+    def testWriteLogEntryWithJSONLines(self):
+        """Tests the WriteLogEntry function with JSON lines."""
+        file_object = io.StringIO()
+        test_writer = output_writers.LogEntryJSONWriter(
+            file_object=file_object, json_lines=True, maximum_buffer_size=1
+        )
+
+        log_entry = self._CreateTestLogEntry()
+
+        test_writer.Open()
+        test_writer.WriteLogEntry(log_entry)
+        test_writer.WriteLogEntry(log_entry)
+        test_writer.Close()
+
+        lines = file_object.getvalue().split("\n")
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(lines[2], "")
+
+        json_values = json.loads(lines[0])
+        self.assertEqual(json_values["eventMessage"], 'Path: "/tmp"\tand')
+        self.assertEqual(
+            json_values["backtrace"],
+            {
+                "frames": [
+                    {
+                        "imageOffset": 17654,
+                        "imageUUID": "10167444-3A9A-33FC-AF11-D0ADEBBF5B95",
+                    }
+                ]
+            },
+        )
+        self.assertEqual(json_values["traceID"], 15101861027778564)
+
+
+class LogEntrySQLiteWriterTest(test_lib.BaseTestCase):
+    """Apple Unified Logging log entry SQLite database writer tests."""
+
+    # pylint: disable=protected-access
+
+    def _CreateTestLogEntry(self):
+        """Creates a log entry for testing.
+
+        Returns:
+          LogEntry: log entry.
+        """
+        log_entry = unified_logging.LogEntry()
+        log_entry.activity_identifier = 0x8000000000000002
+        log_entry.boot_identifier = uuid.UUID("e955fe07-ab9d-48ec-a851-97ac5c611182")
+        log_entry.category = "builtin"
+        log_entry.creator_activity_identifier = 0x8000000000000001
+        log_entry.event_message = "Test message"
+        log_entry.event_type = "logEvent"
+        log_entry.parent_activity_identifier = 0xFFFFFFFFFFFFFFFF
+        log_entry.process_identifier = 14225
+        log_entry.process_image_path = "/usr/sbin/test"
+        log_entry.sender_image_path = "/usr/sbin/test"
+        log_entry.sub_system = "com.apple.AssetCache"
+        log_entry.timestamp = 1548580688663966000
+        log_entry.trace_identifier = 15101861027778564
+        return log_entry
+
+    def testGetSignedInteger64(self):
+        """Tests the _GetSignedInteger64 function."""
+        test_writer = output_writers.LogEntrySQLiteWriter()
+
+        integer = test_writer._GetSignedInteger64(None)
+        self.assertIsNone(integer)
+
+        integer = test_writer._GetSignedInteger64(1)
+        self.assertEqual(integer, 1)
+
+        integer = test_writer._GetSignedInteger64(0xFFFFFFFFFFFFFFFF)
+        self.assertEqual(integer, -1)
+
+    def testWriteLogEntry(self):
+        """Tests the WriteLogEntry function."""
+        log_entry = self._CreateTestLogEntry()
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "log_entries.db")
+
+            for _ in range(2):
+                test_writer = output_writers.LogEntrySQLiteWriter(batch_size=2)
+                test_writer.Open(path)
+
+                for _ in range(3):
+                    test_writer.WriteLogEntry(log_entry)
+
+                test_writer.Close()
+
+            connection = sqlite3.connect(path)
+
+            try:
+                cursor = connection.execute(
+                    "SELECT COUNT(*) FROM log_entries WHERE process_identifier = 14225"
+                )
+                self.assertEqual(cursor.fetchone(), (6,))
+
+                cursor = connection.execute("SELECT COUNT(*) FROM image_paths")
+                self.assertEqual(cursor.fetchone(), (1,))
+
+                cursor = connection.execute(
+                    "SELECT sub_systems.value, log_entries.creator_activity_identifier "
+                    "FROM log_entries JOIN sub_systems ON "
+                    "sub_systems.identifier = log_entries.sub_system_identifier"
+                )
+                self.assertEqual(
+                    cursor.fetchone(), ("com.apple.AssetCache", -0x7FFFFFFFFFFFFFFF)
+                )
+
+                cursor = connection.execute(
+                    "SELECT activity_identifier, parent_activity_identifier "
+                    "FROM log_entries"
+                )
+                self.assertEqual(cursor.fetchone(), (-0x7FFFFFFFFFFFFFFE, -1))
+
+                cursor = connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index'"
+                )
+                index_names = sorted([name for (name,) in cursor.fetchall()])
+                self.assertEqual(
+                    index_names,
+                    [
+                        "log_entries_process_identifier",
+                        "log_entries_sub_system_identifier",
+                        "log_entries_timestamp",
+                    ],
+                )
+
+            finally:
+                connection.close()
+
+
 if __name__ == "__main__":
     unittest.main()
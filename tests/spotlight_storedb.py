@@ -1,17 +1,301 @@
 """Tests for Apple Spotlight store database files."""
 
+import array
+import collections
+import hashlib
+import io
+import os
+import tempfile
 import unittest
 
+import lz4.block
+
+from dtformats import errors
 from dtformats import spotlight_storedb
 
 from tests import test_lib
 
 
+class SpotlightStreamsMapDataFileTest(test_lib.BaseTestCase):
+    """Apple Spotlight database streams map data file tests."""
+
+    def testGetStreamValue(self):
+        """Tests the GetStreamValue function."""
+        offsets = array.array("I", [0, 4, 10])
+        test_file = spotlight_storedb.SpotlightStreamsMapDataFile(10, offsets)
+
+        file_object = io.BytesIO(b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09")
+        test_file.ReadFileObject(file_object)
+
+        self.assertEqual(test_file.number_of_stream_values, 2)
+
+        stream_value = test_file.GetStreamValue(1)
+        self.assertIsInstance(stream_value, memoryview)
+        self.assertEqual(stream_value.tobytes(), b"\x04\x05\x06\x07\x08\x09")
+
+        with self.assertRaises(IndexError):
+            test_file.GetStreamValue(2)
+
+
+class SpotlightStreamsMapOffsetsFileTest(test_lib.BaseTestCase):
+    """Apple Spotlight database streams map offsets file tests."""
+
+    def testReadFileObject(self):
+        """Tests the ReadFileObject function."""
+        test_file = spotlight_storedb.SpotlightStreamsMapOffsetsFile(32, 3)
+
+        file_object = io.BytesIO(b"\x00\x00\x00\x00\x04\x00\x00\x00\x10\x00\x00\x00")
+        test_file.ReadFileObject(file_object)
+
+        self.assertEqual(list(test_file.offsets), [0, 4, 16, 32])
+
+        test_file = spotlight_storedb.SpotlightStreamsMapOffsetsFile(32, 3)
+
+        file_object = io.BytesIO(b"\x00\x00\x00\x00")
+        with self.assertRaises(errors.ParseError):
+            test_file.ReadFileObject(file_object)
+
+
 class SpotlightStoreDatabaseFileTest(test_lib.BaseTestCase):
     """Apple Spotlight store database file tests."""
 
     # pylint: disable=protected-access
 
+    def _CreateMetadataType(self, key_name, property_type, value_type):
+        """Creates a metadata type for testing.
+
+        Args:
+          key_name (str): key name.
+          property_type (int): metadata attribute property type.
+          value_type (int): metadata attribute value type.
+
+        Returns:
+          spotlight_metadata_attribute_type: metadata type.
+        """
+        test_file = spotlight_storedb.SpotlightStoreDatabaseFile()
+        data_type_map = test_file._GetDataTypeMap("spotlight_metadata_attribute_type")
+        metadata_type = data_type_map.CreateStructureValues(
+            key_name=key_name, property_type=property_type, value_type=value_type
+        )
+        return metadata_type
+
+    def _CreateRecordPage(self, page_data):
+        """Creates a LZ4 compressed record page for testing.
+
+        Args:
+          page_data (bytes): uncompressed page data.
+
+        Returns:
+          bytes: record page.
+        """
+        compressed_data = lz4.block.compress(page_data, store_size=False)
+
+        lz4_block = b"".join(
+            [
+                b"bv41",
+                len(page_data).to_bytes(4, "little"),
+                len(compressed_data).to_bytes(4, "little"),
+                compressed_data,
+                b"bv4$",
+            ]
+        )
+        page_size = 20 + len(lz4_block)
+
+        page_header = b"".join(
+            [
+                b"2pbd",
+                page_size.to_bytes(4, "little"),
+                page_size.to_bytes(4, "little"),
+                (0x00001009).to_bytes(4, "little"),
+                len(page_data).to_bytes(4, "little"),
+            ]
+        )
+        return b"".join([page_header, lz4_block])
+
+    def testGetIdentity(self):
+        """Tests the _GetIdentity function."""
+        file_header_tuple = collections.namedtuple(
+            "file_header_tuple", ["map_offset", "map_size"]
+        )
+        file_header = file_header_tuple(map_offset=4096, map_size=2048)
+
+        test_file = spotlight_storedb.SpotlightStoreDatabaseFile()
+        test_file._IDENTITY_READ_SIZE = 1000
+        test_file._file_size = 8192
+
+        data_type_map = test_file._GetDataTypeMap("spotlight_store_db_file_header")
+        file_header_size = data_type_map.GetSizeHint()
+
+        data = bytearray(range(256)) * 32
+        file_object = io.BytesIO(data)
+
+        identity = test_file._GetIdentity(file_object, file_header)
+
+        identity_hash = hashlib.sha256(data[:file_header_size] + data[4096:6144])
+        self.assertEqual(identity, f"8192:{identity_hash.hexdigest():s}")
+
+        # Data between the file header and the map is not part of the identity.
+        data[file_header_size] ^= 0xFF
+        file_object = io.BytesIO(data)
+
+        self.assertEqual(test_file._GetIdentity(file_object, file_header), identity)
+
+        # Data of the map is part of the identity.
+        data[6143] ^= 0xFF
+        file_object = io.BytesIO(data)
+
+        self.assertNotEqual(test_file._GetIdentity(file_object, file_header), identity)
+
+    def testGetMetadataAttributeValueSize(self):
+        """Tests the _GetMetadataAttributeValueSize function."""
+        test_file = spotlight_storedb.SpotlightStoreDatabaseFile()
+
+        metadata_type = self._CreateMetadataType("kMDItemFSName", 0x00, 0x0B)
+        value_size = test_file._GetMetadataAttributeValueSize(
+            metadata_type, b"\x00\x04abc\x00\x00", 1
+        )
+        self.assertEqual(value_size, 5)
+
+        metadata_type = self._CreateMetadataType("_kMDItemFileSize", 0x00, 0x00)
+        value_size = test_file._GetMetadataAttributeValueSize(
+            metadata_type, b"\x80\x99", 0
+        )
+        self.assertEqual(value_size, 2)
+
+        metadata_type = self._CreateMetadataType("kMDItemDate", 0x00, 0x0C)
+        value_size = test_file._GetMetadataAttributeValueSize(
+            metadata_type, b"\x00" * 8, 0
+        )
+        self.assertEqual(value_size, 8)
+
+        metadata_type = self._CreateMetadataType("kMDItemDates", 0x02, 0x0C)
+        value_size = test_file._GetMetadataAttributeValueSize(
+            metadata_type, b"\x10" + b"\x00" * 16, 0
+        )
+        self.assertEqual(value_size, 17)
+
+    def testReadIndexStreamsMap(self):
+        """Tests the _ReadIndexStreamsMap function."""
+        test_file = spotlight_storedb.SpotlightStoreDatabaseFile()
+
+        data_type_map = test_file._GetDataTypeMap("spotlight_metadata_attribute_value")
+        metadata_value = data_type_map.CreateStructureValues(value_name="test")
+        test_file._metadata_values = {2: metadata_value}
+
+        # Stream value 0 is unused, stream value 1 contains 2 index values
+        # preceded by 2 bytes of padding.
+        data = b"".join(
+            [
+                b"\x00",
+                b"\x01\x0a\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00",
+            ]
+        )
+        offsets = array.array("I", [0, 1, len(data)])
+
+        test_file._ReadStreamsMap = lambda _: (data, offsets)
+
+        property_table = {}
+        test_file._ReadIndexStreamsMap(4, property_table)
+
+        self.assertEqual(len(property_table), 1)
+        self.assertEqual(property_table[1].table_index, 1)
+        self.assertEqual(property_table[1].values_list, ["test", ""])
+
+        offsets = array.array("I", [0, 1, len(data) - 4])
+
+        with self.assertRaises(errors.ParseError):
+            test_file._ReadIndexStreamsMap(4, {})
+
+    def testReadRecord(self):
+        """Tests the _ReadRecord function."""
+        test_file = spotlight_storedb.SpotlightStoreDatabaseFile()
+        test_file._metadata_types = {
+            1: self._CreateMetadataType("_kMDItemFileSize", 0x00, 0x00),
+            2: self._CreateMetadataType("kMDItemFSName", 0x00, 0x0B),
+        }
+
+        record_data = b"".join(
+            [
+                # Identifier, flags, item, parent identifier and last update time.
+                b"\x05\x00\x01\x02\x03",
+                # Metadata attribute: 1 with value 153.
+                b"\x01\x80\x99",
+                # Metadata attribute: 2 with value "abc".
+                b"\x01\x04abc\x00",
+            ]
+        )
+        page_data = b"".join(
+            [(len(record_data) + 4).to_bytes(4, "little"), record_data]
+        )
+
+        metadata_item = test_file._ReadRecord(page_data, 20)
+        self.assertEqual(metadata_item.identifier, 5)
+        self.assertEqual(metadata_item.parent_identifier, 2)
+        self.assertEqual(metadata_item.attributes["_kMDItemFileSize"].value, 153)
+        self.assertEqual(metadata_item.attributes["kMDItemFSName"].value, "abc")
+
+        metadata_item = test_file._ReadRecord(page_data, 20, metadata_type_indexes={2})
+        self.assertEqual(list(metadata_item.attributes.keys()), ["kMDItemFSName"])
+        self.assertEqual(metadata_item.attributes["kMDItemFSName"].value, "abc")
+
+    def testReadRecordPages(self):
+        """Tests the _ReadRecordPages function."""
+        file_offsets = []
+        pages_data = []
+        record_pages = []
+
+        file_offset = 0
+        for page_index in range(8):
+            page_data = bytes([page_index]) * 4096
+            record_page = self._CreateRecordPage(page_data)
+
+            file_offsets.append(file_offset)
+            pages_data.append(page_data)
+            record_pages.append(record_page)
+
+            file_offset += len(record_page)
+
+        file_object = io.BytesIO(b"".join(record_pages))
+
+        for number_of_decompression_threads in (None, 4):
+            test_file = spotlight_storedb.SpotlightStoreDatabaseFile(
+                number_of_decompression_threads=number_of_decompression_threads
+            )
+            record_pages = list(
+                test_file._ReadRecordPages(file_object, file_offsets[::-1])
+            )
+            self.assertEqual(
+                [file_offset for file_offset, _, _ in record_pages],
+                list(reversed(file_offsets)),
+            )
+            self.assertEqual(
+                [page_data for _, _, page_data in record_pages],
+                list(reversed(pages_data)),
+            )
+
+    def testReadRecords(self):
+        """Tests the _ReadRecords function."""
+        test_file = spotlight_storedb.SpotlightStoreDatabaseFile()
+
+        page_data = b"".join(
+            [
+                b"\x05\x00\x00\x00\x05\x00\x01\x02\x03",
+                b"\x05\x00\x00\x00\x06\x00\x01\x02\x03",
+                # Record with the same identifier that supersedes the first record.
+                b"\x05\x00\x00\x00\x05\x00\x01\x02\x04",
+            ]
+        )
+        test_file._ReadRecordPageValues(page_data, 0x1000)
+
+        metadata_items = list(test_file._ReadRecords(page_data, 0x1000))
+        self.assertEqual(len(metadata_items), 2)
+
+        self.assertEqual(metadata_items[0].identifier, 6)
+        self.assertEqual(metadata_items[0].last_update_time, 3)
+
+        self.assertEqual(metadata_items[1].identifier, 5)
+        self.assertEqual(metadata_items[1].last_update_time, 4)
+
     # TODO: add test for _ReadFileHeader
     # TODO: add test for _ReadMapPages
     # TODO: add test for _ReadPropertyPage
@@ -95,5 +379,179 @@ class SpotlightStoreDatabaseFileTest(test_lib.BaseTestCase):
         test_file.Open(test_file_path)
 
 
+class SpotlightStoreDatabaseIndexTest(test_lib.BaseTestCase):
+    """Apple Spotlight store database secondary index tests."""
+
+    # pylint: disable=protected-access
+
+    def _CreateMetadataItem(self, identifier, parent_identifier, attributes):
+        """Creates a metadata item.
+
+        Args:
+          identifier (int): file (system) entry identifier.
+          parent_identifier (int): parent file (system) entry identifier.
+          attributes (dict[str, object]): metadata attribute values per name.
+
+        Returns:
+          SpotlightStoreMetadataItem: metadata item.
+        """
+        metadata_item = spotlight_storedb.SpotlightStoreMetadataItem()
+        metadata_item.identifier = identifier
+        metadata_item.parent_identifier = parent_identifier
+
+        for name, value in attributes.items():
+            metadata_attribute = spotlight_storedb.SpotlightStoreMetadataAttribute()
+            metadata_attribute.key = name
+            metadata_attribute.value = value
+            metadata_item.attributes[name] = metadata_attribute
+
+        return metadata_item
+
+    def _CreateStoreDatabase(self):
+        """Creates a store database with metadata items.
+
+        Returns:
+          SpotlightStoreDatabaseFile: store database file.
+        """
+        metadata_items = [
+            self._CreateMetadataItem(
+                2, 1, {"_kMDItemFileName": "Documents", "_kMDItemCreationDate": 10.0}
+            ),
+            self._CreateMetadataItem(
+                3,
+                2,
+                {
+                    "_kMDItemFileName": "document.txt",
+                    "_kMDItemCreationDate": 20.0,
+                    "kMDItemContentType": "public.plain-text",
+                },
+            ),
+            self._CreateMetadataItem(
+                4,
+                2,
+                {"_kMDItemFileName": "image.png", "_kMDItemCreationDate": [30.0]},
+            ),
+            self._CreateMetadataItem(0xFFFFFFFFFFFFFFFE, 2, {}),
+        ]
+        metadata_items_per_identifier = {
+            metadata_item.identifier: metadata_item for metadata_item in metadata_items
+        }
+
+        def _GetMetadataItemsByIdentifiers(identifiers, attribute_names=None):
+            _ = attribute_names
+            for identifier in sorted(identifiers):
+                yield metadata_items_per_identifier[identifier]
+
+        def _IterateMetadataItems(attribute_names=None):
+            _ = attribute_names
+            yield from metadata_items
+
+        store_database = spotlight_storedb.SpotlightStoreDatabaseFile()
+        store_database.GetMetadataItemsByIdentifiers = _GetMetadataItemsByIdentifiers
+        store_database.IterateMetadataItems = _IterateMetadataItems
+
+        return store_database
+
+    def testBuildAndOpen(self):
+        """Tests the Build and Open functions."""
+        store_database = self._CreateStoreDatabase()
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            index_path = os.path.join(temporary_directory, "index.db")
+
+            test_index = spotlight_storedb.SpotlightStoreDatabaseIndex(store_database)
+            test_index.Build(index_path)
+            test_index.Close()
+
+            with self.assertRaises(OSError):
+                test_index.Build(index_path)
+
+            test_index.Open(index_path)
+
+            with self.assertRaises(OSError):
+                test_index.Open(index_path)
+
+            test_index.Close()
+
+            with self.assertRaises(OSError):
+                test_index.Close()
+
+            # An index that was built from another store database is rejected.
+            other_store_database = self._CreateStoreDatabase()
+            other_store_database._identity = "1024:0123456789abcdef"
+
+            other_index = spotlight_storedb.SpotlightStoreDatabaseIndex(
+                other_store_database
+            )
+            with self.assertRaises(OSError):
+                other_index.Open(index_path)
+
+    def testBuildWithError(self):
+        """Tests the Build function with an error reading the metadata items."""
+        store_database = self._CreateStoreDatabase()
+
+        def _IterateMetadataItems(attribute_names=None):
+            _ = attribute_names
+            yield self._CreateMetadataItem(2, 1, {"_kMDItemFileName": "Documents"})
+            raise errors.ParseError("Unable to read metadata item")
+
+        store_database.IterateMetadataItems = _IterateMetadataItems
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            index_path = os.path.join(temporary_directory, "index.db")
+
+            test_index = spotlight_storedb.SpotlightStoreDatabaseIndex(store_database)
+            with self.assertRaises(errors.ParseError):
+                test_index.Build(index_path)
+
+            # The partially built index file is removed.
+            self.assertFalse(os.path.exists(index_path))
+
+            store_database = self._CreateStoreDatabase()
+            test_index = spotlight_storedb.SpotlightStoreDatabaseIndex(store_database)
+            test_index.Build(index_path)
+            test_index.Close()
+
+    def testQueries(self):
+        """Tests the query functions."""
+        store_database = self._CreateStoreDatabase()
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            index_path = os.path.join(temporary_directory, "index.db")
+
+            test_index = spotlight_storedb.SpotlightStoreDatabaseIndex(store_database)
+            test_index.Build(index_path)
+
+            identifiers = [
+                metadata_item.identifier
+                for metadata_item in test_index.GetChildMetadataItems(2)
+            ]
+            self.assertEqual(identifiers, [3, 4, 0xFFFFFFFFFFFFFFFE])
+
+            identifiers = [
+                metadata_item.identifier
+                for metadata_item in test_index.GetMetadataItemsByNamePrefix("Doc")
+            ]
+            self.assertEqual(identifiers, [2])
+
+            identifiers = [
+                metadata_item.identifier
+                for metadata_item in test_index.GetMetadataItemsByDateRange(
+                    "_kMDItemCreationDate", 15.0, 30.0
+                )
+            ]
+            self.assertEqual(identifiers, [3])
+
+            identifiers = [
+                metadata_item.identifier
+                for metadata_item in test_index.GetMetadataItemsByDateRange(
+                    "_kMDItemCreationDate", 15.0, 40.0
+                )
+            ]
+            self.assertEqual(identifiers, [3, 4])
+
+            test_index.Close()
+
+
 if __name__ == "__main__":
     unittest.main()
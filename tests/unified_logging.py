@@ -11,6 +11,135 @@ from dtformats import unified_logging
 from tests import test_lib
 
 
+class ActivityIndexTest(test_lib.BaseTestCase):
+    """Activity index tests."""
+
+    def _CreateTestActivityIndex(self, maximum_generation_size=65536):
+        """Creates an activity index for testing.
+
+        Args:
+          maximum_generation_size (Optional[int]): maximum number of activity
+              relationships and log entry references per generation.
+
+        Returns:
+          ActivityIndex: activity index.
+        """
+        activity_index = unified_logging.ActivityIndex(
+            maximum_generation_size=maximum_generation_size,
+            maximum_number_of_generations=4,
+        )
+
+        # Activity 2 is created by activity 1 and activity 3 by activity 2.
+        for entry_identifier, (
+            activity_identifier,
+            creator_activity_identifier,
+        ) in enumerate([(1, None), (2, 1 | (1 << 63)), (2, None), (3, 2), (4, None)]):
+            log_entry = unified_logging.LogEntry()
+            log_entry.activity_identifier = activity_identifier
+            log_entry.creator_activity_identifier = creator_activity_identifier
+
+            activity_index.AddLogEntry(log_entry, entry_identifier=entry_identifier)
+
+        return activity_index
+
+    def testAddLogEntry(self):
+        """Tests the AddLogEntry function."""
+        activity_index = self._CreateTestActivityIndex(maximum_generation_size=2)
+
+        self.assertEqual(activity_index.number_of_generations, 4)
+
+        activity_index = self._CreateTestActivityIndex(maximum_generation_size=1)
+
+        # The oldest generations are evicted.
+        self.assertEqual(activity_index.number_of_generations, 4)
+        self.assertIsNone(activity_index.GetParentActivityIdentifier(2))
+
+    def testGetDescendantActivityIdentifiers(self):
+        """Tests the GetDescendantActivityIdentifiers function."""
+        for maximum_generation_size in (2, 65536):
+            activity_index = self._CreateTestActivityIndex(
+                maximum_generation_size=maximum_generation_size
+            )
+
+            activity_identifiers = activity_index.GetDescendantActivityIdentifiers(1)
+            self.assertEqual(activity_identifiers, set([1, 2, 3]))
+
+            activity_identifiers = activity_index.GetDescendantActivityIdentifiers(3)
+            self.assertEqual(activity_identifiers, set([3]))
+
+    def testGetEntryIdentifiers(self):
+        """Tests the GetEntryIdentifiers function."""
+        for maximum_generation_size in (2, 65536):
+            activity_index = self._CreateTestActivityIndex(
+                maximum_generation_size=maximum_generation_size
+            )
+
+            entry_identifiers = activity_index.GetEntryIdentifiers(1)
+            self.assertEqual(entry_identifiers, [0, 1, 2, 3])
+
+            entry_identifiers = activity_index.GetEntryIdentifiers(
+                2, include_descendants=False
+            )
+            self.assertEqual(entry_identifiers, [1, 2])
+
+            entry_identifiers = activity_index.GetEntryIdentifiers(5)
+            self.assertEqual(entry_identifiers, [])
+
+    def testGetParentActivityIdentifier(self):
+        """Tests the GetParentActivityIdentifier function."""
+        for maximum_generation_size in (2, 65536):
+            activity_index = self._CreateTestActivityIndex(
+                maximum_generation_size=maximum_generation_size
+            )
+
+            parent_activity_identifier = activity_index.GetParentActivityIdentifier(2)
+            self.assertEqual(parent_activity_identifier, 1)
+
+            parent_activity_identifier = activity_index.GetParentActivityIdentifier(3)
+            self.assertEqual(parent_activity_identifier, 2)
+
+            parent_activity_identifier = activity_index.GetParentActivityIdentifier(1)
+            self.assertIsNone(parent_activity_identifier)
+
+
+class TraceV3FileCheckpointTest(test_lib.BaseTestCase):
+    """Tracev3 file checkpoint tests."""
+
+    def testCopyFromDict(self):
+        """Tests the CopyFromDict function."""
+        checkpoint = unified_logging.TraceV3FileCheckpoint()
+        checkpoint.CopyFromDict(
+            {
+                "boot_identifier": "A6EBC8E3-0A1C-40E8-93B9-DA3A7F671D19",
+                "catalog_offset": 224,
+                "file_offset": 4096,
+                "unreferenced_oversize_chunks": [[1024, 395, 1]],
+            }
+        )
+
+        self.assertEqual(
+            checkpoint.boot_identifier, "A6EBC8E3-0A1C-40E8-93B9-DA3A7F671D19"
+        )
+        self.assertEqual(checkpoint.catalog_offset, 224)
+        self.assertEqual(checkpoint.file_offset, 4096)
+        self.assertEqual(checkpoint.unreferenced_oversize_chunks, [(1024, 395, 1)])
+
+    def testCopyToDict(self):
+        """Tests the CopyToDict function."""
+        checkpoint = unified_logging.TraceV3FileCheckpoint()
+        checkpoint.file_offset = 4096
+
+        expected_checkpoint_values = {
+            "boot_identifier": None,
+            "catalog_offset": None,
+            "file_offset": 4096,
+            "unreferenced_oversize_chunks": [],
+        }
+
+        checkpoint_values = checkpoint.CopyToDict()
+        self.assertEqual(checkpoint_values, expected_checkpoint_values)
+
+
 class FormatStringOperatorTest(test_lib.BaseTestCase):
     """Format string operator tests."""
 
@@ -4146,6 +4275,53 @@ class TraceV3FileTest(test_lib.BaseTestCase):
 
         self.assertIsNotNone(catalog)
 
+    def testBuildCatalogProcessInformationEntries(self):
+        """Tests the _BuildCatalogProcessInformationEntries function."""
+        output_writer = test_lib.TestOutputWriter()
+        test_file = unified_logging.TraceV3File(output_writer=output_writer)
+
+        test_file_path = self._GetTestFilePath(
+            ["unified_logging", "0000000000000030.tracev3"]
+        )
+        self._SkipIfPathNotExists(test_file_path)
+
+        with open(test_file_path, "rb") as file_object:
+            chunk_header = test_file._ReadChunkHeader(file_object, 0x000000E0)
+            catalog = test_file._ReadCatalog(file_object, 0x000000F0, chunk_header)
+
+        test_file._BuildCatalogProcessInformationEntries(catalog)
+
+        self.assertEqual(
+            len(test_file._catalog_process_information_entries),
+            len(catalog.process_information_entries),
+        )
+
+        for process_information_entry in catalog.process_information_entries:
+            proc_id = (
+                process_information_entry.proc_id_upper << 32
+            ) | process_information_entry.proc_id_lower
+            self.assertIs(
+                test_file._catalog_process_information_entries[proc_id],
+                process_information_entry,
+            )
+
+            load_address_range_starts = (
+                process_information_entry.load_address_range_starts
+            )
+            self.assertEqual(
+                load_address_range_starts, sorted(load_address_range_starts)
+            )
+            self.assertEqual(
+                len(process_information_entry.load_address_ranges),
+                len(process_information_entry.uuid_entries),
+            )
+
+            for sub_system_entry in process_information_entry.sub_system_entries:
+                self.assertIn(
+                    sub_system_entry.identifier,
+                    process_information_entry.sub_system_strings,
+                )
+
     def testReadChunkHeader(self):
         """Tests the _ReadChunkHeader function."""
         output_writer = test_lib.TestOutputWriter()
@@ -4451,6 +4627,69 @@ class TraceV3FileTest(test_lib.BaseTestCase):
         test_file.Open(test_file_path)
         test_file.Close()
 
+    def testReadLogEntriesWithCheckpoint(self):
+        """Tests the ReadLogEntries function with a checkpoint."""
+        test_file_path = self._GetTestFilePath(
+            ["unified_logging", "0000000000000f85.tracev3"]
+        )
+        self._SkipIfPathNotExists(test_file_path)
+
+        test_file = unified_logging.TraceV3File(error_on_warning=False)
+        test_file.Open(test_file_path)
+
+        try:
+            expected_log_entries = [
+                (log_entry.timestamp, log_entry.event_message)
+                for log_entry in test_file.ReadLogEntries()
+            ]
+        finally:
+            test_file.Close()
+
+        self.assertEqual(len(expected_log_entries), 8654)
+
+        checkpoint = unified_logging.TraceV3FileCheckpoint()
+
+        test_file = unified_logging.TraceV3File(error_on_warning=False)
+        test_file.Open(test_file_path)
+
+        try:
+            for index, _ in enumerate(test_file.ReadLogEntries(checkpoint=checkpoint)):
+                if index >= 5000:
+                    break
+        finally:
+            test_file.Close()
+
+        self.assertEqual(checkpoint.catalog_offset, 134352)
+        self.assertEqual(checkpoint.file_offset, 237776)
+        self.assertEqual(len(checkpoint.unreferenced_oversize_chunks), 1)
+
+        checkpoint_values = checkpoint.CopyToDict()
+
+        checkpoint = unified_logging.TraceV3FileCheckpoint()
+        checkpoint.CopyFromDict(checkpoint_values)
+
+        test_file = unified_logging.TraceV3File(error_on_warning=False)
+        test_file.Open(test_file_path)
+
+        try:
+            log_entries = [
+                (log_entry.timestamp, log_entry.event_message)
+                for log_entry in test_file.ReadLogEntries(checkpoint=checkpoint)
+            ]
+            self.assertEqual(len(log_entries), 3735)
+            self.assertEqual(log_entries, expected_log_entries[-3735:])
+            self.assertEqual(checkpoint.file_offset, 717296)
+
+            log_entries = list(test_file.ReadLogEntries(checkpoint=checkpoint))
+            self.assertEqual(log_entries, [])
+
+            checkpoint.boot_identifier = "00000000-0000-0000-0000-000000000000"
+            with self.assertRaises(errors.ParseError):
+                list(test_file.ReadLogEntries(checkpoint=checkpoint))
+
+        finally:
+            test_file.Close()
+
 
 class UUIDTextFileTest(test_lib.BaseTestCase):
     """Apple Unified Logging and Activity Tracing (uuidtext) file tests."""
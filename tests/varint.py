@@ -0,0 +1,71 @@
+"""Tests for the variable size integer (varint) decoding functions."""
+
+import unittest
+
+from dtformats import varint
+
+from tests import test_lib
+
+
+class VarintTest(test_lib.BaseTestCase):
+    """Variable size integer (varint) decoding functions tests."""
+
+    def testReadBase128VariableSizeInteger(self):
+        """Tests the ReadBase128VariableSizeInteger function."""
+        integer_value, bytes_read = varint.ReadBase128VariableSizeInteger(b"\x01")
+        self.assertEqual(integer_value, 1)
+        self.assertEqual(bytes_read, 1)
+
+        integer_value, bytes_read = varint.ReadBase128VariableSizeInteger(b"\x96\x01")
+        self.assertEqual(integer_value, 150)
+        self.assertEqual(bytes_read, 2)
+
+        integer_value, bytes_read = varint.ReadBase128VariableSizeInteger(
+            memoryview(b"\x00\x00\x96\x01\x00"), 2
+        )
+        self.assertEqual(integer_value, 150)
+        self.assertEqual(bytes_read, 2)
+
+    def testReadBase128VariableSizeIntegers(self):
+        """Tests the ReadBase128VariableSizeIntegers function."""
+        integer_values, bytes_read = varint.ReadBase128VariableSizeIntegers(
+            b"\x00\x01\x96\x01\x7f", 1, 3
+        )
+        self.assertEqual(integer_values, [1, 150, 127])
+        self.assertEqual(bytes_read, 4)
+
+    def testReadSpotlightVariableSizeInteger(self):
+        """Tests the ReadSpotlightVariableSizeInteger function."""
+        integer_value, bytes_read = varint.ReadSpotlightVariableSizeInteger(b"\x24")
+        self.assertEqual(integer_value, 36)
+        self.assertEqual(bytes_read, 1)
+
+        integer_value, bytes_read = varint.ReadSpotlightVariableSizeInteger(
+            b"\xf1\x02\x03\x04\x05"
+        )
+        self.assertEqual(integer_value, 4328719365)
+        self.assertEqual(bytes_read, 5)
+
+        integer_value, bytes_read = varint.ReadSpotlightVariableSizeInteger(
+            memoryview(b"\x00\xff\x01\x02\x03\x04\x05\x06\x07\x08"), 1
+        )
+        self.assertEqual(integer_value, 72623859790382856)
+        self.assertEqual(bytes_read, 9)
+
+        with self.assertRaises(ValueError):
+            varint.ReadSpotlightVariableSizeInteger(b"\xc0\x00")
+
+    def testReadSpotlightVariableSizeIntegers(self):
+        """Tests the ReadSpotlightVariableSizeIntegers function."""
+        integer_values, bytes_read = varint.ReadSpotlightVariableSizeIntegers(
+            b"\x00\x24\x80\x24\xc0\x00\x24", 1, 3
+        )
+        self.assertEqual(integer_values, [36, 36, 36])
+        self.assertEqual(bytes_read, 6)
+
+        with self.assertRaises(ValueError):
+            varint.ReadSpotlightVariableSizeIntegers(b"\x24\xc0\x00", 0, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
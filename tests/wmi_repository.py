@@ -1,6 +1,7 @@
 """Tests for WMI Common Information Model (CIM) repository files."""
 
 import os
+import tempfile
 import unittest
 
 from dtformats import wmi_repository
@@ -9,7 +10,6 @@ from tests import test_lib
 
 # TODO: add tests for IndexBinaryTreePage
 # TODO: add tests for ObjectRecord
-# TODO: add tests for ObjectsDataPage
 
 
 class IndexBinaryTreeFileTest(test_lib.BaseTestCase):
@@ -19,7 +19,6 @@ class IndexBinaryTreeFileTest(test_lib.BaseTestCase):
 
     # TODO: add tests for _DebugPrintPageBody
 
-    # TODO: add tests for _GetPage
     # TODO: add tests for _ReadPage
     # TODO: add tests for _ReadPageKeyData
     # TODO: add tests for _ReadPageValueData
@@ -28,6 +27,33 @@ class IndexBinaryTreeFileTest(test_lib.BaseTestCase):
     # TODO: add tests for GetMappedPage
     # TODO: add tests for GetRootPage
 
+    def testGetPage(self):
+        """Tests the GetPage function."""
+        test_file_path = self._GetTestFilePath(["cim", "INDEX.BTR"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        test_file = wmi_repository.IndexBinaryTreeFile()
+        test_file.Open(test_file_path)
+
+        try:
+            index_page = test_file.GetPage(1)
+            self.assertIsNotNone(index_page)
+            self.assertEqual(test_file.page_cache.number_of_hits, 0)
+            self.assertEqual(test_file.page_cache.number_of_misses, 1)
+
+            cached_index_page = test_file.GetPage(1)
+            self.assertIs(cached_index_page, index_page)
+            self.assertEqual(test_file.page_cache.number_of_hits, 1)
+            self.assertEqual(test_file.page_cache.number_of_misses, 1)
+
+            index_page = test_file.GetPage(0xFFFFFF)
+            self.assertIsNone(index_page)
+
+        finally:
+            test_file.Close()
+
+        self.assertEqual(test_file.page_cache.number_of_values, 0)
+
     def testReadFileObject(self):
         """Tests the ReadFileObject."""
         test_file_path = self._GetTestFilePath(["cim", "INDEX.MAP"])
@@ -120,11 +146,60 @@ class ObjectsDataFileTest(test_lib.BaseTestCase):
     """Index binary-tree (Index.btr) file tests."""
 
     # TODO: add tests _GetKeyValues
-    # TODO: add tests _GetPage
     # TODO: add tests _ReadPage
     # TODO: add tests GetMappedPage
     # TODO: add tests GetObjectRecordByKey
 
+    def testGetPage(self):
+        """Tests the GetPage function."""
+        object_descriptors_data = b"".join(
+            [
+                b"\x01\x00\x00\x00\x30\x00\x00\x00\x10\x00\x00\x00\x00\x00\x00\x00",
+                b"\x02\x00\x00\x00\x40\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x00",
+                b"\x00" * 16,
+            ]
+        )
+        page_data = object_descriptors_data.ljust(8192, b"\x00")
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            test_file_path = os.path.join(temporary_directory, "OBJECTS.DATA")
+            with open(test_file_path, "wb") as file_object:
+                file_object.write(page_data * 2)
+
+            test_file = wmi_repository.ObjectsDataFile()
+            test_file.Open(test_file_path)
+
+            try:
+                objects_page = test_file.GetPage(0, False)
+                self.assertIsNotNone(objects_page)
+                self.assertEqual(objects_page.page_offset, 0)
+
+                object_descriptor = objects_page.GetObjectDescriptor(2, 8)
+                self.assertIsNotNone(object_descriptor)
+                self.assertEqual(object_descriptor.data_offset, 0x40)
+
+                object_descriptor = objects_page.GetObjectDescriptor(2, 16)
+                self.assertIsNone(object_descriptor)
+
+                object_descriptor = objects_page.GetObjectDescriptor(3, 8)
+                self.assertIsNone(object_descriptor)
+
+                cached_objects_page = test_file.GetPage(0, False)
+                self.assertIs(cached_objects_page, objects_page)
+                self.assertEqual(test_file.page_cache.number_of_hits, 1)
+
+                objects_page = test_file.GetPage(1, True)
+                self.assertIsNotNone(objects_page)
+                self.assertEqual(objects_page.page_offset, 8192)
+                self.assertIsNone(objects_page.GetObjectDescriptor(1, 16))
+                self.assertEqual(test_file.page_cache.number_of_misses, 2)
+
+                objects_page = test_file.GetPage(2, False)
+                self.assertIsNone(objects_page)
+
+            finally:
+                test_file.Close()
+
     def testReadFileObject(self):
         """Tests the ReadFileObject."""
         test_file_path = self._GetTestFilePath(["cim", "OBJECTS.MAP"])
@@ -139,7 +214,220 @@ class ObjectsDataFileTest(test_lib.BaseTestCase):
         test_file.Open(test_file_path)
 
 
-# TODO: add tests for CIMRepository
+class CIMRepositoryTest(test_lib.BaseTestCase):
+    """CIM repository tests."""
+
+    # pylint: disable=protected-access
+
+    def _OpenIndexBinaryTreeFile(self):
+        """Opens a CIM repository with only the index binary-tree file.
+
+        Returns:
+          CIMRepository: CIM repository.
+        """
+        test_file_path = self._GetTestFilePath(["cim", "INDEX.MAP"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        test_file_path = self._GetTestFilePath(["cim", "INDEX.BTR"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        cim_repository = wmi_repository.CIMRepository()
+        cim_repository.Open(test_file_path)
+
+        return cim_repository
+
+    def testGetClassDefinitionByHash(self):
+        """Tests the _GetClassDefinitionByHash function."""
+        cim_repository = self._OpenIndexBinaryTreeFile()
+
+        try:
+            # Class definitions are not read when the repository is opened.
+            self.assertEqual(cim_repository._class_definitions_by_hash, {})
+
+            class_definition = cim_repository._GetClassDefinitionByHash(
+                "00000000000000000000000000000000"
+            )
+            self.assertIsNone(class_definition)
+            self.assertEqual(
+                cim_repository._class_definitions_by_hash,
+                {(None, "00000000000000000000000000000000"): None},
+            )
+
+            namespace_hash = cim_repository._GetHashFromString("ROOT")
+            class_definition = cim_repository._GetClassDefinitionByHash(
+                "00000000000000000000000000000000", namespace_hash=namespace_hash
+            )
+            self.assertIsNone(class_definition)
+            self.assertIn(
+                (namespace_hash.lower(), "00000000000000000000000000000000"),
+                cim_repository._class_definitions_by_hash,
+            )
+
+            # The class definition is found in the index, but its object record
+            # cannot be read since the objects data file was not opened.
+            with self.assertRaises(RuntimeError):
+                cim_repository._GetClassDefinitionByHash(
+                    "19AEDA42897EB08B8D27BEE505DAA661"
+                )
+
+        finally:
+            cim_repository.Close()
+
+    def testGetInstanceKeys(self):
+        """Tests the _GetInstanceKeys function."""
+        cim_repository = self._OpenIndexBinaryTreeFile()
+
+        try:
+            index_keys = list(cim_repository.GetIndexKeys())
+
+            class_name_hash = cim_repository._GetHashFromString("__NAMESPACE")
+            page_cache = cim_repository._index_binary_tree_file.page_cache
+            number_of_misses = page_cache.number_of_misses
+
+            keys = []
+            for namespace_hash in cim_repository._GetNamespaceHashes():
+                keys.extend(
+                    cim_repository._GetInstanceKeys(
+                        namespace_hash, class_name_hash=class_name_hash
+                    )
+                )
+
+            # The pages are cached by GetIndexKeys.
+            self.assertEqual(page_cache.number_of_misses, number_of_misses)
+
+            expected_keys = []
+            for key in index_keys:
+                key_segments = key.split("\\")
+                data_type, _, _ = key_segments[-1].partition("_")
+                _, _, key_class_name_hash = key_segments[2].partition("_")
+
+                if (
+                    data_type in ("I", "IL")
+                    and key_class_name_hash.lower() == class_name_hash
+                ):
+                    expected_keys.append(key)
+
+            self.assertEqual(len(keys), 64)
+            self.assertEqual(sorted(keys), sorted(expected_keys))
+
+        finally:
+            cim_repository.Close()
+
+    def testGetInstances(self):
+        """Tests the GetInstances function."""
+        cim_repository = self._OpenIndexBinaryTreeFile()
+
+        try:
+            instances = list(cim_repository.GetInstances(class_names=["Bogus"]))
+            self.assertEqual(instances, [])
+
+            instances = list(
+                cim_repository.GetInstances(
+                    class_names=["__NAMESPACE"], namespaces=["ROOT\\Bogus"]
+                )
+            )
+            self.assertEqual(instances, [])
+
+            instances = list(
+                cim_repository.GetInstances(class_names=[], namespaces=["ROOT"])
+            )
+            self.assertEqual(instances, [])
+
+            # The instances are found in the index, but their object records
+            # cannot be read since the objects data file was not opened.
+            with self.assertRaises(RuntimeError):
+                list(
+                    cim_repository.GetInstances(
+                        class_names=["__NAMESPACE"], namespaces=["ROOT"]
+                    )
+                )
+
+        finally:
+            cim_repository.Close()
+
+    def testGetKeysByPrefix(self):
+        """Tests the _GetKeysByPrefix function."""
+        cim_repository = self._OpenIndexBinaryTreeFile()
+
+        try:
+            index_keys = list(cim_repository.GetIndexKeys())
+            self.assertEqual(len(index_keys), 10288)
+            self.assertEqual(index_keys, sorted(index_keys))
+
+            cim_repository._index_binary_tree_file.page_cache.Clear()
+
+            key_prefix = "\\NS_14BB13E874022CD07B1538A79462E04A\\CD_"
+            keys = list(cim_repository._GetKeysByPrefix(key_prefix))
+
+            expected_keys = [key for key in index_keys if key.startswith(key_prefix)]
+            self.assertEqual(keys, expected_keys)
+
+            # Only the pages on the path to the keys should have been read.
+            page_cache = cim_repository._index_binary_tree_file.page_cache
+            self.assertLess(page_cache.number_of_values, 10)
+
+            keys = list(cim_repository._GetKeysByPrefix("\\NS_0000"))
+            self.assertEqual(keys, [])
+
+        finally:
+            cim_repository.Close()
+
+    def testGetKeysFromIndexPageWithMissingSubPage(self):
+        """Tests the _GetKeysFromIndexPage function with a missing sub page."""
+        cim_repository = self._OpenIndexBinaryTreeFile()
+
+        try:
+            index_page = cim_repository._GetIndexRootPage()
+            self.assertEqual(len(index_page.sub_pages), len(index_page.keys) + 1)
+
+            missing_sub_index_page = cim_repository._GetIndexPageByMappedPageNumber(
+                index_page.sub_pages[-1]
+            )
+            missing_keys = set(
+                cim_repository._GetKeysFromIndexPage(missing_sub_index_page)
+            )
+
+            damaged_index_page = wmi_repository.IndexBinaryTreePage()
+            damaged_index_page.keys = index_page.keys
+            damaged_index_page.sub_pages = index_page.sub_pages[:-1]
+
+            key_prefix = "\\NS_"
+            end_key = cim_repository._GetKeyPrefixEndKey(key_prefix)
+
+            keys = list(
+                cim_repository._GetKeysFromIndexPage(
+                    damaged_index_page, start_key=key_prefix, end_key=end_key
+                )
+            )
+
+            expected_keys = [
+                key
+                for key in cim_repository.GetIndexKeys()
+                if key.startswith(key_prefix) and key not in missing_keys
+            ]
+            self.assertEqual(len(keys), len(expected_keys))
+            self.assertEqual(sorted(keys), expected_keys)
+
+        finally:
+            cim_repository.Close()
+
+    def testGetNamespaceHashes(self):
+        """Tests the _GetNamespaceHashes function."""
+        cim_repository = self._OpenIndexBinaryTreeFile()
+
+        try:
+            namespace_hashes = list(cim_repository._GetNamespaceHashes())
+
+            expected_namespace_hashes = set()
+            for key in cim_repository.GetIndexKeys():
+                key_segments = key.split("\\")
+                expected_namespace_hashes.add(key_segments[1][3:].lower())
+
+            self.assertEqual(len(namespace_hashes), 34)
+            self.assertEqual(set(namespace_hashes), expected_namespace_hashes)
+
+        finally:
+            cim_repository.Close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""Script to benchmark reading LevelDB database sorted tables (.ldb) files."""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+import snappy
+
+# Change PYTHONPATH to include dtformats.
+sys.path.insert(0, ".")
+
+from dtformats import crc32c  # pylint: disable=wrong-import-position
+from dtformats import leveldb  # pylint: disable=wrong-import-position
+
+
+def CreateBlock(entries, restart_interval):
+    """Creates an uncompressed table block.
+
+    Args:
+      entries (list[tuple[bytes, bytes]]): internal key and value pairs.
+      restart_interval (int): number of entries between restart points.
+
+    Returns:
+      bytes: block data.
+    """
+    block_data = []
+    data_offset = 0
+    restart_values = []
+    shared_key_data = b""
+
+    for entry_index, (key_data, value_data) in enumerate(entries):
+        shared_key_data_size = 0
+        if entry_index % restart_interval == 0:
+            restart_values.append(data_offset)
+        else:
+            shared_key_data_size = len(
+                os.path.commonprefix([key_data, shared_key_data])
+            )
+
+        entry_data = b"".join(
+            [
+                CreateVariableSizeInteger(shared_key_data_size),
+                CreateVariableSizeInteger(len(key_data) - shared_key_data_size),
+                CreateVariableSizeInteger(len(value_data)),
+                key_data[shared_key_data_size:],
+                value_data,
+            ]
+        )
+        block_data.append(entry_data)
+        data_offset += len(entry_data)
+        shared_key_data = key_data
+
+    for restart_value in restart_values:
+        block_data.append(restart_value.to_bytes(4, "little"))
+
+    block_data.append(len(restart_values).to_bytes(4, "little"))
+
+    return b"".join(block_data)
+
+
+def CreateBlockTrailer(block_data, compression_type):
+    """Creates a table block trailer.
+
+    Args:
+      block_data (bytes): block data.
+      compression_type (int): compression type of the block data.
+
+    Returns:
+      bytes: block trailer data.
+    """
+    compression_type_data = compression_type.to_bytes(1, "little")
+
+    checksum = crc32c.CalculateCRC32C(block_data + compression_type_data)
+
+    return compression_type_data + crc32c.MaskCRC32C(checksum).to_bytes(4, "little")
+
+
+def CreateTableFile(path, number_of_entries, block_size, compression_type):
+    """Creates a table file with synthetic entries.
+
+    Args:
+      path (str): path of the table file.
+      number_of_entries (int): number of entries.
+      block_size (int): approximate size of the uncompressed data blocks.
+      compression_type (int): compression type of the data blocks, where 0
+          represents uncompressed and 1 Snappy compressed.
+
+    Returns:
+      list[bytes]: keys of the entries.
+    """
+    # Use text of random words so that the values compress similar to values
+    # stored by Chrome.
+    words = [os.urandom(4).hex().encode("ascii") for _ in range(512)]
+
+    file_data = []
+    file_offset = 0
+    index_entries = []
+    keys = []
+
+    block_entries = []
+    block_entries_size = 0
+
+    for entry_index in range(number_of_entries):
+        key = f"key{entry_index:012d}".encode("ascii")
+        keys.append(key)
+
+        internal_key = key + ((entry_index << 8) | 1).to_bytes(8, "little")
+        value = b" ".join(random.choices(words, k=random.randint(2, 32)))
+
+        block_entries.append((internal_key, value))
+        block_entries_size += len(internal_key) + len(value)
+
+        if block_entries_size < block_size and entry_index + 1 < number_of_entries:
+            continue
+
+        block_data = CreateBlock(block_entries, 16)
+        if compression_type == 1:
+            block_data = snappy.compress(block_data)
+
+        block_handle = b"".join(
+            [
+                CreateVariableSizeInteger(file_offset),
+                CreateVariableSizeInteger(len(block_data)),
+            ]
+        )
+        index_entries.append((internal_key, block_handle))
+
+        file_data.extend([block_data, CreateBlockTrailer(block_data, compression_type)])
+        file_offset += len(block_data) + 5
+
+        block_entries = []
+        block_entries_size = 0
+
+    block_handles = []
+    for block_data in (CreateBlock([], 16), CreateBlock(index_entries, 1)):
+        block_handles.append(CreateVariableSizeInteger(file_offset))
+        block_handles.append(CreateVariableSizeInteger(len(block_data)))
+
+        file_data.extend([block_data, CreateBlockTrailer(block_data, 0)])
+        file_offset += len(block_data) + 5
+
+    footer_data = b"".join(block_handles)
+    file_data.extend(
+        [
+            footer_data,
+            b"\x00" * (40 - len(footer_data)),
+            b"\x57\xfb\x80\x8b\x24\x75\x47\xdb",
+        ]
+    )
+
+    with open(path, "wb") as file_object:
+        file_object.write(b"".join(file_data))
+
+    return keys
+
+
+def CreateVariableSizeInteger(integer_value):
+    """Creates a variable size integer.
+
+    Args:
+      integer_value (int): integer value.
+
+    Returns:
+      bytes: variable size integer data.
+    """
+    data = bytearray()
+    while integer_value >= 0x80:
+        data.append((integer_value & 0x7F) | 0x80)
+        integer_value >>= 7
+
+    data.append(integer_value)
+
+    return bytes(data)
+
+
+def Main():
+    """The main program function.
+
+    Returns:
+      bool: True if successful or False if not.
+    """
+    argument_parser = argparse.ArgumentParser(
+        description=(
+            "Benchmarks full scans with different numbers of decompression "
+            "threads and point lookups in a synthetic LevelDB database sorted "
+            "tables (.ldb) file. The defaults resemble a table file written by "
+            "Chrome, with 4 KiB Snappy compressed data blocks."
+        )
+    )
+
+    argument_parser.add_argument(
+        "--block_size",
+        "--block-size",
+        dest="block_size",
+        type=int,
+        action="store",
+        default=4096,
+        metavar="SIZE",
+        help="approximate size of the uncompressed data blocks.",
+    )
+
+    argument_parser.add_argument(
+        "--checksum_policy",
+        "--checksum-policy",
+        dest="checksum_policy",
+        choices=sorted(leveldb.LevelDBDatabaseFile.CHECKSUM_POLICIES),
+        action="store",
+        default="verify",
+        help="policy for verifying the checksums of blocks.",
+    )
+
+    argument_parser.add_argument(
+        "--no_compression",
+        "--no-compression",
+        dest="no_compression",
+        action="store_true",
+        default=False,
+        help="do not compress the data blocks.",
+    )
+
+    argument_parser.add_argument(
+        "--number_of_entries",
+        "--number-of-entries",
+        dest="number_of_entries",
+        type=int,
+        action="store",
+        default=200000,
+        metavar="NUMBER",
+        help="number of entries in the table file.",
+    )
+
+    argument_parser.add_argument(
+        "--number_of_lookups",
+        "--number-of-lookups",
+        dest="number_of_lookups",
+        type=int,
+        action="store",
+        default=1000,
+        metavar="NUMBER",
+        help="number of point lookups.",
+    )
+
+    argument_parser.add_argument(
+        "--threads",
+        dest="threads",
+        type=str,
+        action="store",
+        default="1,2,4,8",
+        metavar="NUMBERS",
+        help="comma separated numbers of decompression threads.",
+    )
+
+    options = argument_parser.parse_args()
+
+    compression_type = 0 if options.no_compression else 1
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        path = os.path.join(temporary_directory, "000001.ldb")
+
+        keys = CreateTableFile(
+            path, options.number_of_entries, options.block_size, compression_type
+        )
+        lookup_keys = random.sample(keys, min(options.number_of_lookups, len(keys)))
+
+        print(
+            f"Table file with: {options.number_of_entries:d} entries of: "
+            f"{os.path.getsize(path):d} bytes"
+        )
+
+        scan_duration = None
+        for number_of_threads in options.threads.split(","):
+            number_of_threads = int(number_of_threads, 10)
+
+            # Make sure the data blocks are read from the file.
+            leveldb.BLOCK_CACHE.Clear()
+
+            table_file = leveldb.LevelDBDatabaseTableFile(
+                checksum_policy=options.checksum_policy,
+                number_of_decompression_threads=number_of_threads,
+            )
+            table_file.Open(path)
+
+            try:
+                start_time = time.perf_counter()
+
+                for _ in table_file.ReadTableEntries():
+                    pass
+
+                duration = time.perf_counter() - start_time
+
+            finally:
+                table_file.Close()
+
+            if scan_duration is None:
+                scan_duration = duration
+
+            print(
+                f"Full scan\tthreads: {number_of_threads:d}\tduration: "
+                f"{duration:.3f} seconds\tspeedup: {scan_duration / duration:.2f}x"
+            )
+
+        table_file = leveldb.LevelDBDatabaseTableFile(
+            checksum_policy=options.checksum_policy
+        )
+        table_file.Open(path)
+
+        try:
+            start_time = time.perf_counter()
+
+            for key in lookup_keys:
+                if not table_file.Get(key):
+                    print(f"Missing key: {key!s}")
+                    return False
+
+            lookup_duration = (time.perf_counter() - start_time) / len(lookup_keys)
+
+            print(
+                f"Point lookup\tduration: {lookup_duration * 1000.0:.3f} ms per key\t"
+                f"speedup: {scan_duration / lookup_duration:.0f}x"
+            )
+
+            print(
+                f"Block cache\thit rate: {leveldb.BLOCK_CACHE.hit_rate:.2f}\t"
+                f"size: {leveldb.BLOCK_CACHE.size:d} bytes"
+            )
+
+        finally:
+            table_file.Close()
+
+    return True
+
+
+if __name__ == "__main__":
+    if not Main():
+        sys.exit(1)
+    else:
+        sys.exit(0)
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Script to benchmark reading Apple Spotlight store database record pages."""
+
+import argparse
+import io
+import os
+import random
+import sys
+import time
+
+import lz4.block
+
+# Change PYTHONPATH to include dtformats.
+sys.path.insert(0, ".")
+
+from dtformats import spotlight_storedb  # pylint: disable=wrong-import-position
+
+
+def CreateRecordPages(number_of_pages, page_size):
+    """Creates LZ4 compressed record pages.
+
+    Args:
+      number_of_pages (int): number of record pages.
+      page_size (int): size of the uncompressed page data.
+
+    Returns:
+      tuple[bytes, list[int]]: record pages data and file offsets of the record
+          pages.
+    """
+    file_offsets = []
+    record_pages = []
+
+    # Use text of random words so that the pages compress similar to metadata
+    # attribute values.
+    words = [os.urandom(4).hex().encode("ascii") for _ in range(512)]
+
+    file_offset = 0
+    for _ in range(number_of_pages):
+        page_data = b" ".join(random.choices(words, k=(page_size // 9) + 1))
+        page_data = page_data[:page_size]
+
+        compressed_data = lz4.block.compress(page_data, store_size=False)
+
+        lz4_block = b"".join(
+            [
+                b"bv41",
+                len(page_data).to_bytes(4, "little"),
+                len(compressed_data).to_bytes(4, "little"),
+                compressed_data,
+                b"bv4$",
+            ]
+        )
+        record_page_size = 20 + len(lz4_block)
+
+        record_page = b"".join(
+            [
+                b"2pbd",
+                record_page_size.to_bytes(4, "little"),
+                record_page_size.to_bytes(4, "little"),
+                (0x00001009).to_bytes(4, "little"),
+                len(page_data).to_bytes(4, "little"),
+                lz4_block,
+            ]
+        )
+        file_offsets.append(file_offset)
+        record_pages.append(record_page)
+
+        file_offset += record_page_size
+
+    return b"".join(record_pages), file_offsets
+
+
+def Main():
+    """The main program function.
+
+    Returns:
+      bool: True if successful or False if not.
+    """
+    argument_parser = argparse.ArgumentParser(
+        description=(
+            "Benchmarks reading Apple Spotlight store database record pages with "
+            "different numbers of decompression threads."
+        )
+    )
+
+    argument_parser.add_argument(
+        "--number_of_pages",
+        "--number-of-pages",
+        dest="number_of_pages",
+        type=int,
+        action="store",
+        default=2000,
+        metavar="NUMBER",
+        help="number of record pages.",
+    )
+
+    argument_parser.add_argument(
+        "--page_size",
+        "--page-size",
+        dest="page_size",
+        type=int,
+        action="store",
+        default=256 * 1024,
+        metavar="SIZE",
+        help="size of the uncompressed record page data.",
+    )
+
+    argument_parser.add_argument(
+        "--threads",
+        dest="threads",
+        type=str,
+        action="store",
+        default="1,2,4,8",
+        metavar="NUMBERS",
+        help="comma separated numbers of decompression threads.",
+    )
+
+    options = argument_parser.parse_args()
+
+    record_pages_data, file_offsets = CreateRecordPages(
+        options.number_of_pages, options.page_size
+    )
+    file_object = io.BytesIO(record_pages_data)
+
+    print(
+        f"Reading: {options.number_of_pages:d} record pages of: "
+        f"{options.page_size:d} bytes"
+    )
+
+    base_duration = None
+    for number_of_threads in options.threads.split(","):
+        number_of_threads = int(number_of_threads, 10)
+
+        database_file = spotlight_storedb.SpotlightStoreDatabaseFile(
+            number_of_decompression_threads=number_of_threads
+        )
+
+        start_time = time.perf_counter()
+
+        # pylint: disable=protected-access
+        for _ in database_file._ReadRecordPages(file_object, file_offsets):
+            pass
+
+        duration = time.perf_counter() - start_time
+        if base_duration is None:
+            base_duration = duration
+
+        print(
+            f"Threads: {number_of_threads:d}\tduration: {duration:.3f} seconds\t"
+            f"speedup: {base_duration / duration:.2f}x"
+        )
+
+    return True
+
+
+if __name__ == "__main__":
+    if not Main():
+        sys.exit(1)
+    else:
+        sys.exit(0)